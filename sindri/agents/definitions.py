@@ -27,6 +27,7 @@ class AgentDefinition:
     estimated_vram_gb: float = 8.0
     priority: int = 1  # Lower = higher priority
     max_iterations: int = 30
+    llm_timeout: float = 300.0  # Deadline for a single LLM call (seconds)
 
     # Phase 5.6: Model degradation fallback
     fallback_model: Optional[str] = None  # Smaller model to use if primary fails
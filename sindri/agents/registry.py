@@ -213,6 +213,7 @@ AGENTS: dict[str, AgentDefinition] = {
         estimated_vram_gb=9.0,  # Updated for 14b model
         priority=0,
         max_iterations=15,
+        llm_timeout=600.0,  # Reasoning traces run long
         temperature=0.7,  # Higher temp for creative thinking
         # Phase 5.6: Fallback to smaller model when VRAM is insufficient
         fallback_model="deepseek-r1:8b",  # Fall back to 8b version
@@ -232,6 +233,7 @@ AGENTS: dict[str, AgentDefinition] = {
         estimated_vram_gb=10.0,
         priority=1,
         max_iterations=20,
+        llm_timeout=600.0,  # Thinking mode runs long
         temperature=0.3,  # Lower temp for precise security analysis
         # Fallback to smaller model when VRAM is insufficient
         fallback_model="qwen2.5-coder:7b",
@@ -256,6 +258,7 @@ AGENTS: dict[str, AgentDefinition] = {
         estimated_vram_gb=9.0,
         priority=1,
         max_iterations=25,
+        llm_timeout=600.0,  # Reasoning traces run long
         temperature=0.5,  # Balanced for hypothesis exploration
         # Fallback to smaller model when VRAM is insufficient
         fallback_model="deepseek-r1:8b",
@@ -302,6 +305,7 @@ AGENTS: dict[str, AgentDefinition] = {
         estimated_vram_gb=14.0,
         priority=1,
         max_iterations=30,
+        llm_timeout=600.0,  # 22b model generates slowly
         temperature=0.3,  # Lower temp for precise code generation
         # Fallback to smaller model when VRAM is insufficient
         fallback_model="qwen2.5-coder:7b",
@@ -0,0 +1,51 @@
+"""Orchestration benchmarks against a deterministic fake Ollama server.
+
+Measures Sindri's own overhead (scheduling, persistence, events, tool
+dispatch) separately from model speed, without needing a GPU. The
+simulator replays task DAGs on a virtual clock to compare scheduling
+and eviction policies.
+"""
+
+from sindri.benchmark.fake_ollama import (
+    FakeModel,
+    FakeOllamaServer,
+    FakeServerStats,
+    ScriptedReply,
+)
+from sindri.benchmark.runner import (
+    BenchmarkResult,
+    BenchmarkScenario,
+    default_scenarios,
+    run_scenario,
+    run_suite,
+)
+from sindri.benchmark.simulator import (
+    SimTask,
+    SimulationConfig,
+    SimulationResult,
+    TaskTiming,
+    VirtualClockLoop,
+    Workload,
+    run_simulation,
+    synthetic_workload,
+)
+
+__all__ = [
+    "FakeModel",
+    "FakeOllamaServer",
+    "FakeServerStats",
+    "ScriptedReply",
+    "BenchmarkResult",
+    "BenchmarkScenario",
+    "default_scenarios",
+    "run_scenario",
+    "run_suite",
+    "SimTask",
+    "SimulationConfig",
+    "SimulationResult",
+    "TaskTiming",
+    "VirtualClockLoop",
+    "Workload",
+    "run_simulation",
+    "synthetic_workload",
+]
@@ -0,0 +1,393 @@
+"""Deterministic stand-in for the Ollama HTTP API.
+
+Serves scripted chat replies (text and tool calls) with configurable per-token
+latency, model load delays and VRAM-limited model residency, so Sindri's
+orchestration can be exercised and timed without a GPU.
+
+Replies are chosen from the agent's task: the loop puts
+``Your current task: <description>`` in every system prompt, and the number of
+assistant turns already in the conversation selects which reply comes next.
+The same conversation therefore always gets the same reply.
+"""
+
+import json
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+import structlog
+
+log = structlog.get_logger()
+
+NS_PER_SECOND = 1_000_000_000
+
+_TASK_RE = re.compile(r"Your current task: (.*)")
+_TOKEN_RE = re.compile(r"\S+\s*|\s+")
+
+
+@dataclass
+class ScriptedReply:
+    """One assistant reply in a script."""
+
+    content: str = ""
+    # Tool calls as {"name": ..., "arguments": {...}}
+    tool_calls: list[dict] = field(default_factory=list)
+    # Write tool calls into the text as JSON instead of native tool_calls
+    # (exercises the streaming tool-call parser)
+    inline_tools: bool = False
+
+    def message(self) -> dict:
+        """Build the Ollama message for this reply."""
+        content = self.content
+        tool_calls = None
+        if self.tool_calls:
+            if self.inline_tools:
+                blocks = [json.dumps(call) for call in self.tool_calls]
+                content = "\n".join([content] + blocks if content else blocks)
+            else:
+                tool_calls = [
+                    {"function": {"name": c["name"], "arguments": c["arguments"]}}
+                    for c in self.tool_calls
+                ]
+        message = {"role": "assistant", "content": content}
+        if tool_calls:
+            message["tool_calls"] = tool_calls
+        return message
+
+
+@dataclass
+class FakeModel:
+    """A model the fake server can 'load'."""
+
+    name: str
+    size_gb: float = 5.0
+    load_seconds: float = 0.0  # Delay on the first request after (re)loading
+
+
+@dataclass
+class FakeServerStats:
+    """What the fake server did (its time is the simulated model time)."""
+
+    requests: int = 0
+    streamed_requests: int = 0
+    tokens: int = 0
+    prompt_tokens: int = 0
+    loads: int = 0
+    evictions: int = 0
+    load_time: float = 0.0  # Seconds spent in simulated model loads
+    generation_time: float = 0.0  # Seconds spent in simulated token latency
+    unscripted: int = 0  # Requests that fell back to the default reply
+    aborted: int = 0  # Streams the client closed before the reply finished
+
+    @property
+    def model_time(self) -> float:
+        """Total simulated model time (load + generation)."""
+        return self.load_time + self.generation_time
+
+    def to_dict(self) -> dict:
+        """Serialize for reports."""
+        return {
+            "requests": self.requests,
+            "streamed_requests": self.streamed_requests,
+            "tokens": self.tokens,
+            "prompt_tokens": self.prompt_tokens,
+            "loads": self.loads,
+            "evictions": self.evictions,
+            "load_time": round(self.load_time, 4),
+            "generation_time": round(self.generation_time, 4),
+            "unscripted": self.unscripted,
+            "aborted": self.aborted,
+        }
+
+
+class _FakeOllamaHandler(BaseHTTPRequestHandler):
+    """HTTP handler for /api/chat, /api/ps, /api/tags and /api/version."""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def _send_json(self, payload: dict, status: int = 200):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        try:
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            # Client gave up waiting (e.g. the task was cancelled)
+            self.server.fake.record_abort()
+            self.close_connection = True
+
+    def do_GET(self):
+        fake: "FakeOllamaServer" = self.server.fake
+        if self.path == "/api/ps":
+            self._send_json({"models": fake.ps()})
+        elif self.path == "/api/tags":
+            self._send_json({"models": fake.tags()})
+        elif self.path == "/api/version":
+            self._send_json({"version": "0.0.0-fake"})
+        else:
+            self._send_json({"error": "not found"}, status=404)
+
+    def do_POST(self):
+        fake: "FakeOllamaServer" = self.server.fake
+        length = int(self.headers.get("Content-Length", 0))
+        request = json.loads(self.rfile.read(length) or b"{}")
+
+        if self.path != "/api/chat":
+            self._send_json({"error": "not found"}, status=404)
+            return
+
+        model = request.get("model", "")
+        messages = request.get("messages", [])
+        reply = fake.reply_for(messages)
+        message = reply.message()
+        tokens = _TOKEN_RE.findall(message["content"]) or [""]
+        prompt_tokens = sum(len(str(m.get("content", "")).split()) for m in messages)
+
+        load_duration = fake.load(model)
+        stream = request.get("stream", False)
+        fake.record_request(stream, len(tokens), prompt_tokens)
+
+        start = time.perf_counter()
+        if stream:
+            self.send_response(200)
+            self.send_header("Content-Type", "application/x-ndjson")
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            for token in tokens:
+                fake.sleep_token()
+                try:
+                    self._write_chunk(
+                        {
+                            "model": model,
+                            "message": {"role": "assistant", "content": token},
+                            "done": False,
+                        }
+                    )
+                except (BrokenPipeError, ConnectionResetError):
+                    # Client went away (e.g. the task was cancelled)
+                    fake.record_abort()
+                    self.close_connection = True
+                    return
+            final = {"role": "assistant", "content": ""}
+            if "tool_calls" in message:
+                final["tool_calls"] = message["tool_calls"]
+            eval_duration = time.perf_counter() - start
+            self._write_chunk(
+                fake.final_chunk(
+                    model, final, len(tokens), prompt_tokens, load_duration, eval_duration
+                )
+            )
+            self.wfile.write(b"0\r\n\r\n")
+        else:
+            for _ in tokens:
+                fake.sleep_token()
+            eval_duration = time.perf_counter() - start
+            self._send_json(
+                fake.final_chunk(
+                    model,
+                    message,
+                    len(tokens),
+                    prompt_tokens,
+                    load_duration,
+                    eval_duration,
+                )
+            )
+
+    def _write_chunk(self, payload: dict):
+        data = (json.dumps(payload) + "\n").encode()
+        self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+        self.wfile.flush()
+
+
+class FakeOllamaServer:
+    """A scripted Ollama server on a background thread.
+
+    Usage:
+        scripts = {"Fix the bug": [ScriptedReply("Done <sindri:complete/>")]}
+        with FakeOllamaServer(scripts, token_latency=0.002) as server:
+            client = OllamaClient(host=server.host)
+    """
+
+    def __init__(
+        self,
+        scripts: Optional[dict[str, list[ScriptedReply]]] = None,
+        models: Optional[list[FakeModel]] = None,
+        token_latency: float = 0.0,
+        load_seconds: float = 0.0,
+        vram_gb: float = 16.0,
+        default_reply: Optional[ScriptedReply] = None,
+    ):
+        """Initialize the server (call start() to serve).
+
+        Args:
+            scripts: Replies per task description, in conversation order
+                (the last reply repeats once a script runs out)
+            models: Known models with sizes and load delays; unknown models
+                get defaults
+            token_latency: Seconds per generated token
+            load_seconds: Default load delay for models not in ``models``
+            vram_gb: VRAM for resident models; loading past it evicts the
+                least recently used model
+            default_reply: Reply for tasks without a script
+        """
+        self.scripts = scripts or {}
+        self.models = {m.name: m for m in (models or [])}
+        self.token_latency = token_latency
+        self.load_seconds = load_seconds
+        self.vram_gb = vram_gb
+        self.default_reply = default_reply or ScriptedReply(
+            "Done. <sindri:complete/>"
+        )
+        self.stats = FakeServerStats()
+        self.resident: dict[str, float] = {}  # model -> last used
+        self._lock = threading.Lock()
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), _FakeOllamaHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.fake = self
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def host(self) -> str:
+        """Base URL of the server."""
+        return f"http://127.0.0.1:{self.httpd.server_address[1]}"
+
+    def start(self) -> "FakeOllamaServer":
+        """Start serving on a background thread."""
+        self._thread.start()
+        log.info("fake_ollama_started", host=self.host)
+        return self
+
+    def stop(self):
+        """Stop serving and close the socket."""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self) -> "FakeOllamaServer":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    # ------------------------------------------------------------------
+    # Behaviour
+    # ------------------------------------------------------------------
+
+    def _model(self, name: str) -> FakeModel:
+        return self.models.get(name) or FakeModel(name, load_seconds=self.load_seconds)
+
+    def reply_for(self, messages: list[dict]) -> ScriptedReply:
+        """Pick the scripted reply for a conversation."""
+        task = None
+        for message in messages:
+            if message.get("role") == "system":
+                match = _TASK_RE.search(str(message.get("content", "")))
+                if match:
+                    task = match.group(1).strip()
+                    break
+
+        script = self.scripts.get(task) if task else None
+        if not script:
+            with self._lock:
+                self.stats.unscripted += 1
+            return self.default_reply
+
+        step = sum(1 for m in messages if m.get("role") == "assistant")
+        return script[min(step, len(script) - 1)]
+
+    def load(self, name: str) -> float:
+        """Make a model resident, evicting LRU models past the VRAM limit.
+
+        Returns:
+            Seconds spent loading (0.0 if already resident)
+        """
+        model = self._model(name)
+        with self._lock:
+            if name in self.resident:
+                self.resident[name] = time.monotonic()
+                return 0.0
+            used = sum(self._model(m).size_gb for m in self.resident)
+            while self.resident and used + model.size_gb > self.vram_gb:
+                victim = min(self.resident, key=self.resident.get)
+                del self.resident[victim]
+                used -= self._model(victim).size_gb
+                self.stats.evictions += 1
+            self.resident[name] = time.monotonic()
+            self.stats.loads += 1
+
+        if model.load_seconds > 0:
+            time.sleep(model.load_seconds)
+        with self._lock:
+            self.stats.load_time += model.load_seconds
+        return model.load_seconds
+
+    def sleep_token(self):
+        """Simulate the latency of one generated token."""
+        if self.token_latency > 0:
+            time.sleep(self.token_latency)
+            with self._lock:
+                self.stats.generation_time += self.token_latency
+
+    def record_request(self, stream: bool, tokens: int, prompt_tokens: int):
+        """Count a chat request."""
+        with self._lock:
+            self.stats.requests += 1
+            self.stats.streamed_requests += int(stream)
+            self.stats.tokens += tokens
+            self.stats.prompt_tokens += prompt_tokens
+
+    def record_abort(self):
+        """Count a stream the client closed early."""
+        with self._lock:
+            self.stats.aborted += 1
+
+    def final_chunk(
+        self,
+        model: str,
+        message: dict,
+        eval_count: int,
+        prompt_eval_count: int,
+        load_duration: float,
+        eval_duration: float,
+    ) -> dict:
+        """The final response with Ollama's token counts and timings."""
+        return {
+            "model": model,
+            "message": message,
+            "done": True,
+            "done_reason": "stop",
+            "prompt_eval_count": prompt_eval_count,
+            "eval_count": eval_count,
+            "load_duration": int(load_duration * NS_PER_SECOND),
+            "prompt_eval_duration": 0,
+            "eval_duration": int(eval_duration * NS_PER_SECOND),
+            "total_duration": int((load_duration + eval_duration) * NS_PER_SECOND),
+        }
+
+    def ps(self) -> list[dict]:
+        """Resident models as /api/ps reports them."""
+        with self._lock:
+            names = list(self.resident)
+        return [
+            {
+                "name": name,
+                "model": name,
+                "size": int(self._model(name).size_gb * 1024**3),
+                "size_vram": int(self._model(name).size_gb * 1024**3),
+            }
+            for name in names
+        ]
+
+    def tags(self) -> list[dict]:
+        """Known models as /api/tags reports them."""
+        return [
+            {"name": m.name, "model": m.name, "size": int(m.size_gb * 1024**3)}
+            for m in self.models.values()
+        ]
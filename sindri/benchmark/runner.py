@@ -0,0 +1,450 @@
+"""End-to-end orchestration benchmark against the fake Ollama server.
+
+Drives ``Orchestrator.run`` (and through it ``HierarchicalAgentLoop``) over
+scripted multi-agent scenarios and reports where the wall time went:
+
+- model time: simulated load and token latency on the fake server
+- scheduler idle: time when no task was running
+- per-component time: LLM calls, tools, persistence, delegation, scheduling
+- overhead: wall time with no LLM call in flight (Sindri's own cost)
+- events/sec emitted on the event bus
+"""
+
+import asyncio
+import functools
+import inspect
+import json
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional
+import structlog
+
+from sindri.agents.registry import AGENTS
+from sindri.benchmark.fake_ollama import FakeModel, FakeOllamaServer, ScriptedReply
+from sindri.benchmark.timeline import union_length
+from sindri.core.events import EventType
+from sindri.core.loop import LoopConfig
+from sindri.core.tasks import Task
+from sindri.llm.client import OllamaClient
+from sindri.persistence.database import Database
+
+log = structlog.get_logger()
+
+COMPLETE = "<sindri:complete/>"
+
+# Files every scenario workspace starts with
+WORKSPACE_FILES = {
+    "src/app.py": "def main():\n    return 'hello'\n",
+    "src/util.py": "def add(a, b):\n    return a + b\n",
+    "README.md": "# Bench project\n",
+}
+
+
+def _call(name: str, **arguments) -> dict:
+    return {"name": name, "arguments": arguments}
+
+
+def _delegate(agent: str, task: str) -> ScriptedReply:
+    return ScriptedReply(
+        f"Delegating to {agent}.", [_call("delegate", agent=agent, task=task)]
+    )
+
+
+def _done(summary: str) -> ScriptedReply:
+    return ScriptedReply(f"{summary} {COMPLETE}")
+
+
+@dataclass
+class BenchmarkScenario:
+    """A scripted multi-agent run."""
+
+    name: str
+    request: str  # Root task for Brokkr
+    scripts: dict[str, list[ScriptedReply]]
+    # Extra independent (agent, description) tasks scheduled alongside the
+    # root so the orchestrator runs them as parallel batches
+    extra_tasks: list[tuple[str, str]] = field(default_factory=list)
+    description: str = ""
+
+
+@dataclass
+class ComponentTiming:
+    """Time spent in one instrumented component."""
+
+    calls: int = 0
+    total: float = 0.0  # Sum of call durations (overlapping calls add up)
+    busy: float = 0.0  # Wall time with at least one call in flight
+
+    def to_dict(self) -> dict:
+        return {
+            "calls": self.calls,
+            "total": round(self.total, 4),
+            "busy": round(self.busy, 4),
+        }
+
+
+@dataclass
+class BenchmarkResult:
+    """Measurements for one scenario run."""
+
+    scenario: str
+    streaming: bool
+    parallel: bool
+    success: bool
+    wall_time: float
+    scheduler_idle: float
+    overhead: float  # Wall time with no LLM call in flight
+    events: int
+    components: dict[str, ComponentTiming]
+    server: dict[str, Any]
+    error: Optional[str] = None
+
+    @property
+    def events_per_second(self) -> float:
+        return self.events / self.wall_time if self.wall_time > 0 else 0.0
+
+    @property
+    def overhead_per_llm_call(self) -> float:
+        calls = self.components["llm"].calls if "llm" in self.components else 0
+        return self.overhead / calls if calls else 0.0
+
+    def to_dict(self) -> dict:
+        """Serialize for JSON reports."""
+        return {
+            "scenario": self.scenario,
+            "streaming": self.streaming,
+            "parallel": self.parallel,
+            "success": self.success,
+            "error": self.error,
+            "wall_time": round(self.wall_time, 4),
+            "scheduler_idle": round(self.scheduler_idle, 4),
+            "overhead": round(self.overhead, 4),
+            "overhead_per_llm_call": round(self.overhead_per_llm_call, 4),
+            "events": self.events,
+            "events_per_second": round(self.events_per_second, 1),
+            "components": {k: v.to_dict() for k, v in self.components.items()},
+            "server": self.server,
+        }
+
+
+class _Timeline:
+    """Records call intervals for instrumented methods, per component."""
+
+    def __init__(self):
+        self.intervals: dict[str, list[tuple[float, float]]] = {}
+
+    def instrument(self, obj: Any, method: str, component: str):
+        """Wrap ``obj.method`` (sync or async) to record its intervals."""
+        original = getattr(obj, method)
+        spans = self.intervals.setdefault(component, [])
+
+        if inspect.iscoroutinefunction(original):
+
+            @functools.wraps(original)
+            async def wrapper(*args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return await original(*args, **kwargs)
+                finally:
+                    spans.append((start, time.perf_counter()))
+
+        else:
+
+            @functools.wraps(original)
+            def wrapper(*args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return original(*args, **kwargs)
+                finally:
+                    spans.append((start, time.perf_counter()))
+
+        setattr(obj, method, wrapper)
+
+    def timing(self, component: str) -> ComponentTiming:
+        spans = self.intervals.get(component, [])
+        return ComponentTiming(
+            calls=len(spans),
+            total=sum(end - start for start, end in spans),
+            busy=union_length(spans),
+        )
+
+
+def default_scenarios() -> list[BenchmarkScenario]:
+    """Representative scenarios: single agent, delegation tree, parallel batch."""
+    single = BenchmarkScenario(
+        name="single_agent",
+        description="Brokkr reads, writes and completes without delegating",
+        request="Add a notes file for the app",
+        scripts={
+            "Add a notes file for the app": [
+                ScriptedReply(
+                    "Reading the code first.",
+                    [
+                        _call("read_file", path="src/app.py"),
+                        _call("list_directory", path="src"),
+                    ],
+                ),
+                ScriptedReply(
+                    "Writing notes.",
+                    [_call("write_file", path="NOTES.md", content="# Notes\n")],
+                ),
+                _done("Added NOTES.md."),
+            ]
+        },
+    )
+
+    implement = "Implement a subtract helper in src/util.py"
+    format_task = "Write a changelog entry for subtract"
+    review = "Review the subtract helper"
+    delegation = BenchmarkScenario(
+        name="delegation_tree",
+        description="Brokkr -> Huginn -> Ratatoskr, then Brokkr -> Mimir",
+        request="Add subtract support and review it",
+        scripts={
+            "Add subtract support and review it": [
+                _delegate("huginn", implement),
+                _delegate("mimir", review),
+                _done("Subtract implemented and reviewed."),
+            ],
+            implement: [
+                ScriptedReply(
+                    "Looking at util.",
+                    [_call("read_file", path="src/util.py")],
+                    inline_tools=True,
+                ),
+                ScriptedReply(
+                    "Adding subtract.",
+                    [
+                        _call(
+                            "write_file",
+                            path="src/util.py",
+                            content=(
+                                "def add(a, b):\n    return a + b\n\n\n"
+                                "def subtract(a, b):\n    return a - b\n"
+                            ),
+                        )
+                    ],
+                ),
+                _delegate("ratatoskr", format_task),
+                _done("subtract added."),
+            ],
+            format_task: [
+                ScriptedReply(
+                    "Writing changelog.",
+                    [_call("write_file", path="CHANGELOG.md", content="- subtract\n")],
+                ),
+                _done("Changelog written."),
+            ],
+            review: [
+                ScriptedReply("Reading.", [_call("read_file", path="src/util.py")]),
+                _done("Looks correct."),
+            ],
+        },
+    )
+
+    extra = [
+        ("huginn", "Summarize src/app.py"),
+        ("mimir", "Review src/util.py"),
+        ("ratatoskr", "Show the README"),
+    ]
+    parallel_scripts = {
+        "Check the project layout": [
+            ScriptedReply("Listing.", [_call("list_directory", path=".")]),
+            _done("Layout checked."),
+        ]
+    }
+    for _, task in extra:
+        path = task.split()[-1] if "/" in task else "README.md"
+        parallel_scripts[task] = [
+            ScriptedReply("Reading.", [_call("read_file", path=path)]),
+            _done(f"{task} done."),
+        ]
+    parallel = BenchmarkScenario(
+        name="parallel_batch",
+        description="Four independent agents scheduled as VRAM-limited batches",
+        request="Check the project layout",
+        scripts=parallel_scripts,
+        extra_tasks=extra,
+    )
+
+    return [single, delegation, parallel]
+
+
+def _fake_models() -> list[FakeModel]:
+    """Fake models for every agent model, sized by its VRAM estimate."""
+    models: dict[str, FakeModel] = {}
+    for agent in AGENTS.values():
+        models.setdefault(agent.model, FakeModel(agent.model, agent.estimated_vram_gb))
+    return list(models.values())
+
+
+async def run_scenario(
+    scenario: BenchmarkScenario,
+    streaming: bool = True,
+    parallel: bool = True,
+    token_latency: float = 0.001,
+    load_seconds: float = 0.05,
+    total_vram_gb: float = 16.0,
+    work_dir: Optional[Path] = None,
+) -> BenchmarkResult:
+    """Run one scenario end to end against a fresh fake server.
+
+    Args:
+        scenario: Scenario to run
+        streaming: Use streaming LLM calls
+        parallel: Run ready tasks as parallel batches
+        token_latency: Simulated seconds per token
+        load_seconds: Simulated model load time
+        total_vram_gb: VRAM for both the fake server and Sindri's budget
+        work_dir: Workspace directory (a temporary one if None)
+
+    Returns:
+        BenchmarkResult with timings
+    """
+    # Imported here so the fake server can be used without the full stack
+    from sindri.core.orchestrator import Orchestrator
+
+    with tempfile.TemporaryDirectory(prefix="sindri-bench-") as tmp:
+        workspace = work_dir or Path(tmp) / "workspace"
+        for rel, content in WORKSPACE_FILES.items():
+            path = workspace / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content)
+
+        models = _fake_models()
+        for model in models:
+            model.load_seconds = load_seconds
+        server = FakeOllamaServer(
+            scripts=scenario.scripts,
+            models=models,
+            token_latency=token_latency,
+            vram_gb=total_vram_gb,
+        ).start()
+
+        try:
+            orchestrator = Orchestrator(
+                client=OllamaClient(host=server.host),
+                config=LoopConfig(streaming=streaming),
+                total_vram_gb=total_vram_gb,
+                enable_memory=False,
+                work_dir=workspace,
+                database=Database(Path(tmp) / "bench.db"),
+            )
+            timeline = _instrument(orchestrator)
+
+            events = 0
+
+            def count(_data):
+                nonlocal events
+                events += 1
+
+            for event_type in EventType:
+                orchestrator.event_bus.subscribe(event_type, count)
+
+            for agent, description in scenario.extra_tasks:
+                orchestrator.scheduler.add_task(
+                    Task(description=description, assigned_agent=agent)
+                )
+
+            error = None
+            start = time.perf_counter()
+            try:
+                outcome = await orchestrator.run(scenario.request, parallel=parallel)
+                success = bool(outcome.get("success"))
+                error = outcome.get("error")
+            except Exception as e:
+                success = False
+                error = str(e)
+            wall_time = time.perf_counter() - start
+        finally:
+            server.stop()
+
+    components = {
+        name: timeline.timing(name)
+        for name in (
+            "llm",
+            "tools",
+            "persistence",
+            "delegation",
+            "scheduling",
+            "tasks",
+        )
+    }
+    result = BenchmarkResult(
+        scenario=scenario.name,
+        streaming=streaming,
+        parallel=parallel,
+        success=success,
+        wall_time=wall_time,
+        scheduler_idle=max(0.0, wall_time - components["tasks"].busy),
+        overhead=max(0.0, wall_time - components["llm"].busy),
+        events=events,
+        components=components,
+        server=server.stats.to_dict(),
+        error=error,
+    )
+    log.info(
+        "benchmark_scenario_complete",
+        scenario=scenario.name,
+        streaming=streaming,
+        success=success,
+        wall_time=round(wall_time, 3),
+    )
+    return result
+
+
+def _instrument(orchestrator) -> _Timeline:
+    """Attach interval recording to the orchestrator's components."""
+    timeline = _Timeline()
+    timeline.instrument(orchestrator.client, "chat", "llm")
+    timeline.instrument(orchestrator.client, "chat_stream", "llm")
+    for schema in orchestrator.tools.get_schemas():
+        tool = orchestrator.tools.get_tool(schema["function"]["name"])
+        timeline.instrument(tool, "execute", "tools")
+    for method in (
+        "create_session",
+        "load_session",
+        "save_session",
+        "complete_session",
+    ):
+        timeline.instrument(orchestrator.state, method, "persistence")
+    for method in ("delegate", "child_completed", "child_failed"):
+        timeline.instrument(orchestrator.delegation, method, "delegation")
+    for method in ("get_ready_batch", "get_next_task"):
+        timeline.instrument(orchestrator.scheduler, method, "scheduling")
+    timeline.instrument(orchestrator.loop, "run_task", "tasks")
+    return timeline
+
+
+async def run_suite(
+    scenarios: Optional[list[BenchmarkScenario]] = None,
+    streaming_modes: tuple[bool, ...] = (True, False),
+    **kwargs,
+) -> list[BenchmarkResult]:
+    """Run every scenario in each streaming mode.
+
+    Args:
+        scenarios: Scenarios to run (default_scenarios() if None)
+        streaming_modes: Streaming settings to run each scenario with
+        **kwargs: Passed to run_scenario()
+
+    Returns:
+        One result per scenario and mode
+    """
+    results = []
+    for scenario in scenarios or default_scenarios():
+        for streaming in streaming_modes:
+            results.append(await run_scenario(scenario, streaming=streaming, **kwargs))
+    return results
+
+
+def results_to_json(results: list[BenchmarkResult]) -> str:
+    """Serialize results for regression tracking."""
+    return json.dumps([r.to_dict() for r in results], indent=2)
+
+
+def main() -> None:  # pragma: no cover - convenience entry point
+    """Run the default suite and print JSON."""
+    print(results_to_json(asyncio.run(run_suite())))
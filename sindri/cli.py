@@ -28,6 +28,31 @@ structlog.configure(
 console = Console()
 
 
+async def _start_endpoint_pool(endpoints: tuple, vram_gb: float, sindri_config=None):
+    """Endpoint pool from --endpoint flags, else from ``[[ollama_endpoints]]``.
+
+    The pool is health-checked and its periodic checks started; stop them
+    with ``stop_health_checks()`` when done.
+
+    Returns:
+        The pool, or None when no endpoints are given (single local server)
+    """
+    from sindri.config import SindriConfig
+    from sindri.llm.pool import EndpointPool, OllamaEndpoint
+
+    if endpoints:
+        # Each endpoint gets the --vram-gb budget
+        pool = EndpointPool(
+            [OllamaEndpoint(host=h, total_vram_gb=vram_gb) for h in endpoints]
+        )
+    else:
+        pool = EndpointPool.from_config(sindri_config or SindriConfig.load())
+    if pool is not None:
+        await pool.check_health()
+        pool.start_health_checks()
+    return pool
+
+
 @click.group()
 @click.version_option(version="0.1.0")
 def cli():
@@ -84,8 +109,44 @@ def run(task: str, model: str, max_iter: int, work_dir: str = None):
 @click.option(
     "--work-dir", "-w", type=click.Path(), help="Working directory for file operations"
 )
+@click.option(
+    "--response-cache",
+    is_flag=True,
+    help="Cache deterministic LLM responses (summaries, temperature 0 calls)",
+)
+@click.option(
+    "--force-cache",
+    is_flag=True,
+    help="Also serve agent calls from the response cache (implies --response-cache)",
+)
+@click.option(
+    "--endpoint",
+    "endpoints",
+    multiple=True,
+    help="Ollama endpoint URL; repeat to load-balance across several servers "
+    "(default: [[ollama_endpoints]] from the config)",
+)
+@click.option(
+    "--distributed",
+    is_flag=True,
+    help="Queue tasks for `sindri worker` processes instead of running them here",
+)
+@click.option(
+    "--db",
+    type=click.Path(),
+    help="Database path (shared with workers when distributed)",
+)
 def orchestrate(
-    task: str, max_iter: int, vram_gb: float, no_memory: bool, work_dir: str = None
+    task: str,
+    max_iter: int,
+    vram_gb: float,
+    no_memory: bool,
+    work_dir: str = None,
+    response_cache: bool = False,
+    force_cache: bool = False,
+    endpoints: tuple = (),
+    distributed: bool = False,
+    db: str = None,
 ):
     """Run a task with hierarchical agents (Brokkr → Huginn/Mimir/Ratatoskr)."""
 
@@ -96,9 +157,13 @@ def orchestrate(
         console.print(f"[dim]Working directory: {work_dir}[/dim]")
 
     async def execute():
+        from sindri.config import SindriConfig
         from sindri.core.orchestrator import Orchestrator
         from sindri.core.loop import LoopConfig
+        from sindri.llm.cache import ResponseCache
+        from sindri.persistence.database import Database
 
+        sindri_config = SindriConfig.load()
         config = LoopConfig(max_iterations=max_iter)
         work_path = Path(work_dir).resolve() if work_dir else None
         enable_memory = not no_memory
@@ -107,15 +172,42 @@ def orchestrate(
         if enable_memory:
             console.print("[dim]📚 Memory system enabled[/dim]")
 
+        cache = ResponseCache.from_config(
+            sindri_config, enable=response_cache, force=force_cache
+        )
+        if cache is not None:
+            console.print("[dim]💾 Response cache enabled[/dim]")
+
+        pool = await _start_endpoint_pool(endpoints, vram_gb, sindri_config)
+        if pool is not None:
+            count = len(pool.endpoints)
+            console.print(f"[dim]🖧 Load balancing across {count} endpoints[/dim]")
+
+        database = Database(Path(db)) if db else None
+        task_queue = None
+        if distributed:
+            from sindri.distributed import SQLiteTaskQueue
+
+            task_queue = SQLiteTaskQueue(database)
+            console.print("[dim]🖧 Distributed: tasks run on `sindri worker`[/dim]")
+
         orchestrator = Orchestrator(
             config=config,
             total_vram_gb=vram_gb,
             enable_memory=enable_memory,
             work_dir=work_path,
+            response_cache=cache,
+            endpoint_pool=pool,
+            database=database,
+            task_queue=task_queue,
         )
 
-        with console.status("[bold green]Orchestrating..."):
-            result = await orchestrator.run(task)
+        try:
+            with console.status("[bold green]Orchestrating..."):
+                result = await orchestrator.run(task)
+        finally:
+            if pool is not None:
+                await pool.stop_health_checks()
 
         if result["success"]:
             console.print("[green]✓ Completed successfully[/]")
@@ -132,22 +224,116 @@ def orchestrate(
     asyncio.run(execute())
 
 
+@cli.command()
+@click.option("--worker-id", help="Name shown in leases (default: host-pid)")
+@click.option("--max-iter", default=30, help="Maximum iterations per agent")
+@click.option("--vram-gb", default=16.0, help="VRAM on this worker's GPU in GB")
+@click.option(
+    "--endpoint",
+    "endpoints",
+    multiple=True,
+    help="Ollama endpoint URL for this worker; repeat to load-balance "
+    "(default: [[ollama_endpoints]] from the config)",
+)
+@click.option(
+    "--model",
+    "models",
+    multiple=True,
+    help="Only lease tasks for this model; repeat for several (default: any)",
+)
+@click.option("--lease-seconds", default=30.0, help="Lease length before re-queueing")
+@click.option("--max-tasks", type=int, help="Exit after running this many tasks")
+@click.option("--no-memory", is_flag=True, help="Disable memory system")
+@click.option(
+    "--work-dir", "-w", type=click.Path(), help="Working directory for file operations"
+)
+@click.option("--db", type=click.Path(), help="Database shared with the coordinator")
+def worker(
+    worker_id: str,
+    max_iter: int,
+    vram_gb: float,
+    endpoints: tuple,
+    models: tuple,
+    lease_seconds: float,
+    max_tasks: int,
+    no_memory: bool,
+    work_dir: str = None,
+    db: str = None,
+):
+    """Run tasks queued by `sindri orchestrate --distributed`."""
+
+    from pathlib import Path
+
+    async def execute_worker():
+        from sindri.core.orchestrator import Orchestrator
+        from sindri.core.loop import LoopConfig
+        from sindri.distributed import SQLiteTaskQueue, Worker
+        from sindri.persistence.database import Database
+
+        database = Database(Path(db)) if db else Database()
+
+        pool = await _start_endpoint_pool(endpoints, vram_gb)
+
+        # The orchestrator only supplies a wired-up agent loop; the worker
+        # drives it one leased task at a time
+        orchestrator = Orchestrator(
+            config=LoopConfig(max_iterations=max_iter),
+            total_vram_gb=vram_gb,
+            enable_memory=not no_memory,
+            work_dir=Path(work_dir).resolve() if work_dir else None,
+            endpoint_pool=pool,
+            database=database,
+        )
+        runner = Worker(
+            SQLiteTaskQueue(database),
+            orchestrator.loop,
+            worker_id=worker_id,
+            lease_seconds=lease_seconds,
+            models=set(models) or None,
+        )
+
+        console.print(f"[bold blue]Worker {runner.worker_id}[/] waiting for tasks")
+        if models:
+            console.print(f"[dim]Models: {', '.join(models)}[/dim]")
+        try:
+            count = await runner.run(max_tasks=max_tasks)
+        finally:
+            if pool is not None:
+                await pool.stop_health_checks()
+        console.print(f"[green]✓ Ran {count} task(s)[/]")
+
+    try:
+        asyncio.run(execute_worker())
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Worker stopped[/yellow]")
+
+
 @cli.command()
 @click.argument("session_id")
 @click.option("--max-iter", default=30, help="Maximum iterations per agent")
 @click.option("--vram-gb", default=16.0, help="Total VRAM in GB")
 def resume(session_id: str, max_iter: int, vram_gb: float):
-    """Resume an interrupted session."""
+    """Resume an interrupted orchestration (by task ID) or session.
+
+    Given a task ID printed by `sindri orchestrate`, rebuilds the saved
+    task tree and runs only the work left unfinished.
+    """
 
     async def execute_resume():
         from sindri.core.orchestrator import Orchestrator
         from sindri.core.tasks import Task
         from sindri.core.loop import LoopConfig
         from sindri.persistence.state import SessionState
+        from sindri.persistence.task_graph import TaskGraphStore
 
         # Load the session to verify it exists
         state = SessionState()
 
+        # A task ID resumes its whole orchestration
+        if await TaskGraphStore(state.db).find_root(session_id):
+            await resume_orchestration(session_id, max_iter, vram_gb)
+            return
+
         # If session_id is short (8 chars), search for matching full ID
         full_session_id = session_id
         if len(session_id) == 8:
@@ -237,6 +423,46 @@ def resume(session_id: str, max_iter: int, vram_gb: float):
     asyncio.run(execute_resume())
 
 
+async def resume_orchestration(task_id: str, max_iter: int, vram_gb: float):
+    """Continue an orchestration from its saved task tree."""
+    from sindri.core.orchestrator import Orchestrator
+    from sindri.core.loop import LoopConfig
+    from sindri.persistence.task_graph import TaskGraphStore
+
+    tasks = await TaskGraphStore().load(task_id)
+    done = sum(1 for t in tasks if t.status.value == "complete")
+    console.print(
+        Panel(
+            f"[bold blue]Task:[/] {tasks[0].id}\n"
+            f"[dim]Request:[/] {tasks[0].description[:60]}\n"
+            f"[dim]Tasks:[/] {done}/{len(tasks)} complete",
+            title="🔨 Resuming Sindri Orchestration",
+        )
+    )
+
+    pool = await _start_endpoint_pool((), vram_gb)
+    orchestrator = Orchestrator(
+        config=LoopConfig(max_iterations=max_iter),
+        total_vram_gb=vram_gb,
+        endpoint_pool=pool,
+    )
+    try:
+        with console.status("[bold green]Resuming..."):
+            result = await orchestrator.resume(task_id)
+    finally:
+        if pool is not None:
+            await pool.stop_health_checks()
+
+    if result["success"]:
+        console.print("[green]✓ Completed successfully[/]")
+        console.print(f"Subtasks: {result.get('subtasks', 0)}")
+        if result.get("result"):
+            console.print(f"\n[dim]{result['result']}[/]")
+    else:
+        console.print(f"[red]✗ Failed: {result.get('error', 'Unknown error')}[/]")
+        console.print(f"Status: {result.get('status', 'unknown')}")
+
+
 @cli.command()
 def agents():
     """List all available agents."""
@@ -367,6 +593,32 @@ def metrics(
     from rich.table import Table
     from sindri.persistence.metrics import MetricsStore
 
+    def print_throughput(breakdown: dict):
+        """Print tokens/sec and time shares per model and agent."""
+        if not breakdown["overall"]["tokens_generated"]:
+            console.print("[dim]  No token stats recorded[/dim]")
+            return
+
+        for group, label in (("by_model", "Model"), ("by_agent", "Agent")):
+            table = Table()
+            table.add_column(label)
+            table.add_column("Prompt Tok", justify="right")
+            table.add_column("Gen Tok", justify="right")
+            table.add_column("Tok/s", justify="right")
+            table.add_column("Prompt Eval", justify="right")
+            table.add_column("Load", justify="right")
+
+            for name, data in sorted(breakdown[group].items()):
+                table.add_row(
+                    name,
+                    str(data["prompt_tokens"]),
+                    str(data["tokens_generated"]),
+                    f"{data['tokens_per_second']:.1f}",
+                    f"{data['prompt_eval_share'] * 100:.0f}%",
+                    f"{data['load_share'] * 100:.0f}%",
+                )
+            console.print(table)
+
     async def show_metrics():
         store = MetricsStore()
 
@@ -408,6 +660,10 @@ def metrics(
             table.add_row("Total Tool Calls", str(stats["total_tool_executions"]))
 
             console.print(table)
+            console.print()
+
+            console.print("[bold]⚡ Throughput (recent sessions):[/]")
+            print_throughput(await store.get_throughput_stats())
             return
 
         if session_id:
@@ -471,6 +727,22 @@ def metrics(
             console.print(time_table)
             console.print()
 
+            # Token throughput reported by Ollama
+            throughput = summary["throughput"]
+            console.print("[bold]⚡ Throughput:[/]")
+            console.print(
+                f"  Tokens: {throughput['prompt_tokens']} prompt, "
+                f"{throughput['tokens_generated']} generated"
+            )
+            console.print(f"  Tokens/sec: {throughput['tokens_per_second']:.1f}")
+            console.print(
+                f"  Prompt Eval Share: {throughput['prompt_eval_share'] * 100:.0f}%"
+            )
+            console.print(f"  Load Share: {throughput['load_share'] * 100:.0f}%")
+            if throughput["tokens_generated"]:
+                print_throughput(metrics.get_throughput_breakdown())
+            console.print()
+
             # Iteration summary
             console.print("[bold]🔄 Iterations:[/]")
             console.print(f"  Total: {summary['total_iterations']}")
@@ -565,6 +837,224 @@ def metrics(
     asyncio.run(show_metrics())
 
 
+@cli.command()
+@click.option(
+    "--scenario",
+    "-s",
+    multiple=True,
+    help="Scenario to run (repeatable, default: all)",
+)
+@click.option(
+    "--streaming/--no-streaming",
+    default=None,
+    help="Only run with streaming on or off (default: both)",
+)
+@click.option("--sequential", is_flag=True, help="Disable parallel batches")
+@click.option(
+    "--token-latency", default=0.001, help="Simulated seconds per generated token"
+)
+@click.option("--load-seconds", default=0.05, help="Simulated model load time")
+@click.option("--json", "as_json", is_flag=True, help="Output results as JSON")
+def benchmark(
+    scenario: tuple[str, ...],
+    streaming: bool,
+    sequential: bool,
+    token_latency: float,
+    load_seconds: float,
+    as_json: bool,
+):
+    """Benchmark orchestration overhead against a fake Ollama server.
+
+    Runs scripted multi-agent scenarios through the real orchestrator with
+    simulated model latency, and reports wall time, scheduler idle time,
+    per-component time and events/sec. No GPU or Ollama needed.
+
+    Examples:
+
+        sindri benchmark
+
+        sindri benchmark -s delegation_tree --no-streaming
+
+        sindri benchmark --json > bench.json
+    """
+    from rich.table import Table
+    from sindri.benchmark.runner import default_scenarios, results_to_json, run_suite
+
+    scenarios = default_scenarios()
+    if scenario:
+        known = {s.name for s in scenarios}
+        unknown = set(scenario) - known
+        if unknown:
+            console.print(f"[red]✗ Unknown scenario(s): {', '.join(sorted(unknown))}[/]")
+            console.print(f"[dim]Available: {', '.join(sorted(known))}[/dim]")
+            return
+        scenarios = [s for s in scenarios if s.name in scenario]
+
+    modes = (True, False) if streaming is None else (streaming,)
+    results = asyncio.run(
+        run_suite(
+            scenarios,
+            streaming_modes=modes,
+            parallel=not sequential,
+            token_latency=token_latency,
+            load_seconds=load_seconds,
+        )
+    )
+
+    if as_json:
+        click.echo(results_to_json(results))
+        return
+
+    table = Table(title="Orchestration Benchmark")
+    table.add_column("Scenario")
+    table.add_column("Stream")
+    table.add_column("Wall", justify="right")
+    table.add_column("Model", justify="right")
+    table.add_column("Idle", justify="right")
+    table.add_column("Overhead", justify="right")
+    table.add_column("Persist", justify="right")
+    table.add_column("Tools", justify="right")
+    table.add_column("Events/s", justify="right")
+    table.add_column("OK")
+
+    for r in results:
+        table.add_row(
+            r.scenario,
+            "on" if r.streaming else "off",
+            f"{r.wall_time:.3f}s",
+            f"{r.server['load_time'] + r.server['generation_time']:.3f}s",
+            f"{r.scheduler_idle:.3f}s",
+            f"{r.overhead:.3f}s",
+            f"{r.components['persistence'].busy:.3f}s",
+            f"{r.components['tools'].busy:.3f}s",
+            f"{r.events_per_second:.0f}",
+            "[green]✓[/]" if r.success else f"[red]✗ {r.error or ''}[/]",
+        )
+
+    console.print(table)
+    console.print(
+        "[dim]Model = simulated load + token time; Overhead = wall time with "
+        "no LLM call in flight; Idle = no task running[/dim]"
+    )
+
+
+@cli.command()
+@click.option(
+    "--workload",
+    "-f",
+    type=click.Path(exists=True),
+    help="Workload JSON (default: a synthetic DAG)",
+)
+@click.option(
+    "--from-metrics", is_flag=True, help="Replay task durations from recorded sessions"
+)
+@click.option("--tasks", "num_tasks", default=30, help="Tasks in the synthetic DAG")
+@click.option("--seed", default=0, help="Random seed for workload and durations")
+@click.option("--vram-gb", default=16.0, help="Total VRAM in GB")
+@click.option("--keep-warm", multiple=True, help="Model never to evict (repeatable)")
+@click.option("--sequential", is_flag=True, help="Also simulate sequential dispatch")
+@click.option("--json", "as_json", is_flag=True, help="Output results as JSON")
+def simulate(
+    workload: str,
+    from_metrics: bool,
+    num_tasks: int,
+    seed: int,
+    vram_gb: float,
+    keep_warm: tuple[str, ...],
+    sequential: bool,
+    as_json: bool,
+):
+    """Simulate scheduling of a task DAG on a virtual clock.
+
+    Runs the real scheduler, model manager and dispatch loop with model
+    loads and task runs replaced by virtual waits, so hours of work take
+    a fraction of a second. Reports makespan, GPU idle time, VRAM use,
+    model swaps and queueing delay. No GPU or Ollama needed.
+
+    Examples:
+
+        sindri simulate --tasks 50 --seed 3
+
+        sindri simulate -f workload.json --sequential
+
+        sindri simulate --from-metrics --json > sim.json
+    """
+    import json
+
+    from rich.table import Table
+    from sindri.benchmark.simulator import (
+        SimulationConfig,
+        Workload,
+        run_simulation,
+        synthetic_workload,
+    )
+
+    if workload:
+        dag = Workload.from_json(workload)
+    elif from_metrics:
+        from sindri.persistence.metrics import MetricsStore
+
+        history = asyncio.run(MetricsStore().get_task_durations())
+        dag = Workload.from_history(history)
+        if not dag.tasks:
+            console.print("[yellow]No recorded task durations found[/]")
+            return
+    else:
+        dag = synthetic_workload(num_tasks, seed=seed)
+
+    modes = [True, False] if sequential else [True]
+    try:
+        results = [
+            run_simulation(
+                dag,
+                SimulationConfig(
+                    total_vram_gb=vram_gb,
+                    parallel=parallel,
+                    keep_warm=list(keep_warm),
+                    seed=seed,
+                ),
+            )
+            for parallel in modes
+        ]
+    except ValueError as e:
+        console.print(f"[red]✗ Invalid workload: {e}[/]")
+        return
+
+    if as_json:
+        click.echo(json.dumps([r.to_dict() for r in results], indent=2))
+        return
+
+    table = Table(title=f"Scheduling Simulation: {dag.name} ({len(dag.tasks)} tasks)")
+    table.add_column("Dispatch")
+    table.add_column("Makespan", justify="right")
+    table.add_column("GPU Idle", justify="right")
+    table.add_column("VRAM Used", justify="right")
+    table.add_column("Loads", justify="right")
+    table.add_column("Swaps", justify="right")
+    table.add_column("Mean Wait", justify="right")
+    table.add_column("Max Wait", justify="right")
+    table.add_column("OK")
+
+    for parallel, r in zip(modes, results):
+        table.add_row(
+            "parallel" if parallel else "sequential",
+            f"{r.makespan:.1f}s",
+            f"{r.gpu_idle_fraction:.1%}",
+            f"{r.vram_utilization:.1%}",
+            str(r.model_loads),
+            str(r.model_swaps),
+            f"{r.mean_queueing_delay:.1f}s",
+            f"{r.max_queueing_delay:.1f}s",
+            "[green]✓[/]" if r.success else f"[red]✗ {r.error or ''}[/]",
+        )
+
+    console.print(table)
+    console.print(
+        "[dim]Times are virtual seconds; Wait = ready to dispatched; "
+        "Swaps = evictions to load another model[/dim]"
+    )
+
+
 @cli.command()
 @click.argument("session_id")
 @click.argument("output", required=False, type=click.Path())
@@ -663,13 +1153,24 @@ def tui(task: str = None, no_memory: bool = False, work_dir: str = None):
     from sindri.tui.app import run_tui
     from sindri.core.orchestrator import Orchestrator
     from sindri.core.events import EventBus
+    from sindri.core.loop import LoopConfig
+    from sindri.config import SindriConfig
+    from sindri.llm.pool import EndpointPool
 
     try:
         # Create shared event bus for TUI and orchestrator
         event_bus = EventBus()
         work_path = Path(work_dir).resolve() if work_dir else None
+        # Flush streamed token frames at the TUI refresh rate
+        sindri_config = SindriConfig.load()
+        config = LoopConfig(stream_frame_ms=sindri_config.tui.refresh_rate_ms)
         orchestrator = Orchestrator(
-            enable_memory=not no_memory, event_bus=event_bus, work_dir=work_path
+            config=config,
+            enable_memory=not no_memory,
+            event_bus=event_bus,
+            work_dir=work_path,
+            # Health checks run in the TUI's event loop (see SindriApp)
+            endpoint_pool=EndpointPool.from_config(sindri_config),
         )
         run_tui(task=task, orchestrator=orchestrator, event_bus=event_bus)
     except Exception as e:
@@ -5630,8 +6131,18 @@ def validate_api_spec(file_path: str):
     "--work-dir", "-w", type=click.Path(), help="Working directory for file operations"
 )
 @click.option("--reload", is_flag=True, help="Enable auto-reload for development")
+@click.option("--max-running", default=2, help="Tasks run at once; the rest are queued")
+@click.option(
+    "--max-queued", default=50, help="Queued tasks before new ones get HTTP 429"
+)
 def web(
-    host: str, port: int, vram_gb: float, work_dir: str = None, reload: bool = False
+    host: str,
+    port: int,
+    vram_gb: float,
+    work_dir: str = None,
+    reload: bool = False,
+    max_running: int = 2,
+    max_queued: int = 50,
 ):
     """Start the Sindri Web API server.
 
@@ -5639,6 +6150,7 @@ def web(
     - REST endpoints for agents, sessions, tasks, metrics
     - WebSocket for real-time event streaming
     - CORS support for frontend access
+    - Task admission control with a fair, persistent queue
 
     Example:
         sindri web --port 8080
@@ -5660,7 +6172,8 @@ def web(
             f"[bold blue]Sindri Web API[/bold blue]\n\n"
             f"Host: {host}\n"
             f"Port: {port}\n"
-            f"VRAM: {vram_gb}GB",
+            f"VRAM: {vram_gb}GB\n"
+            f"Tasks: {max_running} running, up to {max_queued} queued",
             title="🌐 Starting Server",
         )
     )
@@ -5685,7 +6198,12 @@ def web(
         )
     else:
         # Production mode
-        app = create_app(vram_gb=vram_gb, work_dir=work_path)
+        app = create_app(
+            vram_gb=vram_gb,
+            work_dir=work_path,
+            max_running=max_running,
+            max_queued=max_queued,
+        )
         uvicorn.run(app, host=host, port=port, log_level="info")
 
 
@@ -6590,10 +7108,13 @@ def finetune_evaluate(model_name: str, quick: bool, timeout: float):
         sindri finetune evaluate qwen2.5-coder:7b --quick
     """
     from rich.table import Table
+    from sindri.config import SindriConfig
     from sindri.finetuning.evaluator import ModelEvaluator, BenchmarkSuite
+    from sindri.llm.cache import ResponseCache
 
     async def run():
-        evaluator = ModelEvaluator()
+        cache = ResponseCache.from_config(SindriConfig.load())
+        evaluator = ModelEvaluator(response_cache=cache)
 
         console.print(f"[bold]Evaluating model: {model_name}[/bold]\n")
 
@@ -6666,10 +7187,13 @@ def finetune_compare(model_a: str, model_b: str, quick: bool):
 
         sindri finetune compare base-model finetuned-model --quick
     """
+    from sindri.config import SindriConfig
     from sindri.finetuning.evaluator import ModelEvaluator, BenchmarkSuite
+    from sindri.llm.cache import ResponseCache
 
     async def run():
-        evaluator = ModelEvaluator()
+        cache = ResponseCache.from_config(SindriConfig.load())
+        evaluator = ModelEvaluator(response_cache=cache)
 
         console.print(f"[bold]Comparing models:[/bold]")
         console.print(f"  Model A: {model_a}")
@@ -133,6 +133,8 @@ class ActivityStore:
 
     async def _ensure_tables(self) -> None:
         """Ensure activity_feed table exists."""
+        if self.db.is_schema_ready("activity"):
+            return
         await self.db.initialize()
         async with self.db.get_connection() as conn:
             # Activity feed table
@@ -169,6 +171,7 @@ class ActivityStore:
             """)
 
             await conn.commit()
+        self.db.mark_schema_ready("activity")
 
         log.debug("Activity feed tables initialized")
 
@@ -209,26 +212,25 @@ class ActivityStore:
             metadata=metadata or {},
         )
 
-        async with self.db.get_connection() as conn:
-            await conn.execute(
-                """
-                INSERT INTO activity_feed
-                (id, team_id, actor_id, type, target_id, target_type, message, metadata, created_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    activity.id,
-                    activity.team_id,
-                    activity.actor_id,
-                    activity.type.value,
-                    activity.target_id,
-                    activity.target_type.value if activity.target_type else None,
-                    activity.message,
-                    json.dumps(activity.metadata),
-                    activity.created_at.isoformat(),
-                ),
-            )
-            await conn.commit()
+        self.db.write_behind(
+            "activity_feed",
+            """
+            INSERT INTO activity_feed
+            (id, team_id, actor_id, type, target_id, target_type, message, metadata, created_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                activity.id,
+                activity.team_id,
+                activity.actor_id,
+                activity.type.value,
+                activity.target_id,
+                activity.target_type.value if activity.target_type else None,
+                activity.message,
+                json.dumps(activity.metadata),
+                activity.created_at.isoformat(),
+            ),
+        )
 
         log.info(
             "Activity created",
@@ -249,7 +251,8 @@ class ActivityStore:
         """
         await self._ensure_tables()
 
-        async with self.db.get_connection() as conn:
+        await self.db.flush_writes("activity_feed")
+        async with self.db.get_connection(read_only=True) as conn:
             async with conn.execute(
                 "SELECT * FROM activity_feed WHERE id = ?",
                 (activity_id,),
@@ -304,7 +307,8 @@ class ActivityStore:
         query += " ORDER BY created_at DESC LIMIT ? OFFSET ?"
         params.extend([limit, offset])
 
-        async with self.db.get_connection() as conn:
+        await self.db.flush_writes("activity_feed")
+        async with self.db.get_connection(read_only=True) as conn:
             async with conn.execute(query, tuple(params)) as cursor:
                 rows = await cursor.fetchall()
 
@@ -328,7 +332,8 @@ class ActivityStore:
         """
         await self._ensure_tables()
 
-        async with self.db.get_connection() as conn:
+        await self.db.flush_writes("activity_feed")
+        async with self.db.get_connection(read_only=True) as conn:
             async with conn.execute(
                 """
                 SELECT * FROM activity_feed
@@ -360,7 +365,8 @@ class ActivityStore:
         """
         await self._ensure_tables()
 
-        async with self.db.get_connection() as conn:
+        await self.db.flush_writes("activity_feed")
+        async with self.db.get_connection(read_only=True) as conn:
             if target_type:
                 async with conn.execute(
                     """
@@ -429,7 +435,8 @@ class ActivityStore:
         """
         await self._ensure_tables()
 
-        async with self.db.get_connection() as conn:
+        await self.db.flush_writes("activity_feed")
+        async with self.db.get_connection(read_only=True) as conn:
             async with conn.execute(
                 "SELECT COUNT(*) FROM activity_feed WHERE team_id = ?",
                 (team_id,),
@@ -449,7 +456,8 @@ class ActivityStore:
         """
         await self._ensure_tables()
 
-        async with self.db.get_connection() as conn:
+        await self.db.flush_writes("activity_feed")
+        async with self.db.get_connection(read_only=True) as conn:
             # Total count
             if team_id:
                 async with conn.execute(
@@ -332,6 +332,8 @@ class APIKeyStore:
 
     async def _ensure_tables(self) -> None:
         """Ensure API key tables exist."""
+        if self.db.is_schema_ready("api_keys"):
+            return
         await self.db.initialize()
         async with self.db.get_connection() as conn:
             # Main API keys table
@@ -398,6 +400,7 @@ class APIKeyStore:
             """)
 
             await conn.commit()
+        self.db.mark_schema_ready("api_keys")
 
     async def create_key(
         self,
@@ -516,7 +519,8 @@ class APIKeyStore:
 
         key_hash = hash_api_key(key)
 
-        async with self.db.get_connection() as conn:
+        await self.db.flush_writes("api_keys")
+        async with self.db.get_connection(read_only=True) as conn:
             cursor = await conn.execute(
                 "SELECT * FROM api_keys WHERE key_hash = ?",
                 (key_hash,),
@@ -575,7 +579,7 @@ class APIKeyStore:
         """
         one_minute_ago = (datetime.now() - timedelta(minutes=1)).isoformat()
 
-        async with self.db.get_connection() as conn:
+        async with self.db.get_connection(read_only=True) as conn:
             cursor = await conn.execute(
                 """
                 SELECT COUNT(*) FROM api_key_usage
@@ -586,6 +590,8 @@ class APIKeyStore:
             row = await cursor.fetchone()
             count = row[0] if row else 0
 
+        # Queued usage rows are all from within the last minute
+        count += self.db.pending_writes("api_key_usage", key=key_id)
         return count < limit
 
     async def _update_usage(self, key_id: str, ip_address: Optional[str]) -> None:
@@ -598,25 +604,27 @@ class APIKeyStore:
         now = datetime.now()
         record_id = secrets.token_hex(16)
 
-        async with self.db.get_connection() as conn:
-            # Update key stats
-            await conn.execute(
-                """
-                UPDATE api_keys
-                SET last_used_at = ?, last_used_ip = ?, use_count = use_count + 1
-                WHERE id = ?
-                """,
-                (now.isoformat(), ip_address, key_id),
-            )
-            # Insert minimal usage record for rate limiting
-            await conn.execute(
-                """
-                INSERT INTO api_key_usage (id, key_id, timestamp, ip_address, endpoint)
-                VALUES (?, ?, ?, ?, ?)
-                """,
-                (record_id, key_id, now.isoformat(), ip_address, "_internal"),
-            )
-            await conn.commit()
+        # Queued rather than committed per request; the rate limit check
+        # counts queued usage rows too
+        self.db.write_behind(
+            "api_keys",
+            """
+            UPDATE api_keys
+            SET last_used_at = ?, last_used_ip = ?, use_count = use_count + 1
+            WHERE id = ?
+            """,
+            (now.isoformat(), ip_address, key_id),
+        )
+        # Minimal usage record for rate limiting
+        self.db.write_behind(
+            "api_key_usage",
+            """
+            INSERT INTO api_key_usage (id, key_id, timestamp, ip_address, endpoint)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            (record_id, key_id, now.isoformat(), ip_address, "_internal"),
+            key=key_id,
+        )
 
     async def record_usage(
         self,
@@ -643,27 +651,27 @@ class APIKeyStore:
 
         record_id = secrets.token_hex(16)
 
-        async with self.db.get_connection() as conn:
-            await conn.execute(
-                """
-                INSERT INTO api_key_usage (
-                    id, key_id, timestamp, ip_address, endpoint,
-                    method, status_code, user_agent, duration_ms
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    record_id,
-                    key_id,
-                    datetime.now().isoformat(),
-                    ip_address,
-                    endpoint,
-                    method,
-                    status_code,
-                    user_agent,
-                    duration_ms,
-                ),
-            )
-            await conn.commit()
+        self.db.write_behind(
+            "api_key_usage",
+            """
+            INSERT INTO api_key_usage (
+                id, key_id, timestamp, ip_address, endpoint,
+                method, status_code, user_agent, duration_ms
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                record_id,
+                key_id,
+                datetime.now().isoformat(),
+                ip_address,
+                endpoint,
+                method,
+                status_code,
+                user_agent,
+                duration_ms,
+            ),
+            key=key_id,
+        )
 
     async def get_key(self, key_id: str) -> Optional[APIKey]:
         """Get an API key by ID.
@@ -676,7 +684,8 @@ class APIKeyStore:
         """
         await self._ensure_tables()
 
-        async with self.db.get_connection() as conn:
+        await self.db.flush_writes("api_keys")
+        async with self.db.get_connection(read_only=True) as conn:
             cursor = await conn.execute(
                 "SELECT * FROM api_keys WHERE id = ?",
                 (key_id,),
@@ -726,7 +735,8 @@ class APIKeyStore:
 
         where_clause = " AND ".join(conditions) if conditions else "1=1"
 
-        async with self.db.get_connection() as conn:
+        await self.db.flush_writes("api_keys")
+        async with self.db.get_connection(read_only=True) as conn:
             cursor = await conn.execute(
                 f"""
                 SELECT * FROM api_keys
@@ -883,7 +893,8 @@ class APIKeyStore:
 
         start_date = (datetime.now() - timedelta(days=days)).isoformat()
 
-        async with self.db.get_connection() as conn:
+        await self.db.flush_writes("api_key_usage")
+        async with self.db.get_connection(read_only=True) as conn:
             # Total requests
             cursor = await conn.execute(
                 """
@@ -968,7 +979,8 @@ class APIKeyStore:
         """
         await self._ensure_tables()
 
-        async with self.db.get_connection() as conn:
+        await self.db.flush_writes("api_key_usage", "api_keys")
+        async with self.db.get_connection(read_only=True) as conn:
             # Total keys
             cursor = await conn.execute(
                 """
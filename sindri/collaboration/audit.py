@@ -257,6 +257,8 @@ class AuditStore:
 
     async def _ensure_tables(self) -> None:
         """Ensure audit log tables exist."""
+        if self.db.is_schema_ready("audit"):
+            return
         await self.db.initialize()
         async with self.db.get_connection() as conn:
             await conn.execute("""
@@ -313,6 +315,7 @@ class AuditStore:
             """)
 
             await conn.commit()
+        self.db.mark_schema_ready("audit")
 
     async def log(
         self,
@@ -379,38 +382,39 @@ class AuditStore:
             duration_ms=duration_ms,
         )
 
-        async with self.db.get_connection() as conn:
-            await conn.execute(
-                """
-                INSERT INTO audit_logs (
-                    id, timestamp, category, action, severity, outcome,
-                    actor_id, actor_type, target_type, target_id,
-                    ip_address, user_agent, details, metadata,
-                    team_id, session_id, request_id, duration_ms
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    entry.id,
-                    entry.timestamp.isoformat(),
-                    entry.category.value,
-                    entry.action.value,
-                    entry.severity.value,
-                    entry.outcome.value,
-                    entry.actor_id,
-                    entry.actor_type,
-                    entry.target_type,
-                    entry.target_id,
-                    entry.ip_address,
-                    entry.user_agent,
-                    entry.details,
-                    json.dumps(entry.metadata),
-                    entry.team_id,
-                    entry.session_id,
-                    entry.request_id,
-                    entry.duration_ms,
-                ),
-            )
-            await conn.commit()
+        # Batched with other entries; the queue is drained before the next
+        # query or write through the shared writer connection
+        self.db.write_behind(
+            "audit_logs",
+            """
+            INSERT INTO audit_logs (
+                id, timestamp, category, action, severity, outcome,
+                actor_id, actor_type, target_type, target_id,
+                ip_address, user_agent, details, metadata,
+                team_id, session_id, request_id, duration_ms
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                entry.id,
+                entry.timestamp.isoformat(),
+                entry.category.value,
+                entry.action.value,
+                entry.severity.value,
+                entry.outcome.value,
+                entry.actor_id,
+                entry.actor_type,
+                entry.target_type,
+                entry.target_id,
+                entry.ip_address,
+                entry.user_agent,
+                entry.details,
+                json.dumps(entry.metadata),
+                entry.team_id,
+                entry.session_id,
+                entry.request_id,
+                entry.duration_ms,
+            ),
+        )
 
         # Log for structlog as well (for real-time monitoring)
         log.info(
@@ -438,7 +442,8 @@ class AuditStore:
         """
         await self._ensure_tables()
 
-        async with self.db.get_connection() as conn:
+        await self.db.flush_writes("audit_logs")
+        async with self.db.get_connection(read_only=True) as conn:
             cursor = await conn.execute(
                 "SELECT * FROM audit_logs WHERE id = ?",
                 (entry_id,),
@@ -553,7 +558,8 @@ class AuditStore:
         sql += " ORDER BY timestamp DESC LIMIT ? OFFSET ?"
         params.extend([query.limit, query.offset])
 
-        async with self.db.get_connection() as conn:
+        await self.db.flush_writes("audit_logs")
+        async with self.db.get_connection(read_only=True) as conn:
             cursor = await conn.execute(sql, params)
             rows = await cursor.fetchall()
 
@@ -687,7 +693,8 @@ class AuditStore:
 
         where_sql = " AND ".join(where_clauses)
 
-        async with self.db.get_connection() as conn:
+        await self.db.flush_writes("audit_logs")
+        async with self.db.get_connection(read_only=True) as conn:
             # Total count
             cursor = await conn.execute(
                 f"SELECT COUNT(*) FROM audit_logs WHERE {where_sql}",
@@ -169,7 +169,7 @@ class CommentStore:
         """
         await self.db.initialize()
 
-        async with self.db.get_connection() as conn:
+        async with self.db.get_connection(read_only=True) as conn:
             async with conn.execute(
                 """
                 SELECT id, session_id, turn_index, line_number, author, content,
@@ -215,7 +215,7 @@ class CommentStore:
         query += " ORDER BY created_at ASC"
 
         comments = []
-        async with self.db.get_connection() as conn:
+        async with self.db.get_connection(read_only=True) as conn:
             async with conn.execute(query, params) as cursor:
                 async for row in cursor:
                     comments.append(self._row_to_comment(row))
@@ -239,7 +239,7 @@ class CommentStore:
         await self.db.initialize()
 
         comments = []
-        async with self.db.get_connection() as conn:
+        async with self.db.get_connection(read_only=True) as conn:
             async with conn.execute(
                 """
                 SELECT id, session_id, turn_index, line_number, author, content,
@@ -267,7 +267,7 @@ class CommentStore:
         await self.db.initialize()
 
         comments = []
-        async with self.db.get_connection() as conn:
+        async with self.db.get_connection(read_only=True) as conn:
             async with conn.execute(
                 """
                 SELECT id, session_id, turn_index, line_number, author, content,
@@ -394,7 +394,7 @@ class CommentStore:
 
         counts: dict[str, int] = {"total": 0}
 
-        async with self.db.get_connection() as conn:
+        async with self.db.get_connection(read_only=True) as conn:
             # Total count
             async with conn.execute(
                 f"""
@@ -437,7 +437,7 @@ class CommentStore:
         """
         await self.db.initialize()
 
-        async with self.db.get_connection() as conn:
+        async with self.db.get_connection(read_only=True) as conn:
             # Total comments
             async with conn.execute("SELECT COUNT(*) FROM session_comments") as cursor:
                 total_comments = (await cursor.fetchone())[0]
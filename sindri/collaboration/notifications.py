@@ -214,6 +214,8 @@ class NotificationStore:
 
     async def _ensure_tables(self) -> None:
         """Ensure notification tables exist."""
+        if self.db.is_schema_ready("notifications"):
+            return
         await self.db.initialize()
         async with self.db.get_connection() as conn:
             # Notifications table
@@ -267,6 +269,7 @@ class NotificationStore:
             """)
 
             await conn.commit()
+        self.db.mark_schema_ready("notifications")
 
     async def create_notification(
         self,
@@ -382,7 +385,7 @@ class NotificationStore:
         """
         await self._ensure_tables()
 
-        async with self.db.get_connection() as conn:
+        async with self.db.get_connection(read_only=True) as conn:
             cursor = await conn.execute(
                 "SELECT * FROM notifications WHERE id = ?",
                 (notification_id,),
@@ -439,7 +442,7 @@ class NotificationStore:
         """
         params.extend([limit, offset])
 
-        async with self.db.get_connection() as conn:
+        async with self.db.get_connection(read_only=True) as conn:
             cursor = await conn.execute(query, params)
             rows = await cursor.fetchall()
 
@@ -456,7 +459,7 @@ class NotificationStore:
         """
         await self._ensure_tables()
 
-        async with self.db.get_connection() as conn:
+        async with self.db.get_connection(read_only=True) as conn:
             cursor = await conn.execute(
                 """
                 SELECT COUNT(*) FROM notifications
@@ -584,7 +587,7 @@ class NotificationStore:
         """
         await self._ensure_tables()
 
-        async with self.db.get_connection() as conn:
+        async with self.db.get_connection(read_only=True) as conn:
             cursor = await conn.execute(
                 "SELECT * FROM notification_preferences WHERE user_id = ?",
                 (user_id,),
@@ -704,7 +707,7 @@ class NotificationStore:
         """
         await self._ensure_tables()
 
-        async with self.db.get_connection() as conn:
+        async with self.db.get_connection(read_only=True) as conn:
             if user_id:
                 cursor = await conn.execute(
                     """
@@ -758,7 +761,7 @@ class NotificationStore:
         """
         await self._ensure_tables()
 
-        async with self.db.get_connection() as conn:
+        async with self.db.get_connection(read_only=True) as conn:
             cursor = await conn.execute(
                 """
                 SELECT type, COUNT(*) as count
@@ -216,7 +216,7 @@ class ShareStore:
         """
         await self.db.initialize()
 
-        async with self.db.get_connection() as conn:
+        async with self.db.get_connection(read_only=True) as conn:
             async with conn.execute(
                 """
                 SELECT id, session_id, share_token, created_by, permission,
@@ -294,7 +294,7 @@ class ShareStore:
         await self.db.initialize()
 
         shares = []
-        async with self.db.get_connection() as conn:
+        async with self.db.get_connection(read_only=True) as conn:
             async with conn.execute(
                 """
                 SELECT id, session_id, share_token, created_by, permission,
@@ -403,7 +403,7 @@ class ShareStore:
         """
         await self.db.initialize()
 
-        async with self.db.get_connection() as conn:
+        async with self.db.get_connection(read_only=True) as conn:
             # Total shares
             async with conn.execute("SELECT COUNT(*) FROM session_shares") as cursor:
                 total_shares = (await cursor.fetchone())[0]
@@ -229,6 +229,8 @@ class TeamStore:
 
     async def _ensure_tables(self) -> None:
         """Ensure team tables exist."""
+        if self.db.is_schema_ready("teams"):
+            return
         await self.db.initialize()
         async with self.db.get_connection() as conn:
             # Teams table
@@ -298,6 +300,7 @@ class TeamStore:
             """)
 
             await conn.commit()
+        self.db.mark_schema_ready("teams")
 
     # ========== Team CRUD ==========
 
@@ -379,7 +382,7 @@ class TeamStore:
         """
         await self._ensure_tables()
 
-        async with self.db.get_connection() as conn:
+        async with self.db.get_connection(read_only=True) as conn:
             cursor = await conn.execute(
                 "SELECT * FROM teams WHERE id = ?",
                 (team_id,),
@@ -402,7 +405,7 @@ class TeamStore:
         """
         await self._ensure_tables()
 
-        async with self.db.get_connection() as conn:
+        async with self.db.get_connection(read_only=True) as conn:
             cursor = await conn.execute(
                 "SELECT * FROM teams WHERE invite_code = ? AND is_active = 1",
                 (invite_code,),
@@ -544,7 +547,7 @@ class TeamStore:
         query += " ORDER BY created_at DESC LIMIT ? OFFSET ?"
         params.extend([limit, offset])
 
-        async with self.db.get_connection() as conn:
+        async with self.db.get_connection(read_only=True) as conn:
             cursor = await conn.execute(query, params)
             rows = await cursor.fetchall()
 
@@ -697,7 +700,7 @@ class TeamStore:
         """
         await self._ensure_tables()
 
-        async with self.db.get_connection() as conn:
+        async with self.db.get_connection(read_only=True) as conn:
             cursor = await conn.execute(
                 """
                 SELECT * FROM team_memberships
@@ -737,7 +740,7 @@ class TeamStore:
 
         query += " ORDER BY joined_at"
 
-        async with self.db.get_connection() as conn:
+        async with self.db.get_connection(read_only=True) as conn:
             cursor = await conn.execute(query, params)
             rows = await cursor.fetchall()
 
@@ -754,7 +757,7 @@ class TeamStore:
         """
         await self._ensure_tables()
 
-        async with self.db.get_connection() as conn:
+        async with self.db.get_connection(read_only=True) as conn:
             cursor = await conn.execute(
                 """
                 SELECT t.*, m.*
@@ -949,7 +952,7 @@ class TeamStore:
             """
             params = [team_id, limit, offset]
 
-        async with self.db.get_connection() as conn:
+        async with self.db.get_connection(read_only=True) as conn:
             cursor = await conn.execute(query, params)
             rows = await cursor.fetchall()
 
@@ -966,7 +969,7 @@ class TeamStore:
         """
         await self._ensure_tables()
 
-        async with self.db.get_connection() as conn:
+        async with self.db.get_connection(read_only=True) as conn:
             cursor = await conn.execute(
                 """
                 SELECT t.*, ts.*
@@ -1073,7 +1076,7 @@ class TeamStore:
         """
         await self._ensure_tables()
 
-        async with self.db.get_connection() as conn:
+        async with self.db.get_connection(read_only=True) as conn:
             # Member counts by role
             cursor = await conn.execute(
                 """
@@ -1110,7 +1113,7 @@ class TeamStore:
         """
         await self._ensure_tables()
 
-        async with self.db.get_connection() as conn:
+        async with self.db.get_connection(read_only=True) as conn:
             cursor = await conn.execute(
                 "SELECT COUNT(*) FROM teams WHERE is_active = 1"
             )
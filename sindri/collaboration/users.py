@@ -145,6 +145,8 @@ class UserStore:
 
     async def _ensure_tables(self) -> None:
         """Ensure user tables exist."""
+        if self.db.is_schema_ready("users"):
+            return
         await self.db.initialize()
         async with self.db.get_connection() as conn:
             await conn.execute("""
@@ -168,6 +170,7 @@ class UserStore:
                 CREATE INDEX IF NOT EXISTS idx_users_email ON users(email)
             """)
             await conn.commit()
+        self.db.mark_schema_ready("users")
 
     async def create_user(
         self,
@@ -253,7 +256,7 @@ class UserStore:
         """
         await self._ensure_tables()
 
-        async with self.db.get_connection() as conn:
+        async with self.db.get_connection(read_only=True) as conn:
             cursor = await conn.execute(
                 "SELECT * FROM users WHERE id = ?",
                 (user_id,),
@@ -276,7 +279,7 @@ class UserStore:
         """
         await self._ensure_tables()
 
-        async with self.db.get_connection() as conn:
+        async with self.db.get_connection(read_only=True) as conn:
             cursor = await conn.execute(
                 "SELECT * FROM users WHERE username = ?",
                 (username,),
@@ -299,7 +302,7 @@ class UserStore:
         """
         await self._ensure_tables()
 
-        async with self.db.get_connection() as conn:
+        async with self.db.get_connection(read_only=True) as conn:
             cursor = await conn.execute(
                 "SELECT * FROM users WHERE email = ?",
                 (email,),
@@ -490,7 +493,7 @@ class UserStore:
         query += " ORDER BY created_at DESC LIMIT ? OFFSET ?"
         params.extend([limit, offset])
 
-        async with self.db.get_connection() as conn:
+        async with self.db.get_connection(read_only=True) as conn:
             cursor = await conn.execute(query, params)
             rows = await cursor.fetchall()
 
@@ -510,7 +513,7 @@ class UserStore:
 
         search_pattern = f"%{query}%"
 
-        async with self.db.get_connection() as conn:
+        async with self.db.get_connection(read_only=True) as conn:
             cursor = await conn.execute(
                 """
                 SELECT * FROM users
@@ -533,7 +536,7 @@ class UserStore:
         """
         await self._ensure_tables()
 
-        async with self.db.get_connection() as conn:
+        async with self.db.get_connection(read_only=True) as conn:
             cursor = await conn.execute(
                 """
                 SELECT
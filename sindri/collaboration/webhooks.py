@@ -256,6 +256,8 @@ class WebhookStore:
 
     async def _ensure_tables(self) -> None:
         """Ensure webhook tables exist."""
+        if self.db.is_schema_ready("webhooks"):
+            return
         await self.db.initialize()
         async with self.db.get_connection() as conn:
             # Webhooks table
@@ -316,6 +318,7 @@ class WebhookStore:
             """)
 
             await conn.commit()
+        self.db.mark_schema_ready("webhooks")
 
     async def create_webhook(
         self,
@@ -415,7 +418,7 @@ class WebhookStore:
         """
         await self._ensure_tables()
 
-        async with self.db.get_connection() as conn:
+        async with self.db.get_connection(read_only=True) as conn:
             cursor = await conn.execute(
                 "SELECT * FROM webhooks WHERE id = ?",
                 (webhook_id,),
@@ -451,7 +454,7 @@ class WebhookStore:
 
         query += " ORDER BY created_at DESC"
 
-        async with self.db.get_connection() as conn:
+        async with self.db.get_connection(read_only=True) as conn:
             cursor = await conn.execute(query, params)
             rows = await cursor.fetchall()
 
@@ -738,7 +741,7 @@ class WebhookStore:
         """
         await self._ensure_tables()
 
-        async with self.db.get_connection() as conn:
+        async with self.db.get_connection(read_only=True) as conn:
             cursor = await conn.execute(
                 "SELECT * FROM webhook_deliveries WHERE id = ?",
                 (delivery_id,),
@@ -780,7 +783,7 @@ class WebhookStore:
         query += " ORDER BY created_at DESC LIMIT ? OFFSET ?"
         params.extend([limit, offset])
 
-        async with self.db.get_connection() as conn:
+        async with self.db.get_connection(read_only=True) as conn:
             cursor = await conn.execute(query, params)
             rows = await cursor.fetchall()
 
@@ -796,7 +799,7 @@ class WebhookStore:
 
         now = datetime.now().isoformat()
 
-        async with self.db.get_connection() as conn:
+        async with self.db.get_connection(read_only=True) as conn:
             cursor = await conn.execute(
                 """
                 SELECT * FROM webhook_deliveries
@@ -854,7 +857,7 @@ class WebhookStore:
         """
         await self._ensure_tables()
 
-        async with self.db.get_connection() as conn:
+        async with self.db.get_connection(read_only=True) as conn:
             # Webhook counts
             webhook_query = "SELECT COUNT(*), SUM(CASE WHEN enabled = 1 THEN 1 ELSE 0 END) FROM webhooks"
             webhook_params: list = []
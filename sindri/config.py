@@ -1,7 +1,7 @@
 """Configuration for Sindri with validation."""
 
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Optional, Dict, List
 from pydantic import BaseModel, Field, field_validator, ConfigDict
 import structlog
 
@@ -29,6 +29,14 @@ class ModelConfig(BaseModel):
         return v.strip()
 
 
+class OllamaEndpointConfig(BaseModel):
+    """An Ollama server in a multi-endpoint pool."""
+
+    host: str
+    total_vram_gb: float = Field(gt=0, default=16.0)
+    reserve_vram_gb: float = Field(ge=0, default=2.0)
+
+
 class MemoryConfig(BaseModel):
     """Memory system configuration."""
 
@@ -45,6 +53,15 @@ class TUIConfig(BaseModel):
     refresh_rate_ms: int = Field(gt=0, default=100)
 
 
+class ResponseCacheConfig(BaseModel):
+    """LLM response cache configuration."""
+
+    enabled: bool = False
+    ttl_hours: float = Field(gt=0, default=168.0)
+    max_entries: int = Field(gt=0, default=2000)
+    force: bool = False  # Also cache non-deterministic agent calls (temperature > 0)
+
+
 class SindriConfig(BaseModel):
     """Main configuration for Sindri with validation."""
 
@@ -60,6 +77,8 @@ class SindriConfig(BaseModel):
     # Ollama
     ollama_host: str = "http://localhost:11434"
     default_model: str = "qwen2.5-coder:14b"
+    # Multiple Ollama servers (overrides ollama_host when set)
+    ollama_endpoints: List[OllamaEndpointConfig] = Field(default_factory=list)
 
     # Hardware
     total_vram_gb: float = Field(gt=0, default=16.0)
@@ -74,6 +93,9 @@ class SindriConfig(BaseModel):
     # TUI
     tui: TUIConfig = Field(default_factory=TUIConfig)
 
+    # LLM response cache
+    response_cache: ResponseCacheConfig = Field(default_factory=ResponseCacheConfig)
+
     # Execution
     max_iterations: int = Field(gt=0, default=50)
     completion_marker: str = "<sindri:complete/>"
@@ -1,9 +1,19 @@
 """Delegation: spawning child tasks from parent agents.
 
 Phase 6.2: Pre-warming support for model caching.
+
+Finished delegations are remembered for the rest of the orchestration: a
+request for the same agent, description and context is answered with
+the earlier result, without running a child loop, as long as none of
+the files that child touched have changed since. Children that read
+whole directories (searches, listings) are also invalidated by any write
+to their workspace, since a directory's stamp misses edits inside it.
 """
 
-from dataclasses import dataclass
+import hashlib
+import json
+import os
+from dataclasses import dataclass, field
 from typing import Optional, TYPE_CHECKING
 import structlog
 
@@ -11,8 +21,11 @@ from sindri.core.tasks import Task, TaskStatus
 from sindri.core.scheduler import TaskScheduler
 from sindri.agents.registry import AGENTS
 
+from sindri.tools.registry import workspace_generation
+
 if TYPE_CHECKING:
     from sindri.llm.manager import ModelManager
+    from sindri.tools.registry import ToolRegistry
 
 log = structlog.get_logger()
 
@@ -26,6 +39,58 @@ class DelegationRequest:
     context: dict
     constraints: list[str]
     success_criteria: list[str]
+    use_cache: bool = True  # False runs the child even if a result is cached
+
+
+@dataclass
+class CachedDelegation:
+    """A finished delegation that identical requests can reuse."""
+
+    child_id: str
+    result: Optional[dict]
+    # Files the child (and its own children) touched -> (mtime_ns, size)
+    stamps: dict[str, Optional[tuple[int, int]]] = field(default_factory=dict)
+    # Workspaces it read as a whole -> their generation at the time
+    generations: dict[str, int] = field(default_factory=dict)
+
+    def is_fresh(self) -> bool:
+        """Whether nothing the cached result depends on has changed."""
+        return file_stamps(self.stamps) == self.stamps and all(
+            workspace_generation(w) == g for w, g in self.generations.items()
+        )
+
+
+def delegation_key(request: DelegationRequest) -> Optional[tuple[str, str, str]]:
+    """Cache key: target agent, normalized description and context hash.
+
+    Returns:
+        The key, or None if the context can't be serialized
+    """
+    try:
+        context = json.dumps(
+            [request.context, request.constraints, request.success_criteria],
+            sort_keys=True,
+        )
+    except (TypeError, ValueError):
+        return None
+    description = " ".join(request.task_description.lower().split())
+    return (
+        request.target_agent,
+        description,
+        hashlib.sha256(context.encode()).hexdigest(),
+    )
+
+
+def file_stamps(paths) -> dict[str, Optional[tuple[int, int]]]:
+    """(mtime_ns, size) of each path; None for paths that don't exist."""
+    stamps: dict[str, Optional[tuple[int, int]]] = {}
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            stamps[path] = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            stamps[path] = None
+    return stamps
 
 
 class DelegationManager:
@@ -39,10 +104,23 @@ class DelegationManager:
         scheduler: TaskScheduler,
         state=None,
         model_manager: Optional["ModelManager"] = None,
+        cache_results: bool = True,
     ):
         self.scheduler = scheduler
         self.state = state  # SessionState for updating parent sessions
         self.model_manager = model_manager  # For pre-warming
+
+        # Delegation result cache (see module docstring)
+        self.cache_results = cache_results
+        self._cache: dict[tuple, CachedDelegation] = {}
+        self._keys: dict[str, tuple] = {}  # Running child id -> its cache key
+        self._touched: dict[str, set[str]] = {}  # Task id -> files it touched
+        # Task id -> workspaces it read as a whole -> earliest generation
+        self._generations: dict[str, dict[str, int]] = {}
+        self._untracked: set[str] = set()  # Tasks with effects we can't stamp
+        self.cache_hits = 0
+        self.cache_misses = 0
+
         log.info(
             "delegation_manager_initialized", prewarm_enabled=model_manager is not None
         )
@@ -63,6 +141,12 @@ class DelegationManager:
                 f"{parent_task.assigned_agent} cannot delegate to {request.target_agent}"
             )
 
+        key = delegation_key(request) if self.cache_results else None
+        if key is not None and request.use_cache:
+            cached = self._lookup(key)
+            if cached is not None:
+                return self._reuse(parent_task, request, cached)
+
         # Phase 6.2: Pre-warm the target agent's model in background
         if self.model_manager:
             await self.model_manager.pre_warm(agent.model, agent.estimated_vram_gb)
@@ -81,12 +165,18 @@ class DelegationManager:
             },
         )
 
+        # A cancelled parent's children start out cancelled
+        if parent_task.cancel_requested:
+            child.cancel_requested = True
+
         # Add to parent's subtasks
         parent_task.add_subtask(child.id)
         parent_task.status = TaskStatus.WAITING
 
         # Schedule child
         self.scheduler.add_task(child)
+        if key is not None:
+            self._keys[child.id] = key
 
         log.info(
             "task_delegated",
@@ -100,8 +190,106 @@ class DelegationManager:
 
         return child
 
+    def _lookup(self, key: tuple) -> Optional[CachedDelegation]:
+        """A cached delegation for ``key`` whose files are unchanged."""
+        cached = self._cache.get(key)
+        if cached is not None and not cached.is_fresh():
+            log.info("delegation_cache_stale", child_id=cached.child_id)
+            del self._cache[key]
+            cached = None
+        if cached is None:
+            self.cache_misses += 1
+        else:
+            self.cache_hits += 1
+        return cached
+
+    def _reuse(
+        self, parent_task: Task, request: DelegationRequest, cached: CachedDelegation
+    ) -> Task:
+        """Record a cache hit as an already-completed child of the parent."""
+        child = Task(
+            parent_id=parent_task.id,
+            description=request.task_description,
+            task_type=request.target_agent,
+            assigned_agent=request.target_agent,
+            priority=parent_task.priority + 1,
+            status=TaskStatus.COMPLETE,
+            context={"cached_from": cached.child_id},
+            result=cached.result,
+        )
+        parent_task.add_subtask(child.id)
+        self.scheduler.add_task(child)
+        # The parent's own result depends on the same files
+        self._touched.setdefault(parent_task.id, set()).update(cached.stamps)
+        self._note_generations(parent_task.id, cached.generations)
+
+        log.info(
+            "delegation_cache_hit",
+            parent_id=parent_task.id,
+            child_id=child.id,
+            cached_from=cached.child_id,
+            to_agent=request.target_agent,
+            hits=self.cache_hits,
+        )
+        return child
+
+    def record_tool_usage(self, task: Task, tools: "ToolRegistry"):
+        """Note the files a task's tools touched, for caching its result."""
+        self._touched.setdefault(task.id, set()).update(tools.touched_paths)
+        self._note_generations(task.id, tools.read_generations)
+        # Delegations are covered by the children's own usage
+        if set(tools.untracked_effects) - {"delegate"}:
+            self._untracked.add(task.id)
+
+    def _note_generations(self, task_id: str, generations: dict[str, int]):
+        """Merge workspace generations, keeping the earliest seen."""
+        seen = self._generations.setdefault(task_id, {})
+        for workspace, generation in generations.items():
+            seen[workspace] = min(seen.get(workspace, generation), generation)
+
+    def _remember(self, child: Task):
+        """Cache a completed child's result and pass its usage to the parent."""
+        key = self._keys.pop(child.id, None)
+        touched = self._touched.pop(child.id, set())
+        generations = self._generations.pop(child.id, {})
+        untracked = child.id in self._untracked
+        self._untracked.discard(child.id)
+
+        if key is not None and not untracked:
+            self._cache[key] = CachedDelegation(
+                child_id=child.id,
+                result=child.result,
+                stamps=file_stamps(touched),
+                generations=generations,
+            )
+            log.debug("delegation_cached", child_id=child.id, files=len(touched))
+
+        if child.parent_id:
+            self._touched.setdefault(child.parent_id, set()).update(touched)
+            self._note_generations(child.parent_id, generations)
+            if untracked:
+                self._untracked.add(child.parent_id)
+
+    def _forget(self, child: Task):
+        """Drop bookkeeping for a child that didn't complete."""
+        self._keys.pop(child.id, None)
+        self._touched.pop(child.id, None)
+        self._generations.pop(child.id, None)
+        self._untracked.discard(child.id)
+
+    def get_cache_stats(self) -> dict:
+        """Delegation cache hits, misses and size."""
+        lookups = self.cache_hits + self.cache_misses
+        return {
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "hit_rate": self.cache_hits / lookups if lookups else 0.0,
+            "entries": len(self._cache),
+        }
+
     async def child_completed(self, child: Task):
         """Handle child task completion."""
+        self._remember(child)
 
         if not child.parent_id:
             return
@@ -155,14 +343,11 @@ class DelegationManager:
                 num_children=len(parent.subtask_ids),
             )
             # Resume parent
-            parent.status = TaskStatus.PENDING
-            # Re-add to pending queue
-            import heapq
-
-            heapq.heappush(self.scheduler.pending, (parent.priority, parent.id))
+            self.scheduler.requeue(parent)
 
     async def child_failed(self, child: Task):
         """Handle child task failure."""
+        self._forget(child)
 
         if not child.parent_id:
             return
@@ -179,3 +364,27 @@ class DelegationManager:
         # In future, could implement retry logic
         parent.status = TaskStatus.FAILED
         parent.error = f"Child task {child.id} failed: {child.error}"
+
+    async def child_cancelled(self, child: Task):
+        """Handle child task cancellation.
+
+        A parent that was cancelled too is marked cancelled; otherwise it
+        fails, since the work it is waiting on will never finish.
+        """
+        self._forget(child)
+
+        if not child.parent_id:
+            return
+
+        parent = self.scheduler.get_task(child.parent_id)
+        if not parent or parent.status != TaskStatus.WAITING:
+            return
+
+        log.info("child_cancelled", child_id=child.id, parent_id=parent.id)
+
+        if parent.cancel_requested:
+            parent.status = TaskStatus.CANCELLED
+            parent.error = "Task cancelled by user"
+        else:
+            parent.status = TaskStatus.FAILED
+            parent.error = f"Child task {child.id} was cancelled"
@@ -0,0 +1,97 @@
+"""Task duration estimates from past sessions.
+
+The scheduler uses these to rank ready tasks by critical-path length: a
+task's rank is its own estimated duration plus the longest rank among the
+tasks that wait on it (dependents and its parent). Long chains therefore
+start first and short leaves fill the gaps around them.
+"""
+
+from dataclasses import dataclass, field
+from statistics import median
+from typing import TYPE_CHECKING, Iterable, Optional
+import structlog
+
+from sindri.core.tasks import Task
+
+if TYPE_CHECKING:
+    from sindri.persistence.metrics import MetricsStore, TaskMetrics
+
+log = structlog.get_logger()
+
+DEFAULT_TASK_SECONDS = 60.0
+
+
+@dataclass
+class DurationEstimator:
+    """Median task durations, by agent and model.
+
+    Lookups fall back from (agent, model) to the agent, then to every
+    recorded task, then to ``default_seconds`` when there is no history.
+    An agent's name is also its task type for delegated tasks, so the
+    agent key covers task type too.
+    """
+
+    by_agent_model: dict[tuple[str, str], float] = field(default_factory=dict)
+    by_agent: dict[str, float] = field(default_factory=dict)
+    overall: Optional[float] = None
+    default_seconds: float = DEFAULT_TASK_SECONDS
+
+    @classmethod
+    def from_history(
+        cls,
+        tasks: Iterable["TaskMetrics"],
+        default_seconds: float = DEFAULT_TASK_SECONDS,
+    ) -> "DurationEstimator":
+        """Build estimates from finished task metrics."""
+        by_agent_model: dict[tuple[str, str], list[float]] = {}
+        by_agent: dict[str, list[float]] = {}
+        durations: list[float] = []
+        for task in tasks:
+            seconds = task.duration_seconds
+            if seconds <= 0:
+                continue
+            by_agent_model.setdefault((task.agent_name, task.model_name), []).append(
+                seconds
+            )
+            by_agent.setdefault(task.agent_name, []).append(seconds)
+            durations.append(seconds)
+
+        return cls(
+            by_agent_model={k: median(v) for k, v in by_agent_model.items()},
+            by_agent={k: median(v) for k, v in by_agent.items()},
+            overall=median(durations) if durations else None,
+            default_seconds=default_seconds,
+        )
+
+    @classmethod
+    async def load(
+        cls, store: "MetricsStore", limit: int = 100
+    ) -> "DurationEstimator":
+        """Build estimates from the most recent ``limit`` sessions in a store.
+
+        Returns an estimator with only the default if history can't be read.
+        """
+        try:
+            tasks = await store.get_task_durations(limit=limit)
+        except Exception as e:
+            log.warning("duration_history_unavailable", error=str(e))
+            return cls()
+
+        estimator = cls.from_history(tasks)
+        log.info(
+            "duration_estimates_loaded",
+            tasks=len(tasks),
+            agents=len(estimator.by_agent),
+        )
+        return estimator
+
+    def estimate(self, task: Task) -> float:
+        """Expected run time of a task in seconds."""
+        key = (task.assigned_agent, task.model_name)
+        if key in self.by_agent_model:
+            return self.by_agent_model[key]
+        if task.assigned_agent in self.by_agent:
+            return self.by_agent[task.assigned_agent]
+        if self.overall is not None:
+            return self.overall
+        return self.default_seconds
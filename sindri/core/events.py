@@ -1,5 +1,6 @@
 """Event system for orchestrator-to-TUI communication."""
 
+import asyncio
 import time
 from dataclasses import dataclass, field
 from typing import Callable, Any, Optional
@@ -28,7 +29,7 @@ class EventType(Enum):
     ITERATION_WARNING = auto()  # Warn agent about remaining iterations
     MODEL_DEGRADED = auto()  # Agent falling back to smaller model
     # Phase 6.3: Streaming output
-    STREAMING_TOKEN = auto()  # Individual token during streaming response
+    STREAMING_TOKEN = auto()  # Frame of coalesced tokens during streaming
     STREAMING_START = auto()  # Streaming response started
     STREAMING_END = auto()  # Streaming response completed
     # Phase 7.3: Interactive planning
@@ -104,3 +105,141 @@ class EventBus:
     def enable(self):
         """Enable event emission."""
         self._enabled = True
+
+
+@dataclass
+class _TokenBuffer:
+    """Pending tokens for one task."""
+
+    agent: str
+    parts: list[str] = field(default_factory=list)
+    size: int = 0  # Bytes buffered
+    count: int = 0  # Tokens buffered
+    first_at: float = 0.0  # When the oldest buffered token arrived
+    seq: int = 0  # Next frame sequence number
+
+
+class TokenFrameCoalescer:
+    """Batch streaming tokens into frames before emitting them.
+
+    Emitting one STREAMING_TOKEN event per token costs a RichLog write in the
+    TUI and a JSON encode plus socket send per WebSocket client, multiplied
+    by every parallel task. Tokens are instead buffered per task and emitted
+    as a single frame every ``interval_ms`` or once ``max_bytes`` are
+    buffered, whichever comes first. Each frame carries a per-task sequence
+    number so consumers can detect gaps or reordering.
+    """
+
+    def __init__(
+        self,
+        event_bus: EventBus,
+        interval_ms: int = 100,
+        max_bytes: int = 512,
+    ):
+        """Initialize the coalescer.
+
+        Args:
+            event_bus: Bus to emit frames on
+            interval_ms: Maximum time a token waits before being flushed
+                (usually TUIConfig.refresh_rate_ms)
+            max_bytes: Flush early once this many bytes are buffered
+        """
+        self.event_bus = event_bus
+        self.interval = interval_ms / 1000.0
+        self.max_bytes = max_bytes
+        self._buffers: dict[str, _TokenBuffer] = {}
+        self._timer: Optional[asyncio.TimerHandle] = None
+        # Stats
+        self.tokens_in = 0
+        self.frames_out = 0
+
+    def add(self, task_id: str, agent: str, token: str) -> None:
+        """Buffer a token, flushing the task's frame if it is due."""
+        if not token:
+            return
+
+        buffer = self._buffers.get(task_id)
+        if buffer is None:
+            buffer = self._buffers[task_id] = _TokenBuffer(agent=agent)
+
+        now = time.time()
+        if not buffer.parts:
+            buffer.first_at = now
+        buffer.parts.append(token)
+        buffer.size += len(token.encode("utf-8"))
+        buffer.count += 1
+        self.tokens_in += 1
+
+        if buffer.size >= self.max_bytes or now - buffer.first_at >= self.interval:
+            self.flush(task_id)
+        else:
+            self._schedule_timer()
+
+    def flush(self, task_id: str) -> None:
+        """Emit the pending frame for a task (no-op if nothing is buffered)."""
+        buffer = self._buffers.get(task_id)
+        if buffer is None or not buffer.parts:
+            return
+
+        text = "".join(buffer.parts)
+        frame = {
+            "task_id": task_id,
+            "agent": buffer.agent,
+            "token": text,
+            "seq": buffer.seq,
+            "token_count": buffer.count,
+        }
+        buffer.parts.clear()
+        buffer.size = 0
+        buffer.count = 0
+        buffer.seq += 1
+        self.frames_out += 1
+
+        self.event_bus.emit(
+            Event(type=EventType.STREAMING_TOKEN, data=frame, task_id=task_id)
+        )
+
+    def flush_all(self) -> None:
+        """Emit pending frames for every task."""
+        for task_id in list(self._buffers):
+            self.flush(task_id)
+
+    def finish(self, task_id: str) -> int:
+        """Flush a task's final frame and forget it.
+
+        Returns:
+            Number of frames emitted for the task
+        """
+        self.flush(task_id)
+        buffer = self._buffers.pop(task_id, None)
+        return buffer.seq if buffer else 0
+
+    def _flush_due(self) -> None:
+        """Timer callback: flush frames older than the interval."""
+        self._timer = None
+        now = time.time()
+        for task_id, buffer in list(self._buffers.items()):
+            if buffer.parts and now - buffer.first_at >= self.interval:
+                self.flush(task_id)
+        if any(b.parts for b in self._buffers.values()):
+            self._schedule_timer()
+
+    def _schedule_timer(self) -> None:
+        """Make sure stalled streams still flush after the interval."""
+        if self._timer is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # No loop: frames flush on the next token or finish()
+        self._timer = loop.call_later(self.interval, self._flush_due)
+
+    def get_stats(self) -> dict:
+        """Get coalescing statistics."""
+        return {
+            "tokens": self.tokens_in,
+            "frames": self.frames_out,
+            "tokens_per_frame": (
+                self.tokens_in / self.frames_out if self.frames_out else 0.0
+            ),
+        }
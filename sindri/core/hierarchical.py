@@ -1,14 +1,16 @@
 """Hierarchical agent loop with delegation support."""
 
+import asyncio
 from datetime import datetime
 import os
 import time
 import structlog
 
-from sindri.llm.client import OllamaClient
+from sindri.llm.client import GenerationStats, OllamaClient
 from sindri.llm.tool_parser import ToolCallParser
 from sindri.llm.streaming import StreamingBuffer
 from sindri.tools.registry import ToolRegistry
+from sindri.tools.paging import OutputBudget, ToolOutputPageTool, ToolOutputStore
 from sindri.tools.delegation import DelegateTool
 from sindri.persistence.state import SessionState
 from sindri.persistence.metrics import MetricsCollector, MetricsStore
@@ -22,12 +24,17 @@ from sindri.core.recovery import RecoveryManager
 from sindri.agents.registry import AGENTS
 from sindri.memory.system import MuninnMemory
 from sindri.memory.summarizer import ConversationSummarizer
-from sindri.core.events import EventBus, Event, EventType
+from sindri.memory.compaction import ConversationCompactor
+from sindri.core.events import EventBus, Event, EventType, TokenFrameCoalescer
 from typing import Optional
 
 log = structlog.get_logger()
 
 
+class GenerationCancelled(Exception):
+    """An in-flight LLM call was aborted because its task was cancelled."""
+
+
 class HierarchicalAgentLoop:
     """Agent loop with delegation support."""
 
@@ -41,9 +48,11 @@ class HierarchicalAgentLoop:
         config: LoopConfig = None,
         memory: Optional[MuninnMemory] = None,
         summarizer: Optional[ConversationSummarizer] = None,
+        compactor: Optional[ConversationCompactor] = None,
         event_bus: Optional[EventBus] = None,
         recovery: Optional[RecoveryManager] = None,
         enable_metrics: bool = True,  # Phase 5.5: Performance metrics
+        metrics_store: Optional[MetricsStore] = None,
     ):
         self.client = client
         self.tools = tools
@@ -54,15 +63,30 @@ class HierarchicalAgentLoop:
         self.context_builder = ContextBuilder()
         self.memory = memory
         self.summarizer = summarizer
+        self.compactor = compactor
         self.event_bus = event_bus or EventBus()
+        self.token_frames = TokenFrameCoalescer(
+            self.event_bus,
+            interval_ms=self.config.stream_frame_ms,
+            max_bytes=self.config.stream_frame_bytes,
+        )
         self.recovery = recovery  # Phase 5.6: Recovery manager for error checkpoints
         self._indexed_projects = set()  # Track indexed projects
         # Phase 5.5: Performance metrics
         self.enable_metrics = enable_metrics
-        self._metrics_store = MetricsStore() if enable_metrics else None
+        self._metrics_store = (
+            (metrics_store or MetricsStore()) if enable_metrics else None
+        )
         self._metrics_collectors: dict[str, MetricsCollector] = (
             {}
         )  # Per-session collectors
+        # In-flight LLM calls by task ID, so cancellation can abort them
+        self._inflight_calls: dict[str, asyncio.Task] = {}
+        # Bounds read-only tool calls running at once (mid-stream and batched)
+        self._tool_slots = asyncio.Semaphore(max(1, self.config.max_parallel_tools))
+        # Full text of truncated tool outputs, shared by all tasks for paging
+        # (in a temp directory private to this loop, removed with it)
+        self.tool_outputs = ToolOutputStore()
 
     async def run_task(self, task: Task) -> LoopResult:
         """Run a specific task with its assigned agent."""
@@ -75,6 +99,20 @@ class HierarchicalAgentLoop:
                 reason=f"Unknown agent: {task.assigned_agent}",
             )
 
+        # Don't load a model for a task that was cancelled while queued
+        if task.cancel_requested:
+            log.info("task_cancelled_before_start", task_id=task.id)
+            task.status = TaskStatus.CANCELLED
+            task.error = "Task cancelled by user"
+            await self.delegation.child_cancelled(task)
+            self.event_bus.emit(
+                Event(
+                    type=EventType.TASK_STATUS_CHANGED,
+                    data={"task_id": task.id, "status": TaskStatus.CANCELLED},
+                )
+            )
+            return LoopResult(success=False, iterations=0, reason="cancelled")
+
         # Ensure model is loaded (Phase 5.6: with fallback support)
         loaded = await self.scheduler.model_manager.ensure_loaded(
             agent.model, agent.estimated_vram_gb
@@ -158,7 +196,18 @@ class HierarchicalAgentLoop:
         )
 
         # Add delegate tool if agent can delegate
-        task_tools = ToolRegistry()
+        budget = None
+        if self.config.tool_output_budget > 0:
+            budget = OutputBudget.from_max_chars(self.config.tool_output_budget)
+        task_tools = ToolRegistry(
+            cache_results=self.config.cache_tool_results,
+            output_budget=budget,
+            output_store=self.tool_outputs,
+        )
+        if budget:
+            task_tools.register(
+                ToolOutputPageTool(self.tool_outputs, page_chars=budget.page_chars)
+            )
         for tool_name in agent.tools:
             if tool_name == "delegate":
                 # Add delegation tool with task context
@@ -172,6 +221,7 @@ class HierarchicalAgentLoop:
         result = await self._run_loop(
             task, agent, task_tools, active_model=active_model
         )
+        self.delegation.record_tool_usage(task, task_tools)
 
         if result.success:
             task.status = TaskStatus.COMPLETE
@@ -192,7 +242,10 @@ class HierarchicalAgentLoop:
             )
 
             log.info("task_completed", task_id=task.id, iterations=result.iterations)
-        elif task.status != TaskStatus.CANCELLED:
+        elif task.status == TaskStatus.CANCELLED:
+            # Let a waiting parent stop instead of waiting forever
+            await self.delegation.child_cancelled(task)
+        else:
             # Only mark as FAILED if not already CANCELLED
             task.status = TaskStatus.FAILED
             task.error = result.reason
@@ -265,6 +318,8 @@ class HierarchicalAgentLoop:
             log.info("creating_new_session", task_id=task.id)
             session = await self.state.create_session(task.description, agent.model)
             task.session_id = session.id
+        # Record the session so a resumed orchestration continues it
+        self.scheduler.task_updated(task)
 
         # Index project if memory available and not yet indexed
         project_id = f"project_{os.getcwd().replace('/', '_')}"
@@ -289,7 +344,6 @@ class HierarchicalAgentLoop:
                 description=task.description,
                 agent_name=agent.name,
                 model_name=model_to_use,
-                model_load_time=0.0,  # TODO: Track actual model load time
             )
             log.debug("metrics_collector_initialized", session_id=session.id)
 
@@ -386,12 +440,18 @@ class HierarchicalAgentLoop:
                     model_name=model_to_use,
                 )
 
+            # Long conversations send summaries of their older spans instead
+            # of the original turns (which stay in the session and the DB)
+            history = session.turns
+            if self.compactor:
+                self.compactor.schedule(task.description, session.turns)
+                history = self.compactor.compact(session.turns)
+
             # Build messages with memory-augmented context if available
             if self.memory:
                 # Convert session turns to message format
                 conversation = [
-                    {"role": turn.role, "content": turn.content}
-                    for turn in session.turns
+                    {"role": turn.role, "content": turn.content} for turn in history
                 ]
 
                 # Get memory-augmented context
@@ -417,30 +477,86 @@ class HierarchicalAgentLoop:
                     agent.system_prompt,
                     task.description,
                     task.context,
-                    session.turns,
+                    history,
                     task_tools.get_schemas(),
                 )
 
             # Call LLM (Phase 5.6: use model_to_use for potential fallback)
             # Phase 6.3: Support streaming mode
-            if self.config.streaming:
-                response, assistant_content = await self._call_llm_streaming(
-                    model=model_to_use,
-                    messages=messages,
-                    tools=task_tools.get_schemas(),
+            # The call runs as its own asyncio task so cancellation aborts the
+            # generation (closing the HTTP stream) instead of waiting for it
+            response = None
+            assistant_content = ""
+            streamed_calls = []
+            prefetched = {}
+            try:
+                if self.config.streaming:
+                    (
+                        response,
+                        assistant_content,
+                        streamed_calls,
+                        prefetched,
+                    ) = await self._call_llm_cancellable(
+                        task,
+                        agent,
+                        self._call_llm_streaming(
+                            model=model_to_use,
+                            messages=messages,
+                            tools=task_tools.get_schemas(),
+                            task=task,
+                            agent=agent,
+                            tool_registry=task_tools,
+                        ),
+                    )
+                else:
+                    response = await self._call_llm_cancellable(
+                        task,
+                        agent,
+                        self.client.chat(
+                            model=model_to_use,
+                            messages=messages,
+                            tools=task_tools.get_schemas(),
+                        ),
+                    )
+                    assistant_content = response.message.content
+            except GenerationCancelled:
+                task.cancel_requested = True
+            except asyncio.TimeoutError:
+                reason = f"LLM call exceeded {agent.llm_timeout:.0f}s deadline"
+                log.error(
+                    "llm_call_deadline_exceeded",
+                    task_id=task.id,
+                    agent=agent.name,
+                    timeout=agent.llm_timeout,
+                )
+                self._save_error_checkpoint(
                     task=task,
-                    agent=agent,
+                    error_reason=reason,
+                    session_id=session.id,
+                    iteration=iteration + 1,
                 )
-            else:
-                response = await self.client.chat(
-                    model=model_to_use,
-                    messages=messages,
-                    tools=task_tools.get_schemas(),
+                return LoopResult(
+                    success=False, iterations=iteration + 1, reason=reason
+                )
+
+            if metrics_collector and getattr(response, "cached", False):
+                metrics_collector.record_cache_hit(response.cache_time_saved)
+
+            # Token counts and timings reported by Ollama (model load time
+            # accumulates into the task's model_load_time)
+            stats = getattr(response, "stats", None)
+            if metrics_collector and isinstance(stats, GenerationStats):
+                metrics_collector.record_generation(
+                    prompt_tokens=stats.prompt_tokens,
+                    eval_tokens=stats.eval_tokens,
+                    load_duration=stats.load_duration,
+                    prompt_eval_duration=stats.prompt_eval_duration,
+                    eval_duration=stats.eval_duration,
                 )
-                assistant_content = response.message.content
 
             # Check for cancellation after LLM call (in case it was requested during call)
             if task.cancel_requested:
+                self._cancel_prefetched(prefetched)
                 log.info("task_cancelled_after_llm", task_id=task.id)
                 task.status = TaskStatus.CANCELLED
                 task.error = "Task cancelled by user"
@@ -454,7 +570,9 @@ class HierarchicalAgentLoop:
                 # Phase 5.6: Save checkpoint on cancellation
                 self._save_error_checkpoint(
                     task=task,
-                    error_reason="cancelled_after_llm",
+                    error_reason=(
+                        "cancelled_after_llm" if response else "cancelled_during_llm"
+                    ),
                     session_id=session.id,
                     iteration=iteration + 1,
                 )
@@ -505,7 +623,9 @@ class HierarchicalAgentLoop:
                 log.info(
                     "attempting_tool_parse", content_preview=assistant_content[:200]
                 )
-                parsed_calls = tool_parser.parse(assistant_content)
+                # Reuse calls the streaming parser already extracted (their
+                # indices match the calls started mid-stream)
+                parsed_calls = streamed_calls or tool_parser.parse(assistant_content)
                 log.info(
                     "parse_result",
                     parsed_count=len(parsed_calls) if parsed_calls else 0,
@@ -528,8 +648,9 @@ class HierarchicalAgentLoop:
                         CallWrapper(c.name, c.arguments) for c in parsed_calls
                     ]
 
-            # Execute all calls
-            for call in calls_to_execute:
+            # Execute all calls (read-only calls may already have started
+            # mid-stream; their results are collected here in call order)
+            for index, call in enumerate(calls_to_execute):
                 log.info(
                     "executing_tool",
                     task_id=task.id,
@@ -537,15 +658,28 @@ class HierarchicalAgentLoop:
                     args=call.function.arguments,
                 )
 
-                # Phase 5.5: Track tool execution timing
-                tool_start_time = time.time()
+                if index not in prefetched:
+                    # Start this call and the read-only calls right after it
+                    # together; calls with side effects run one at a time
+                    self._start_read_only_run(
+                        task_tools, calls_to_execute, index, prefetched
+                    )
 
-                result = await task_tools.execute(
-                    call.function.name, call.function.arguments
-                )
+                prefetch = prefetched.pop(index, None)
+                if prefetch is not None:
+                    # Phase 5.5: Timing reflects when the call actually ran
+                    result, tool_start_time, tool_end_time = await prefetch
+                else:
+                    # Phase 5.5: Track tool execution timing
+                    tool_start_time = time.time()
+
+                    result = await task_tools.execute(
+                        call.function.name, call.function.arguments
+                    )
+
+                    tool_end_time = time.time()
 
                 # Phase 5.5: Record tool execution metrics
-                tool_end_time = time.time()
                 if metrics_collector:
                     metrics_collector.record_tool_execution(
                         tool_name=call.function.name,
@@ -622,8 +756,31 @@ class HierarchicalAgentLoop:
                         steps=result.metadata.get("step_count", 0),
                     )
 
-                # If delegation occurred, pause this task
-                if call.function.name == "delegate" and result.success:
+                # If delegation occurred, pause this task (a reused result
+                # is already in the tool output)
+                if (
+                    call.function.name == "delegate"
+                    and result.success
+                    and not (result.metadata or {}).get("cached")
+                ):
+                    child = self.scheduler.get_task(
+                        (result.metadata or {}).get("child_task_id", "")
+                    )
+                    if child:
+                        self.event_bus.emit(
+                            Event(
+                                type=EventType.TASK_CREATED,
+                                data={
+                                    "task_id": child.id,
+                                    "parent_id": task.id,
+                                    "description": child.description,
+                                    "status": child.status,
+                                    "agent": child.assigned_agent,
+                                    "estimated_seconds": child.estimated_duration,
+                                    "critical_path_seconds": child.critical_path,
+                                },
+                            )
+                        )
                     log.info(
                         "delegation_in_progress",
                         task_id=task.id,
@@ -903,24 +1060,112 @@ class HierarchicalAgentLoop:
             reason="max_iterations_reached",
         )
 
+    async def _call_llm_cancellable(self, task: Task, agent, call):
+        """Await an LLM call, aborting it on cancellation or deadline.
+
+        The call is registered so :meth:`cancel_generation` can abort it;
+        nothing polls ``task.cancel_requested`` while it runs.
+
+        Args:
+            task: Task making the call
+            agent: Agent definition (its llm_timeout is the deadline)
+            call: Coroutine performing the call
+
+        Returns:
+            The call's result
+
+        Raises:
+            GenerationCancelled: If the task was cancelled mid-call
+            asyncio.TimeoutError: If the call ran past the deadline
+        """
+        pending = asyncio.ensure_future(call)
+        self._inflight_calls[task.id] = pending
+        try:
+            # Cancelled before the call was registered to be aborted
+            if task.cancel_requested:
+                raise GenerationCancelled(task.id)
+            done, _ = await asyncio.wait({pending}, timeout=agent.llm_timeout)
+            if not done:
+                raise asyncio.TimeoutError()
+            if pending.cancelled():
+                log.info("llm_call_cancelled", task_id=task.id)
+                raise GenerationCancelled(task.id)
+            return pending.result()
+        finally:
+            self._inflight_calls.pop(task.id, None)
+            if not pending.done():
+                pending.cancel()
+                try:
+                    await pending
+                except (asyncio.CancelledError, Exception):
+                    pass
+
+    def cancel_generation(self, task_id: str) -> bool:
+        """Abort a task's in-flight LLM call right away.
+
+        Returns:
+            True if a call was in flight
+        """
+        pending = self._inflight_calls.get(task_id)
+        if pending is None or pending.done():
+            return False
+        pending.cancel()
+        log.info("llm_generation_aborted", task_id=task_id)
+        return True
+
     async def _call_llm_streaming(
-        self, model: str, messages: list[dict], tools: list[dict], task: Task, agent
+        self,
+        model: str,
+        messages: list[dict],
+        tools: list[dict],
+        task: Task,
+        agent,
+        tool_registry: Optional[ToolRegistry] = None,
     ) -> tuple:
         """Call LLM with streaming, emitting tokens to event bus.
 
         Phase 6.3: Enables real-time token display in TUI.
 
+        Tool calls parsed from text are started as soon as they close if
+        they are read-only and every call before them was read-only too, so
+        tool I/O overlaps with the rest of the generation.
+
         Args:
             model: Model to use
             messages: Conversation messages
             tools: Tool schemas
             task: Current task
             agent: Agent definition
+            tool_registry: Registry used to start read-only calls mid-stream
 
         Returns:
-            (Response, content) - Response object and full content string
+            (Response, content, detected_calls, prefetched) - Response object,
+            full content string, tool calls parsed from text during the
+            stream, and tasks for calls already started (keyed by call index)
         """
         streaming_buffer = StreamingBuffer()
+        prefetched: dict[int, asyncio.Task] = {}
+        eager = self.config.eager_tools and tool_registry is not None
+
+        def start_ready_calls():
+            """Start newly closed read-only calls."""
+            nonlocal eager
+            calls = streaming_buffer.get_tool_calls()
+            for index in range(len(prefetched), len(calls)):
+                call = calls[index]
+                if not tool_registry.is_read_only(call.name):
+                    # Later calls may depend on this call's side effects
+                    eager = False
+                    return
+                prefetched[index] = asyncio.create_task(
+                    self._run_tool_timed(tool_registry, call.name, call.arguments)
+                )
+                log.info(
+                    "tool_started_during_stream",
+                    task_id=task.id,
+                    tool=call.name,
+                    index=index,
+                )
 
         # Emit streaming start event
         self.event_bus.emit(
@@ -935,30 +1180,33 @@ class HierarchicalAgentLoop:
             """Callback for each token."""
             displayable, is_tool = streaming_buffer.add_token(token)
 
-            # Only emit displayable tokens (not tool call JSON)
-            if displayable and not is_tool:
-                self.event_bus.emit(
-                    Event(
-                        type=EventType.STREAMING_TOKEN,
-                        data={
-                            "task_id": task.id,
-                            "agent": agent.name,
-                            "token": displayable,
-                        },
-                        task_id=task.id,
-                    )
-                )
+            # Only emit displayable text (never tool call JSON), batched
+            # into frames so parallel streams don't flood the UI
+            if displayable:
+                self.token_frames.add(task.id, agent.name, displayable)
+
+            if eager and is_tool and streaming_buffer.tool_call_count > len(prefetched):
+                start_ready_calls()
 
         try:
             # Use streaming chat
             streaming_response = await self.client.chat_stream(
-                model=model, messages=messages, tools=tools, on_token=on_token
+                model=model,
+                messages=messages,
+                tools=tools,
+                on_token=on_token,
             )
 
             # Convert to standard Response
             response = streaming_response.to_response()
 
-            # Emit streaming end event
+            # Release text held back while deciding whether it was a tool call
+            tail = streaming_buffer.flush()
+            if tail:
+                self.token_frames.add(task.id, agent.name, tail)
+
+            # Flush the last frame before the end event
+            frames = self.token_frames.finish(task.id)
             self.event_bus.emit(
                 Event(
                     type=EventType.STREAMING_END,
@@ -966,39 +1214,106 @@ class HierarchicalAgentLoop:
                         "task_id": task.id,
                         "agent": agent.name,
                         "content_length": len(streaming_response.content),
+                        "frames": frames,
                     },
                     task_id=task.id,
                 )
             )
 
-            # Check for tool calls detected from text (if not native)
-            if not response.message.tool_calls:
+            # Tool calls parsed from text while streaming (if not native).
+            # An unfinished call means the text needs ToolCallParser's repairs.
+            detected_calls = []
+            if not response.message.tool_calls and not streaming_buffer.in_tool_block:
                 detected_calls = streaming_buffer.get_tool_calls()
                 if detected_calls:
-                    # Convert to the expected format
-                    class CallWrapper:
-                        def __init__(self, name, arguments):
-                            self.function = type(
-                                "obj", (object,), {"name": name, "arguments": arguments}
-                            )()
-
-                    # Note: We don't modify response.message.tool_calls as it's
-                    # already handled by ToolCallParser later in the flow
                     log.info(
                         "streaming_detected_tool_calls",
                         task_id=task.id,
                         count=len(detected_calls),
+                        started_early=len(prefetched),
                     )
+            if not detected_calls:
+                # Native calls (or ToolCallParser) win - drop early starts
+                self._cancel_prefetched(prefetched)
 
-            return response, streaming_response.content
+            return response, streaming_response.content, detected_calls, prefetched
+
+        except asyncio.CancelledError:
+            # Aborted mid-generation: drop partial output and early tool calls
+            frames = self.token_frames.finish(task.id)
+            self._cancel_prefetched(prefetched)
+            self.event_bus.emit(
+                Event(
+                    type=EventType.STREAMING_END,
+                    data={
+                        "task_id": task.id,
+                        "agent": agent.name,
+                        "content_length": len(streaming_buffer.content),
+                        "frames": frames,
+                        "cancelled": True,
+                    },
+                    task_id=task.id,
+                )
+            )
+            raise
 
         except Exception as e:
+            self.token_frames.finish(task.id)
+            self._cancel_prefetched(prefetched)
             log.error("streaming_error", task_id=task.id, error=str(e))
             # Fallback to non-streaming
             response = await self.client.chat(
-                model=model, messages=messages, tools=tools
+                model=model,
+                messages=messages,
+                tools=tools,
             )
-            return response, response.message.content
+            return response, response.message.content, [], {}
+
+    async def _run_tool_timed(
+        self, registry: ToolRegistry, name: str, arguments: dict
+    ) -> tuple:
+        """Execute a read-only tool, returning (result, start_time, end_time).
+
+        Waits for a free slot first, so timing covers only the execution.
+        """
+        async with self._tool_slots:
+            start_time = time.time()
+            result = await registry.execute(name, arguments)
+            return result, start_time, time.time()
+
+    def _start_read_only_run(
+        self, registry: ToolRegistry, calls: list, index: int, started: dict
+    ) -> int:
+        """Start the consecutive read-only calls beginning at ``index``.
+
+        Calls up to the next call with side effects are started as tasks in
+        ``started`` (by call index) and run concurrently, bounded by
+        ``max_parallel_tools``. Calls after a write wait until it has run.
+
+        Returns:
+            Number of calls started
+        """
+        count = 0
+        for i in range(index, len(calls)):
+            call = calls[i]
+            if not registry.is_read_only(call.function.name):
+                break
+            if i not in started:
+                started[i] = asyncio.create_task(
+                    self._run_tool_timed(
+                        registry, call.function.name, call.function.arguments
+                    )
+                )
+                count += 1
+        if count > 1:
+            log.info("tools_started_concurrently", first=index, count=count)
+        return count
+
+    def _cancel_prefetched(self, prefetched: dict) -> None:
+        """Cancel tool calls started mid-stream whose results won't be used."""
+        for pending in prefetched.values():
+            pending.cancel()
+        prefetched.clear()
 
     def _build_messages(
         self,
@@ -30,6 +30,26 @@ class LoopConfig:
     similarity_threshold: float = 0.8  # Word overlap ratio for similarity detection
     # Phase 6.3: Streaming output
     streaming: bool = True  # Enable streaming responses by default
+    # Streamed tokens are coalesced into frames flushed every N ms or N bytes
+    stream_frame_ms: int = 100  # Usually TUIConfig.refresh_rate_ms
+    stream_frame_bytes: int = 512
+    # Start read-only tool calls as soon as they are parsed mid-stream
+    eager_tools: bool = True
+    # Consecutive read-only calls in one response run concurrently, at most
+    # this many at a time (1 = strictly sequential)
+    max_parallel_tools: int = 4
+    # Serve repeated idempotent tool calls within a task from a result cache
+    # (invalidated by any tool that writes to the workspace)
+    cache_tool_results: bool = True
+    # Answer repeated delegations (same agent, task and context) with the
+    # earlier child's result while the files it touched are unchanged
+    cache_delegations: bool = True
+    # Tool outputs longer than this many characters are cut to head + tail;
+    # the agent pages through the rest with tool_output_page (0 = no limit)
+    tool_output_budget: int = 12000
+    # Past this many turns, older spans of the conversation are summarized in
+    # the background and sent as summary turns (0 = never compact)
+    compaction_threshold: int = 24
 
 
 @dataclass
@@ -1,14 +1,21 @@
 """Main orchestrator for running hierarchical tasks."""
 
 import asyncio
+import math
 import structlog
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
+from sindri.llm.cache import ResponseCache
 from sindri.llm.client import OllamaClient
 from sindri.llm.manager import ModelManager
+from sindri.llm.pool import EndpointPool
 from sindri.tools.registry import ToolRegistry
+from sindri.persistence.database import Database
+from sindri.persistence.metrics import MetricsStore
 from sindri.persistence.state import SessionState
+from sindri.persistence.task_graph import TaskGraphStore
+from sindri.core.estimates import DurationEstimator
 from sindri.core.tasks import Task, TaskStatus
 from sindri.core.scheduler import TaskScheduler
 from sindri.core.delegation import DelegationManager
@@ -16,10 +23,53 @@ from sindri.core.hierarchical import HierarchicalAgentLoop
 from sindri.core.loop import LoopConfig
 from sindri.memory.system import MuninnMemory
 from sindri.memory.summarizer import ConversationSummarizer
+from sindri.memory.compaction import CompactionConfig, ConversationCompactor
 from sindri.core.events import EventBus
+from sindri.distributed.coordinator import RemoteRunner
+
+if TYPE_CHECKING:
+    from sindri.distributed.queue import TaskQueue
 
 log = structlog.get_logger()
 
+FINISHED = (TaskStatus.COMPLETE, TaskStatus.FAILED, TaskStatus.CANCELLED)
+
+
+def prepare_resume(tasks: list[Task]):
+    """Reset a saved task tree so its unfinished work runs again.
+
+    Tasks caught mid-run go back to pending. A parent waiting on children
+    resumes if they all completed and fails (or is cancelled) if one of
+    them did, as it would have when the child finished.
+
+    Args:
+        tasks: Every task of one orchestration, as saved
+    """
+    by_id = {task.id: task for task in tasks}
+    for task in tasks:
+        if task.status in (TaskStatus.RUNNING, TaskStatus.PLANNING):
+            task.status = TaskStatus.PENDING
+
+    for task in tasks:
+        if task.status != TaskStatus.WAITING:
+            continue
+        children = [by_id[i] for i in task.subtask_ids if i in by_id]
+        failed = next((c for c in children if c.status == TaskStatus.FAILED), None)
+        cancelled = next(
+            (c for c in children if c.status == TaskStatus.CANCELLED), None
+        )
+        if failed is not None:
+            task.status = TaskStatus.FAILED
+            task.error = f"Child task {failed.id} failed: {failed.error}"
+        elif cancelled is not None and task.cancel_requested:
+            task.status = TaskStatus.CANCELLED
+            task.error = "Task cancelled by user"
+        elif cancelled is not None:
+            task.status = TaskStatus.FAILED
+            task.error = f"Child task {cancelled.id} was cancelled"
+        elif all(c.status == TaskStatus.COMPLETE for c in children):
+            task.status = TaskStatus.PENDING
+
 
 class Orchestrator:
     """Main orchestrator for hierarchical task execution."""
@@ -32,19 +82,38 @@ class Orchestrator:
         enable_memory: bool = True,
         event_bus: Optional[EventBus] = None,
         work_dir: Optional[Path] = None,
+        response_cache: Optional[ResponseCache] = None,
+        endpoint_pool: Optional[EndpointPool] = None,
+        database: Optional[Database] = None,
+        task_queue: Optional["TaskQueue"] = None,
     ):
-        self.client = client or OllamaClient()
+        self.client = client or OllamaClient(
+            response_cache=response_cache, pool=endpoint_pool
+        )
+        if response_cache is not None:
+            self.client.response_cache = response_cache
+        self.endpoint_pool = endpoint_pool
         self.config = config or LoopConfig()
         self.event_bus = event_bus or EventBus()
         self.work_dir = work_dir
 
         # Initialize subsystems
-        self.model_manager = ModelManager(total_vram_gb=total_vram_gb)
+        # With an endpoint pool, VRAM budgets come from each endpoint instead
+        self.model_manager = ModelManager(
+            total_vram_gb=total_vram_gb, pool=endpoint_pool
+        )
         self.scheduler = TaskScheduler(self.model_manager)
-        self.state = SessionState()
+        # Sessions and metrics go to the default database unless one is given
+        self.state = SessionState(database)
+        # Task tree saved as it changes, for `sindri resume <task_id>`
+        self.task_graph = TaskGraphStore(self.state.db)
+        self.scheduler.add_observer(self.task_graph.track)
         # Phase 6.2: Pass model_manager for pre-warming during delegation
         self.delegation = DelegationManager(
-            self.scheduler, self.state, model_manager=self.model_manager
+            self.scheduler,
+            self.state,
+            model_manager=self.model_manager,
+            cache_results=self.config.cache_delegations,
         )
         self.tools = ToolRegistry.default(work_dir=work_dir)
 
@@ -59,6 +128,17 @@ class Orchestrator:
             self.memory = None
             self.summarizer = None
 
+        # Rolling compaction of long conversations (uses the small summary model)
+        self.compactor = None
+        if self.config.compaction_threshold > 0:
+            self.compactor = ConversationCompactor(
+                self.summarizer or ConversationSummarizer(self.client),
+                CompactionConfig(threshold_turns=self.config.compaction_threshold),
+            )
+
+        # Task metrics; past sessions also give duration estimates for ranking
+        self.metrics_store = MetricsStore(database) if database else MetricsStore()
+
         # Create hierarchical loop
         self.loop = HierarchicalAgentLoop(
             client=self.client,
@@ -69,17 +149,38 @@ class Orchestrator:
             config=self.config,
             memory=self.memory,
             summarizer=self.summarizer,
+            compactor=self.compactor,
             event_bus=self.event_bus,
+            metrics_store=self.metrics_store,
         )
 
-        log.info("orchestrator_initialized", memory_enabled=enable_memory)
+        # Distributed mode: publish ready tasks for workers instead of
+        # running them here
+        self.task_queue = task_queue
+        self.remote = (
+            RemoteRunner(task_queue, self.scheduler, self.delegation, self.event_bus)
+            if task_queue is not None
+            else None
+        )
+
+        log.info(
+            "orchestrator_initialized",
+            memory_enabled=enable_memory,
+            distributed=task_queue is not None,
+        )
 
     def cancel_task(self, task_id: str):
-        """Request cancellation of a task and its subtasks."""
+        """Request cancellation of a task and its subtasks.
+
+        In-flight generations are aborted immediately so the GPU is freed.
+        """
         task = self.scheduler.tasks.get(task_id)
         if task:
             log.info("task_cancellation_requested", task_id=task_id)
             task.cancel_requested = True
+            self.loop.cancel_generation(task_id)
+            # Wake a dispatcher waiting on subtasks so it sees the request
+            self.scheduler.notify_changed()
 
             # Cancel all subtasks recursively
             for subtask_id in task.subtask_ids:
@@ -102,8 +203,6 @@ class Orchestrator:
         Returns:
             Dict with success status, task_id, result, and subtask count.
         """
-        log.info("orchestrator_started", request=user_request[:100], parallel=parallel)
-
         # Create root task assigned to Brokkr (orchestrator)
         root_task = Task(
             description=user_request,
@@ -111,35 +210,79 @@ class Orchestrator:
             assigned_agent="brokkr",
             priority=0,
         )
+        log.info(
+            "orchestrator_started",
+            task_id=root_task.id,
+            request=user_request[:100],
+            parallel=parallel,
+        )
+
+        # Rank tasks by critical path, using durations from past sessions
+        self.scheduler.estimator = await DurationEstimator.load(self.metrics_store)
 
         # Add to scheduler
         self.scheduler.add_task(root_task)
 
-        # Execute task queue
-        while self.scheduler.has_work():
-            # Check for cancellation
-            if root_task.cancel_requested:
-                log.info("orchestrator_cancelled", task_id=root_task.id)
-                root_task.status = TaskStatus.CANCELLED
-                return {
-                    "success": False,
-                    "task_id": root_task.id,
-                    "error": "Task cancelled by user",
-                    "output": "Task cancelled",
-                }
+        return await self._drive(root_task, parallel)
+
+    async def resume(self, task_id: str, parallel: bool = True) -> Optional[dict]:
+        """Continue an interrupted orchestration from its saved task tree.
+
+        Completed tasks keep their results; tasks that were running start
+        again (continuing their sessions) and pending ones run as usual.
+
+        Args:
+            task_id: The root task or any task of the orchestration
+            parallel: Execute independent tasks concurrently
+
+        Returns:
+            Result dict as for run(), or None if the task was never saved
+        """
+        tasks = await self.task_graph.load(task_id)
+        if not tasks:
+            return None
+        root_task = tasks[0]
+        prepare_resume(tasks)
+        log.info(
+            "orchestrator_resumed",
+            task_id=root_task.id,
+            tasks=len(tasks),
+            unfinished=sum(1 for t in tasks if t.status not in FINISHED),
+        )
+
+        self.scheduler.estimator = await DurationEstimator.load(self.metrics_store)
+        for task in tasks:
+            self.scheduler.add_task(task)
+
+        return await self._drive(root_task, parallel)
 
+    async def _drive(self, root_task: Task, parallel: bool) -> dict:
+        """Run the scheduled tasks until the root task's tree is done."""
+        # Sleep until tasks are added or re-queued instead of polling
+        wake = asyncio.Event()
+        self.scheduler.add_listener(wake.set)
+        try:
             if parallel:
-                # Phase 6.1: Parallel execution
-                result = await self._run_parallel_batch()
+                # Phase 6.1: Parallel execution, dispatched continuously
+                outcome = await self._run_parallel(root_task, wake)
             else:
                 # Legacy sequential execution
-                result = await self._run_sequential()
+                outcome = await self._run_sequential_until_idle(root_task, wake)
+        finally:
+            self.scheduler.remove_listener(wake.set)
 
-            if result == "waiting":
-                await asyncio.sleep(0.5)
-                continue
-            elif result == "stuck":
-                break
+        if outcome == "cancelled":
+            log.info("orchestrator_cancelled", task_id=root_task.id)
+            root_task.status = TaskStatus.CANCELLED
+        await self.task_graph.flush()
+
+        if outcome == "cancelled":
+            return {
+                "success": False,
+                "task_id": root_task.id,
+                "error": "Task cancelled by user",
+                "output": "Task cancelled",
+            }
 
         # Check root task status
         if root_task.status == TaskStatus.COMPLETE:
@@ -164,78 +307,115 @@ class Orchestrator:
                 "error": root_task.error,
             }
 
-    async def _run_parallel_batch(self) -> str:
-        """Execute a batch of tasks in parallel.
+    def _no_ready_work(self) -> str:
+        """Classify an empty ready queue as "waiting" or "stuck"."""
+        waiting_count = self.scheduler.get_status_counts().get(TaskStatus.WAITING, 0)
+        if waiting_count > 0:
+            log.info("waiting_for_subtasks", count=waiting_count)
+            return "waiting"
+        log.warning("no_tasks_ready", pending=self.scheduler.get_pending_count())
+        return "stuck"
+
+    async def _run_parallel(self, root_task: Task, wake: asyncio.Event) -> str:
+        """Run tasks as soon as they are ready, without batch barriers.
+
+        Ready tasks are started whenever a running task finishes or
+        delegates (its VRAM and parallelism slot free up) or the scheduler
+        gets new work, so one slow task never holds back the rest.
 
         Returns:
-            "ok" if tasks were executed,
-            "waiting" if waiting on subtasks,
-            "stuck" if no progress possible.
+            "done" when no work is left, "cancelled" if the root task was
+            cancelled, "stuck" if no progress is possible.
         """
-        # Get batch of ready tasks
-        batch = self.scheduler.get_ready_batch()
-
-        if not batch:
-            # No tasks ready - check if we're waiting
-            waiting_count = sum(
-                1
-                for t in self.scheduler.tasks.values()
-                if t.status == TaskStatus.WAITING
-            )
+        running: dict[asyncio.Future, Task] = {}
+        outcome = "done"
 
-            if waiting_count > 0:
-                log.info("waiting_for_subtasks", count=waiting_count)
-                return "waiting"
-            else:
-                log.warning(
-                    "no_tasks_ready", pending=self.scheduler.get_pending_count()
+        while True:
+            wake.clear()
+
+            # Collect finished tasks
+            for future in [f for f in running if f.done()]:
+                self._record_result(running.pop(future), future)
+
+            if not running and not self.scheduler.has_work():
+                break
+            if root_task.cancel_requested:
+                outcome = "cancelled"
+                break
+
+            # Workers manage their own VRAM; locally it's the model budget
+            for task in self.scheduler.get_ready_batch(
+                max_vram=math.inf if self.remote else None,
+                running=list(running.values()),
+            ):
+                log.info(
+                    "executing_task",
+                    task_id=task.id,
+                    agent=task.assigned_agent,
+                    description=task.description[:50],
+                    running=len(running),
                 )
-                return "stuck"
+                future = asyncio.ensure_future(self._execute(task))
+                future.add_done_callback(lambda _: wake.set())
+                running[future] = task
 
-        if len(batch) == 1:
-            # Single task - run directly
-            task = batch[0]
-            log.info(
-                "executing_task",
-                task_id=task.id,
-                agent=task.assigned_agent,
-                description=task.description[:50],
-            )
-            result = await self.loop.run_task(task)
-            log.info(
-                "task_result",
-                task_id=task.id,
-                success=result.success,
-                iterations=result.iterations,
-            )
-        else:
-            # Multiple tasks - run in parallel
-            log.info(
-                "executing_parallel_batch",
-                task_count=len(batch),
-                tasks=[t.id for t in batch],
-            )
+            if not running and self._no_ready_work() == "stuck":
+                outcome = "stuck"
+                break
 
-            # Execute all tasks concurrently
-            results = await asyncio.gather(
-                *[self.loop.run_task(task) for task in batch], return_exceptions=True
-            )
+            await wake.wait()
+
+        if running:
+            # Cancelled: running tasks were told to stop; let them wind down
+            await asyncio.gather(*running, return_exceptions=True)
+            for future, task in running.items():
+                self._record_result(task, future)
+        return outcome
+
+    def _execute(self, task: Task):
+        """Run a task here, or on a worker in distributed mode."""
+        if self.remote is not None:
+            return self.remote.run_task(task)
+        return self.loop.run_task(task)
+
+    def _record_result(self, task: Task, future: asyncio.Future):
+        """Log a finished task, failing it if run_task raised."""
+        if future.cancelled():
+            task.status = TaskStatus.CANCELLED
+            return
+        error = future.exception()
+        if error is not None:
+            log.error("task_exception", task_id=task.id, error=str(error))
+            task.status = TaskStatus.FAILED
+            task.error = str(error)
+            return
+        result = future.result()
+        log.info(
+            "task_result",
+            task_id=task.id,
+            success=result.success,
+            iterations=result.iterations,
+        )
 
-            # Log results
-            for task, result in zip(batch, results):
-                if isinstance(result, Exception):
-                    log.error("task_exception", task_id=task.id, error=str(result))
-                    task.status = TaskStatus.FAILED
-                    task.error = str(result)
-                else:
-                    log.info(
-                        "task_result",
-                        task_id=task.id,
-                        success=result.success,
-                        iterations=result.iterations,
-                    )
+    async def _run_sequential_until_idle(
+        self, root_task: Task, wake: asyncio.Event
+    ) -> str:
+        """Run tasks one at a time until no work is left.
 
-        return "ok"
+        Returns:
+            "done", "cancelled" or "stuck" as for _run_parallel.
+        """
+        while self.scheduler.has_work():
+            if root_task.cancel_requested:
+                return "cancelled"
+
+            wake.clear()
+            result = await self._run_sequential()
+            if result == "waiting":
+                await wake.wait()
+            elif result == "stuck":
+                return "stuck"
+        return "done"
 
     async def _run_sequential(self) -> str:
         """Execute tasks sequentially (legacy behavior).
@@ -248,20 +428,7 @@ class Orchestrator:
         next_task = self.scheduler.get_next_task()
 
         if next_task is None:
-            waiting_count = sum(
-                1
-                for t in self.scheduler.tasks.values()
-                if t.status == TaskStatus.WAITING
-            )
-
-            if waiting_count > 0:
-                log.info("waiting_for_subtasks", count=waiting_count)
-                return "waiting"
-            else:
-                log.warning(
-                    "no_tasks_ready", pending=self.scheduler.get_pending_count()
-                )
-                return "stuck"
+            return self._no_ready_work()
 
         log.info(
             "executing_task",
@@ -270,7 +437,7 @@ class Orchestrator:
             description=next_task.description[:50],
         )
 
-        result = await self.loop.run_task(next_task)
+        result = await self._execute(next_task)
 
         log.info(
             "task_result",
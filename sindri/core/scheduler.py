@@ -1,25 +1,129 @@
 """Task scheduler with priority queue and dependency resolution."""
 
-from typing import Optional
+from collections import Counter
+from dataclasses import dataclass
+from typing import Callable, Optional
 import heapq
+import math
 import structlog
 
+from sindri.core.estimates import DurationEstimator
 from sindri.core.tasks import Task, TaskStatus
 from sindri.llm.manager import ModelManager
 
 log = structlog.get_logger()
 
 
-class TaskScheduler:
-    """Priority queue with dependency resolution and parallel execution support."""
+@dataclass
+class BatchingPolicy:
+    """How get_ready_batch packs ready tasks into the VRAM budget."""
+
+    max_skips: int = 4  # Batches a ready task can be passed over before it must run
+    loaded_bonus: float = 1.0  # Extra weight for models already in VRAM
+    vram_step_gb: float = 0.1  # VRAM resolution of the knapsack
+
+
+def pack_models(
+    items: list[tuple[Optional[str], float, float]], capacity: float, step: float
+) -> set[Optional[str]]:
+    """Choose models to run: a 0/1 knapsack over VRAM.
+
+    Args:
+        items: (model, vram_gb, weight) for each model with ready tasks
+        capacity: VRAM available (GB)
+        step: VRAM resolution (GB); costs round up, capacity rounds down
+
+    Returns:
+        Models whose total VRAM fits and whose total weight is largest
+    """
+    if sum(vram for _, vram, _ in items) <= capacity:
+        return {model for model, _, _ in items}  # Everything fits
+    slots = max(0, int(capacity / step + 1e-9))
+    # best[c]: heaviest choice using at most c slots
+    best: list[tuple[float, frozenset]] = [(0.0, frozenset())] * (slots + 1)
+    for model, vram, weight in items:
+        cost = math.ceil(vram / step - 1e-9)
+        if cost > slots:
+            continue
+        for c in range(slots, cost - 1, -1):
+            candidate = best[c - cost][0] + weight
+            if candidate > best[c][0]:
+                best[c] = (candidate, best[c - cost][1] | {model})
+    return set(best[slots][1])
+
 
-    def __init__(self, model_manager: ModelManager):
+class TaskScheduler:
+    """Priority queue with dependency resolution and parallel execution support.
+
+    Only tasks whose dependencies are all complete sit in the ready heap.
+    Each task keeps a count of unfinished dependencies and each dependency
+    knows its dependents, so a task moves into the heap exactly when its
+    last dependency completes; status counts are kept per transition. A
+    dispatch therefore touches the ready tasks, not every task.
+
+    With a duration estimator, ready tasks are ordered by critical-path
+    length (longest first) before priority, so long chains start early and
+    short leaves fill the gaps.
+    """
+
+    def __init__(
+        self,
+        model_manager: ModelManager,
+        policy: Optional[BatchingPolicy] = None,
+        estimator: Optional[DurationEstimator] = None,
+    ):
         self.tasks: dict[str, Task] = {}
-        self.pending: list[tuple[int, str]] = []  # (priority, task_id) heap
+        # Ready heap of ((-critical_path, priority), task_id)
+        self.pending: list[tuple[tuple[float, int], str]] = []
         self.model_manager = model_manager
+        # Called whenever a task may have become ready (see add_listener)
+        self._listeners: list[Callable[[], None]] = []
+        # Called with each added or changed task (see add_observer)
+        self._observers: list[Callable[[Task], None]] = []
+
+        # Dependency index
+        self._dependents: dict[str, set[str]] = {}  # task id -> tasks needing it
+        self._remaining: dict[str, int] = {}  # task id -> unfinished dependencies
+        self._queued: set[str] = set()  # Task ids in the ready heap
+        self._status_counts: Counter[TaskStatus] = Counter()
+
+        self.policy = policy or BatchingPolicy()
+        self._skips: dict[str, int] = {}  # Times a ready task was left out
+        self.estimator = estimator
 
         log.info("scheduler_initialized")
 
+    def add_listener(self, callback: Callable[[], None]):
+        """Call ``callback`` when tasks are added or re-queued.
+
+        Lets a dispatcher sleep until there may be new work instead of
+        polling.
+        """
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback: Callable[[], None]):
+        """Stop calling a listener added with add_listener."""
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def add_observer(self, callback: Callable[[Task], None]):
+        """Call ``callback(task)`` when a task is added or changes.
+
+        Status changes are reported automatically; other changes worth
+        recording are reported with task_updated().
+        """
+        self._observers.append(callback)
+
+    def task_updated(self, task: Task):
+        """Report a change to a task to the observers."""
+        for callback in list(self._observers):
+            callback(task)
+
+    def notify_changed(self):
+        """Wake listeners (e.g. after a status change made outside the scheduler)."""
+        for callback in list(self._listeners):
+            callback()
+
     def add_task(self, task: Task) -> str:
         """Add task to scheduler."""
         from sindri.agents.registry import AGENTS
@@ -29,144 +133,347 @@ class TaskScheduler:
         if agent:
             task.vram_required = agent.estimated_vram_gb
             task.model_name = agent.model
+        if self.estimator and not task.estimated_duration:
+            task.estimated_duration = self.estimator.estimate(task)
 
+        previous = self.tasks.get(task.id)
+        if previous is not None:
+            self._status_counts[previous.status] -= 1
+            previous.set_status_listener(None)
         self.tasks[task.id] = task
-        heapq.heappush(self.pending, (task.priority, task.id))
+        self._status_counts[task.status] += 1
+        task.set_status_listener(self._on_status_change)
+
+        self._index_dependencies(task)
+        if task.status == TaskStatus.COMPLETE:
+            self._release_dependents(task.id)
+        self._update_ranks(task)
 
         log.info(
             "task_added",
             task_id=task.id,
             priority=task.priority,
+            estimated_seconds=round(task.estimated_duration, 1),
+            critical_path_seconds=round(task.critical_path, 1),
             agent=task.assigned_agent,
             vram_required=task.vram_required,
             description=task.description[:50],
         )
 
-        return task.id
+        if task.status == TaskStatus.PENDING and not self._remaining[task.id]:
+            self._push_ready(task)
+        self.task_updated(task)
 
-    def get_next_task(self) -> Optional[Task]:
-        """Get next executable task."""
+        return task.id
 
-        not_ready = []
+    def requeue(self, task: Task):
+        """Put a task back in the pending queue (e.g. a resumed parent)."""
+        task.status = TaskStatus.PENDING
+        if not self._remaining.get(task.id):
+            self._push_ready(task)
+        self.notify_changed()
 
+    def _index_dependencies(self, task: Task):
+        """(Re)build a task's unfinished-dependency count and reverse edges."""
+        remaining = 0
+        for dep_id in task.depends_on:
+            self._dependents.setdefault(dep_id, set()).add(task.id)
+            dep = self.tasks.get(dep_id)
+            if not dep or dep.status != TaskStatus.COMPLETE:
+                remaining += 1
+        self._remaining[task.id] = remaining
+
+    def _release_dependents(self, task_id: str):
+        """A task completed: dependents whose last dependency it was are ready."""
+        for dependent_id in self._dependents.get(task_id, ()):
+            remaining = self._remaining.get(dependent_id, 0) - 1
+            self._remaining[dependent_id] = max(0, remaining)
+            dependent = self.tasks.get(dependent_id)
+            if (
+                remaining <= 0
+                and dependent is not None
+                and dependent.status == TaskStatus.PENDING
+            ):
+                self._push_ready(dependent)
+
+    def _successors(self, task: Task) -> list[Task]:
+        """Tasks that can't finish until ``task`` does."""
+        ids = set(self._dependents.get(task.id, ()))
+        if task.parent_id:
+            ids.add(task.parent_id)
+        return [self.tasks[i] for i in ids if i in self.tasks]
+
+    def _predecessors(self, task: Task) -> list[Task]:
+        """Tasks ``task`` waits on (dependencies and subtasks)."""
+        ids = set(task.depends_on) | set(task.subtask_ids)
+        return [self.tasks[i] for i in ids if i in self.tasks]
+
+    def _update_ranks(self, task: Task):
+        """Recompute critical-path length for a task and everything upstream.
+
+        Upward rank: a task's estimated duration plus the largest rank of
+        its successors. Ranks are settled sinks-first over the affected
+        tasks; tasks on a dependency cycle keep their old rank.
+        """
+        affected: dict[str, Task] = {}
+        stack = [task]
+        while stack:
+            current = stack.pop()
+            if current.id not in affected:
+                affected[current.id] = current
+                stack.extend(self._predecessors(current))
+
+        waiting_on = {
+            task_id: sum(1 for s in self._successors(t) if s.id in affected)
+            for task_id, t in affected.items()
+        }
+        settled = [t for task_id, t in affected.items() if not waiting_on[task_id]]
+        reorder = False
+        while settled:
+            current = settled.pop()
+            rank = current.estimated_duration + max(
+                (s.critical_path for s in self._successors(current)), default=0.0
+            )
+            if rank != current.critical_path:
+                current.critical_path = rank
+                reorder = reorder or current.id in self._queued
+            for predecessor in self._predecessors(current):
+                if predecessor.id in affected:
+                    waiting_on[predecessor.id] -= 1
+                    if waiting_on[predecessor.id] == 0:
+                        settled.append(predecessor)
+
+        if reorder:
+            # Ready tasks moved up; rebuild the heap with their new keys
+            self.pending = [
+                (self._sort_key(self.tasks[task_id]), task_id)
+                for task_id in self._queued
+            ]
+            heapq.heapify(self.pending)
+
+    @staticmethod
+    def _sort_key(task: Task) -> tuple[float, int]:
+        """Heap key: longest critical path first, then priority."""
+        return (-task.critical_path, task.priority)
+
+    def _on_status_change(self, task: Task, old: TaskStatus):
+        """Keep counters and the ready heap in step with a status change."""
+        self._status_counts[old] -= 1
+        self._status_counts[task.status] += 1
+        if old == TaskStatus.PENDING:
+            self._skips.pop(task.id, None)
+
+        if task.status == TaskStatus.COMPLETE:
+            self._release_dependents(task.id)
+        elif old == TaskStatus.COMPLETE:
+            # Completed work was reopened; its dependents wait again
+            for dependent_id in self._dependents.get(task.id, ()):
+                if dependent_id in self._remaining:
+                    self._remaining[dependent_id] += 1
+
+        if task.status == TaskStatus.PENDING and not self._remaining.get(task.id):
+            self._push_ready(task)
+        self.task_updated(task)
+
+    def _push_ready(self, task: Task, notify: bool = True):
+        if task.id in self._queued:
+            return
+        self._queued.add(task.id)
+        heapq.heappush(self.pending, (self._sort_key(task), task.id))
+        if notify:
+            self.notify_changed()
+
+    def _pop_ready(self) -> Optional[tuple[int, Task]]:
+        """Pop the highest-priority ready task, skipping stale heap entries."""
         while self.pending:
-            priority, task_id = heapq.heappop(self.pending)
+            _, task_id = heapq.heappop(self.pending)
+            self._queued.discard(task_id)
             task = self.tasks.get(task_id)
 
             if not task or task.status != TaskStatus.PENDING:
                 continue
 
-            if self._dependencies_satisfied(task) and self._resources_available(task):
+            if not self._dependencies_satisfied(task):
+                # depends_on was changed after the task was added; re-index
+                # so the task comes back when the new dependencies complete
+                self._index_dependencies(task)
+                continue
+
+            return task.priority, task
+        return None
+
+    def get_next_task(self) -> Optional[Task]:
+        """Get next executable task."""
+
+        not_ready = []
+
+        while (entry := self._pop_ready()) is not None:
+            priority, task = entry
+
+            if self._resources_available(task):
                 log.info(
                     "task_selected",
                     task_id=task.id,
                     priority=priority,
                     agent=task.assigned_agent,
                 )
-                # Put back non-ready tasks before returning
-                for item in not_ready:
-                    heapq.heappush(self.pending, item)
+                # Put back tasks skipped for resources before returning
+                for skipped in not_ready:
+                    self._push_ready(skipped, notify=False)
+                self._skips.pop(task.id, None)
                 return task
 
-            # Not ready yet
-            not_ready.append((priority, task_id))
+            # Ready but no room for its model yet
+            not_ready.append(task)
 
-        # Put back non-ready tasks
-        for item in not_ready:
-            heapq.heappush(self.pending, item)
+        for skipped in not_ready:
+            self._push_ready(skipped, notify=False)
 
         return None
 
-    def get_ready_batch(self, max_vram: Optional[float] = None) -> list[Task]:
+    def get_ready_batch(
+        self,
+        max_vram: Optional[float] = None,
+        running: Optional[list[Task]] = None,
+    ) -> list[Task]:
         """Get all tasks that can run in parallel within VRAM budget.
 
         This method implements the core parallel execution logic:
-        1. Finds all tasks whose dependencies are satisfied
-        2. Groups tasks that can fit within VRAM constraints
-        3. Tasks sharing the same model only count VRAM once
+        1. Groups ready tasks by model; tasks sharing a model count its
+           VRAM once, and models already used by running tasks cost nothing
+        2. Chooses which models to run with a knapsack over the VRAM left,
+           weighting tasks by critical path (or priority, without
+           estimates) and favouring loaded models, so a
+           run of same-model tasks isn't broken up by a model swap
+        3. A task passed over ``policy.max_skips`` times must run next;
+           new models are held back until it fits (bounded starvation)
 
         Args:
             max_vram: Maximum VRAM budget. If None, uses model_manager.available.
+            running: Tasks already executing. Their models count against the
+                budget and new tasks must be able to run alongside them.
 
         Returns:
             List of tasks that can run concurrently.
         """
         if max_vram is None:
             max_vram = self.model_manager.available
-
-        ready_tasks: list[Task] = []
-        vram_allocated: float = 0.0
-        models_used: set[str] = set()
-        not_ready: list[tuple[int, str]] = []
-
-        # Get currently loaded models - they don't need additional VRAM
+        running = running or []
         loaded_models = set(self.model_manager.loaded.keys())
 
-        while self.pending:
-            priority, task_id = heapq.heappop(self.pending)
-            task = self.tasks.get(task_id)
-
-            if not task or task.status != TaskStatus.PENDING:
-                continue
-
-            # Check dependencies
-            if not self._dependencies_satisfied(task):
-                not_ready.append((priority, task_id))
-                continue
-
-            # Check if task can run in parallel with already selected tasks
-            can_add = True
-            for selected in ready_tasks:
-                if not task.can_run_parallel_with(selected):
-                    can_add = False
-                    break
-
-            if not can_add:
-                not_ready.append((priority, task_id))
-                continue
-
-            # Calculate VRAM needed for this task
-            model = task.model_name
-            vram_needed = task.vram_required
-
-            if model in models_used or model in loaded_models:
-                # Model already allocated or loaded - no additional VRAM needed
-                vram_needed = 0.0
-
-            # Check if we have VRAM budget
-            if vram_allocated + vram_needed > max_vram:
-                not_ready.append((priority, task_id))
-                continue
+        # VRAM held by the models of running tasks
+        models_used: set[str] = set()
+        vram_allocated = 0.0
+        for task in running:
+            if task.model_name and task.model_name not in models_used:
+                vram_allocated += task.vram_required
+                models_used.add(task.model_name)
+
+        # Ready tasks (priority order) that may run alongside running ones
+        candidates: list[Task] = []
+        not_ready: list[Task] = []
+        while (entry := self._pop_ready()) is not None:
+            task = entry[1]
+            if all(task.can_run_parallel_with(other) for other in running):
+                candidates.append(task)
+            else:
+                not_ready.append(task)
+
+        groups: dict[Optional[str], list[Task]] = {}
+        for task in candidates:
+            groups.setdefault(task.model_name, []).append(task)
+
+        def vram_cost(model: Optional[str]) -> float:
+            if model is None or model in models_used:
+                return 0.0
+            return max(t.vram_required for t in groups[model])
+
+        capacity = max_vram - vram_allocated
+        chosen: set[Optional[str]] = {m for m in groups if vram_cost(m) == 0.0}
+
+        starving = self._starving_task(candidates, max_vram)
+        if starving is not None and starving.model_name not in chosen:
+            need = vram_cost(starving.model_name)
+            if need <= capacity:
+                chosen.add(starving.model_name)
+                capacity -= need
+            else:
+                # Hold back new models until running work frees enough VRAM
+                chosen = set()
+                capacity = 0.0
+                log.info(
+                    "batch_held_for_starving_task",
+                    task_id=starving.id,
+                    model=starving.model_name,
+                    vram_needed=need,
+                )
 
-            # Add task to batch
-            ready_tasks.append(task)
-            vram_allocated += vram_needed
-            if model:
-                models_used.add(model)
+        if capacity > 0:
+            items = [
+                (
+                    model,
+                    vram_cost(model),
+                    sum(self._task_weight(t) for t in tasks)
+                    * (1.0 + self.policy.loaded_bonus * (model in loaded_models)),
+                )
+                for model, tasks in groups.items()
+                if model not in chosen
+            ]
+            chosen |= pack_models(items, capacity, self.policy.vram_step_gb)
 
-            log.debug(
-                "task_added_to_batch",
-                task_id=task.id,
-                agent=task.assigned_agent,
-                model=model,
-                vram_needed=vram_needed,
-                total_vram=vram_allocated,
-            )
+        ready_tasks: list[Task] = []
+        for task in candidates:
+            if task.model_name in chosen and all(
+                task.can_run_parallel_with(selected) for selected in ready_tasks
+            ):
+                ready_tasks.append(task)
+                self._skips.pop(task.id, None)
+                log.debug(
+                    "task_added_to_batch",
+                    task_id=task.id,
+                    agent=task.assigned_agent,
+                    model=task.model_name,
+                    vram_needed=vram_cost(task.model_name),
+                )
+            else:
+                self._skips[task.id] = self._skips.get(task.id, 0) + 1
+                not_ready.append(task)
 
-        # Put back non-ready tasks
-        for item in not_ready:
-            heapq.heappush(self.pending, item)
+        # Put back ready tasks that didn't fit this batch (not new work, so
+        # listeners aren't woken)
+        for task in not_ready:
+            self._push_ready(task, notify=False)
 
         if ready_tasks:
+            new_models = [m for m in chosen if m and m not in models_used]
             log.info(
                 "batch_ready",
                 task_count=len(ready_tasks),
-                vram_allocated=vram_allocated,
-                models=list(models_used),
+                vram_allocated=vram_allocated + sum(vram_cost(m) for m in new_models),
+                models=[m for m in chosen if m],
+                models_to_load=[m for m in new_models if m not in loaded_models],
+                deferred=len(not_ready),
             )
 
         return ready_tasks
 
+    def _task_weight(self, task: Task) -> float:
+        """Knapsack weight: critical path (else priority) and age count more."""
+        urgency = task.critical_path or 1.0 / (1 + max(0, task.priority))
+        return (1 + self._skips.get(task.id, 0)) * urgency
+
+    def _starving_task(self, candidates: list[Task], max_vram: float) -> Optional[Task]:
+        """The longest-skipped task past the skip limit, if any can ever fit."""
+        starving = [
+            t
+            for t in candidates
+            if self._skips.get(t.id, 0) >= self.policy.max_skips
+            and t.vram_required <= max_vram
+        ]
+        if not starving:
+            return None
+        return max(starving, key=lambda t: (self._skips[t.id], -t.priority))
+
     def _dependencies_satisfied(self, task: Task) -> bool:
         """Check if all task dependencies are complete."""
         for dep_id in task.depends_on:
@@ -200,6 +507,18 @@ class TaskScheduler:
 
         return can_load
 
+    def clear(self):
+        """Forget every task (e.g. a worker between leased tasks)."""
+        for task in self.tasks.values():
+            task.set_status_listener(None)
+        self.tasks.clear()
+        self.pending.clear()
+        self._dependents.clear()
+        self._remaining.clear()
+        self._queued.clear()
+        self._status_counts.clear()
+        self._skips.clear()
+
     def get_task(self, task_id: str) -> Optional[Task]:
         """Get a task by ID."""
         return self.tasks.get(task_id)
@@ -219,15 +538,22 @@ class TaskScheduler:
 
     def get_pending_count(self) -> int:
         """Get number of pending tasks."""
-        return sum(1 for t in self.tasks.values() if t.status == TaskStatus.PENDING)
+        return self._status_counts[TaskStatus.PENDING]
 
     def get_running_count(self) -> int:
         """Get number of running tasks."""
-        return sum(1 for t in self.tasks.values() if t.status == TaskStatus.RUNNING)
+        return self._status_counts[TaskStatus.RUNNING]
+
+    def get_status_counts(self) -> dict[TaskStatus, int]:
+        """Number of tasks in each status."""
+        return {status: n for status, n in self._status_counts.items() if n}
 
     def has_work(self) -> bool:
         """Check if there's any work to do."""
-        return any(
-            t.status in (TaskStatus.PENDING, TaskStatus.RUNNING, TaskStatus.WAITING)
-            for t in self.tasks.values()
+        counts = self._status_counts
+        return (
+            counts[TaskStatus.PENDING]
+            + counts[TaskStatus.RUNNING]
+            + counts[TaskStatus.WAITING]
+            > 0
         )
@@ -59,6 +59,83 @@ class Task:
     vram_required: float = 0.0  # VRAM needed for this task's model (GB)
     model_name: Optional[str] = None  # Model used by assigned agent
 
+    # Critical-path scheduling (seconds; 0.0 when no estimator is set)
+    estimated_duration: float = 0.0  # Expected run time, from past sessions
+    critical_path: float = 0.0  # This task plus the longest chain waiting on it
+
+    def __setattr__(self, name: str, value) -> None:
+        old = self.__dict__.get(name)
+        super().__setattr__(name, value)
+        # Status changes are reported to the owning scheduler, wherever they
+        # are made (agent loop, delegation, orchestrator)
+        if name == "status" and old is not None and old is not value:
+            listener = self.__dict__.get("_status_listener")
+            if listener is not None:
+                listener(self, old)
+
+    def set_status_listener(self, listener) -> None:
+        """Call ``listener(task, old_status)`` after every status change."""
+        self.__dict__["_status_listener"] = listener
+
+    def to_dict(self) -> dict:
+        """Serialize to a JSON-compatible dictionary."""
+        return {
+            "id": self.id,
+            "parent_id": self.parent_id,
+            "description": self.description,
+            "task_type": self.task_type,
+            "assigned_agent": self.assigned_agent,
+            "status": self.status.value,
+            "priority": self.priority,
+            "created_at": self.created_at.isoformat(),
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "completed_at": (
+                self.completed_at.isoformat() if self.completed_at else None
+            ),
+            "subtask_ids": list(self.subtask_ids),
+            "depends_on": list(self.depends_on),
+            "context": self.context,
+            "result": self.result,
+            "error": self.error,
+            "session_id": self.session_id,
+            "cancel_requested": self.cancel_requested,
+            "vram_required": self.vram_required,
+            "model_name": self.model_name,
+            "estimated_duration": self.estimated_duration,
+            "critical_path": self.critical_path,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Task":
+        """Deserialize from a dictionary made by to_dict()."""
+
+        def timestamp(value: Optional[str]) -> Optional[datetime]:
+            return datetime.fromisoformat(value) if value else None
+
+        return cls(
+            id=data["id"],
+            parent_id=data.get("parent_id"),
+            description=data.get("description", ""),
+            task_type=data.get("task_type", "general"),
+            assigned_agent=data.get("assigned_agent", "brokkr"),
+            status=TaskStatus(data.get("status", TaskStatus.PENDING.value)),
+            priority=data.get("priority", 1),
+            created_at=timestamp(data.get("created_at")) or datetime.now(),
+            started_at=timestamp(data.get("started_at")),
+            completed_at=timestamp(data.get("completed_at")),
+            subtask_ids=list(data.get("subtask_ids", [])),
+            depends_on=list(data.get("depends_on", [])),
+            context=data.get("context") or {},
+            result=data.get("result"),
+            error=data.get("error"),
+            session_id=data.get("session_id"),
+            cancel_requested=data.get("cancel_requested", False),
+            vram_required=data.get("vram_required", 0.0),
+            model_name=data.get("model_name"),
+            estimated_duration=data.get("estimated_duration", 0.0),
+            critical_path=data.get("critical_path", 0.0),
+        )
+
     def add_subtask(self, subtask_id: str):
         """Add a subtask to this task."""
         if subtask_id not in self.subtask_ids:
@@ -0,0 +1,27 @@
+"""Distributed execution: a coordinator and workers sharing a task queue.
+
+The orchestrator publishes ready tasks to a durable queue instead of
+running them itself; workers on other GPU hosts lease them, run them
+against their own Ollama server, and report results and events back.
+"""
+
+from sindri.distributed.coordinator import RemoteRunner
+from sindri.distributed.queue import (
+    Lease,
+    QueuedEvent,
+    QueueEntry,
+    SQLiteTaskQueue,
+    TaskQueue,
+)
+from sindri.distributed.worker import Worker, default_worker_id
+
+__all__ = [
+    "Lease",
+    "QueuedEvent",
+    "QueueEntry",
+    "RemoteRunner",
+    "SQLiteTaskQueue",
+    "TaskQueue",
+    "Worker",
+    "default_worker_id",
+]
@@ -0,0 +1,229 @@
+"""Coordinator side of distributed execution."""
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Optional
+import structlog
+
+from sindri.core.events import Event, EventBus, EventType
+from sindri.core.loop import LoopResult
+from sindri.core.scheduler import TaskScheduler
+from sindri.core.tasks import Task, TaskStatus
+from sindri.distributed.queue import (
+    DONE,
+    LEASED,
+    QueuedEvent,
+    QueueEntry,
+    TaskQueue,
+)
+
+if TYPE_CHECKING:
+    from sindri.core.delegation import DelegationManager
+
+log = structlog.get_logger()
+
+
+@dataclass
+class _Waiter:
+    """A published task whose coordinator is waiting for a worker."""
+
+    task: Task
+    last_event: int = 0
+    cancel_sent: bool = False
+    entry: Optional[QueueEntry] = None
+    error: Optional[BaseException] = None
+    finished: asyncio.Event = field(default_factory=asyncio.Event)
+
+
+class RemoteRunner:
+    """Runs tasks on workers through a queue.
+
+    Has the same ``run_task`` shape as HierarchicalAgentLoop, so the
+    orchestrator dispatches to either. Worker events are re-emitted on the
+    local event bus; subtasks a worker delegated are added to the local
+    scheduler, and parents are resumed, failed or cancelled here as they
+    would be after a local run.
+
+    However many tasks are in flight, one poller reads their queue entries
+    and events together and wakes each waiting ``run_task`` when its task
+    is done; expired leases are re-queued from the same loop on a slower
+    timer. Transient queue errors are retried with backoff; after
+    ``max_poll_failures`` in a row (or any other error) the waiting tasks
+    are cancelled in the queue and fail locally.
+    """
+
+    def __init__(
+        self,
+        queue: TaskQueue,
+        scheduler: TaskScheduler,
+        delegation: "DelegationManager",
+        event_bus: EventBus,
+        poll_interval: float = 0.25,
+        requeue_interval: float = 1.0,
+        max_poll_failures: int = 5,
+        max_backoff: float = 5.0,
+    ):
+        self.queue = queue
+        self.scheduler = scheduler
+        self.delegation = delegation
+        self.event_bus = event_bus
+        self.poll_interval = poll_interval
+        self.requeue_interval = requeue_interval
+        self.max_poll_failures = max_poll_failures
+        self.max_backoff = max_backoff
+        self._waiting: dict[str, _Waiter] = {}
+        self._poller: Optional[asyncio.Task] = None
+
+    async def run_task(self, task: Task) -> LoopResult:
+        """Publish a task and wait for a worker to finish it."""
+        await self.queue.publish(task)
+        waiter = _Waiter(task)
+        self._waiting[task.id] = waiter
+        if self._poller is None or self._poller.done():
+            self._poller = asyncio.ensure_future(self._poll())
+        try:
+            await waiter.finished.wait()
+        finally:
+            self._waiting.pop(task.id, None)
+
+        if waiter.error is not None:
+            task.status = TaskStatus.FAILED
+            task.error = f"Lost track of the task in the queue: {waiter.error}"
+            await self.delegation.child_failed(task)
+            return LoopResult(success=False, iterations=0, reason=task.error)
+        if waiter.entry is None:
+            # Another coordinator forgot it; nothing will report back
+            task.status = TaskStatus.FAILED
+            task.error = "Task was removed from the queue"
+            await self.delegation.child_failed(task)
+            return LoopResult(success=False, iterations=0, reason=task.error)
+        await self.queue.forget(task.id)
+        return await self._apply(task, waiter.entry)
+
+    async def _poll(self):
+        """Follow every waiting task until none are left."""
+        loop = asyncio.get_running_loop()
+        next_requeue = loop.time()
+        failures = 0
+        while self._waiting:
+            delay = self.poll_interval
+            try:
+                if loop.time() >= next_requeue:
+                    await self.queue.requeue_expired()
+                    next_requeue = loop.time() + self.requeue_interval
+                await self._poll_once()
+                failures = 0
+            except Exception as e:
+                failures += 1
+                transient = isinstance(e, self.queue.transient_errors)
+                log.warning(
+                    "remote_poll_failed",
+                    error=str(e),
+                    transient=transient,
+                    failures=failures,
+                )
+                if not transient or failures >= self.max_poll_failures:
+                    await self._abandon(e)
+                    return
+                delay = min(self.poll_interval * 2**failures, self.max_backoff)
+            await asyncio.sleep(delay)
+
+    async def _abandon(self, error: Exception):
+        """Give up on every waiting task: cancel it in the queue, fail it here."""
+        waiting, self._waiting = self._waiting, {}
+        for task_id, waiter in waiting.items():
+            try:
+                await self.queue.request_cancel(task_id)
+            except Exception as e:
+                log.warning("remote_cancel_failed", task_id=task_id, error=str(e))
+            waiter.error = error
+            waiter.finished.set()
+
+    async def _poll_once(self):
+        """Read entries and events for all waiting tasks in one pass."""
+        waiting = dict(self._waiting)
+        for waiter in waiting.values():
+            if waiter.task.cancel_requested and not waiter.cancel_sent:
+                await self.queue.request_cancel(waiter.task.id)
+                waiter.cancel_sent = True
+
+        task_ids = list(waiting)
+        # Entries first: events a worker committed before finishing are
+        # then already visible when its entry reads as done
+        entries = await self.queue.get_entries(task_ids)
+        after_id = min(waiter.last_event for waiter in waiting.values())
+        for event in await self.queue.get_events_for(task_ids, after_id):
+            waiter = waiting[event.task_id]
+            if event.id > waiter.last_event:
+                waiter.last_event = event.id
+                self._emit(event)
+
+        for task_id, waiter in waiting.items():
+            entry = entries.get(task_id)
+            if entry is None or entry.state == DONE:
+                waiter.entry = entry
+                self._waiting.pop(task_id, None)
+                waiter.finished.set()
+            elif entry.state == LEASED and waiter.task.status == TaskStatus.PENDING:
+                waiter.task.status = TaskStatus.RUNNING  # A worker has picked it up
+
+    async def _apply(self, task: Task, entry: QueueEntry) -> LoopResult:
+        """Copy a worker's outcome onto the local task and its parent."""
+        if entry.outcome is None:
+            task.status = TaskStatus.FAILED
+            task.error = entry.error or "Task failed on worker"
+            await self.delegation.child_failed(task)
+            return LoopResult(success=False, iterations=0, reason=task.error)
+
+        remote = Task.from_dict(entry.outcome["task"])
+        # Subtasks first, so they're scheduled before the parent waits
+        for data in entry.outcome.get("new_tasks", []):
+            if data["id"] not in self.scheduler.tasks:
+                self.scheduler.add_task(Task.from_dict(data))
+        for subtask_id in remote.subtask_ids:
+            task.add_subtask(subtask_id)
+
+        task.result = remote.result
+        task.error = remote.error
+        task.session_id = remote.session_id
+        task.started_at = remote.started_at
+        task.completed_at = remote.completed_at
+        task.status = remote.status
+
+        if task.status == TaskStatus.COMPLETE:
+            await self.delegation.child_completed(task)
+        elif task.status == TaskStatus.FAILED:
+            await self.delegation.child_failed(task)
+        elif task.status == TaskStatus.CANCELLED:
+            await self.delegation.child_cancelled(task)
+
+        result = entry.outcome.get("result", {})
+        log.info(
+            "remote_task_finished",
+            task_id=task.id,
+            worker_id=entry.worker_id,
+            status=task.status.value,
+            attempts=entry.attempts,
+        )
+        return LoopResult(
+            success=result.get("success"),
+            iterations=result.get("iterations", 0),
+            reason=result.get("reason", ""),
+            final_output=result.get("final_output", ""),
+        )
+
+    def _emit(self, event: QueuedEvent):
+        """Re-emit a worker's event on the local bus."""
+        try:
+            event_type = EventType[event.event_type]
+        except KeyError:
+            return
+        data = dict(event.data)
+        if isinstance(data.get("status"), str):
+            try:
+                data["status"] = TaskStatus(data["status"])
+            except ValueError:
+                pass
+        self.event_bus.emit(
+            Event(type=event_type, data=data, task_id=data.get("task_id"))
+        )
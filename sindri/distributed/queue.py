@@ -0,0 +1,502 @@
+"""Durable, lease-based task queue for distributed execution.
+
+The coordinator publishes ready tasks. Workers lease them, renew the
+lease with heartbeats while they run, and report the finished task (plus
+any subtasks it delegated) and its events back. A lease that isn't
+renewed in time expires and the task goes back in the queue for another
+worker; after ``max_attempts`` expired leases it is given up as failed.
+
+Lease expiry uses wall-clock time, so hosts sharing a queue need
+reasonably synchronized clocks.
+"""
+
+import json
+import sqlite3
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Optional
+import structlog
+
+from sindri.core.tasks import Task
+
+if TYPE_CHECKING:
+    from sindri.persistence.database import Database
+
+log = structlog.get_logger()
+
+# Queue entry states
+QUEUED = "queued"
+LEASED = "leased"
+DONE = "done"
+
+DEFAULT_LEASE_SECONDS = 30.0
+DEFAULT_MAX_ATTEMPTS = 3
+
+
+def _encode(value: Any) -> Any:
+    """JSON fallback for event data (enums, timestamps, anything else)."""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+@dataclass
+class Lease:
+    """A task held by a worker until ``expires_at`` (renewed by heartbeats)."""
+
+    task: Task
+    worker_id: str
+    attempt: int
+    expires_at: float
+    cancel_requested: bool = False
+
+
+@dataclass
+class QueueEntry:
+    """A published task as the coordinator sees it."""
+
+    task_id: str
+    state: str
+    worker_id: Optional[str] = None
+    attempts: int = 0
+    # Reported by the worker: {"task": ..., "new_tasks": [...], "result": ...}
+    outcome: Optional[dict] = None
+    error: Optional[str] = None  # Set when the queue gave up on the task
+
+
+@dataclass
+class QueuedEvent:
+    """An event a worker reported for a task."""
+
+    id: int
+    task_id: str
+    worker_id: Optional[str]
+    event_type: str
+    data: dict
+
+
+class TaskQueue(ABC):
+    """Where the coordinator publishes tasks and workers lease them.
+
+    SQLiteTaskQueue serves workers on one host or sharing a database file;
+    other backends implement the same methods.
+    """
+
+    # Errors that may pass on retry (e.g. a busy database)
+    transient_errors: tuple[type[Exception], ...] = ()
+
+    @abstractmethod
+    async def publish(self, task: Task) -> None:
+        """Queue a task (again, if it ran before) for any worker to lease."""
+
+    @abstractmethod
+    async def lease(
+        self,
+        worker_id: str,
+        lease_seconds: float = DEFAULT_LEASE_SECONDS,
+        models: Optional[set[str]] = None,
+    ) -> Optional[Lease]:
+        """Take the next queued task, or None if there is none.
+
+        Args:
+            worker_id: Who is taking it
+            lease_seconds: How long the lease lasts without a heartbeat
+            models: Only take tasks for these models (None = any)
+        """
+
+    @abstractmethod
+    async def heartbeat(
+        self, lease: Lease, lease_seconds: float = DEFAULT_LEASE_SECONDS
+    ) -> bool:
+        """Renew a lease; False if it was lost (expired and re-queued).
+
+        Also refreshes ``lease.cancel_requested``.
+        """
+
+    @abstractmethod
+    async def complete(
+        self, lease: Lease, task: Task, new_tasks: list[Task], result: dict
+    ) -> bool:
+        """Report a finished run; False if the lease was lost meanwhile."""
+
+    @abstractmethod
+    async def post_event(
+        self, task_id: str, worker_id: Optional[str], event_type: str, data: dict
+    ) -> None:
+        """Record an event for the coordinator to re-emit."""
+
+    @abstractmethod
+    async def get_events(self, task_id: str, after_id: int = 0) -> list[QueuedEvent]:
+        """Events for a task newer than ``after_id``, oldest first."""
+
+    @abstractmethod
+    async def get_entry(self, task_id: str) -> Optional[QueueEntry]:
+        """The queue's view of a published task."""
+
+    @abstractmethod
+    async def get_entries(self, task_ids: list[str]) -> dict[str, QueueEntry]:
+        """The queue's view of several tasks (unknown ids are left out)."""
+
+    @abstractmethod
+    async def get_events_for(
+        self, task_ids: list[str], after_id: int = 0
+    ) -> list[QueuedEvent]:
+        """Events for any of several tasks newer than ``after_id``, oldest first."""
+
+    @abstractmethod
+    async def request_cancel(self, task_id: str) -> None:
+        """Ask the worker running a task (or the next to lease it) to stop."""
+
+    @abstractmethod
+    async def requeue_expired(self) -> int:
+        """Re-queue tasks whose leases expired; returns how many."""
+
+    @abstractmethod
+    async def forget(self, task_id: str) -> None:
+        """Drop a finished task and its events."""
+
+
+class SQLiteTaskQueue(TaskQueue):
+    """Task queue in a SQLite database shared by coordinator and workers.
+
+    Leases are taken with a single UPDATE ... RETURNING, so two workers
+    can never hold the same task.
+    """
+
+    transient_errors = (sqlite3.OperationalError,)
+
+    def __init__(
+        self,
+        database: Optional["Database"] = None,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    ):
+        """Initialize the queue.
+
+        Args:
+            database: Database instance (creates default if not provided)
+            max_attempts: Leases a task may have before it is given up
+        """
+        from sindri.persistence.database import Database
+
+        self.db = database or Database()
+        self.max_attempts = max_attempts
+
+    async def _ensure_tables(self) -> None:
+        """Ensure task_queue and task_events tables exist."""
+        if self.db.is_schema_ready("task_queue"):
+            return
+        async with self.db.get_connection() as conn:
+            await conn.execute("""
+                CREATE TABLE IF NOT EXISTS task_queue (
+                    task_id TEXT PRIMARY KEY,
+                    task_json TEXT NOT NULL,
+                    model_name TEXT,
+                    rank REAL DEFAULT 0,
+                    priority INTEGER DEFAULT 1,
+                    state TEXT NOT NULL,
+                    worker_id TEXT,
+                    lease_expires REAL,
+                    attempts INTEGER DEFAULT 0,
+                    cancel_requested INTEGER DEFAULT 0,
+                    outcome_json TEXT,
+                    error TEXT,
+                    enqueued_at REAL NOT NULL,
+                    updated_at REAL NOT NULL
+                )
+            """)
+            await conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_task_queue_ready
+                ON task_queue(state, rank DESC, priority, enqueued_at)
+            """)
+            await conn.execute("""
+                CREATE TABLE IF NOT EXISTS task_events (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    task_id TEXT NOT NULL,
+                    worker_id TEXT,
+                    event_type TEXT NOT NULL,
+                    data_json TEXT,
+                    created_at REAL NOT NULL
+                )
+            """)
+            await conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_task_events_task
+                ON task_events(task_id, id)
+            """)
+            await conn.commit()
+        self.db.mark_schema_ready("task_queue")
+
+    async def publish(self, task: Task) -> None:
+        await self._ensure_tables()
+        now = time.time()
+        async with self.db.get_connection() as conn:
+            await conn.execute("DELETE FROM task_events WHERE task_id = ?", (task.id,))
+            await conn.execute(
+                """
+                INSERT OR REPLACE INTO task_queue
+                (task_id, task_json, model_name, rank, priority, state, attempts,
+                 cancel_requested, enqueued_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, 0, ?, ?, ?)
+                """,
+                (
+                    task.id,
+                    json.dumps(task.to_dict(), default=_encode),
+                    task.model_name,
+                    task.critical_path,
+                    task.priority,
+                    QUEUED,
+                    int(task.cancel_requested),
+                    now,
+                    now,
+                ),
+            )
+            await conn.commit()
+        log.info("task_published", task_id=task.id, agent=task.assigned_agent)
+
+    async def lease(
+        self,
+        worker_id: str,
+        lease_seconds: float = DEFAULT_LEASE_SECONDS,
+        models: Optional[set[str]] = None,
+    ) -> Optional[Lease]:
+        await self._ensure_tables()
+        await self.requeue_expired()
+
+        now = time.time()
+        model_filter = ""
+        params: list[Any] = [LEASED, worker_id, now + lease_seconds, now, QUEUED]
+        if models:
+            placeholders = ", ".join("?" for _ in models)
+            model_filter = f"AND (model_name IS NULL OR model_name IN ({placeholders}))"
+            params.extend(sorted(models))
+
+        async with self.db.get_connection() as conn:
+            async with conn.execute(
+                f"""
+                UPDATE task_queue
+                SET state = ?, worker_id = ?, lease_expires = ?,
+                    attempts = attempts + 1, updated_at = ?
+                WHERE task_id = (
+                    SELECT task_id FROM task_queue
+                    WHERE state = ? {model_filter}
+                    ORDER BY rank DESC, priority, enqueued_at
+                    LIMIT 1
+                )
+                RETURNING task_json, attempts, lease_expires, cancel_requested
+                """,
+                params,
+            ) as cursor:
+                row = await cursor.fetchone()
+            await conn.commit()
+
+        if row is None:
+            return None
+        task = Task.from_dict(json.loads(row[0]))
+        log.info("task_leased", task_id=task.id, worker_id=worker_id, attempt=row[1])
+        return Lease(
+            task=task,
+            worker_id=worker_id,
+            attempt=row[1],
+            expires_at=row[2],
+            cancel_requested=bool(row[3]),
+        )
+
+    async def heartbeat(
+        self, lease: Lease, lease_seconds: float = DEFAULT_LEASE_SECONDS
+    ) -> bool:
+        await self._ensure_tables()
+        now = time.time()
+        async with self.db.get_connection() as conn:
+            async with conn.execute(
+                """
+                UPDATE task_queue SET lease_expires = ?, updated_at = ?
+                WHERE task_id = ? AND worker_id = ? AND state = ?
+                RETURNING cancel_requested
+                """,
+                (now + lease_seconds, now, lease.task.id, lease.worker_id, LEASED),
+            ) as cursor:
+                row = await cursor.fetchone()
+            await conn.commit()
+
+        if row is None:
+            return False
+        lease.expires_at = now + lease_seconds
+        lease.cancel_requested = bool(row[0])
+        return True
+
+    async def complete(
+        self, lease: Lease, task: Task, new_tasks: list[Task], result: dict
+    ) -> bool:
+        await self._ensure_tables()
+        outcome = {
+            "task": task.to_dict(),
+            "new_tasks": [t.to_dict() for t in new_tasks],
+            "result": result,
+        }
+        async with self.db.get_connection() as conn:
+            cursor = await conn.execute(
+                """
+                UPDATE task_queue
+                SET state = ?, outcome_json = ?, lease_expires = NULL, updated_at = ?
+                WHERE task_id = ? AND worker_id = ? AND state = ?
+                """,
+                (
+                    DONE,
+                    json.dumps(outcome, default=_encode),
+                    time.time(),
+                    task.id,
+                    lease.worker_id,
+                    LEASED,
+                ),
+            )
+            await conn.commit()
+            return cursor.rowcount > 0
+
+    async def post_event(
+        self, task_id: str, worker_id: Optional[str], event_type: str, data: dict
+    ) -> None:
+        await self._ensure_tables()
+        # Batched; complete() takes the writer, which drains the batch first,
+        # so a task's events are committed before it shows as done
+        self.db.write_behind(
+            "task_events",
+            """
+            INSERT INTO task_events (task_id, worker_id, event_type, data_json,
+                                     created_at)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            (
+                task_id,
+                worker_id,
+                event_type,
+                json.dumps(data, default=_encode),
+                time.time(),
+            ),
+        )
+
+    async def get_events(self, task_id: str, after_id: int = 0) -> list[QueuedEvent]:
+        return await self.get_events_for([task_id], after_id)
+
+    async def get_events_for(
+        self, task_ids: list[str], after_id: int = 0
+    ) -> list[QueuedEvent]:
+        await self._ensure_tables()
+        await self.db.flush_writes("task_events")
+        if not task_ids:
+            return []
+        placeholders = ", ".join("?" for _ in task_ids)
+        async with self.db.get_connection(read_only=True) as conn:
+            async with conn.execute(
+                f"""
+                SELECT id, task_id, worker_id, event_type, data_json
+                FROM task_events WHERE task_id IN ({placeholders}) AND id > ?
+                ORDER BY id
+                """,
+                (*task_ids, after_id),
+            ) as cursor:
+                return [
+                    QueuedEvent(
+                        id=row[0],
+                        task_id=row[1],
+                        worker_id=row[2],
+                        event_type=row[3],
+                        data=json.loads(row[4]) if row[4] else {},
+                    )
+                    for row in await cursor.fetchall()
+                ]
+
+    async def get_entry(self, task_id: str) -> Optional[QueueEntry]:
+        return (await self.get_entries([task_id])).get(task_id)
+
+    async def get_entries(self, task_ids: list[str]) -> dict[str, QueueEntry]:
+        await self._ensure_tables()
+        if not task_ids:
+            return {}
+        placeholders = ", ".join("?" for _ in task_ids)
+        async with self.db.get_connection(read_only=True) as conn:
+            async with conn.execute(
+                f"""
+                SELECT task_id, state, worker_id, attempts, outcome_json, error
+                FROM task_queue WHERE task_id IN ({placeholders})
+                """,
+                tuple(task_ids),
+            ) as cursor:
+                rows = await cursor.fetchall()
+        return {
+            row[0]: QueueEntry(
+                task_id=row[0],
+                state=row[1],
+                worker_id=row[2],
+                attempts=row[3],
+                outcome=json.loads(row[4]) if row[4] else None,
+                error=row[5],
+            )
+            for row in rows
+        }
+
+    async def request_cancel(self, task_id: str) -> None:
+        await self._ensure_tables()
+        async with self.db.get_connection() as conn:
+            await conn.execute(
+                "UPDATE task_queue SET cancel_requested = 1, updated_at = ? "
+                "WHERE task_id = ?",
+                (time.time(), task_id),
+            )
+            await conn.commit()
+
+    async def requeue_expired(self) -> int:
+        await self._ensure_tables()
+        now = time.time()
+        async with self.db.get_connection() as conn:
+            given_up = await conn.execute(
+                """
+                UPDATE task_queue
+                SET state = ?, error = ?, lease_expires = NULL, updated_at = ?
+                WHERE state = ? AND lease_expires < ? AND attempts >= ?
+                """,
+                (
+                    DONE,
+                    f"Lease expired {self.max_attempts} times; no worker finished it",
+                    now,
+                    LEASED,
+                    now,
+                    self.max_attempts,
+                ),
+            )
+            requeued = await conn.execute(
+                """
+                UPDATE task_queue
+                SET state = ?, worker_id = NULL, lease_expires = NULL, updated_at = ?
+                WHERE state = ? AND lease_expires < ?
+                """,
+                (QUEUED, now, LEASED, now),
+            )
+            await conn.commit()
+
+        if given_up.rowcount or requeued.rowcount:
+            log.warning(
+                "task_leases_expired",
+                requeued=requeued.rowcount,
+                given_up=given_up.rowcount,
+            )
+        return requeued.rowcount + given_up.rowcount
+
+    async def forget(self, task_id: str) -> None:
+        await self._ensure_tables()
+        async with self.db.get_connection() as conn:
+            await conn.execute("DELETE FROM task_events WHERE task_id = ?", (task_id,))
+            await conn.execute("DELETE FROM task_queue WHERE task_id = ?", (task_id,))
+            await conn.commit()
+
+    async def get_stats(self) -> dict[str, int]:
+        """Number of queue entries in each state."""
+        await self._ensure_tables()
+        async with self.db.get_connection(read_only=True) as conn:
+            async with conn.execute(
+                "SELECT state, COUNT(*) FROM task_queue GROUP BY state"
+            ) as cursor:
+                return {row[0]: row[1] for row in await cursor.fetchall()}
@@ -0,0 +1,192 @@
+"""Worker process for distributed execution.
+
+A worker leases tasks from a TaskQueue and runs each with its own
+HierarchicalAgentLoop (and so its own Ollama server), one at a time. While
+a task runs the worker renews the lease and forwards the loop's events;
+when it ends, the worker reports the task and any subtasks it delegated,
+which the coordinator schedules like local ones.
+"""
+
+import asyncio
+import os
+import socket
+import time
+from functools import partial
+from typing import TYPE_CHECKING, Optional
+import structlog
+
+from sindri.core.events import EventType
+from sindri.core.loop import LoopResult
+from sindri.core.tasks import TaskStatus
+from sindri.distributed.queue import DEFAULT_LEASE_SECONDS, Lease, TaskQueue
+
+if TYPE_CHECKING:
+    from sindri.core.hierarchical import HierarchicalAgentLoop
+
+log = structlog.get_logger()
+
+
+def default_worker_id() -> str:
+    """Host name and process id, unique among workers sharing a queue."""
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+class Worker:
+    """Leases tasks from a queue and runs them with a local agent loop."""
+
+    def __init__(
+        self,
+        queue: TaskQueue,
+        loop: "HierarchicalAgentLoop",
+        worker_id: Optional[str] = None,
+        lease_seconds: float = DEFAULT_LEASE_SECONDS,
+        poll_interval: float = 1.0,
+        models: Optional[set[str]] = None,
+    ):
+        """Initialize the worker.
+
+        Args:
+            queue: Queue shared with the coordinator
+            loop: Agent loop to run tasks with; its scheduler only ever
+                holds the leased task and the subtasks it delegates
+            worker_id: Name in leases (defaults to host and pid)
+            lease_seconds: Lease length; heartbeats renew it every third
+            poll_interval: Seconds between lease attempts when idle
+            models: Only lease tasks for these models (None = any)
+        """
+        self.queue = queue
+        self.loop = loop
+        self.worker_id = worker_id or default_worker_id()
+        self.lease_seconds = lease_seconds
+        self.poll_interval = poll_interval
+        self.models = models
+        self.tasks_run = 0
+        self._stopping = False
+        self._lease: Optional[Lease] = None
+        self._events: list[tuple[str, dict]] = []
+
+        for event_type in EventType:
+            loop.event_bus.subscribe(event_type, partial(self._capture, event_type))
+
+    def stop(self):
+        """Stop after the current task."""
+        self._stopping = True
+
+    async def run(
+        self, max_tasks: Optional[int] = None, idle_timeout: Optional[float] = None
+    ) -> int:
+        """Lease and run tasks until stopped.
+
+        Args:
+            max_tasks: Stop after this many tasks (None = no limit)
+            idle_timeout: Stop after this many seconds without work
+
+        Returns:
+            Number of tasks run
+        """
+        log.info("worker_started", worker_id=self.worker_id, models=self.models)
+        idle_since = time.monotonic()
+        while not self._stopping and (max_tasks is None or self.tasks_run < max_tasks):
+            if await self.run_once():
+                idle_since = time.monotonic()
+            elif (
+                idle_timeout is not None
+                and time.monotonic() - idle_since >= idle_timeout
+            ):
+                break
+            else:
+                await asyncio.sleep(self.poll_interval)
+        log.info("worker_stopped", worker_id=self.worker_id, tasks_run=self.tasks_run)
+        return self.tasks_run
+
+    async def run_once(self) -> bool:
+        """Lease and run one task; False if the queue had none."""
+        lease = await self.queue.lease(self.worker_id, self.lease_seconds, self.models)
+        if lease is None:
+            return False
+        await self._run(lease)
+        self.tasks_run += 1
+        return True
+
+    async def _run(self, lease: Lease):
+        task = lease.task
+        task.cancel_requested = task.cancel_requested or lease.cancel_requested
+
+        # Only this task and what it delegates live in the local scheduler
+        scheduler = self.loop.scheduler
+        scheduler.clear()
+        scheduler.add_task(task)
+
+        self._lease = lease
+        self._events = []
+        run = asyncio.ensure_future(self.loop.run_task(task))
+        heartbeat = asyncio.ensure_future(self._heartbeat(lease, run))
+        try:
+            result = await run
+        except asyncio.CancelledError:
+            if not heartbeat.done():
+                raise  # The worker itself is being cancelled
+            log.warning("task_abandoned_lease_lost", task_id=task.id)
+            return
+        except Exception as e:
+            log.error("task_exception", task_id=task.id, error=str(e))
+            task.status = TaskStatus.FAILED
+            task.error = str(e)
+            result = LoopResult(success=False, iterations=0, reason=str(e))
+        finally:
+            heartbeat.cancel()
+            self._lease = None
+
+        await self._flush_events(task.id)
+        new_tasks = [t for t in scheduler.tasks.values() if t.id != task.id]
+        reported = await self.queue.complete(
+            lease,
+            task,
+            new_tasks,
+            {
+                "success": result.success,
+                "iterations": result.iterations,
+                "reason": result.reason,
+                "final_output": result.final_output,
+            },
+        )
+        log.info(
+            "task_reported",
+            task_id=task.id,
+            status=task.status.value,
+            subtasks=len(new_tasks),
+            accepted=reported,
+        )
+
+    async def _heartbeat(self, lease: Lease, run: asyncio.Future):
+        """Renew the lease and pass on cancellation until the run ends."""
+        while True:
+            await asyncio.sleep(self.lease_seconds / 3)
+            try:
+                await self._flush_events(lease.task.id)
+                alive = await self.queue.heartbeat(lease, self.lease_seconds)
+            except Exception as e:
+                log.warning("heartbeat_failed", task_id=lease.task.id, error=str(e))
+                continue
+
+            if not alive:
+                # Another worker may have it by now; don't report twice
+                run.cancel()
+                return
+            if lease.cancel_requested and not lease.task.cancel_requested:
+                lease.task.cancel_requested = True
+                self.loop.cancel_generation(lease.task.id)
+
+    def _capture(self, event_type: EventType, data):
+        if self._lease is not None:
+            self._events.append((event_type.name, data))
+
+    async def _flush_events(self, task_id: str):
+        events, self._events = self._events, []
+        for event_type, data in events:
+            await self.queue.post_event(
+                task_id,
+                self.worker_id,
+                event_type,
+                data if isinstance(data, dict) else {"value": data},
+            )
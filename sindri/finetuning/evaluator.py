@@ -16,6 +16,7 @@ from enum import Enum
 from typing import Optional, Any
 import structlog
 
+from sindri.llm.cache import ResponseCache
 from sindri.llm.client import OllamaClient
 from sindri.finetuning.registry import ModelRegistry, FineTunedModel
 
@@ -277,14 +278,16 @@ class ModelEvaluator:
         self,
         client: Optional[OllamaClient] = None,
         registry: Optional[ModelRegistry] = None,
+        response_cache: Optional[ResponseCache] = None,
     ):
         """Initialize the evaluator.
 
         Args:
             client: Ollama client for running models
             registry: Model registry for looking up models
+            response_cache: Cache for the default client's benchmark calls
         """
-        self.client = client or OllamaClient()
+        self.client = client or OllamaClient(response_cache=response_cache)
         self.registry = registry or ModelRegistry()
         self._results_cache: dict[str, list[EvaluationResult]] = {}
 
@@ -352,7 +355,9 @@ class ModelEvaluator:
                 self.client.generate(
                     model=model_name,
                     prompt=prompt.prompt,
-                    options={"num_predict": prompt.max_tokens},
+                    # Greedy sampling keeps benchmark runs reproducible
+                    # (and lets the response cache serve repeated runs)
+                    options={"num_predict": prompt.max_tokens, "temperature": 0},
                 ),
                 timeout=timeout,
             )
@@ -373,7 +373,7 @@ class ModelRegistry:
         """
         await self.initialize()
 
-        async with self.db.get_connection() as conn:
+        async with self.db.get_connection(read_only=True) as conn:
             async with conn.execute(
                 "SELECT * FROM finetuned_models WHERE id = ?",
                 (model_id,),
@@ -409,7 +409,7 @@ class ModelRegistry:
         query += " ORDER BY version DESC"
 
         models = []
-        async with self.db.get_connection() as conn:
+        async with self.db.get_connection(read_only=True) as conn:
             async with conn.execute(query, params) as cursor:
                 async for row in cursor:
                     models.append(self._row_to_model(row))
@@ -436,7 +436,7 @@ class ModelRegistry:
         """
         await self.initialize()
 
-        async with self.db.get_connection() as conn:
+        async with self.db.get_connection(read_only=True) as conn:
             async with conn.execute(
                 "SELECT * FROM finetuned_models WHERE status = ? LIMIT 1",
                 (ModelStatus.ACTIVE.value,),
@@ -516,7 +516,7 @@ class ModelRegistry:
         params.append(limit)
 
         models = []
-        async with self.db.get_connection() as conn:
+        async with self.db.get_connection(read_only=True) as conn:
             async with conn.execute(query, params) as cursor:
                 async for row in cursor:
                     models.append(self._row_to_model(row))
@@ -0,0 +1,379 @@
+"""Content-addressed response cache for deterministic LLM calls.
+
+Some LLM calls are pure functions of their input: conversation summaries,
+benchmark prompts, and replays of the same prompt during retries and
+resumes. This cache stores their responses in SQLite, keyed by a hash of
+(model digest, messages, tools, options), so identical requests are served
+without touching the GPU.
+
+The cache is opt-in. Calls are only served from it when they are
+deterministic (``temperature == 0``) or the caller explicitly forces it.
+"""
+
+import hashlib
+import json
+import time
+from dataclasses import dataclass
+from typing import Any, Optional, TYPE_CHECKING
+import structlog
+
+if TYPE_CHECKING:
+    from sindri.config import SindriConfig
+    from sindri.persistence.database import Database
+
+log = structlog.get_logger()
+
+
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600  # One week
+DEFAULT_MAX_ENTRIES = 2000
+
+
+def _normalize(value: Any) -> Any:
+    """Convert a value into a JSON-stable structure for hashing."""
+    if isinstance(value, dict):
+        return {str(k): _normalize(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(v) for v in value]
+    if hasattr(value, "model_dump"):
+        # Pydantic objects (ollama ToolCall, Message, etc.)
+        return _normalize(value.model_dump(exclude_none=True))
+    if hasattr(value, "function"):
+        # Duck-typed tool call wrappers
+        return {
+            "function": {
+                "name": value.function.name,
+                "arguments": _normalize(value.function.arguments),
+            }
+        }
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+@dataclass
+class CachedResponse:
+    """A response served from the cache."""
+
+    content: str
+    model: str
+    tool_calls: Optional[list] = None
+    duration: float = 0.0  # Seconds the original call took
+    created_at: float = 0.0
+    hit_count: int = 0
+
+
+@dataclass
+class ResponseCacheStats:
+    """Runtime statistics for the response cache."""
+
+    hits: int = 0
+    misses: int = 0
+    bypassed: int = 0  # Non-deterministic calls that skipped the cache
+    stores: int = 0
+    evictions: int = 0
+    time_saved: float = 0.0  # Seconds of generation avoided
+
+    @property
+    def hit_rate(self) -> float:
+        """Hit rate over cache lookups (0.0 to 1.0)."""
+        total = self.hits + self.misses
+        return self.hits / total if total > 0 else 0.0
+
+
+class ResponseCache:
+    """SQLite-backed cache of LLM responses with TTL and size-bounded eviction."""
+
+    def __init__(
+        self,
+        database: Optional["Database"] = None,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        force: bool = False,
+    ):
+        """Initialize the response cache.
+
+        Args:
+            database: Database instance (creates default if not provided)
+            ttl_seconds: Entries older than this are treated as misses
+            max_entries: Maximum cached responses before LRU eviction
+            force: Also serve non-deterministic calls from the cache
+        """
+        from sindri.persistence.database import Database
+
+        self.db = database or Database()
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.force = force
+        self.stats = ResponseCacheStats()
+
+    @classmethod
+    def from_config(
+        cls,
+        config: "SindriConfig",
+        database: Optional["Database"] = None,
+        enable: bool = False,
+        force: bool = False,
+    ) -> Optional["ResponseCache"]:
+        """Create a cache from ``[response_cache]`` (None if not enabled).
+
+        Args:
+            config: Loaded Sindri configuration
+            database: Database instance (creates default if not provided)
+            enable: Enable the cache even if the config does not
+            force: Force caching even if the config does not
+        """
+        settings = config.response_cache
+        if not (settings.enabled or enable or force):
+            return None
+        return cls(
+            database=database,
+            ttl_seconds=settings.ttl_hours * 3600,
+            max_entries=settings.max_entries,
+            force=settings.force or force,
+        )
+
+    async def _ensure_tables(self) -> None:
+        """Ensure the response cache table exists."""
+        if self.db.is_schema_ready("llm_response_cache"):
+            return
+        await self.db.initialize()
+        async with self.db.get_connection() as conn:
+            await conn.execute("""
+                CREATE TABLE IF NOT EXISTS llm_response_cache (
+                    cache_key TEXT PRIMARY KEY,
+                    model TEXT NOT NULL,
+                    content TEXT NOT NULL,
+                    tool_calls TEXT,
+                    duration REAL DEFAULT 0,
+                    created_at REAL NOT NULL,
+                    last_accessed REAL NOT NULL,
+                    hit_count INTEGER DEFAULT 0
+                )
+            """)
+            await conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_llm_response_cache_accessed
+                ON llm_response_cache(last_accessed)
+            """)
+            await conn.commit()
+        self.db.mark_schema_ready("llm_response_cache")
+
+    @staticmethod
+    def make_key(
+        model_digest: str,
+        messages: list,
+        tools: Optional[list] = None,
+        options: Optional[dict] = None,
+    ) -> str:
+        """Build a content-addressed cache key.
+
+        Args:
+            model_digest: Model digest (or name if the digest is unknown)
+            messages: Chat messages
+            tools: Tool schemas
+            options: Generation options
+
+        Returns:
+            Hex SHA-256 digest identifying the request
+        """
+        payload = json.dumps(
+            {
+                "model": model_digest,
+                "messages": _normalize(messages),
+                "tools": _normalize(tools or []),
+                "options": _normalize(options or {}),
+            },
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def is_deterministic(options: Optional[dict]) -> bool:
+        """Whether a call with these options always yields the same output.
+
+        Ollama samples with a non-zero default temperature, so only an
+        explicit ``temperature == 0`` counts as deterministic.
+        """
+        if not options:
+            return False
+        temperature = options.get("temperature")
+        return temperature is not None and temperature <= 0
+
+    def should_use(self, options: Optional[dict], force: bool = False) -> bool:
+        """Decide whether a call may be served from the cache."""
+        if force or self.force or self.is_deterministic(options):
+            return True
+        self.stats.bypassed += 1
+        return False
+
+    async def get(self, key: str) -> Optional[CachedResponse]:
+        """Look up a cached response.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            CachedResponse on hit, None on miss or expiry
+        """
+        await self._ensure_tables()
+        now = time.time()
+
+        async with self.db.get_connection() as conn:
+            async with conn.execute(
+                """
+                SELECT model, content, tool_calls, duration, created_at, hit_count
+                FROM llm_response_cache WHERE cache_key = ?
+                """,
+                (key,),
+            ) as cursor:
+                row = await cursor.fetchone()
+
+            if not row:
+                self.stats.misses += 1
+                return None
+
+            if now - row[4] > self.ttl_seconds:
+                await conn.execute(
+                    "DELETE FROM llm_response_cache WHERE cache_key = ?", (key,)
+                )
+                await conn.commit()
+                self.stats.misses += 1
+                self.stats.evictions += 1
+                log.debug("response_cache_expired", key=key[:12])
+                return None
+
+            await conn.execute(
+                """
+                UPDATE llm_response_cache
+                SET last_accessed = ?, hit_count = hit_count + 1
+                WHERE cache_key = ?
+                """,
+                (now, key),
+            )
+            await conn.commit()
+
+        cached = CachedResponse(
+            model=row[0],
+            content=row[1],
+            tool_calls=json.loads(row[2]) if row[2] else None,
+            duration=row[3] or 0.0,
+            created_at=row[4],
+            hit_count=row[5] + 1,
+        )
+        self.stats.hits += 1
+        self.stats.time_saved += cached.duration
+        log.info(
+            "response_cache_hit",
+            key=key[:12],
+            model=cached.model,
+            time_saved=round(cached.duration, 3),
+        )
+        return cached
+
+    async def put(
+        self,
+        key: str,
+        model: str,
+        content: str,
+        tool_calls: Optional[list] = None,
+        duration: float = 0.0,
+    ) -> None:
+        """Store a response in the cache.
+
+        Args:
+            key: Cache key from make_key()
+            model: Model that produced the response
+            content: Response text
+            tool_calls: Native tool calls, if any
+            duration: Seconds the call took (reported as time saved on hits)
+        """
+        await self._ensure_tables()
+        now = time.time()
+        tool_calls_json = (
+            json.dumps(_normalize(tool_calls)) if tool_calls else None
+        )
+
+        async with self.db.get_connection() as conn:
+            await conn.execute(
+                """
+                INSERT OR REPLACE INTO llm_response_cache
+                (cache_key, model, content, tool_calls, duration,
+                 created_at, last_accessed, hit_count)
+                VALUES (?, ?, ?, ?, ?, ?, ?, 0)
+                """,
+                (key, model, content, tool_calls_json, duration, now, now),
+            )
+            await conn.commit()
+
+        self.stats.stores += 1
+        await self._evict()
+
+    async def _evict(self) -> int:
+        """Drop expired entries and trim to max_entries (least recently used)."""
+        cutoff = time.time() - self.ttl_seconds
+        async with self.db.get_connection() as conn:
+            cursor = await conn.execute(
+                "DELETE FROM llm_response_cache WHERE created_at < ?", (cutoff,)
+            )
+            evicted = cursor.rowcount or 0
+
+            async with conn.execute(
+                "SELECT COUNT(*) FROM llm_response_cache"
+            ) as count_cursor:
+                row = await count_cursor.fetchone()
+                overflow = (row[0] if row else 0) - self.max_entries
+
+            if overflow > 0:
+                cursor = await conn.execute(
+                    """
+                    DELETE FROM llm_response_cache WHERE cache_key IN (
+                        SELECT cache_key FROM llm_response_cache
+                        ORDER BY last_accessed ASC LIMIT ?
+                    )
+                    """,
+                    (overflow,),
+                )
+                evicted += cursor.rowcount or 0
+
+            await conn.commit()
+
+        if evicted:
+            self.stats.evictions += evicted
+            log.debug("response_cache_evicted", count=evicted)
+        return evicted
+
+    async def clear(self) -> int:
+        """Remove all cached responses.
+
+        Returns:
+            Number of entries removed
+        """
+        await self._ensure_tables()
+        async with self.db.get_connection() as conn:
+            cursor = await conn.execute("DELETE FROM llm_response_cache")
+            await conn.commit()
+            return cursor.rowcount or 0
+
+    async def count(self) -> int:
+        """Number of entries currently stored."""
+        await self._ensure_tables()
+        async with self.db.get_connection(read_only=True) as conn:
+            async with conn.execute(
+                "SELECT COUNT(*) FROM llm_response_cache"
+            ) as cursor:
+                row = await cursor.fetchone()
+                return row[0] if row else 0
+
+    def get_stats(self) -> dict:
+        """Get cache statistics."""
+        return {
+            "hits": self.stats.hits,
+            "misses": self.stats.misses,
+            "bypassed": self.stats.bypassed,
+            "stores": self.stats.stores,
+            "evictions": self.stats.evictions,
+            "hit_rate": self.stats.hit_rate,
+            "time_saved": self.stats.time_saved,
+            "ttl_seconds": self.ttl_seconds,
+            "max_entries": self.max_entries,
+        }
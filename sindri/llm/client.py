@@ -1,13 +1,66 @@
 """Async Ollama client wrapper."""
 
+import time
 import ollama
 from dataclasses import dataclass
 from typing import AsyncIterator, Optional, Callable
 import structlog
 
+from sindri.llm.cache import CachedResponse, ResponseCache
+from sindri.llm.pool import EndpointPool, FAILOVER_ERRORS, NoHealthyEndpointError
+
 log = structlog.get_logger()
 
 
+NS_PER_SECOND = 1_000_000_000
+
+
+@dataclass
+class GenerationStats:
+    """Token counts and timings Ollama reports with a finished response.
+
+    Durations are in seconds (Ollama reports nanoseconds).
+    """
+
+    prompt_tokens: int = 0  # prompt_eval_count
+    eval_tokens: int = 0  # eval_count
+    load_duration: float = 0.0
+    prompt_eval_duration: float = 0.0
+    eval_duration: float = 0.0
+    total_duration: float = 0.0
+
+    @classmethod
+    def from_response(cls, response) -> Optional["GenerationStats"]:
+        """Extract stats from a final chat response or stream chunk.
+
+        Returns:
+            GenerationStats, or None if the response carries no counts
+        """
+
+        def value(key: str) -> float:
+            try:
+                raw = response.get(key)
+            except AttributeError:
+                raw = getattr(response, key, None)
+            return raw if isinstance(raw, (int, float)) else 0
+
+        if not (value("eval_count") or value("prompt_eval_count")):
+            return None
+        return cls(
+            prompt_tokens=int(value("prompt_eval_count")),
+            eval_tokens=int(value("eval_count")),
+            load_duration=value("load_duration") / NS_PER_SECOND,
+            prompt_eval_duration=value("prompt_eval_duration") / NS_PER_SECOND,
+            eval_duration=value("eval_duration") / NS_PER_SECOND,
+            total_duration=value("total_duration") / NS_PER_SECOND,
+        )
+
+    @property
+    def tokens_per_second(self) -> float:
+        """Generation throughput."""
+        return self.eval_tokens / self.eval_duration if self.eval_duration > 0 else 0.0
+
+
 @dataclass
 class Message:
     role: str
@@ -20,6 +73,9 @@ class Response:
     message: Message
     model: str
     done: bool
+    cached: bool = False  # Served from the response cache
+    cache_time_saved: float = 0.0  # Seconds of generation avoided by the cache
+    stats: Optional[GenerationStats] = None  # Ollama token counts and timings
 
 
 @dataclass
@@ -30,6 +86,9 @@ class StreamingResponse:
     tool_calls: Optional[list] = None
     model: str = ""
     done: bool = False
+    cached: bool = False
+    cache_time_saved: float = 0.0
+    stats: Optional[GenerationStats] = None  # From the final chunk
 
     def to_response(self) -> Response:
         """Convert to a standard Response object."""
@@ -39,21 +98,178 @@ class StreamingResponse:
             ),
             model=self.model,
             done=self.done,
+            cached=self.cached,
+            cache_time_saved=self.cache_time_saved,
+            stats=self.stats,
         )
 
 
+def _restore_tool_calls(tool_calls: Optional[list]) -> Optional[list]:
+    """Rebuild native tool call objects from their cached JSON form."""
+    if not tool_calls:
+        return None
+    restored = []
+    for call in tool_calls:
+        if isinstance(call, dict) and "function" in call:
+            restored.append(ollama.Message.ToolCall.model_validate(call))
+        else:
+            restored.append(call)
+    return restored
+
+
+class StreamInterruptedError(RuntimeError):
+    """A stream failed after tokens were already delivered (no failover)."""
+
+
 class OllamaClient:
-    """Wrapper around Ollama with async support."""
+    """Wrapper around Ollama with async support.
 
-    def __init__(self, host: str = "http://localhost:11434"):
+    With an EndpointPool, requests are routed across several Ollama servers
+    by model affinity and load, failing over on connection errors.
+    """
+
+    def __init__(
+        self,
+        host: str = "http://localhost:11434",
+        response_cache: Optional[ResponseCache] = None,
+        pool: Optional[EndpointPool] = None,
+    ):
+        if pool is not None:
+            host = next(iter(pool.endpoints))
         self.host = host
         self._client = ollama.Client(host=host)
         self._async_client = ollama.AsyncClient(host=host)
+        self.response_cache = response_cache  # Opt-in deterministic response cache
+        self.pool = pool  # Multi-endpoint routing (None = single host)
+        self._model_digests: dict[str, str] = {}
+
+    async def _dispatch(self, model: Optional[str], call):
+        """Run call(async_client) on the best endpoint for a model.
+
+        Without a pool this uses the single configured host. With a pool,
+        connection errors mark the endpoint unhealthy and the call is
+        retried on the next candidate.
+        """
+        if self.pool is None:
+            return await call(self._async_client)
+
+        tried: set[str] = set()
+        last_error: Optional[Exception] = None
+        while True:
+            endpoint = None
+            try:
+                async with self.pool.acquire(model, exclude=tried) as endpoint:
+                    tried.add(endpoint.host)
+                    result = await call(endpoint.client)
+            except NoHealthyEndpointError:
+                if last_error is not None:
+                    raise NoHealthyEndpointError(
+                        f"All Ollama endpoints failed: {last_error}"
+                    ) from last_error
+                raise
+            except FAILOVER_ERRORS as e:
+                self.pool.mark_failure(endpoint, e)
+                last_error = e
+                log.warning(
+                    "ollama_endpoint_failover",
+                    host=endpoint.host,
+                    model=model,
+                    error=str(e),
+                )
+                continue
+
+            self.pool.mark_success(endpoint, model)
+            return result
+
+    async def _model_digest(self, model: str) -> str:
+        """Get the model digest for cache keys (falls back to the model name)."""
+        if model not in self._model_digests:
+            try:
+                listing = await self._dispatch(None, lambda c: c.list())
+                for m in listing.models:
+                    if m.model and m.digest:
+                        self._model_digests[m.model] = m.digest
+            except Exception as e:
+                log.debug("model_digest_lookup_failed", model=model, error=str(e))
+        return self._model_digests.get(model, model)
+
+    async def _cache_key(
+        self,
+        model: str,
+        messages: list[dict],
+        tools: Optional[list[dict]],
+        options: Optional[dict],
+        force_cache: bool,
+    ) -> Optional[str]:
+        """Return a cache key if this call may use the response cache."""
+        if not self.response_cache:
+            return None
+        if not self.response_cache.should_use(options, force=force_cache):
+            return None
+        digest = await self._model_digest(model)
+        return ResponseCache.make_key(digest, messages, tools, options)
+
+    async def _cache_get(self, key: Optional[str]) -> Optional[CachedResponse]:
+        """Look up a response, treating cache errors as misses."""
+        if key is None:
+            return None
+        try:
+            return await self.response_cache.get(key)
+        except Exception as e:
+            log.warning("response_cache_lookup_failed", error=str(e))
+            return None
+
+    async def _cache_put(
+        self,
+        key: Optional[str],
+        model: str,
+        content: str,
+        tool_calls: Optional[list],
+        duration: float,
+    ):
+        """Store a response, ignoring cache errors."""
+        if key is None:
+            return
+        try:
+            await self.response_cache.put(
+                key, model, content, tool_calls=tool_calls, duration=duration
+            )
+        except Exception as e:
+            log.warning("response_cache_store_failed", error=str(e))
 
     async def chat(
-        self, model: str, messages: list[dict], tools: list[dict] = None
+        self,
+        model: str,
+        messages: list[dict],
+        tools: list[dict] = None,
+        options: Optional[dict] = None,
+        force_cache: bool = False,
     ) -> Response:
-        """Send chat request to Ollama."""
+        """Send chat request to Ollama.
+
+        Args:
+            model: Model name to use
+            messages: Conversation messages
+            tools: Tool definitions (optional)
+            options: Generation options such as temperature (optional)
+            force_cache: Use the response cache even if the call is not
+                deterministic (temperature > 0)
+        """
+
+        cache_key = await self._cache_key(model, messages, tools, options, force_cache)
+        cached = await self._cache_get(cache_key)
+        if cached:
+            return Response(
+                message=Message(
+                    role="assistant",
+                    content=cached.content,
+                    tool_calls=_restore_tool_calls(cached.tool_calls),
+                ),
+                model=cached.model,
+                done=True,
+                cached=True,
+                cache_time_saved=cached.duration,
+            )
 
         kwargs = {
             "model": model,
@@ -61,10 +277,13 @@ class OllamaClient:
         }
         if tools:
             kwargs["tools"] = tools
+        if options:
+            kwargs["options"] = options
 
         log.info("ollama_chat_request", model=model, num_messages=len(messages))
 
-        response = await self._async_client.chat(**kwargs)
+        start_time = time.time()
+        response = await self._dispatch(model, lambda c: c.chat(**kwargs))
 
         log.debug(
             "ollama_response_keys",
@@ -82,16 +301,57 @@ class OllamaClient:
         tool_calls = response["message"].get("tool_calls")
         log.info("ollama_tool_calls", tool_calls=tool_calls)
 
+        content = response["message"].get("content", "")
+        await self._cache_put(
+            cache_key, model, content, tool_calls, time.time() - start_time
+        )
+
         return Response(
             message=Message(
                 role=response["message"]["role"],
-                content=response["message"].get("content", ""),
+                content=content,
                 tool_calls=tool_calls,
             ),
             model=response["model"],
             done=response.get("done", True),
+            stats=GenerationStats.from_response(response),
         )
 
+    async def generate(
+        self,
+        model: str,
+        prompt: str,
+        options: Optional[dict] = None,
+        force_cache: bool = False,
+    ) -> dict:
+        """Single-prompt completion (used by benchmark evaluation).
+
+        Args:
+            model: Model name to use
+            prompt: Prompt text
+            options: Generation options (optional)
+            force_cache: Use the response cache even if not deterministic
+
+        Returns:
+            Dict with "response", "model" and "cached" keys
+        """
+        messages = [{"role": "user", "content": prompt}]
+        cache_key = await self._cache_key(model, messages, None, options, force_cache)
+        cached = await self._cache_get(cache_key)
+        if cached:
+            return {"response": cached.content, "model": cached.model, "cached": True}
+
+        kwargs = {"model": model, "prompt": prompt}
+        if options:
+            kwargs["options"] = options
+
+        start_time = time.time()
+        response = await self._dispatch(model, lambda c: c.generate(**kwargs))
+        text = response.get("response", "")
+        await self._cache_put(cache_key, model, text, None, time.time() - start_time)
+
+        return {"response": text, "model": response.get("model", model), "cached": False}
+
     async def stream(self, model: str, messages: list[dict]) -> AsyncIterator[str]:
         """Stream response tokens."""
 
@@ -107,6 +367,8 @@ class OllamaClient:
         messages: list[dict],
         tools: list[dict] = None,
         on_token: Optional[Callable[[str], None]] = None,
+        options: Optional[dict] = None,
+        force_cache: bool = False,
     ) -> StreamingResponse:
         """Stream chat response with tool support.
 
@@ -115,35 +377,67 @@ class OllamaClient:
             messages: Conversation messages
             tools: Tool definitions (optional)
             on_token: Callback called for each token (optional)
+            options: Generation options such as temperature (optional)
+            force_cache: Use the response cache even if not deterministic
 
         Returns:
             StreamingResponse with accumulated content and tool calls
         """
+        cache_key = await self._cache_key(model, messages, tools, options, force_cache)
+        cached = await self._cache_get(cache_key)
+        if cached:
+            # Replay the cached text as a single token so displays stay consistent
+            if on_token and cached.content:
+                on_token(cached.content)
+            return StreamingResponse(
+                content=cached.content,
+                tool_calls=_restore_tool_calls(cached.tool_calls),
+                model=cached.model,
+                done=True,
+                cached=True,
+                cache_time_saved=cached.duration,
+            )
+
         kwargs = {"model": model, "messages": messages, "stream": True}
         if tools:
             kwargs["tools"] = tools
+        if options:
+            kwargs["options"] = options
 
         log.info("ollama_stream_request", model=model, num_messages=len(messages))
 
-        result = StreamingResponse(model=model)
-
-        async for chunk in await self._async_client.chat(**kwargs):
-            # Accumulate content
-            token = chunk.get("message", {}).get("content", "")
-            if token:
-                result.content += token
-                if on_token:
-                    on_token(token)
-
-            # Check for tool calls (usually in final chunk)
-            tool_calls = chunk.get("message", {}).get("tool_calls")
-            if tool_calls:
-                result.tool_calls = tool_calls
-
-            # Check if done
-            if chunk.get("done", False):
-                result.done = True
-                result.model = chunk.get("model", model)
+        start_time = time.time()
+
+        async def _stream(async_client) -> StreamingResponse:
+            partial = StreamingResponse(model=model)
+            try:
+                async for chunk in await async_client.chat(**kwargs):
+                    # Accumulate content
+                    token = chunk.get("message", {}).get("content", "")
+                    if token:
+                        partial.content += token
+                        if on_token:
+                            on_token(token)
+
+                    # Check for tool calls (usually in final chunk)
+                    tool_calls = chunk.get("message", {}).get("tool_calls")
+                    if tool_calls:
+                        partial.tool_calls = tool_calls
+
+                    # Check if done
+                    if chunk.get("done", False):
+                        partial.done = True
+                        partial.model = chunk.get("model", model)
+                        partial.stats = GenerationStats.from_response(chunk)
+            except FAILOVER_ERRORS as e:
+                # Tokens already reached the caller - replaying elsewhere
+                # would duplicate output, so don't fail over mid-stream
+                if partial.content:
+                    raise StreamInterruptedError(str(e)) from e
+                raise
+            return partial
+
+        result = await self._dispatch(model, _stream)
 
         log.info(
             "ollama_stream_complete",
@@ -152,6 +446,15 @@ class OllamaClient:
             has_tool_calls=result.tool_calls is not None,
         )
 
+        if result.done:
+            await self._cache_put(
+                cache_key,
+                result.model,
+                result.content,
+                result.tool_calls,
+                time.time() - start_time,
+            )
+
         return result
 
     def list_models(self) -> list[str]:
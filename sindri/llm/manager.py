@@ -6,10 +6,13 @@ Phase 6.2: Model caching with pre-warming and usage metrics.
 import asyncio
 import time
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 import ollama
 import structlog
 
+if TYPE_CHECKING:
+    from sindri.llm.pool import EndpointPool, OllamaEndpoint
+
 log = structlog.get_logger()
 
 
@@ -24,6 +27,7 @@ class LoadedModel:
     use_count: int = 0  # Times this model has been used
     load_time: float = 0.0  # Seconds taken to load
     loaded_at: float = field(default_factory=time.time)  # When loaded
+    endpoint: Optional[str] = None  # Ollama host holding the model (pool mode)
 
 
 @dataclass
@@ -58,6 +62,13 @@ class ModelManager:
     - Cache metrics (hit rate, evictions)
     - Pre-warming for anticipated model needs
     - Keep-warm list for frequently used models
+
+    With an EndpointPool, each endpoint has its own VRAM budget and
+    eviction only frees space there. A model may then be resident on
+    several endpoints: ``copies`` maps model -> endpoint -> copy, while
+    ``loaded`` stays keyed by model name (holding one of its copies).
+    Requests use the least busy copy, and a model whose copies are all
+    saturated gets another copy on an endpoint with spare VRAM.
     """
 
     def __init__(
@@ -65,11 +76,19 @@ class ModelManager:
         total_vram_gb: float = 16.0,
         reserve_gb: float = 2.0,
         keep_warm: Optional[list[str]] = None,
+        pool: Optional["EndpointPool"] = None,
     ):
+        self.pool = pool
+        if pool is not None:
+            endpoints = list(pool.endpoints.values())
+            total_vram_gb = sum(e.total_vram_gb for e in endpoints)
+            reserve_gb = sum(e.reserve_vram_gb for e in endpoints)
         self.total_vram = total_vram_gb
         self.reserve = reserve_gb
         self.available = total_vram_gb - reserve_gb
         self.loaded: dict[str, LoadedModel] = {}
+        # Pool mode: model -> endpoint host -> the copy loaded there
+        self.copies: dict[str, dict[str, LoadedModel]] = {}
         self._client = ollama.Client()
 
         # Phase 6.1: Thread-safety for parallel execution
@@ -88,14 +107,65 @@ class ModelManager:
             keep_warm=list(self.keep_warm),
         )
 
+    def _resident(self) -> list[LoadedModel]:
+        """Every loaded copy (one per model without a pool)."""
+        if self.pool is None:
+            return list(self.loaded.values())
+        return [m for copies in self.copies.values() for m in copies.values()]
+
+    def _copies(self, model: str) -> list[LoadedModel]:
+        """Loaded copies of a model on reachable endpoints."""
+        if self.pool is None:
+            return [self.loaded[model]] if model in self.loaded else []
+        return [
+            m
+            for host, m in self.copies.get(model, {}).items()
+            if (ep := self.pool.get_endpoint(host)) is not None and ep.healthy
+        ]
+
+    def _least_busy_copy(self, model: str) -> Optional[LoadedModel]:
+        """The copy of a model with the fewest outstanding requests."""
+        copies = self._copies(model)
+        if not copies or self.pool is None:
+            return copies[0] if copies else None
+        return min(copies, key=lambda m: self.pool.endpoints[m.endpoint].outstanding)
+
+    def _wants_copy(self, copy: LoadedModel, required_vram: float) -> bool:
+        """Whether a busy copy should be joined by another one (pool mode).
+
+        Only when its endpoint is saturated and another endpoint has room
+        for the model without evicting anything.
+        """
+        if self.pool is None:
+            return False
+        endpoint = self.pool.endpoints[copy.endpoint]
+        return (
+            endpoint.outstanding >= self.pool.saturation_threshold
+            and self._select_endpoint(copy.name, required_vram, spare_only=True)
+            is not None
+        )
+
+    def _note_hit(self, copy: LoadedModel):
+        """Record a use of an already loaded copy."""
+        copy.last_used = time.time()
+        copy.use_count += 1
+        self.metrics.hits += 1
+
     def can_load(self, model: str, required_vram: float) -> bool:
         """Check if model can be loaded (may require eviction).
 
         Note: This is a non-locking check. For actual loading, use ensure_loaded().
         """
-        if model in self.loaded:
+        if self._copies(model):
             return True
 
+        if self.pool is not None:
+            can = self._select_endpoint(model, required_vram) is not None
+            log.debug(
+                "can_load_check", model=model, required=required_vram, can_load=can
+            )
+            return can
+
         free_vram = self._get_free_vram()
         # Can load if we have space OR can make space by evicting
         can = free_vram >= required_vram or len(self.loaded) > 0
@@ -116,10 +186,64 @@ class ModelManager:
             self._model_locks[model] = asyncio.Lock()
         return self._model_locks[model]
 
-    def _get_free_vram(self) -> float:
-        """Calculate free VRAM."""
-        used = sum(m.vram_gb for m in self.loaded.values())
-        return self.available - used
+    def _get_free_vram(self, endpoint: Optional[str] = None) -> float:
+        """Calculate free VRAM (on one endpoint if given)."""
+        if endpoint is None:
+            used = sum(m.vram_gb for m in self._resident())
+            return self.available - used
+
+        ep = self.pool.get_endpoint(endpoint)
+        used = sum(m.vram_gb for m in self._resident() if m.endpoint == endpoint)
+        return (ep.available_vram_gb if ep else 0.0) - used
+
+    def _is_evictable(self, loaded: LoadedModel) -> bool:
+        """Whether a loaded model may be evicted right now."""
+        return loaded.name not in self.keep_warm and (
+            loaded.name not in self._model_locks
+            or not self._model_locks[loaded.name].locked()
+        )
+
+    def _select_endpoint(
+        self, model: str, required_vram: float, spare_only: bool = False
+    ) -> Optional["OllamaEndpoint"]:
+        """Pick the endpoint to place a (further) copy of a model on.
+
+        Prefers endpoints that fit the model without eviction (most free
+        VRAM first), then endpoints where evicting idle models makes room.
+        Endpoints already holding the model are skipped.
+
+        Args:
+            model: Model to place
+            required_vram: VRAM the model needs
+            spare_only: Only consider endpoints with room to spare (no eviction)
+        """
+        candidates = [
+            e
+            for e in self.pool.candidates(model)
+            if e.healthy
+            and e.available_vram_gb >= required_vram
+            and e.host not in self.copies.get(model, {})
+        ]
+        if not candidates:
+            return None
+
+        fitting = [
+            e for e in candidates if self._get_free_vram(e.host) >= required_vram
+        ]
+        if fitting:
+            return max(fitting, key=lambda e: self._get_free_vram(e.host))
+        if spare_only:
+            return None
+
+        def reclaimable(e) -> float:
+            return self._get_free_vram(e.host) + sum(
+                m.vram_gb
+                for m in self._resident()
+                if m.endpoint == e.host and self._is_evictable(m)
+            )
+
+        best = max(candidates, key=reclaimable)
+        return best if reclaimable(best) >= required_vram else None
 
     async def ensure_loaded(self, model: str, required_vram: float) -> bool:
         """Ensure model is loaded, evicting others if needed.
@@ -128,31 +252,29 @@ class ModelManager:
         Tracks cache metrics for monitoring.
         """
         # Quick check without lock - cache hit
-        if model in self.loaded:
-            # Update usage tracking
-            self.loaded[model].last_used = time.time()
-            self.loaded[model].use_count += 1
-            self.metrics.hits += 1
+        copy = self._least_busy_copy(model)
+        if copy is not None and not self._wants_copy(copy, required_vram):
+            self._note_hit(copy)
             log.debug(
                 "model_cache_hit",
                 model=model,
-                use_count=self.loaded[model].use_count,
+                endpoint=copy.endpoint,
+                use_count=copy.use_count,
                 hit_rate=f"{self.metrics.hit_rate:.1%}",
             )
             return True
 
-        # Cache miss - need to load
+        # Cache miss (or a saturated copy) - need to load
         self.metrics.misses += 1
 
         # Need to load - acquire per-model lock to prevent double-loading
         model_lock = self._get_model_lock(model)
         async with model_lock:
             # Double-check after acquiring lock (another task may have loaded it)
-            if model in self.loaded:
-                self.loaded[model].last_used = time.time()
-                self.loaded[model].use_count += 1
+            copy = self._least_busy_copy(model)
+            if copy is not None and not self._wants_copy(copy, required_vram):
                 # This is still a "hit" from user perspective
-                self.metrics.hits += 1
+                self._note_hit(copy)
                 self.metrics.misses -= 1  # Correct the earlier miss
                 log.debug("model_loaded_by_another_task", model=model)
                 return True
@@ -162,17 +284,33 @@ class ModelManager:
 
             # Acquire main lock for VRAM operations
             async with self._lock:
+                host = None
+                if self.pool is not None:
+                    endpoint = self._select_endpoint(
+                        model, required_vram, spare_only=copy is not None
+                    )
+                    if endpoint is None and copy is not None:
+                        # The room went meanwhile; share the busy copy
+                        self._note_hit(copy)
+                        self.metrics.misses -= 1
+                        return True
+                    if endpoint is None:
+                        log.error(
+                            "no_endpoint_for_model",
+                            model=model,
+                            required=required_vram,
+                        )
+                        return False
+                    host = endpoint.host
+
                 # Need to free up space?
-                while self._get_free_vram() < required_vram and self.loaded:
+                while self._get_free_vram(host) < required_vram and self.loaded:
                     # Evict least recently used (but not locked or keep_warm models)
                     evictable = [
                         m
-                        for m in self.loaded.values()
-                        if m.name not in self.keep_warm
-                        and (
-                            m.name not in self._model_locks
-                            or not self._model_locks[m.name].locked()
-                        )
+                        for m in self._resident()
+                        if self._is_evictable(m)
+                        and (host is None or m.endpoint == host)
                     ]
                     if not evictable:
                         log.warning(
@@ -190,10 +328,10 @@ class ModelManager:
                         reason="LRU",
                         use_count=lru.use_count,
                     )
-                    await self._unload(lru.name)
+                    await self._unload(lru.name, lru.endpoint)
                     self.metrics.evictions += 1
 
-                free_vram = self._get_free_vram()
+                free_vram = self._get_free_vram(host)
                 if free_vram < required_vram:
                     log.error(
                         "insufficient_vram",
@@ -206,14 +344,19 @@ class ModelManager:
                 load_time = time.time() - load_start
 
                 # Track as loaded (Ollama loads on first use)
-                self.loaded[model] = LoadedModel(
+                loaded = LoadedModel(
                     name=model,
                     vram_gb=required_vram,
                     last_used=time.time(),
                     use_count=1,
                     load_time=load_time,
                     loaded_at=time.time(),
+                    endpoint=host,
                 )
+                self.loaded.setdefault(model, loaded)
+                if host is not None:
+                    self.copies.setdefault(model, {})[host] = loaded
+                    self.pool.note_loaded(host, model)
 
                 self.metrics.total_load_time += load_time
 
@@ -221,24 +364,40 @@ class ModelManager:
                     "model_loaded",
                     model=model,
                     vram_used=required_vram,
+                    endpoint=host,
                     load_time=f"{load_time:.2f}s",
-                    free_vram=self._get_free_vram(),
+                    free_vram=self._get_free_vram(host),
                     cache_hit_rate=f"{self.metrics.hit_rate:.1%}",
                 )
 
         return True
 
-    async def _unload(self, model: str):
-        """Unload a model from VRAM."""
+    async def _unload(self, model: str, endpoint: Optional[str] = None):
+        """Unload a model from VRAM (its copy on ``endpoint`` in pool mode)."""
         # Ollama doesn't have explicit unload API, but we track it
-        if model in self.loaded:
+        if endpoint is not None:
+            copies = self.copies.get(model, {})
+            unloaded = copies.pop(endpoint, None)
+            if unloaded is None:
+                return
+            self.pool.note_unloaded(endpoint, model)
+            if not copies:
+                self.copies.pop(model, None)
+                self.loaded.pop(model, None)
+            elif self.loaded.get(model) is unloaded:
+                # Keep ``loaded`` pointing at a copy that is still resident
+                self.loaded[model] = next(iter(copies.values()))
+        elif model in self.loaded:
             unloaded = self.loaded.pop(model)
-            log.info(
-                "model_unloaded",
-                model=model,
-                was_used=unloaded.use_count,
-                lifetime=f"{time.time() - unloaded.loaded_at:.1f}s",
-            )
+        else:
+            return
+        log.info(
+            "model_unloaded",
+            model=model,
+            endpoint=endpoint,
+            was_used=unloaded.use_count,
+            lifetime=f"{time.time() - unloaded.loaded_at:.1f}s",
+        )
 
     async def pre_warm(self, model: str, required_vram: float) -> None:
         """Pre-load a model in the background for anticipated use.
@@ -286,14 +445,27 @@ class ModelManager:
 
     def get_vram_stats(self) -> dict:
         """Get VRAM usage statistics including cache metrics."""
-        used = sum(m.vram_gb for m in self.loaded.values())
-        return {
+        used = sum(m.vram_gb for m in self._resident())
+        stats = {
             "total": self.total_vram,
             "available": self.available,
             "used": used,
             "free": self.available - used,
             "loaded_models": list(self.loaded.keys()),
         }
+        if self.pool is not None:
+            stats["endpoints"] = {
+                host: {
+                    "healthy": ep.healthy,
+                    "available": ep.available_vram_gb,
+                    "free": self._get_free_vram(host),
+                    "loaded_models": [
+                        name for name, copies in self.copies.items() if host in copies
+                    ],
+                }
+                for host, ep in self.pool.endpoints.items()
+            }
+        return stats
 
     def get_cache_stats(self) -> dict:
         """Get cache performance statistics."""
@@ -307,13 +479,13 @@ class ModelManager:
             "prewarm_count": self.metrics.prewarm_count,
             "keep_warm": list(self.keep_warm),
             "models": {
-                name: {
+                m.name if m.endpoint is None else f"{m.name}@{m.endpoint}": {
                     "use_count": m.use_count,
                     "vram_gb": m.vram_gb,
                     "load_time": m.load_time,
                     "lifetime": time.time() - m.loaded_at,
                 }
-                for name, m in self.loaded.items()
+                for m in self._resident()
             },
         }
 
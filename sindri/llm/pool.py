@@ -0,0 +1,347 @@
+"""Multi-endpoint Ollama pool with health checks and model-affinity routing.
+
+A single Sindri orchestrator can drive several Ollama servers (different
+boxes or GPUs). The pool tracks which models each endpoint has loaded and
+routes each request by:
+
+1. Health - unhealthy endpoints are skipped until their cooldown expires
+2. Model affinity - endpoints that already hold the model are preferred
+3. Least outstanding requests - spreads parallel work across GPUs
+
+A model can be resident on several endpoints at once: ModelManager loads
+another copy when every endpoint holding it is saturated, and requests for
+the model then go to whichever copy is least busy.
+
+Connection errors mark an endpoint unhealthy and the request fails over to
+the next candidate.
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Optional, TYPE_CHECKING
+import httpx
+import ollama
+import structlog
+
+if TYPE_CHECKING:
+    from sindri.config import SindriConfig
+
+log = structlog.get_logger()
+
+
+# Errors that mean "this endpoint is unreachable" (as opposed to a bad request)
+FAILOVER_ERRORS = (ConnectionError, httpx.TransportError)
+
+
+@dataclass
+class OllamaEndpoint:
+    """A single Ollama server in the pool."""
+
+    host: str
+    total_vram_gb: float = 16.0
+    reserve_vram_gb: float = 2.0
+
+    # Runtime state
+    healthy: bool = True
+    outstanding: int = 0  # In-flight requests
+    loaded_models: set[str] = field(default_factory=set)
+    consecutive_failures: int = 0
+    total_requests: int = 0
+    total_failures: int = 0
+    last_error: Optional[str] = None
+    last_check: float = 0.0
+    unhealthy_since: Optional[float] = None
+
+    def __post_init__(self):
+        self._client: Optional[ollama.AsyncClient] = None
+
+    @property
+    def available_vram_gb(self) -> float:
+        """VRAM usable for models on this endpoint."""
+        return self.total_vram_gb - self.reserve_vram_gb
+
+    @property
+    def client(self) -> ollama.AsyncClient:
+        """Lazily created async client bound to this endpoint."""
+        if self._client is None:
+            self._client = ollama.AsyncClient(host=self.host)
+        return self._client
+
+    def to_dict(self) -> dict:
+        """Serialize endpoint state for status displays."""
+        return {
+            "host": self.host,
+            "healthy": self.healthy,
+            "outstanding": self.outstanding,
+            "loaded_models": sorted(self.loaded_models),
+            "total_vram_gb": self.total_vram_gb,
+            "available_vram_gb": self.available_vram_gb,
+            "total_requests": self.total_requests,
+            "total_failures": self.total_failures,
+            "last_error": self.last_error,
+        }
+
+
+class NoHealthyEndpointError(ConnectionError):
+    """Raised when every endpoint in the pool is unreachable."""
+
+
+class EndpointPool:
+    """Routes Ollama requests across several endpoints."""
+
+    def __init__(
+        self,
+        endpoints: list[OllamaEndpoint],
+        failure_threshold: int = 1,
+        cooldown_seconds: float = 30.0,
+        health_check_interval: float = 15.0,
+        saturation_threshold: int = 1,
+    ):
+        """Initialize the pool.
+
+        Args:
+            endpoints: Endpoints to route across (at least one)
+            failure_threshold: Consecutive failures before marking unhealthy
+            cooldown_seconds: How long an unhealthy endpoint is skipped before
+                being retried
+            health_check_interval: Seconds between background health checks
+            saturation_threshold: Outstanding requests at which an endpoint
+                counts as saturated for the models it holds, so ModelManager
+                loads another copy on a spare endpoint
+        """
+        if not endpoints:
+            raise ValueError("EndpointPool requires at least one endpoint")
+
+        self.endpoints: dict[str, OllamaEndpoint] = {e.host: e for e in endpoints}
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self.health_check_interval = health_check_interval
+        self.saturation_threshold = saturation_threshold
+        self._health_task: Optional[asyncio.Task] = None
+        # Where ModelManager placed each model's copies (Ollama only reports
+        # a model as loaded after its first request, so keep our own too)
+        self.placements: dict[str, set[str]] = {}
+
+        log.info(
+            "endpoint_pool_initialized",
+            endpoints=list(self.endpoints.keys()),
+            failure_threshold=failure_threshold,
+        )
+
+    @classmethod
+    def from_hosts(cls, hosts: list[str], **kwargs) -> "EndpointPool":
+        """Create a pool from plain host URLs with default VRAM budgets."""
+        return cls([OllamaEndpoint(host=h) for h in hosts], **kwargs)
+
+    @classmethod
+    def from_config(cls, config: "SindriConfig", **kwargs) -> Optional["EndpointPool"]:
+        """Create a pool from ``ollama_endpoints`` (None if not configured)."""
+        if not config.ollama_endpoints:
+            return None
+        return cls(
+            [
+                OllamaEndpoint(
+                    host=e.host,
+                    total_vram_gb=e.total_vram_gb,
+                    reserve_vram_gb=e.reserve_vram_gb,
+                )
+                for e in config.ollama_endpoints
+            ],
+            **kwargs,
+        )
+
+    # ------------------------------------------------------------------
+    # Routing
+    # ------------------------------------------------------------------
+
+    def _is_candidate(self, endpoint: OllamaEndpoint, now: float) -> bool:
+        """Healthy endpoints, or unhealthy ones whose cooldown has expired."""
+        if endpoint.healthy:
+            return True
+        return (
+            endpoint.unhealthy_since is not None
+            and now - endpoint.unhealthy_since >= self.cooldown_seconds
+        )
+
+    def candidates(
+        self, model: Optional[str] = None, exclude: Optional[set[str]] = None
+    ) -> list[OllamaEndpoint]:
+        """Endpoints ordered by routing preference for a model.
+
+        Args:
+            model: Model the request needs (for affinity)
+            exclude: Hosts to skip (already tried)
+
+        Returns:
+            Ordered list of endpoints, best first
+        """
+        now = time.time()
+        exclude = exclude or set()
+        eligible = [
+            e
+            for e in self.endpoints.values()
+            if e.host not in exclude and self._is_candidate(e, now)
+        ]
+
+        def sort_key(e: OllamaEndpoint):
+            has_model = model is not None and (
+                model in e.loaded_models or e.host in self.placements.get(model, ())
+            )
+            return (
+                not e.healthy,  # Healthy first, recovering last
+                not has_model,  # Model affinity
+                e.outstanding,  # Least outstanding requests
+                -e.available_vram_gb,  # Biggest GPU breaks ties
+            )
+
+        return sorted(eligible, key=sort_key)
+
+    def select(
+        self, model: Optional[str] = None, exclude: Optional[set[str]] = None
+    ) -> OllamaEndpoint:
+        """Pick the best endpoint for a model.
+
+        Raises:
+            NoHealthyEndpointError: If no endpoint is available
+        """
+        ordered = self.candidates(model, exclude)
+        if not ordered:
+            raise NoHealthyEndpointError(
+                f"No healthy Ollama endpoint available for {model or 'request'}"
+            )
+        return ordered[0]
+
+    def get_endpoint(self, host: str) -> Optional[OllamaEndpoint]:
+        """Get an endpoint by host."""
+        return self.endpoints.get(host)
+
+    @asynccontextmanager
+    async def acquire(
+        self, model: Optional[str] = None, exclude: Optional[set[str]] = None
+    ) -> AsyncIterator[OllamaEndpoint]:
+        """Reserve an endpoint for one request (tracks outstanding count)."""
+        endpoint = self.select(model, exclude)
+        endpoint.outstanding += 1
+        endpoint.total_requests += 1
+        try:
+            yield endpoint
+        finally:
+            endpoint.outstanding -= 1
+
+    # ------------------------------------------------------------------
+    # Health tracking
+    # ------------------------------------------------------------------
+
+    def mark_success(self, endpoint: OllamaEndpoint, model: Optional[str] = None):
+        """Record a successful request (restores health, notes the model)."""
+        if not endpoint.healthy:
+            log.info("endpoint_recovered", host=endpoint.host)
+        endpoint.healthy = True
+        endpoint.unhealthy_since = None
+        endpoint.consecutive_failures = 0
+        if model:
+            endpoint.loaded_models.add(model)
+
+    def mark_failure(self, endpoint: OllamaEndpoint, error: Exception):
+        """Record a connection failure (may mark the endpoint unhealthy)."""
+        endpoint.consecutive_failures += 1
+        endpoint.total_failures += 1
+        endpoint.last_error = str(error)
+        if (
+            endpoint.consecutive_failures >= self.failure_threshold
+            and endpoint.healthy
+        ):
+            endpoint.healthy = False
+            endpoint.unhealthy_since = time.time()
+            # Nothing is known to be loaded on an unreachable server
+            endpoint.loaded_models.clear()
+            log.warning(
+                "endpoint_unhealthy",
+                host=endpoint.host,
+                failures=endpoint.consecutive_failures,
+                error=str(error),
+            )
+        elif not endpoint.healthy:
+            # Failed retry after cooldown - restart the cooldown
+            endpoint.unhealthy_since = time.time()
+
+    def note_loaded(self, host: str, model: str):
+        """Record that a model is resident on an endpoint."""
+        endpoint = self.endpoints.get(host)
+        if endpoint:
+            endpoint.loaded_models.add(model)
+            self.placements.setdefault(model, set()).add(host)
+
+    def note_unloaded(self, host: str, model: str):
+        """Record that a model left an endpoint."""
+        endpoint = self.endpoints.get(host)
+        if endpoint:
+            endpoint.loaded_models.discard(model)
+        hosts = self.placements.get(model)
+        if hosts is not None:
+            hosts.discard(host)
+            if not hosts:
+                del self.placements[model]
+
+    async def check_endpoint(self, endpoint: OllamaEndpoint) -> bool:
+        """Probe one endpoint and refresh its loaded-model list."""
+        endpoint.last_check = time.time()
+        try:
+            response = await endpoint.client.ps()
+            endpoint.loaded_models = {
+                m.model or m.name for m in response.models if (m.model or m.name)
+            }
+            self.mark_success(endpoint)
+            return True
+        except Exception as e:
+            self.mark_failure(endpoint, e)
+            return False
+
+    async def check_health(self) -> dict[str, bool]:
+        """Probe all endpoints concurrently.
+
+        Returns:
+            Mapping of host to health
+        """
+        endpoints = list(self.endpoints.values())
+        results = await asyncio.gather(*[self.check_endpoint(e) for e in endpoints])
+        health = {e.host: ok for e, ok in zip(endpoints, results)}
+        log.debug("endpoint_health_checked", health=health)
+        return health
+
+    def start_health_checks(self) -> None:
+        """Re-check every endpoint each ``health_check_interval`` seconds.
+
+        Runs in the background until :meth:`stop_health_checks`; callers
+        await :meth:`check_health` first for the initial state.
+        """
+        if self._health_task and not self._health_task.done():
+            return
+
+        async def _loop():
+            while True:
+                await asyncio.sleep(self.health_check_interval)
+                await self.check_health()
+
+        self._health_task = asyncio.create_task(_loop())
+
+    async def stop_health_checks(self) -> None:
+        """Stop background health checks."""
+        if self._health_task:
+            self._health_task.cancel()
+            try:
+                await self._health_task
+            except asyncio.CancelledError:
+                pass
+            self._health_task = None
+
+    def get_stats(self) -> dict:
+        """Get pool status for displays."""
+        return {
+            "endpoints": [e.to_dict() for e in self.endpoints.values()],
+            "healthy": sum(1 for e in self.endpoints.values() if e.healthy),
+            "total": len(self.endpoints),
+            "outstanding": sum(e.outstanding for e in self.endpoints.values()),
+        }
@@ -1,11 +1,19 @@
 """Streaming buffer for tool call detection in streamed responses.
 
 Phase 6.3: Buffer accumulates tokens and detects tool calls in the stream.
+
+The buffer is an incremental state machine: every character is examined
+exactly once (plus a bounded look-back when a possible tool call turns out
+to be plain text), string escapes and brace depth are tracked so braces
+inside JSON strings don't confuse it, and each tool call is parsed as soon
+as its closing brace arrives. Display text and tool calls are produced in
+the same pass, so long generations cost linear time.
 """
 
-import re
 import json
-from dataclasses import dataclass, field
+from collections import deque
+from dataclasses import dataclass
+from typing import Optional
 import structlog
 
 log = structlog.get_logger()
@@ -19,207 +27,376 @@ class DetectedToolCall:
     arguments: dict
 
 
-@dataclass
+# Parser states
+_TEXT = "text"  # Plain text
+_OPENER = "opener"  # Possibly inside a ```json / <tool_call> wrapper opener
+_CANDIDATE = "candidate"  # Saw "{" in text, deciding if it starts a tool call
+_JSON = "json"  # Inside a tool call JSON object
+_CLOSER = "closer"  # After a wrapped tool call, swallowing its closer
+
+# Wrappers whose JSON body is always treated as a tool call, and their closers
+WRAPPERS = {"```json": "```", "<tool_call>": "</tool_call>"}
+
+# Keys that mark an inline JSON object as a tool call
+TOOL_KEYS = ("name", "function", "tool")
+
+TOOL_PLACEHOLDER = "[Tool Call]"
+
+
+def extract_tool_call(data: object) -> Optional[DetectedToolCall]:
+    """Extract a tool call from a decoded JSON object (various formats).
+
+    Args:
+        data: Decoded JSON
+
+    Returns:
+        DetectedToolCall, or None if the object is not a tool call
+    """
+    if not isinstance(data, dict):
+        return None
+
+    name = None
+    arguments = None
+
+    # An arguments key is required so plain data objects with a "name"
+    # field aren't mistaken for tool calls
+    if "name" in data:
+        name = data["name"]
+        arguments = data.get("arguments", data.get("parameters"))
+    elif "function" in data:
+        func = data["function"]
+        if isinstance(func, dict):
+            name = func.get("name")
+            arguments = func.get("arguments", {})
+        else:
+            name = func
+            arguments = data.get("arguments")
+    elif "tool" in data:
+        name = data["tool"]
+        arguments = data.get("input", data.get("arguments", data.get("args")))
+
+    if arguments is None:
+        return None
+    if not name or not isinstance(name, str):
+        return None
+
+    # Handle string arguments (some models double-encode)
+    if isinstance(arguments, str):
+        try:
+            arguments = json.loads(arguments)
+        except json.JSONDecodeError:
+            arguments = {"input": arguments}
+    if not isinstance(arguments, dict):
+        arguments = {"input": arguments}
+
+    return DetectedToolCall(name=name, arguments=arguments)
+
+
 class StreamingBuffer:
     """Buffer for accumulating and parsing streamed LLM output.
 
-    Detects tool calls from text-based JSON patterns while streaming.
-    Useful for models that don't support native tool calling.
+    Detects tool calls from text-based JSON while streaming. Useful for
+    models that don't support native tool calling. Recognized forms are
+    inline objects starting with a ``"name"``, ``"function"`` or ``"tool"``
+    key, and any object wrapped in a json code fence or ``<tool_call>``.
 
     Usage:
         buffer = StreamingBuffer()
         for token in stream:
-            buffer.add_token(token)
-            # Token is safe to display unless we're in a tool call block
-            if not buffer.in_tool_block:
-                display(token)
-        # After streaming, get any detected tool calls
+            text, is_tool = buffer.add_token(token)
+            if text:
+                display(text)
+        display(buffer.flush())
+        # Tool calls are available as soon as each one closes
         calls = buffer.get_tool_calls()
     """
 
-    content: str = ""
-    _tool_calls: list[DetectedToolCall] = field(default_factory=list)
-    _in_json_block: bool = False
-    _json_depth: int = 0
-    _json_buffer: str = ""
-    _pending_tokens: list[str] = field(default_factory=list)
-    _last_processed_pos: int = 0  # Position up to which we've checked for patterns
-
-    # Patterns that indicate start of a tool call
-    TOOL_PATTERNS = [
-        r"```json\s*\{",  # Markdown JSON block
-        r'\{"name"\s*:\s*"',  # Direct JSON with name field
-        r'\{"function"\s*:\s*"',  # Function calling format
-        r'\{"tool"\s*:\s*"',  # Tool format
-        r"<tool_call>\s*\{",  # XML-style wrapper
-    ]
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Reset the buffer for a new response."""
+        self._parts: list[str] = []
+        self._content: Optional[str] = ""  # Cached join of _parts
+        self._display: list[str] = []
+        self._tool_calls: list[DetectedToolCall] = []
+        self._state = _TEXT
+        self._held: list[str] = []  # Characters awaiting a decision
+        # Wrapper opener / closer matching
+        self._opener = ""
+        self._wrapper: Optional[str] = None
+        self._closer_matched = 0
+        # Inline candidate matching
+        self._cand_phase = ""
+        self._cand_key = ""
+        # JSON tracking
+        self._json_start = 0  # Index in _held where the JSON object starts
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+
+    @property
+    def content(self) -> str:
+        """All raw content received so far."""
+        if self._content is None:
+            self._content = "".join(self._parts)
+        return self._content
 
     @property
     def in_tool_block(self) -> bool:
-        """Returns True if currently accumulating a potential tool call block."""
-        return self._in_json_block
+        """Returns True if currently accumulating a tool call block."""
+        return self._state == _JSON
 
     def add_token(self, token: str) -> tuple[str, bool]:
         """Add a token to the buffer.
 
+        Text that might still turn out to be part of a tool call is held
+        back and returned with a later token (or by flush()).
+
         Args:
             token: The token to add
 
         Returns:
-            (displayable_text, is_tool_related) - text safe to display and flag
+            (displayable_text, is_tool_related) - text safe to display now,
+            and whether this token contributed to a tool call block
         """
-        self.content += token
-
-        # Check if we're starting a JSON block
-        if not self._in_json_block:
-            # Only check content after last processed position
-            search_start = max(
-                0, self._last_processed_pos - 50
-            )  # Small overlap for context
-            search_content = self.content[search_start:]
-
-            # Check for tool call patterns in new content
-            for pattern in self.TOOL_PATTERNS:
-                match = re.search(pattern, search_content)
-                if match:
-                    self._in_json_block = True
-                    self._json_buffer = ""
-                    self._json_depth = 0
-
-                    # Find where JSON starts (from the match position forward)
-                    match_pos = search_start + match.start()
-                    json_start = self._find_json_start(self.content, match_pos)
-
-                    if json_start >= 0:
-                        self._json_buffer = self.content[json_start:]
-                        # Count initial depth
-                        for char in self._json_buffer:
-                            if char == "{":
-                                self._json_depth += 1
-                            elif char == "}":
-                                self._json_depth -= 1
-                        # Check if already complete
-                        if self._json_depth == 0 and self._json_buffer.strip():
-                            self._try_parse_tool_call()
-                            self._in_json_block = False
-                            self._json_buffer = ""
-                            self._last_processed_pos = len(self.content)
-                        # Don't display the JSON block
-                        return ("", True)
-                    break
-
-            return (token, False)
-
-        # We're in a JSON block - accumulate
-        self._json_buffer += token
-
-        # Track JSON depth to know when we've completed the object
-        for char in token:
-            if char == "{":
-                self._json_depth += 1
-            elif char == "}":
-                self._json_depth -= 1
-                if self._json_depth == 0:
-                    # Complete JSON object - try to parse
-                    self._try_parse_tool_call()
-                    self._in_json_block = False
-                    self._json_buffer = ""
-                    self._last_processed_pos = len(self.content)
-                    return ("", True)
-
-        return ("", True)
-
-    def _find_json_start(self, content: str, from_pos: int = 0) -> int:
-        """Find where a JSON object starts in content.
+        if not token:
+            return ("", False)
 
-        Args:
-            content: The content to search
-            from_pos: Start searching from this position
+        self._parts.append(token)
+        self._content = None
+
+        out: list[str] = []
+        touched_tool = False
+        pending = deque(token)
+
+        while pending:
+            ch = pending.popleft()
+            state = self._state
+
+            if state == _TEXT:
+                self._feed_text(ch, out)
+            elif state == _OPENER:
+                self._feed_opener(ch, out, pending)
+            elif state == _CANDIDATE:
+                self._feed_candidate(ch, out, pending)
+            elif state == _JSON:
+                self._feed_json(ch, out)
+            else:
+                self._feed_closer(ch, pending)
+
+            if self._state in (_JSON, _CLOSER) or state in (_JSON, _CLOSER):
+                touched_tool = True
+
+        return ("".join(out), touched_tool)
+
+    def flush(self) -> str:
+        """Release held-back text at the end of the stream.
+
+        An unfinished tool call stays pending (in_tool_block remains True).
 
         Returns:
-            Position of first '{' at or after from_pos, or -1 if not found
+            Text that is safe to display
         """
-        # Look for opening brace from the given position
-        for i in range(from_pos, len(content)):
-            if content[i] == "{":
-                return i
-        return -1
-
-    def _try_parse_tool_call(self):
-        """Try to parse accumulated JSON as a tool call."""
-        # Clean up the buffer
-        json_str = self._json_buffer.strip()
-
-        # Remove markdown wrappers
-        json_str = re.sub(r"^```json\s*", "", json_str)
-        json_str = re.sub(r"\s*```$", "", json_str)
-        json_str = re.sub(r"^<tool_call>\s*", "", json_str)
-        json_str = re.sub(r"\s*</tool_call>$", "", json_str)
-
+        if self._state in (_OPENER, _CANDIDATE):
+            text = "".join(self._held)
+            self._display.append(text)
+            self._held = []
+            self._state = _TEXT
+            return text
+        if self._state == _CLOSER:
+            self._held = []
+            self._state = _TEXT
+        return ""
+
+    # ------------------------------------------------------------------
+    # State handlers
+    # ------------------------------------------------------------------
+
+    def _emit(self, text: str, out: list[str]):
+        """Emit display text."""
+        out.append(text)
+        self._display.append(text)
+
+    def _reject(self, ch: str, out: list[str], pending: deque):
+        """Held text wasn't a tool call: emit its first char, re-scan the rest."""
+        held = self._held
+        self._held = []
+        self._state = _TEXT
+        self._emit(held[0], out)
+        pending.appendleft(ch)
+        pending.extendleft(reversed(held[1:]))
+
+    def _feed_text(self, ch: str, out: list[str]):
+        if ch == "{":
+            self._state = _CANDIDATE
+            self._held = [ch]
+            self._cand_phase = "open"
+            self._cand_key = ""
+        elif ch in "`<":
+            self._state = _OPENER
+            self._held = [ch]
+            self._opener = ch
+            self._wrapper = None
+        else:
+            self._emit(ch, out)
+
+    def _feed_opener(self, ch: str, out: list[str], pending: deque):
+        if self._wrapper is not None:
+            # Full opener seen: allow whitespace, then the JSON object
+            if ch.isspace():
+                self._held.append(ch)
+            elif ch == "{":
+                self._start_json(ch)
+            else:
+                self._reject(ch, out, pending)
+            return
+
+        candidate = self._opener + ch
+        if any(w.startswith(candidate) for w in WRAPPERS):
+            self._held.append(ch)
+            self._opener = candidate
+            if candidate in WRAPPERS:
+                self._wrapper = candidate
+        else:
+            self._reject(ch, out, pending)
+
+    def _feed_candidate(self, ch: str, out: list[str], pending: deque):
+        phase = self._cand_phase
+
+        if phase == "open":
+            if ch.isspace():
+                self._held.append(ch)
+            elif ch == '"':
+                self._held.append(ch)
+                self._cand_phase = "key"
+            else:
+                self._reject(ch, out, pending)
+        elif phase == "key":
+            if ch == '"' and self._cand_key in TOOL_KEYS:
+                self._held.append(ch)
+                self._cand_phase = "colon"
+            elif any(k.startswith(self._cand_key + ch) for k in TOOL_KEYS):
+                self._held.append(ch)
+                self._cand_key += ch
+            else:
+                self._reject(ch, out, pending)
+        elif phase == "colon":
+            if ch.isspace():
+                self._held.append(ch)
+            elif ch == ":":
+                self._held.append(ch)
+                self._cand_phase = "value"
+            else:
+                self._reject(ch, out, pending)
+        else:  # value
+            if ch.isspace():
+                self._held.append(ch)
+            elif ch in '"{':
+                # Looks like a tool call: switch to JSON tracking
+                self._wrapper = None
+                self._json_start = 0
+                self._depth = 1
+                self._in_string = False
+                self._escape = False
+                self._state = _JSON
+                self._feed_json(ch, out)
+            else:
+                self._reject(ch, out, pending)
+
+    def _start_json(self, ch: str):
+        """Enter JSON tracking at an opening brace after a wrapper."""
+        self._json_start = len(self._held)
+        self._held.append(ch)
+        self._depth = 1
+        self._in_string = False
+        self._escape = False
+        self._state = _JSON
+
+    def _feed_json(self, ch: str, out: list[str]):
+        self._held.append(ch)
+
+        if self._escape:
+            self._escape = False
+        elif self._in_string:
+            if ch == "\\":
+                self._escape = True
+            elif ch == '"':
+                self._in_string = False
+        elif ch == '"':
+            self._in_string = True
+        elif ch == "{":
+            self._depth += 1
+        elif ch == "}":
+            self._depth -= 1
+            if self._depth == 0:
+                self._close_json(out)
+
+    def _close_json(self, out: list[str]):
+        """A JSON object closed: parse it and emit a tool call or raw text."""
+        raw = "".join(self._held)
+        json_str = "".join(self._held[self._json_start :])
+        self._held = []
+
+        call = None
         try:
-            data = json.loads(json_str)
-
-            # Extract tool call (various formats)
-            name = None
-            arguments = {}
-
-            if "name" in data:
-                name = data["name"]
-                arguments = data.get("arguments", data.get("parameters", {}))
-            elif "function" in data:
-                func = data["function"]
-                name = func.get("name")
-                arguments = func.get("arguments", {})
-            elif "tool" in data:
-                name = data["tool"]
-                arguments = data.get("input", data.get("arguments", {}))
-
-            if name:
-                # Handle string arguments (some models double-encode)
-                if isinstance(arguments, str):
-                    try:
-                        arguments = json.loads(arguments)
-                    except json.JSONDecodeError:
-                        arguments = {"input": arguments}
-
-                self._tool_calls.append(
-                    DetectedToolCall(name=name, arguments=arguments)
-                )
-                log.info("tool_call_detected_from_stream", name=name)
-
+            call = extract_tool_call(json.loads(json_str))
         except json.JSONDecodeError as e:
-            log.debug(
-                "json_parse_failed_in_stream", error=str(e), buffer=json_str[:100]
-            )
+            log.debug("json_parse_failed_in_stream", error=str(e), buffer=json_str[:100])
+
+        if call is None:
+            # Not a tool call after all - it's displayable text
+            self._state = _TEXT
+            self._emit(raw, out)
+            return
+
+        self._tool_calls.append(call)
+        self._display.append(TOOL_PLACEHOLDER)
+        log.info("tool_call_detected_from_stream", name=call.name)
+
+        if self._wrapper is not None:
+            self._state = _CLOSER
+            self._closer_matched = 0
+        else:
+            self._state = _TEXT
+
+    def _feed_closer(self, ch: str, pending: deque):
+        closer = WRAPPERS[self._wrapper]
+        if self._closer_matched == 0 and ch.isspace():
+            self._held.append(ch)
+            return
+        if ch == closer[self._closer_matched]:
+            self._held.append(ch)
+            self._closer_matched += 1
+            if self._closer_matched == len(closer):
+                # Swallow the closer
+                self._held = []
+                self._state = _TEXT
+            return
+
+        # No closer: re-scan what we held as ordinary text
+        held = self._held
+        self._held = []
+        self._state = _TEXT
+        pending.appendleft(ch)
+        pending.extendleft(reversed(held))
+
+    # ------------------------------------------------------------------
+    # Results
+    # ------------------------------------------------------------------
+
+    @property
+    def tool_call_count(self) -> int:
+        """Number of complete tool calls detected so far."""
+        return len(self._tool_calls)
 
     def get_tool_calls(self) -> list[DetectedToolCall]:
         """Get all detected tool calls."""
         return self._tool_calls.copy()
 
     def get_display_content(self) -> str:
-        """Get content that's safe to display (excludes tool call blocks)."""
-        # Remove detected tool call patterns from content
-        display = self.content
-
-        # Remove markdown JSON blocks
-        display = re.sub(r"```json\s*\{[^`]*\}\s*```", "[Tool Call]", display)
-
-        # Remove inline JSON tool calls
-        display = re.sub(r'\{"name"\s*:\s*"[^}]+\}', "[Tool Call]", display)
-
-        # Remove XML-style tool calls
-        display = re.sub(
-            r"<tool_call>\s*\{[^<]*\}\s*</tool_call>", "[Tool Call]", display
-        )
-
+        """Get content that's safe to display (tool calls become placeholders)."""
+        display = "".join(self._display)
+        if self._state in (_OPENER, _CANDIDATE):
+            display += "".join(self._held)
         return display.strip()
-
-    def reset(self):
-        """Reset the buffer for a new response."""
-        self.content = ""
-        self._tool_calls = []
-        self._in_json_block = False
-        self._json_depth = 0
-        self._json_buffer = ""
-        self._pending_tokens = []
-        self._last_processed_pos = 0
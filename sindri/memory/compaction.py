@@ -0,0 +1,144 @@
+"""Rolling in-session conversation compaction."""
+
+import asyncio
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+import structlog
+
+from sindri.memory.summarizer import ConversationSummarizer
+from sindri.persistence.state import Turn
+
+log = structlog.get_logger()
+
+# Summary turns start with this so later stages (e.g. working-memory fitting)
+# can recognise and keep them
+SUMMARY_PREFIX = "[Summary of earlier conversation"
+
+
+@dataclass
+class CompactionConfig:
+    """When and how much of a conversation to compact."""
+
+    threshold_turns: int = 24  # Start compacting past this many turns
+    keep_recent: int = 10  # Most recent turns always stay verbatim
+    span_turns: int = 8  # Turns summarized together
+    max_cached: int = 512  # Summaries kept in memory
+
+
+class ConversationCompactor:
+    """Replaces older spans of a long conversation with summary turns.
+
+    Spans are fixed blocks of ``span_turns`` turns counted from the start of
+    the session, so a span's turns (and its cache key) never change as the
+    conversation grows. Summaries are produced in the background by the
+    summarizer's small model; until a span's summary is ready the span stays
+    verbatim, so compaction never delays an iteration. Session turns are
+    not modified; only the messages sent to the model are.
+    """
+
+    def __init__(
+        self,
+        summarizer: ConversationSummarizer,
+        config: Optional[CompactionConfig] = None,
+    ):
+        self.summarizer = summarizer
+        self.config = config or CompactionConfig()
+        # span key -> summary (None if summarizing failed; not retried)
+        self._summaries: OrderedDict[str, Optional[str]] = OrderedDict()
+        self._pending: dict[str, asyncio.Task] = {}
+
+    @staticmethod
+    def _span_key(turns: list[Turn]) -> str:
+        digest = hashlib.sha256()
+        for turn in turns:
+            digest.update(turn.role.encode())
+            digest.update(b"\0")
+            digest.update((turn.content or "").encode())
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def _spans(self, turns: list[Turn]) -> list[tuple[int, int]]:
+        """Index ranges of the spans old enough to compact."""
+        span = self.config.span_turns
+        if span <= 0 or len(turns) <= self.config.threshold_turns:
+            return []
+        limit = len(turns) - self.config.keep_recent
+        return [(start, start + span) for start in range(0, limit - span + 1, span)]
+
+    def schedule(self, task: str, turns: list[Turn]) -> int:
+        """Start background summaries for spans that don't have one yet.
+
+        Returns:
+            Number of summaries started
+        """
+        started = 0
+        for start, end in self._spans(turns):
+            span = turns[start:end]
+            key = self._span_key(span)
+            if key in self._summaries or key in self._pending:
+                continue
+            self._pending[key] = asyncio.ensure_future(
+                self._summarize(key, task, span)
+            )
+            started += 1
+        if started:
+            log.info("compaction_scheduled", spans=started, turns=len(turns))
+        return started
+
+    async def _summarize(self, key: str, task: str, span: list[Turn]):
+        try:
+            summary = await self.summarizer.summarize_span(
+                task, [{"role": t.role, "content": t.content} for t in span]
+            )
+        except Exception as e:
+            log.warning("compaction_summary_failed", error=str(e))
+            summary = None
+        finally:
+            self._pending.pop(key, None)
+        self._summaries[key] = summary
+        while len(self._summaries) > self.config.max_cached:
+            self._summaries.popitem(last=False)
+
+    def compact(self, turns: list[Turn]) -> list[Turn]:
+        """The conversation with summarized spans replaced by summary turns.
+
+        Consecutive summarized spans are merged into one summary turn.
+        """
+        spans = self._spans(turns)
+        if not spans:
+            return list(turns)
+
+        result: list[Turn] = []
+        summaries: list[str] = []
+        first = 0
+        for start, end in spans:
+            summary = self._summaries.get(self._span_key(turns[start:end]))
+            if summary:
+                if not summaries:
+                    first = start
+                summaries.append(summary)
+                continue
+            if summaries:
+                result.append(self._summary_turn(first, start, summaries))
+                summaries = []
+            result.extend(turns[start:end])
+        end = spans[-1][1]
+        if summaries:
+            result.append(self._summary_turn(first, end, summaries))
+        result.extend(turns[end:])
+        return result
+
+    @staticmethod
+    def _summary_turn(start: int, end: int, summaries: list[str]) -> Turn:
+        body = "\n\n".join(summaries)
+        return Turn(
+            role="user",
+            content=f"{SUMMARY_PREFIX} (turns {start + 1}-{end})]\n{body}",
+        )
+
+    async def wait(self):
+        """Wait for summaries in progress (e.g. before shutdown or in tests)."""
+        while self._pending:
+            await asyncio.gather(*list(self._pending.values()), return_exceptions=True)
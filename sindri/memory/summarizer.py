@@ -20,6 +20,25 @@ Provide a concise summary (2-3 sentences) capturing:
 
 Summary:"""
 
+SPAN_PROMPT = """Summarize this earlier part of an ongoing task conversation so the agent can continue without it.
+
+Task: {task}
+
+Conversation:
+{conversation}
+
+In a few sentences, keep:
+1. Files read or changed, and what was found or done
+2. Decisions made and why
+3. Errors hit and how they were handled
+Leave out anything the agent would not need to finish the task.
+
+Summary:"""
+
+# Summaries are pure functions of the conversation, so sample greedily to
+# make them deterministic (and eligible for the response cache).
+SUMMARIZE_OPTIONS = {"temperature": 0}
+
 
 class ConversationSummarizer:
     """Compress conversations into episodic memories."""
@@ -47,7 +66,9 @@ class ConversationSummarizer:
 
         try:
             response = await self.client.chat(
-                model=self.model, messages=[{"role": "user", "content": prompt}]
+                model=self.model,
+                messages=[{"role": "user", "content": prompt}],
+                options=SUMMARIZE_OPTIONS,
             )
             summary = response.message.content.strip()
             log.info("conversation_summarized", length=len(summary))
@@ -57,3 +78,36 @@ class ConversationSummarizer:
             log.error("summarization_failed", error=str(e))
             # Fallback: return truncated task description
             return f"Completed: {task[:200]}"
+
+    async def summarize_span(self, task: str, conversation: list[dict]) -> str:
+        """Summarize part of an ongoing conversation for in-session compaction.
+
+        Args:
+            task: Task the conversation is working on
+            conversation: Messages (role/content dicts) to summarize
+
+        Returns:
+            The summary
+
+        Raises:
+            Exception: If the model call fails (callers keep the original turns)
+        """
+        conv_text = "\n".join(
+            f"{msg['role']}: {msg.get('content', '')[:1500]}"
+            for msg in conversation
+            if msg.get("content")
+        )
+        prompt = SPAN_PROMPT.format(task=task, conversation=conv_text)
+
+        response = await self.client.chat(
+            model=self.model,
+            messages=[{"role": "user", "content": prompt}],
+            options=SUMMARIZE_OPTIONS,
+        )
+        summary = response.message.content.strip()
+        log.info(
+            "conversation_span_summarized",
+            turns=len(conversation),
+            length=len(summary),
+        )
+        return summary
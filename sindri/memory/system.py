@@ -11,6 +11,7 @@ from sindri.memory.embedder import LocalEmbedder
 from sindri.memory.patterns import PatternStore
 from sindri.memory.learner import PatternLearner, LearningConfig
 from sindri.memory.codebase import CodebaseAnalyzer
+from sindri.memory.compaction import SUMMARY_PREFIX
 from sindri.persistence.vectors import VectorStore
 
 if TYPE_CHECKING:
@@ -231,13 +232,24 @@ class MuninnMemory:
         return self._tokenizer.decode(tokens[:max_tokens])
 
     def _fit_conversation(self, conv: list[dict], max_tokens: int) -> list[dict]:
-        """Fit conversation into token budget, keeping most recent."""
-        result = []
-        used = 0
+        """Fit conversation into token budget, keeping most recent.
+
+        Compaction summaries (which stand in for the oldest turns) are kept
+        ahead of older verbatim turns, so earlier decisions aren't dropped.
+        """
+        summaries = [
+            msg
+            for msg in conv
+            if msg.get("content", "").startswith(SUMMARY_PREFIX)
+        ]
+        used = sum(self._count_tokens(msg["content"]) for msg in summaries)
+        if used > max_tokens:
+            summaries, used = [], 0
 
+        result = []
         for msg in reversed(conv):
             content = msg.get("content", "")
-            if not content:
+            if not content or msg in summaries:
                 continue
 
             msg_tokens = self._count_tokens(content)
@@ -246,7 +258,10 @@ class MuninnMemory:
             result.insert(0, msg)
             used += msg_tokens
 
-        return result
+        kept = len(summaries) + len(result)
+        if kept < len(conv):
+            log.debug("working_memory_trimmed", dropped=len(conv) - kept)
+        return summaries + result
 
     # Storage operations
 
@@ -9,6 +9,8 @@ from typing import Optional
 import aiosqlite
 import structlog
 
+from sindri.persistence.pool import close_pool
+
 log = structlog.get_logger()
 
 
@@ -180,6 +182,11 @@ class DatabaseBackup:
                 log.warning("pre_restore_backup_failed", error=str(e))
 
         try:
+            # Pooled connections and WAL files belong to the old file
+            await close_pool(self.db_path)
+            for suffix in ("-wal", "-shm"):
+                Path(f"{self.db_path}{suffix}").unlink(missing_ok=True)
+
             # Copy backup to database location
             shutil.copy2(backup_path, self.db_path)
 
@@ -644,7 +644,7 @@ class CoverageStore:
         """
         await self._ensure_table()
 
-        async with self.db.get_connection() as conn:
+        async with self.db.get_connection(read_only=True) as conn:
             async with conn.execute(
                 "SELECT coverage_json FROM session_coverage WHERE session_id = ?",
                 (session_id,),
@@ -667,7 +667,7 @@ class CoverageStore:
         """
         await self._ensure_table()
 
-        async with self.db.get_connection() as conn:
+        async with self.db.get_connection(read_only=True) as conn:
             async with conn.execute(
                 """
                 SELECT sc.session_id, sc.line_rate, sc.branch_rate, sc.files_covered,
@@ -706,7 +706,7 @@ class CoverageStore:
         """
         await self._ensure_table()
 
-        async with self.db.get_connection() as conn:
+        async with self.db.get_connection(read_only=True) as conn:
             async with conn.execute(
                 """
                 SELECT
@@ -1,17 +1,22 @@
 """SQLite database setup for Sindri."""
 
 import aiosqlite
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Optional
+from typing import AsyncIterator, Optional
 import structlog
 
+from sindri.persistence.pool import ConnectionPool, close_pool, get_pool
+from sindri.persistence.write_behind import get_write_queue
+
 log = structlog.get_logger()
 
 # Current schema version for migration tracking
 # Version 2: Added session_metrics table for performance tracking
 # Version 3: Added session_feedback table for feedback collection and fine-tuning
 # Version 4: Added session_shares and session_comments for remote collaboration
-SCHEMA_VERSION = 4
+# Version 5: Added turns.seq (unique per session) for append-only turn saves
+SCHEMA_VERSION = 5
 
 
 class Database:
@@ -54,12 +59,47 @@ class Database:
         """Set schema version in database."""
         await db.execute(f"PRAGMA user_version = {version}")
 
+    async def _migrate_turn_seq(self, db: aiosqlite.Connection):
+        """Add turns.seq to older databases, numbering existing turns in order."""
+        async with db.execute("PRAGMA table_info(turns)") as cursor:
+            columns = [row[1] for row in await cursor.fetchall()]
+        if "seq" in columns:
+            return
+
+        await db.execute("ALTER TABLE turns ADD COLUMN seq INTEGER")
+        await db.execute(
+            """
+            UPDATE turns SET seq = (
+                SELECT COUNT(*) FROM turns AS earlier
+                WHERE earlier.session_id = turns.session_id
+                AND earlier.id < turns.id
+            )
+        """
+        )
+        log.info("turns_seq_migrated")
+
+    def is_schema_ready(self, name: str) -> bool:
+        """Whether schema setup ``name`` already ran against this file.
+
+        Stores use this to run their CREATE TABLE statements once per
+        process instead of on every call.
+        """
+        return name in get_pool(self.db_path).schema_ready
+
+    def mark_schema_ready(self, name: str):
+        """Record that schema setup ``name`` ran against this file."""
+        get_pool(self.db_path).schema_ready.add(name)
+
     async def initialize(self):
         """Create database schema if it doesn't exist.
 
-        Creates auto-backup before schema changes if database exists
-        and auto_backup is enabled.
+        Runs once per process for each database file (again only if the
+        file is deleted or replaced). Creates auto-backup before schema
+        changes if database exists and auto_backup is enabled.
         """
+        if self.is_schema_ready("core"):
+            return
+
         # Check if we need to create backup before schema changes
         needs_migration = False
         if self.db_path.exists() and self.auto_backup:
@@ -79,7 +119,7 @@ class Database:
                 log.warning("pre_migration_backup_failed", error=str(e))
                 # Continue with migration anyway
 
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.get_connection() as db:
             await db.execute(
                 """
                 CREATE TABLE IF NOT EXISTS sessions (
@@ -103,6 +143,7 @@ class Database:
                     content TEXT NOT NULL,
                     tool_calls TEXT,
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    seq INTEGER,
                     FOREIGN KEY (session_id) REFERENCES sessions(id)
                 )
             """
@@ -115,6 +156,15 @@ class Database:
             """
             )
 
+            # Version 5: Position of each turn in its session
+            await self._migrate_turn_seq(db)
+            await db.execute(
+                """
+                CREATE UNIQUE INDEX IF NOT EXISTS idx_turns_session_seq
+                ON turns(session_id, seq)
+            """
+            )
+
             # Phase 5.5: Performance metrics table
             await db.execute(
                 """
@@ -235,8 +285,64 @@ class Database:
 
             await db.commit()
 
+        self.mark_schema_ready("core")
         log.info("database_initialized", path=str(self.db_path))
 
-    def get_connection(self):
-        """Get an async database connection context manager."""
-        return aiosqlite.connect(self.db_path)
+    def get_connection(self, read_only: bool = False):
+        """Get a pooled database connection context manager.
+
+        Args:
+            read_only: Borrow one of the read-only connections, which run
+                alongside the writer (WAL mode) and see committed data
+                only. The default is the shared writer connection, held by
+                one caller at a time (see ConnectionPool).
+
+        Usage:
+            async with db.get_connection() as conn:
+                await conn.execute(...)
+                await conn.commit()
+        """
+        pool = get_pool(self.db_path)
+        return pool.reader() if read_only else self._writer(pool)
+
+    @asynccontextmanager
+    async def _writer(
+        self, pool: ConnectionPool
+    ) -> AsyncIterator[aiosqlite.Connection]:
+        # Queued writes go first so writes land in the order they were made
+        if not pool.held_by_caller:
+            await self.flush_writes()
+        async with pool.writer() as conn:
+            yield conn
+
+    def write_behind(
+        self, table: str, sql: str, params: tuple, key: Optional[str] = None
+    ):
+        """Queue a write to be committed with the next batch.
+
+        For log-style records whose writers don't need to wait for them.
+        The queue is drained before the writer connection is next handed
+        out; read-only queries of ``table`` call :meth:`flush_writes` first.
+
+        Args:
+            table: Table the statement writes to
+            sql: Statement to execute
+            params: Statement parameters
+            key: Optional key for counting queued rows (see pending_writes)
+        """
+        get_write_queue(self.db_path).enqueue(table, sql, params, key)
+
+    async def flush_writes(self, *tables: str):
+        """Write queued records, if any target ``tables`` (any table if none)."""
+        queue = get_write_queue(self.db_path)
+        if queue.has_pending(tables):
+            await queue.flush()
+
+    def pending_writes(self, table: str, key: Optional[str] = None) -> int:
+        """Number of queued, not yet written records for a table."""
+        return get_write_queue(self.db_path).pending_count(table, key)
+
+    async def close(self):
+        """Flush queued writes and close the pooled connections."""
+        await self.flush_writes()
+        await close_pool(self.db_path)
@@ -164,7 +164,7 @@ class FeedbackStore:
         await self.db.initialize()
 
         feedback_list = []
-        async with self.db.get_connection() as conn:
+        async with self.db.get_connection(read_only=True) as conn:
             async with conn.execute(
                 """
                 SELECT id, session_id, turn_index, rating, quality_tags, notes,
@@ -204,7 +204,7 @@ class FeedbackStore:
         """
         await self.db.initialize()
 
-        async with self.db.get_connection() as conn:
+        async with self.db.get_connection(read_only=True) as conn:
             async with conn.execute(
                 """
                 SELECT id, session_id, turn_index, rating, quality_tags, notes,
@@ -330,7 +330,7 @@ class FeedbackStore:
         params.append(limit)
 
         sessions = []
-        async with self.db.get_connection() as conn:
+        async with self.db.get_connection(read_only=True) as conn:
             async with conn.execute(query, params) as cursor:
                 async for row in cursor:
                     # Parse all quality tags from concatenated JSON arrays
@@ -376,7 +376,7 @@ class FeedbackStore:
         await self.db.initialize()
 
         session_ids = []
-        async with self.db.get_connection() as conn:
+        async with self.db.get_connection(read_only=True) as conn:
             async with conn.execute(
                 """
                 SELECT DISTINCT f.session_id
@@ -402,7 +402,7 @@ class FeedbackStore:
         """
         await self.db.initialize()
 
-        async with self.db.get_connection() as conn:
+        async with self.db.get_connection(read_only=True) as conn:
             # Total feedback count
             async with conn.execute("SELECT COUNT(*) FROM session_feedback") as cursor:
                 total_feedback = (await cursor.fetchone())[0]
@@ -1,6 +1,8 @@
 """Performance metrics tracking for Sindri sessions.
 
 Phase 5.5: Track task duration, iteration timing, tool execution, and model loading.
+Token counts and timings reported by Ollama give per-iteration, per-model and
+per-agent throughput (tokens/sec, prompt-eval share, load share).
 """
 
 import json
@@ -43,13 +45,23 @@ class IterationMetrics:
     agent_name: str
     model_name: str
     tool_executions: list[ToolExecutionMetrics] = field(default_factory=list)
-    tokens_generated: int = 0
+    tokens_generated: int = 0  # Ollama eval_count
+    # Ollama-reported generation stats (seconds)
+    prompt_tokens: int = 0  # Ollama prompt_eval_count
+    load_duration: float = 0.0
+    prompt_eval_duration: float = 0.0
+    eval_duration: float = 0.0
 
     @property
     def duration_seconds(self) -> float:
         """Get iteration duration in seconds."""
         return self.end_time - self.start_time
 
+    @property
+    def tokens_per_second(self) -> float:
+        """Generation throughput for this iteration."""
+        return ThroughputStats.from_iterations([self]).tokens_per_second
+
     @property
     def tool_count(self) -> int:
         """Number of tools executed in this iteration."""
@@ -66,6 +78,96 @@ class IterationMetrics:
         return max(0, self.duration_seconds - self.total_tool_time)
 
 
+@dataclass
+class ThroughputStats:
+    """Token throughput aggregated over a set of iterations."""
+
+    iterations: int = 0
+    prompt_tokens: int = 0
+    tokens_generated: int = 0
+    load_duration: float = 0.0
+    prompt_eval_duration: float = 0.0
+    eval_duration: float = 0.0
+
+    @classmethod
+    def from_iterations(cls, iterations: list[IterationMetrics]) -> "ThroughputStats":
+        """Sum generation stats over iterations."""
+        stats = cls()
+        for it in iterations:
+            stats.iterations += 1
+            stats.prompt_tokens += it.prompt_tokens
+            stats.tokens_generated += it.tokens_generated
+            stats.load_duration += it.load_duration
+            stats.prompt_eval_duration += it.prompt_eval_duration
+            stats.eval_duration += it.eval_duration
+        return stats
+
+    @property
+    def generation_time(self) -> float:
+        """Time Ollama spent loading, evaluating the prompt and generating."""
+        return self.load_duration + self.prompt_eval_duration + self.eval_duration
+
+    @property
+    def tokens_per_second(self) -> float:
+        """Generated tokens per second of eval time."""
+        if self.eval_duration <= 0:
+            return 0.0
+        return self.tokens_generated / self.eval_duration
+
+    @property
+    def prompt_tokens_per_second(self) -> float:
+        """Prompt tokens evaluated per second."""
+        if self.prompt_eval_duration <= 0:
+            return 0.0
+        return self.prompt_tokens / self.prompt_eval_duration
+
+    @property
+    def prompt_eval_share(self) -> float:
+        """Fraction of generation time spent evaluating the prompt."""
+        total = self.generation_time
+        return self.prompt_eval_duration / total if total > 0 else 0.0
+
+    @property
+    def load_share(self) -> float:
+        """Fraction of generation time spent loading the model."""
+        total = self.generation_time
+        return self.load_duration / total if total > 0 else 0.0
+
+    def to_dict(self) -> dict:
+        """Summary dictionary for displays and the API."""
+        return {
+            "iterations": self.iterations,
+            "prompt_tokens": self.prompt_tokens,
+            "tokens_generated": self.tokens_generated,
+            "tokens_per_second": round(self.tokens_per_second, 2),
+            "prompt_tokens_per_second": round(self.prompt_tokens_per_second, 2),
+            "prompt_eval_share": round(self.prompt_eval_share, 3),
+            "load_share": round(self.load_share, 3),
+            "generation_time": round(self.generation_time, 2),
+        }
+
+
+def throughput_breakdown(iterations: list[IterationMetrics]) -> dict[str, dict]:
+    """Throughput overall and grouped by model and by agent."""
+    by_model: dict[str, list[IterationMetrics]] = {}
+    by_agent: dict[str, list[IterationMetrics]] = {}
+    for it in iterations:
+        by_model.setdefault(it.model_name, []).append(it)
+        by_agent.setdefault(it.agent_name, []).append(it)
+
+    return {
+        "overall": ThroughputStats.from_iterations(iterations).to_dict(),
+        "by_model": {
+            name: ThroughputStats.from_iterations(its).to_dict()
+            for name, its in by_model.items()
+        },
+        "by_agent": {
+            name: ThroughputStats.from_iterations(its).to_dict()
+            for name, its in by_agent.items()
+        },
+    }
+
+
 @dataclass
 class TaskMetrics:
     """Aggregate metrics for a single task."""
@@ -153,6 +255,9 @@ class SessionMetrics:
     end_time: Optional[float] = None
     status: str = "active"
     tasks: list[TaskMetrics] = field(default_factory=list)
+    # Response cache usage
+    cache_hits: int = 0
+    cache_time_saved: float = 0.0  # Seconds of generation avoided
 
     @property
     def duration_seconds(self) -> float:
@@ -208,8 +313,23 @@ class SessionMetrics:
                 if self.tasks
                 else 0.0
             ),
+            "response_cache": {
+                "hits": self.cache_hits,
+                "time_saved": round(self.cache_time_saved, 2),
+            },
+            "throughput": ThroughputStats.from_iterations(
+                self.all_iterations()
+            ).to_dict(),
         }
 
+    def all_iterations(self) -> list[IterationMetrics]:
+        """Iterations across all tasks."""
+        return [it for task in self.tasks for it in task.iterations]
+
+    def get_throughput_breakdown(self) -> dict[str, dict]:
+        """Token throughput overall and per model and agent."""
+        return throughput_breakdown(self.all_iterations())
+
     def get_tool_breakdown(self) -> dict[str, dict]:
         """Get combined tool breakdown across all tasks."""
         combined = {}
@@ -259,6 +379,8 @@ class SessionMetrics:
             "start_time": self.start_time,
             "end_time": self.end_time,
             "status": self.status,
+            "cache_hits": self.cache_hits,
+            "cache_time_saved": self.cache_time_saved,
             "tasks": [
                 {
                     "task_id": task.task_id,
@@ -277,6 +399,10 @@ class SessionMetrics:
                             "agent_name": it.agent_name,
                             "model_name": it.model_name,
                             "tokens_generated": it.tokens_generated,
+                            "prompt_tokens": it.prompt_tokens,
+                            "load_duration": it.load_duration,
+                            "prompt_eval_duration": it.prompt_eval_duration,
+                            "eval_duration": it.eval_duration,
                             "tool_executions": [
                                 {
                                     "tool_name": te.tool_name,
@@ -320,6 +446,10 @@ class SessionMetrics:
                         agent_name=it_data["agent_name"],
                         model_name=it_data["model_name"],
                         tokens_generated=it_data.get("tokens_generated", 0),
+                        prompt_tokens=it_data.get("prompt_tokens", 0),
+                        load_duration=it_data.get("load_duration", 0.0),
+                        prompt_eval_duration=it_data.get("prompt_eval_duration", 0.0),
+                        eval_duration=it_data.get("eval_duration", 0.0),
                         tool_executions=tool_executions,
                     )
                 )
@@ -346,6 +476,8 @@ class SessionMetrics:
             end_time=data.get("end_time"),
             status=data.get("status", "completed"),
             tasks=tasks,
+            cache_hits=data.get("cache_hits", 0),
+            cache_time_saved=data.get("cache_time_saved", 0.0),
         )
 
 
@@ -423,11 +555,52 @@ class MetricsCollector:
                 duration_ms=tool_metrics.duration_ms,
             )
 
-    def end_iteration(self, tokens_generated: int = 0):
-        """End the current iteration."""
+    def record_cache_hit(self, time_saved: float = 0.0):
+        """Record an LLM response served from the response cache."""
+        self.session_metrics.cache_hits += 1
+        self.session_metrics.cache_time_saved += time_saved
+        log.debug("metrics_cache_hit", time_saved=time_saved)
+
+    def record_generation(
+        self,
+        prompt_tokens: int = 0,
+        eval_tokens: int = 0,
+        load_duration: float = 0.0,
+        prompt_eval_duration: float = 0.0,
+        eval_duration: float = 0.0,
+    ):
+        """Record Ollama's token counts and timings for one LLM call.
+
+        Adds to the current iteration; load time also counts toward the
+        task's model_load_time.
+        """
+        if self._current_iteration:
+            it = self._current_iteration
+            it.prompt_tokens += prompt_tokens
+            it.tokens_generated += eval_tokens
+            it.load_duration += load_duration
+            it.prompt_eval_duration += prompt_eval_duration
+            it.eval_duration += eval_duration
+        if self._current_task:
+            self._current_task.model_load_time += load_duration
+        log.debug(
+            "metrics_generation_recorded",
+            prompt_tokens=prompt_tokens,
+            eval_tokens=eval_tokens,
+            load_duration=load_duration,
+        )
+
+    def end_iteration(self, tokens_generated: Optional[int] = None):
+        """End the current iteration.
+
+        Args:
+            tokens_generated: Override the token count recorded via
+                record_generation()
+        """
         if self._current_iteration and self._current_task:
             self._current_iteration.end_time = time.time()
-            self._current_iteration.tokens_generated = tokens_generated
+            if tokens_generated is not None:
+                self._current_iteration.tokens_generated = tokens_generated
             self._current_task.iterations.append(self._current_iteration)
             log.debug(
                 "metrics_iteration_ended",
@@ -508,28 +681,27 @@ class MetricsStore:
         metrics_json = json.dumps(metrics.to_dict())
         summary = metrics.get_summary()
 
-        async with self.db.get_connection() as conn:
-            # Use REPLACE to handle updates
-            await conn.execute(
-                """
-                INSERT OR REPLACE INTO session_metrics
-                (session_id, metrics_json, duration_seconds, total_iterations,
-                 total_tool_executions, created_at, updated_at)
-                VALUES (?, ?, ?, ?, ?, COALESCE(
-                    (SELECT created_at FROM session_metrics WHERE session_id = ?),
-                    CURRENT_TIMESTAMP
-                ), CURRENT_TIMESTAMP)
-                """,
-                (
-                    metrics.session_id,
-                    metrics_json,
-                    summary["duration_seconds"],
-                    summary["total_iterations"],
-                    summary["total_tool_executions"],
-                    metrics.session_id,  # For the subquery
-                ),
-            )
-            await conn.commit()
+        # Batched; the read methods below flush queued metrics first
+        self.db.write_behind(
+            "session_metrics",
+            """
+            INSERT OR REPLACE INTO session_metrics
+            (session_id, metrics_json, duration_seconds, total_iterations,
+             total_tool_executions, created_at, updated_at)
+            VALUES (?, ?, ?, ?, ?, COALESCE(
+                (SELECT created_at FROM session_metrics WHERE session_id = ?),
+                CURRENT_TIMESTAMP
+            ), CURRENT_TIMESTAMP)
+            """,
+            (
+                metrics.session_id,
+                metrics_json,
+                summary["duration_seconds"],
+                summary["total_iterations"],
+                summary["total_tool_executions"],
+                metrics.session_id,  # For the subquery
+            ),
+        )
 
         log.info(
             "metrics_saved",
@@ -548,8 +720,9 @@ class MetricsStore:
             SessionMetrics if found, None otherwise.
         """
         await self.db.initialize()
+        await self.db.flush_writes("session_metrics")
 
-        async with self.db.get_connection() as conn:
+        async with self.db.get_connection(read_only=True) as conn:
             async with conn.execute(
                 "SELECT metrics_json FROM session_metrics WHERE session_id = ?",
                 (session_id,),
@@ -571,8 +744,9 @@ class MetricsStore:
             List of metrics summary dictionaries.
         """
         await self.db.initialize()
+        await self.db.flush_writes("session_metrics")
 
-        async with self.db.get_connection() as conn:
+        async with self.db.get_connection(read_only=True) as conn:
             async with conn.execute(
                 """
                 SELECT sm.session_id, sm.duration_seconds, sm.total_iterations,
@@ -608,8 +782,9 @@ class MetricsStore:
             Dictionary with aggregate stats.
         """
         await self.db.initialize()
+        await self.db.flush_writes("session_metrics")
 
-        async with self.db.get_connection() as conn:
+        async with self.db.get_connection(read_only=True) as conn:
             async with conn.execute(
                 """
                 SELECT
@@ -641,6 +816,76 @@ class MetricsStore:
                     "total_tool_executions": 0,
                 }
 
+    async def get_throughput_stats(self, limit: int = 100) -> dict:
+        """Token throughput across recent sessions, per model and agent.
+
+        Args:
+            limit: Number of most recent sessions to include.
+
+        Returns:
+            Dictionary with "overall", "by_model" and "by_agent" entries.
+        """
+        await self.db.initialize()
+        await self.db.flush_writes("session_metrics")
+
+        iterations: list[IterationMetrics] = []
+        async with self.db.get_connection(read_only=True) as conn:
+            async with conn.execute(
+                """
+                SELECT metrics_json FROM session_metrics
+                ORDER BY updated_at DESC
+                LIMIT ?
+                """,
+                (limit,),
+            ) as cursor:
+                async for row in cursor:
+                    try:
+                        metrics = SessionMetrics.from_dict(json.loads(row[0]))
+                    except (ValueError, KeyError) as e:
+                        log.warning("metrics_parse_failed", error=str(e))
+                        continue
+                    iterations.extend(metrics.all_iterations())
+
+        return throughput_breakdown(iterations)
+
+    async def get_task_durations(self, limit: int = 100) -> list[TaskMetrics]:
+        """Finished tasks from recent sessions, for duration estimates.
+
+        Tasks cut off when their session ended early are left out.
+
+        Args:
+            limit: Number of most recent sessions to include.
+
+        Returns:
+            List of TaskMetrics with an end time.
+        """
+        await self.db.initialize()
+        await self.db.flush_writes("session_metrics")
+
+        tasks: list[TaskMetrics] = []
+        async with self.db.get_connection(read_only=True) as conn:
+            async with conn.execute(
+                """
+                SELECT metrics_json FROM session_metrics
+                ORDER BY updated_at DESC
+                LIMIT ?
+                """,
+                (limit,),
+            ) as cursor:
+                async for row in cursor:
+                    try:
+                        metrics = SessionMetrics.from_dict(json.loads(row[0]))
+                    except (ValueError, KeyError) as e:
+                        log.warning("metrics_parse_failed", error=str(e))
+                        continue
+                    tasks.extend(
+                        task
+                        for task in metrics.tasks
+                        if task.end_time is not None and task.status != "incomplete"
+                    )
+
+        return tasks
+
     async def delete_metrics(self, session_id: str) -> bool:
         """Delete metrics for a session.
 
@@ -0,0 +1,253 @@
+"""Pooled SQLite connections shared by every Database on the same file.
+
+Opening an aiosqlite connection starts a thread and opens the file, which
+used to happen for every query. A pool keeps one writer connection (writes
+are serialized by SQLite anyway) and a few read-only connections per
+database file, in WAL mode so readers never wait for the writer.
+"""
+
+import asyncio
+import threading
+import weakref
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import AsyncIterator, Optional
+import aiosqlite
+import structlog
+
+log = structlog.get_logger()
+
+# Applied to every pooled connection
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",  # Durable at checkpoints; safe with WAL
+    "PRAGMA busy_timeout = 5000",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -16000",  # 16 MB
+)
+
+DEFAULT_READERS = 4
+MAX_POOLS = 8  # Pools for other files are closed once idle past this many
+
+
+class _WriterHold:
+    """A held writer, seen by the holder's context and tasks it starts."""
+
+    __slots__ = ("pool", "active")
+
+    def __init__(self, pool: "ConnectionPool"):
+        self.pool = pool
+        self.active = True
+
+
+# Writers held by the current context (inherited by child tasks; a task
+# outliving the hold sees it inactive and queues for the writer again)
+_held_writers: ContextVar[tuple[_WriterHold, ...]] = ContextVar(
+    "sindri_held_db_writers", default=()
+)
+
+
+class ConnectionPool:
+    """One writer and up to ``max_readers`` reader connections to a file.
+
+    The writer is held by one caller at a time and is re-entrant within
+    the holder's context, so a store method holding it can call another
+    that asks for it again. Tasks started while it is held (e.g. by
+    ``asyncio.gather``) inherit that context and share the held writer
+    and its transaction rather than waiting for it. Transactions left open
+    when a connection is released are rolled back, as closing a
+    connection used to do.
+    """
+
+    def __init__(self, db_path: Path, max_readers: int = DEFAULT_READERS):
+        self.db_path = db_path
+        self.max_readers = max(1, max_readers)
+        # Schema setup already done against this file (see Database)
+        self.schema_ready: set[str] = set()
+        self._inode: Optional[int] = None
+        self._writer: Optional[aiosqlite.Connection] = None
+        self._readers: list[aiosqlite.Connection] = []
+        self._idle: list[aiosqlite.Connection] = []
+        self._in_use = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._writer_lock: Optional[asyncio.Lock] = None
+        self._reader_slots: Optional[asyncio.Semaphore] = None
+
+    def _bind_loop(self):
+        """(Re)create asyncio primitives for the running event loop.
+
+        Connections run on their own threads and work from any loop; only
+        the locks belong to one.
+        """
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._writer_lock = asyncio.Lock()
+            self._reader_slots = asyncio.Semaphore(self.max_readers)
+            self._idle = list(self._readers)
+            self._in_use = 0
+
+    @property
+    def is_current(self) -> bool:
+        """False once the file was deleted or replaced under the pool."""
+        if self._inode is None:
+            return True
+        try:
+            return self.db_path.stat().st_ino == self._inode
+        except OSError:
+            return False
+
+    @property
+    def held_by_caller(self) -> bool:
+        """Whether the current context already holds the writer."""
+        return any(h.pool is self and h.active for h in _held_writers.get())
+
+    @property
+    def is_idle(self) -> bool:
+        """Whether no connection is checked out."""
+        return self._in_use == 0
+
+    async def _open(self, read_only: bool) -> aiosqlite.Connection:
+        conn = await aiosqlite.connect(self.db_path)
+        for pragma in CONNECTION_PRAGMAS:
+            await conn.execute(pragma)
+        if read_only:
+            await conn.execute("PRAGMA query_only = ON")
+        if self._inode is None:
+            self._inode = self.db_path.stat().st_ino
+        log.debug("db_connection_opened", path=str(self.db_path), read_only=read_only)
+        return conn
+
+    async def _reset(self, conn: aiosqlite.Connection):
+        """Undo per-use state before a connection goes back to the pool."""
+        if conn.in_transaction:
+            await conn.rollback()
+        conn.row_factory = None
+
+    @asynccontextmanager
+    async def writer(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Hold the writer connection."""
+        self._bind_loop()
+        if self.held_by_caller:
+            # Re-entrant use shares the outer transaction
+            yield self._writer
+            return
+
+        async with self._writer_lock:
+            self._in_use += 1
+            hold = _WriterHold(self)
+            token = _held_writers.set(_held_writers.get() + (hold,))
+            try:
+                if self._writer is None:
+                    self._writer = await self._open(read_only=False)
+                yield self._writer
+            finally:
+                hold.active = False
+                _held_writers.reset(token)
+                self._in_use -= 1
+                if self._writer is not None:
+                    await self._reset(self._writer)
+
+    @asynccontextmanager
+    async def reader(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Borrow a read-only connection."""
+        self._bind_loop()
+        async with self._reader_slots:
+            self._in_use += 1
+            if self._idle:
+                conn = self._idle.pop()
+            else:
+                conn = await self._open(read_only=True)
+                self._readers.append(conn)
+            try:
+                yield conn
+            finally:
+                self._in_use -= 1
+                await self._reset(conn)
+                self._idle.append(conn)
+
+    def _take_connections(self) -> list[aiosqlite.Connection]:
+        connections = self._readers + ([self._writer] if self._writer else [])
+        self._writer = None
+        self._readers = []
+        self._idle = []
+        return connections
+
+    async def close(self):
+        """Close every connection."""
+        for conn in self._take_connections():
+            try:
+                await conn.close()
+            except Exception as e:
+                log.warning("db_connection_close_failed", error=str(e))
+
+    def stop(self):
+        """Close every connection without an event loop (at shutdown).
+
+        Each connection closes on its own worker thread, which then exits.
+        """
+        for conn in self._take_connections():
+            conn.stop()
+
+
+_pools: "OrderedDict[str, ConnectionPool]" = OrderedDict()
+# Every pool not yet closed, including retired ones still closing
+_open_pools: "weakref.WeakSet[ConnectionPool]" = weakref.WeakSet()
+
+
+def _stop_all_pools():
+    """Stop the connection threads of every pool left open at exit."""
+    for pool in list(_open_pools):
+        pool.stop()
+
+
+# Connection worker threads are not daemons, and the interpreter joins
+# them before running atexit handlers; threading's own exit hooks run
+# first (concurrent.futures relies on the same hook)
+threading._register_atexit(_stop_all_pools)
+
+
+def _retire(pool: ConnectionPool):
+    """Close a pool that is no longer handed out."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pool.stop()
+        return
+    asyncio.ensure_future(pool.close())
+
+
+def get_pool(db_path: Path) -> ConnectionPool:
+    """The shared pool for a database file, creating it if needed."""
+    key = str(Path(db_path).resolve())
+    pool = _pools.get(key)
+    if pool is not None and not pool.is_current:
+        log.info("db_pool_reset", path=key)
+        del _pools[key]
+        _retire(pool)
+        pool = None
+
+    if pool is None:
+        pool = ConnectionPool(Path(key))
+        _pools[key] = pool
+        _open_pools.add(pool)
+        # Close idle pools for other files beyond the limit
+        for other_key in list(_pools):
+            if len(_pools) <= MAX_POOLS:
+                break
+            other = _pools[other_key]
+            if other is not pool and other.is_idle:
+                del _pools[other_key]
+                _retire(other)
+
+    _pools.move_to_end(key)
+    return pool
+
+
+async def close_pool(db_path: Path):
+    """Close and forget the pool for a file (e.g. before replacing it)."""
+    pool = _pools.pop(str(Path(db_path).resolve()), None)
+    if pool is not None:
+        await pool.close()
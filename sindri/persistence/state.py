@@ -61,6 +61,8 @@ class Session:
     iterations: int = 0
     created_at: datetime = field(default_factory=datetime.now)
     completed_at: Optional[datetime] = None
+    # Turns already written to the database (saves only append the rest)
+    persisted_turns: int = field(default=0, repr=False, compare=False)
 
     def add_turn(self, role: str, content: str, tool_calls: Optional[list] = None):
         """Add a turn to the session."""
@@ -104,8 +106,13 @@ class SessionState:
         return session
 
     async def save_session(self, session: Session):
-        """Save session state to database."""
+        """Save session state to database.
 
+        Turns are append-only: only turns added since the last save or load
+        are written (turns edited in place are not re-saved).
+        """
+
+        start = session.persisted_turns
         async with self.db.get_connection() as conn:
             # Update session
             await conn.execute(
@@ -117,33 +124,47 @@ class SessionState:
                 (session.status, session.iterations, session.completed_at, session.id),
             )
 
-            # Save new turns (simple approach: delete and re-insert all)
-            await conn.execute("DELETE FROM turns WHERE session_id = ?", (session.id,))
-
-            for turn in session.turns:
-                tool_calls_json = serialize_tool_calls(turn.tool_calls)
+            if len(session.turns) < start:
+                # Turns were removed from the session, so the saved history
+                # no longer lines up with it; rewrite it in full
+                start = 0
                 await conn.execute(
-                    """
-                    INSERT INTO turns (session_id, role, content, tool_calls, created_at)
-                    VALUES (?, ?, ?, ?, ?)
-                    """,
+                    "DELETE FROM turns WHERE session_id = ?", (session.id,)
+                )
+
+            await conn.executemany(
+                """
+                INSERT OR REPLACE INTO turns
+                    (session_id, seq, role, content, tool_calls, created_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                [
                     (
                         session.id,
+                        seq,
                         turn.role,
                         turn.content,
-                        tool_calls_json,
+                        serialize_tool_calls(turn.tool_calls),
                         turn.created_at,
-                    ),
-                )
+                    )
+                    for seq, turn in enumerate(session.turns[start:], start=start)
+                ],
+            )
 
             await conn.commit()
 
-        log.info("session_saved", session_id=session.id, turns=len(session.turns))
+        session.persisted_turns = len(session.turns)
+        log.info(
+            "session_saved",
+            session_id=session.id,
+            turns=len(session.turns),
+            new_turns=len(session.turns) - start,
+        )
 
     async def load_session(self, session_id: str) -> Optional[Session]:
         """Load a session from database."""
 
-        async with self.db.get_connection() as conn:
+        async with self.db.get_connection(read_only=True) as conn:
             # Load session
             async with conn.execute(
                 "SELECT * FROM sessions WHERE id = ?", (session_id,)
@@ -164,7 +185,7 @@ class SessionState:
 
             # Load turns
             async with conn.execute(
-                "SELECT role, content, tool_calls, created_at FROM turns WHERE session_id = ? ORDER BY id",
+                "SELECT role, content, tool_calls, created_at FROM turns WHERE session_id = ? ORDER BY seq, id",
                 (session_id,),
             ) as cursor:
                 async for row in cursor:
@@ -176,6 +197,7 @@ class SessionState:
                         created_at=datetime.fromisoformat(row[3]),
                     )
                     session.turns.append(turn)
+            session.persisted_turns = len(session.turns)
 
         log.info("session_loaded", session_id=session_id, turns=len(session.turns))
         return session
@@ -199,7 +221,7 @@ class SessionState:
     async def list_sessions(self, limit: int = 10) -> list[dict[str, Any]]:
         """List recent sessions."""
 
-        async with self.db.get_connection() as conn:
+        async with self.db.get_connection(read_only=True) as conn:
             async with conn.execute(
                 """
                 SELECT id, task, model, status, created_at, iterations
@@ -277,7 +299,7 @@ class SessionState:
         """Get count of active sessions."""
         await self.db.initialize()
 
-        async with self.db.get_connection() as conn:
+        async with self.db.get_connection(read_only=True) as conn:
             async with conn.execute(
                 "SELECT COUNT(*) FROM sessions WHERE status = 'active'"
             ) as cursor:
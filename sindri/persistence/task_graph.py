@@ -0,0 +1,154 @@
+"""Durable orchestration task graphs.
+
+Every task an orchestration creates is saved with its dependencies,
+subtasks, status and result, keyed by the root task of its tree, so an
+orchestration interrupted by a crash can be rebuilt and continued from
+the work that was left (``sindri resume <task_id>``).
+
+Saves go through the database's write-behind queue: the tasks changed
+during one event-loop step are snapshotted together once the step ends,
+so a status change and the result set right after it land in one row.
+"""
+
+import asyncio
+import json
+from datetime import datetime
+from typing import TYPE_CHECKING, Optional
+import structlog
+
+from sindri.core.tasks import Task
+
+if TYPE_CHECKING:
+    from sindri.persistence.database import Database
+
+log = structlog.get_logger()
+
+
+class TaskGraphStore:
+    """Saves orchestration task trees and loads them back for resuming."""
+
+    def __init__(self, database: Optional["Database"] = None):
+        """Initialize the store.
+
+        Args:
+            database: Database instance (creates default if not provided)
+        """
+        from sindri.persistence.database import Database
+
+        self.db = database or Database()
+        self._roots: dict[str, str] = {}  # Task id -> root task id
+        self._dirty: dict[str, Task] = {}
+        self._saving: Optional[asyncio.Task] = None
+
+    async def _ensure_tables(self) -> None:
+        """Ensure the orchestration_tasks table exists."""
+        if self.db.is_schema_ready("orchestration_tasks"):
+            return
+        async with self.db.get_connection() as conn:
+            await conn.execute("""
+                CREATE TABLE IF NOT EXISTS orchestration_tasks (
+                    task_id TEXT PRIMARY KEY,
+                    root_id TEXT NOT NULL,
+                    parent_id TEXT,
+                    status TEXT NOT NULL,
+                    task_json TEXT NOT NULL,
+                    updated_at TEXT NOT NULL
+                )
+            """)
+            await conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_orchestration_tasks_root
+                ON orchestration_tasks(root_id)
+            """)
+            await conn.commit()
+        self.db.mark_schema_ready("orchestration_tasks")
+
+    def track(self, task: Task):
+        """Save a task that was added or changed (see TaskScheduler.add_observer).
+
+        Returns immediately; the save happens after the current event-loop
+        step. Without a running loop the task waits for :meth:`flush`.
+        """
+        if task.id not in self._roots:
+            parent_root = self._roots.get(task.parent_id) if task.parent_id else None
+            self._roots[task.id] = parent_root or task.parent_id or task.id
+        self._dirty[task.id] = task
+        if self._saving is None or self._saving.done():
+            try:
+                self._saving = asyncio.ensure_future(self._save_dirty())
+            except RuntimeError:
+                pass  # No running loop
+
+    async def _save_dirty(self):
+        await self._ensure_tables()
+        dirty, self._dirty = self._dirty, {}
+        now = datetime.now().isoformat()
+        for task in dirty.values():
+            self.db.write_behind(
+                "orchestration_tasks",
+                """
+                INSERT OR REPLACE INTO orchestration_tasks
+                (task_id, root_id, parent_id, status, task_json, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    task.id,
+                    self._roots[task.id],
+                    task.parent_id,
+                    task.status.value,
+                    json.dumps(task.to_dict(), default=str),
+                    now,
+                ),
+            )
+
+    async def flush(self):
+        """Write every tracked change and wait for it."""
+        if self._saving is not None and not self._saving.done():
+            await self._saving
+        if self._dirty:
+            await self._save_dirty()
+        await self.db.flush_writes("orchestration_tasks")
+
+    async def find_root(self, task_id: str) -> Optional[str]:
+        """Root task id of the orchestration containing ``task_id``.
+
+        Args:
+            task_id: Any task of the orchestration
+
+        Returns:
+            The root task id, or None if the task was never saved
+        """
+        await self._ensure_tables()
+        await self.flush()
+        async with self.db.get_connection(read_only=True) as conn:
+            async with conn.execute(
+                "SELECT root_id FROM orchestration_tasks WHERE task_id = ?",
+                (task_id,),
+            ) as cursor:
+                row = await cursor.fetchone()
+        return row[0] if row else None
+
+    async def load(self, task_id: str) -> list[Task]:
+        """Load the whole orchestration tree containing ``task_id``.
+
+        Args:
+            task_id: Any task of the orchestration
+
+        Returns:
+            Its tasks in creation order (root first), or [] if unknown
+        """
+        root_id = await self.find_root(task_id)
+        if root_id is None:
+            return []
+        async with self.db.get_connection(read_only=True) as conn:
+            async with conn.execute(
+                "SELECT task_json FROM orchestration_tasks WHERE root_id = ?",
+                (root_id,),
+            ) as cursor:
+                rows = await cursor.fetchall()
+
+        tasks = [Task.from_dict(json.loads(row[0])) for row in rows]
+        tasks.sort(key=lambda t: (t.id != root_id, t.created_at))
+        for task in tasks:
+            self._roots[task.id] = root_id
+        log.info("task_graph_loaded", root_id=root_id, tasks=len(tasks))
+        return tasks
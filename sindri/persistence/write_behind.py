@@ -0,0 +1,256 @@
+"""Write-behind batching for append-mostly log records.
+
+Metrics, activity, audit and API key usage rows used to be written with one
+transaction each, inline on the request or agent path. A write-behind queue
+accepts them without waiting and writes them in batched transactions every
+``flush_interval_ms`` or ``max_batch`` records, whichever comes first.
+
+The queue is drained before ``Database.get_connection`` hands out the
+writer, so writes stay in order; read-only queries that need queued rows
+call ``Database.flush_writes`` with the tables they read. Anything still
+queued at interpreter exit is written synchronously, so short-lived CLI
+runs don't lose records.
+"""
+
+import asyncio
+import atexit
+import sqlite3
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+import structlog
+
+from sindri.persistence.pool import get_pool
+
+log = structlog.get_logger()
+
+DEFAULT_FLUSH_INTERVAL_MS = 250
+DEFAULT_MAX_BATCH = 200
+
+
+@dataclass
+class PendingWrite:
+    """A queued statement."""
+
+    table: str
+    sql: str
+    params: tuple
+    key: Optional[str] = None  # Lets readers count queued rows (e.g. per API key)
+
+
+class WriteBehindQueue:
+    """Queued writes to one database file, flushed in batches."""
+
+    def __init__(
+        self,
+        db_path: Path,
+        flush_interval_ms: int = DEFAULT_FLUSH_INTERVAL_MS,
+        max_batch: int = DEFAULT_MAX_BATCH,
+    ):
+        self.db_path = db_path
+        self.flush_interval_ms = flush_interval_ms
+        self.max_batch = max(1, max_batch)
+        self._pending: list[PendingWrite] = []
+        self._in_flight: list[PendingWrite] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._task: Optional[asyncio.Task] = None
+
+        # Counters exposed through stats()
+        self.enqueued = 0
+        self.written = 0
+        self.failed = 0
+        self.batches = 0
+        self.last_flush_ms = 0.0
+        self.max_flush_ms = 0.0
+        self._total_flush_ms = 0.0
+
+    @property
+    def depth(self) -> int:
+        """Records waiting to be written."""
+        return len(self._pending) + len(self._in_flight)
+
+    def has_pending(self, tables: tuple[str, ...] = ()) -> bool:
+        """Whether any queued record targets one of ``tables`` (any if empty)."""
+        records = self._in_flight + self._pending
+        if not tables:
+            return bool(records)
+        return any(record.table in tables for record in records)
+
+    def pending_count(self, table: str, key: Optional[str] = None) -> int:
+        """Queued records for a table, optionally only those with ``key``."""
+        return sum(
+            1
+            for record in self._in_flight + self._pending
+            if record.table == table and (key is None or record.key == key)
+        )
+
+    def _bind_loop(self) -> asyncio.AbstractEventLoop:
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Timers and tasks from a finished loop will never run
+            self._loop = loop
+            self._timer = None
+            self._task = None
+            self._pending[:0] = self._in_flight
+            self._in_flight = []
+        return loop
+
+    def enqueue(
+        self, table: str, sql: str, params: tuple, key: Optional[str] = None
+    ):
+        """Queue a statement; returns immediately.
+
+        Must be called from a running event loop.
+        """
+        loop = self._bind_loop()
+        self._pending.append(PendingWrite(table, sql, tuple(params), key))
+        self.enqueued += 1
+
+        if len(self._pending) >= self.max_batch:
+            self._start_flush()
+        elif self._timer is None and not self._flushing:
+            self._timer = loop.call_later(
+                self.flush_interval_ms / 1000, self._start_flush
+            )
+
+    @property
+    def _flushing(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def _start_flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._flushing:
+            self._task = asyncio.ensure_future(self._drain())
+
+    async def _drain(self):
+        while self._pending:
+            await self._write_batch()
+
+    async def _write_batch(self):
+        batch = self._pending[: self.max_batch]
+        del self._pending[: len(batch)]
+        self._in_flight = batch
+        started = time.perf_counter()
+        try:
+            async with get_pool(self.db_path).writer() as conn:
+                try:
+                    for record in batch:
+                        await conn.execute(record.sql, record.params)
+                    await conn.commit()
+                    self.written += len(batch)
+                except Exception as e:
+                    # One bad record shouldn't cost the batch; retry one by one
+                    await conn.rollback()
+                    log.warning("write_behind_batch_failed", error=str(e))
+                    for record in batch:
+                        try:
+                            await conn.execute(record.sql, record.params)
+                            await conn.commit()
+                            self.written += 1
+                        except Exception as record_error:
+                            await conn.rollback()
+                            self.failed += 1
+                            log.warning(
+                                "write_behind_record_dropped",
+                                table=record.table,
+                                error=str(record_error),
+                            )
+        finally:
+            self._in_flight = []
+
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self.batches += 1
+        self.last_flush_ms = elapsed_ms
+        self.max_flush_ms = max(self.max_flush_ms, elapsed_ms)
+        self._total_flush_ms += elapsed_ms
+        log.debug(
+            "write_behind_flushed",
+            records=len(batch),
+            depth=self.depth,
+            latency_ms=round(elapsed_ms, 2),
+        )
+
+    async def flush(self):
+        """Write everything queued so far and wait for it."""
+        self._bind_loop()
+        # Always go through the single flush task so batches stay in order
+        while self._pending or self._flushing:
+            if not self._flushing:
+                self._start_flush()
+            await asyncio.shield(self._task)
+
+    def flush_sync(self):
+        """Write queued records without an event loop (interpreter exit)."""
+        records = self._in_flight + self._pending
+        self._in_flight, self._pending = [], []
+        if not records or not self.db_path.exists():
+            return
+        conn = sqlite3.connect(self.db_path, timeout=5)
+        try:
+            for record in records:
+                try:
+                    conn.execute(record.sql, record.params)
+                    self.written += 1
+                except sqlite3.IntegrityError:
+                    pass  # Batch was committed before the loop went away
+                except sqlite3.Error:
+                    self.failed += 1
+            conn.commit()
+        finally:
+            conn.close()
+
+    def stats(self) -> dict[str, Any]:
+        """Queue depth, throughput and flush latency."""
+        return {
+            "depth": self.depth,
+            "enqueued": self.enqueued,
+            "written": self.written,
+            "failed": self.failed,
+            "batches": self.batches,
+            "last_flush_ms": round(self.last_flush_ms, 2),
+            "avg_flush_ms": round(self._total_flush_ms / self.batches, 2)
+            if self.batches
+            else 0.0,
+            "max_flush_ms": round(self.max_flush_ms, 2),
+        }
+
+
+_queues: dict[str, WriteBehindQueue] = {}
+
+
+def get_write_queue(db_path: Path) -> WriteBehindQueue:
+    """The shared write-behind queue for a database file."""
+    key = str(Path(db_path).resolve())
+    queue = _queues.get(key)
+    if queue is None:
+        queue = _queues[key] = WriteBehindQueue(Path(key))
+    return queue
+
+
+def write_behind_stats() -> dict[str, dict[str, Any]]:
+    """Stats for every queue, keyed by database path."""
+    return {path: queue.stats() for path, queue in _queues.items()}
+
+
+async def flush_all():
+    """Flush every queue (e.g. on server shutdown)."""
+    for queue in list(_queues.values()):
+        try:
+            await queue.flush()
+        except Exception as e:
+            log.warning(
+                "write_behind_flush_failed", path=str(queue.db_path), error=str(e)
+            )
+
+
+@atexit.register
+def _flush_all_sync():
+    for queue in _queues.values():
+        try:
+            queue.flush_sync()
+        except Exception as e:
+            log.warning("write_behind_exit_flush_failed", error=str(e))
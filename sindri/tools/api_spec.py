@@ -49,6 +49,8 @@ class GenerateApiSpecTool(Tool):
     """
 
     name = "generate_api_spec"
+    cpu_bound = True
+    max_concurrency = 2
     description = """Generate an OpenAPI 3.0 specification from route definitions.
 
 Automatically detects the web framework and extracts route information:
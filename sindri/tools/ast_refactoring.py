@@ -15,7 +15,7 @@ from typing import TYPE_CHECKING, Any, Optional
 import aiofiles
 import structlog
 
-from sindri.tools.base import Tool, ToolResult
+from sindri.tools.base import SideEffect, Tool, ToolResult
 
 log = structlog.get_logger()
 
@@ -335,6 +335,8 @@ class ASTParserTool(Tool):
     """Parse source code and return AST structure using tree-sitter."""
 
     name = "parse_ast"
+    side_effect = SideEffect.READ
+    cpu_bound = True
     description = """Parse source code into an Abstract Syntax Tree (AST) using tree-sitter.
 
 Supports: Python, JavaScript, TypeScript, Rust, Go.
@@ -432,6 +434,9 @@ class FindReferencesTool(Tool):
     """Find all references to a symbol using AST analysis."""
 
     name = "find_references"
+    side_effect = SideEffect.READ
+    cpu_bound = True
+    max_concurrency = 2
     description = """Find all references to a symbol across files using AST analysis.
 
 More accurate than grep as it only finds actual code references, not strings or comments.
@@ -587,6 +592,8 @@ class ASTSymbolInfoTool(Tool):
     """Get detailed information about a symbol using AST analysis."""
 
     name = "symbol_info"
+    side_effect = SideEffect.READ
+    cpu_bound = True
     description = """Get detailed information about a symbol (function, class, variable) in a file.
 
 Returns: symbol type, line number, scope, docstring, parameters (for functions), etc.
@@ -722,6 +729,8 @@ class ASTRefactorRenameTool(Tool):
     """Precise symbol renaming using AST analysis."""
 
     name = "ast_rename"
+    cpu_bound = True
+    max_concurrency = 1
     description = """Rename a symbol precisely using AST analysis.
 
 More accurate than regex-based renaming - only renames actual code references,
@@ -2,6 +2,7 @@
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
+from enum import Enum
 from typing import Optional, TYPE_CHECKING
 from pathlib import Path
 
@@ -33,12 +34,38 @@ class ToolResult:
     retries_attempted: int = 0
 
 
+class SideEffect(Enum):
+    """What a tool touches when it runs."""
+
+    READ = "read"  # Only reads the workspace - safe to run concurrently
+    WRITE = "write"  # Modifies the workspace
+    EXTERNAL = "external"  # Processes, network, databases or other agents
+
+
 class Tool(ABC):
     """Base class for all tools."""
 
     name: str
     description: str
     parameters: dict  # JSON Schema
+    # Tools are assumed to write unless they declare otherwise
+    side_effect: SideEffect = SideEffect.WRITE
+    # Same arguments give the same output while the workspace is unchanged,
+    # so per-task registries may serve repeats from cache
+    cacheable: bool = False
+    # Heavy synchronous work: the registry runs execute() in the shared
+    # process pool (see sindri.tools.offload) so the event loop stays free
+    cpu_bound: bool = False
+    max_concurrency: Optional[int] = None  # Calls in the pool at once (None = any)
+
+    @property
+    def read_only(self) -> bool:
+        """Side-effect-free tools may run early or alongside other calls."""
+        return self.side_effect == SideEffect.READ
+
+    @read_only.setter
+    def read_only(self, value: bool):
+        self.side_effect = SideEffect.READ if value else SideEffect.WRITE
 
     def __init__(self, work_dir: Optional[Path] = None):
         """Initialize tool with optional working directory.
@@ -2,9 +2,9 @@
 
 import structlog
 
-from sindri.tools.base import Tool, ToolResult
+from sindri.tools.base import SideEffect, Tool, ToolResult
 from sindri.core.delegation import DelegationManager, DelegationRequest
-from sindri.core.tasks import Task
+from sindri.core.tasks import Task, TaskStatus
 
 log = structlog.get_logger()
 
@@ -13,6 +13,7 @@ class DelegateTool(Tool):
     """Delegate a task to another agent."""
 
     name = "delegate"
+    side_effect = SideEffect.EXTERNAL
     description = "Delegate a subtask to another specialized agent"
     parameters = {
         "type": "object",
@@ -43,6 +44,12 @@ class DelegateTool(Tool):
                 "description": "Success criteria for the task",
                 "default": [],
             },
+            "fresh": {
+                "type": "boolean",
+                "description": "Run the task again even if an identical "
+                "delegation already finished",
+                "default": False,
+            },
         },
         "required": ["agent", "task"],
     }
@@ -58,6 +65,7 @@ class DelegateTool(Tool):
         context: dict = None,
         constraints: list[str] = None,
         criteria: list[str] = None,
+        fresh: bool = False,
     ) -> ToolResult:
         """Execute delegation to another agent."""
 
@@ -68,12 +76,29 @@ class DelegateTool(Tool):
                 context=context or {},
                 constraints=constraints or [],
                 success_criteria=criteria or [],
+                use_cache=not fresh,
             )
 
             child_task = await self.delegation_manager.delegate(
                 self.current_task, request
             )
 
+            if child_task.status == TaskStatus.COMPLETE:
+                # Identical delegation already done: answer now, don't wait
+                output = (child_task.result or {}).get("output", "")
+                return ToolResult(
+                    success=True,
+                    output=(
+                        f"{agent} already completed this task (task "
+                        f"{child_task.context['cached_from']}); result:\n{output}"
+                    ),
+                    metadata={
+                        "child_task_id": child_task.id,
+                        "agent": agent,
+                        "cached": True,
+                    },
+                )
+
             log.info(
                 "delegation_executed",
                 parent=self.current_task.id,
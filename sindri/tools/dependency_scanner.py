@@ -16,7 +16,7 @@ from typing import Optional
 
 import structlog
 
-from sindri.tools.base import Tool, ToolResult
+from sindri.tools.base import SideEffect, Tool, ToolResult
 
 log = structlog.get_logger()
 
@@ -1323,6 +1323,7 @@ class CheckOutdatedTool(Tool):
     """
 
     name = "check_outdated"
+    side_effect = SideEffect.EXTERNAL
     description = """Check for outdated dependencies in a project.
 
 Lists all packages that have newer versions available.
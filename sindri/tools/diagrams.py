@@ -973,6 +973,8 @@ class DiagramFromCodeTool(Tool):
     """
 
     name = "diagram_from_code"
+    cpu_bound = True
+    max_concurrency = 2
     description = """Extract and generate diagrams from source code.
 
 Analyzes code files to generate:
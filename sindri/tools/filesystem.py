@@ -3,10 +3,10 @@
 import aiofiles
 from pathlib import Path
 import structlog
-from typing import List
+from typing import List, Optional
 import fnmatch
 
-from sindri.tools.base import Tool, ToolResult
+from sindri.tools.base import SideEffect, Tool, ToolResult
 
 log = structlog.get_logger()
 
@@ -15,17 +15,32 @@ class ReadFileTool(Tool):
     """Read contents of a file."""
 
     name = "read_file"
-    description = "Read the contents of a file at the given path"
+    side_effect = SideEffect.READ
+    cacheable = True
+    description = (
+        "Read the contents of a file at the given path "
+        "(use offset/limit to read a range of lines from a large file)"
+    )
     parameters = {
         "type": "object",
         "properties": {
-            "path": {"type": "string", "description": "Path to the file to read"}
+            "path": {"type": "string", "description": "Path to the file to read"},
+            "offset": {
+                "type": "integer",
+                "description": "First line to read, starting at 1",
+            },
+            "limit": {
+                "type": "integer",
+                "description": "Maximum number of lines to read",
+            },
         },
         "required": ["path"],
     }
 
-    async def execute(self, path: str) -> ToolResult:
-        """Read file contents."""
+    async def execute(
+        self, path: str, offset: Optional[int] = None, limit: Optional[int] = None
+    ) -> ToolResult:
+        """Read file contents, optionally a range of lines."""
         try:
             file_path = self._resolve_path(path)
 
@@ -44,11 +59,21 @@ class ReadFileTool(Tool):
                 work_dir=str(self.work_dir) if self.work_dir else None,
             )
 
-            return ToolResult(
-                success=True,
-                output=content,
-                metadata={"path": str(file_path), "size": len(content)},
-            )
+            metadata = {"path": str(file_path), "size": len(content)}
+            if offset is not None or limit is not None:
+                lines = content.splitlines(keepends=True)
+                start = max(int(offset or 1), 1) - 1
+                end = len(lines) if limit is None else start + max(int(limit), 0)
+                content = "".join(lines[start:end])
+                metadata.update(
+                    {
+                        "first_line": start + 1,
+                        "last_line": min(end, len(lines)),
+                        "total_lines": len(lines),
+                    }
+                )
+
+            return ToolResult(success=True, output=content, metadata=metadata)
 
         except Exception as e:
             log.error("file_read_error", path=path, error=str(e))
@@ -173,6 +198,8 @@ class ListDirectoryTool(Tool):
     """List files and directories in a path."""
 
     name = "list_directory"
+    side_effect = SideEffect.READ
+    cacheable = True
     description = "List files and directories in a path with optional filtering"
     parameters = {
         "type": "object",
@@ -295,6 +322,8 @@ class ReadTreeTool(Tool):
     """Show directory tree structure."""
 
     name = "read_tree"
+    side_effect = SideEffect.READ
+    cacheable = True
     description = "Show directory tree structure with optional depth limit"
     parameters = {
         "type": "object",
@@ -6,7 +6,7 @@ from pathlib import Path
 from typing import Optional
 import structlog
 
-from sindri.tools.base import Tool, ToolResult
+from sindri.tools.base import SideEffect, Tool, ToolResult
 
 log = structlog.get_logger()
 
@@ -18,6 +18,8 @@ class GitStatusTool(Tool):
     """
 
     name = "git_status"
+    side_effect = SideEffect.READ
+    cacheable = True
     description = """Get git repository status showing modified, staged, and untracked files.
 
 Examples:
@@ -203,6 +205,7 @@ class GitDiffTool(Tool):
     """
 
     name = "git_diff"
+    side_effect = SideEffect.READ
     description = """Show git diff of changes in the repository.
 
 Examples:
@@ -432,6 +435,7 @@ class GitLogTool(Tool):
     """
 
     name = "git_log"
+    side_effect = SideEffect.READ
     description = """Show git commit history.
 
 Examples:
@@ -6,7 +6,7 @@ from typing import Optional, Any
 from urllib.parse import urlparse
 import structlog
 
-from sindri.tools.base import Tool, ToolResult
+from sindri.tools.base import SideEffect, Tool, ToolResult
 
 log = structlog.get_logger()
 
@@ -27,6 +27,7 @@ class HttpRequestTool(Tool):
     """
 
     name = "http_request"
+    side_effect = SideEffect.EXTERNAL
     description = """Make HTTP requests to APIs and web services.
 
 Examples:
@@ -325,6 +326,7 @@ class HttpGetTool(Tool):
     """Simplified GET request tool for quick API calls."""
 
     name = "http_get"
+    side_effect = SideEffect.EXTERNAL
     description = """Make a simple HTTP GET request. For more options use http_request.
 
 Examples:
@@ -356,6 +358,7 @@ class HttpPostTool(Tool):
     """Simplified POST request tool for API submissions."""
 
     name = "http_post"
+    side_effect = SideEffect.EXTERNAL
     description = """Make a simple HTTP POST request with JSON body.
 
 Examples:
@@ -21,7 +21,7 @@ from pathlib import Path
 from typing import Optional
 import structlog
 
-from sindri.tools.base import Tool, ToolResult
+from sindri.tools.base import SideEffect, Tool, ToolResult
 
 log = structlog.get_logger()
 
@@ -925,6 +925,7 @@ class RunMigrationsTool(Tool):
     """
 
     name = "run_migrations"
+    side_effect = SideEffect.EXTERNAL
     description = """Run pending database migrations.
 
 Applies all pending migrations to the database.
@@ -1101,6 +1102,7 @@ class RollbackMigrationTool(Tool):
     """
 
     name = "rollback_migration"
+    side_effect = SideEffect.EXTERNAL
     description = """Rollback database migrations.
 
 Reverts migrations to a previous state.
@@ -0,0 +1,196 @@
+"""Process-pool offload for CPU-bound tools.
+
+Some tools do heavy synchronous work inside ``async def execute``: regex
+scans over every file, multi-file rewrites, tree-sitter parsing. Run on
+the event loop, they freeze streaming, websockets and parallel tasks for
+as long as they take. Tools declare ``cpu_bound = True`` and the registry
+runs their ``execute`` in a shared worker process instead, limited to
+``max_concurrency`` calls of that tool at a time.
+
+Cancelling a call cancels it outright if it hasn't started. A call that is
+already running in a worker can't be interrupted: the caller stops
+waiting at once, and the worker finishes in the background while still
+counting against the tool's limit.
+"""
+
+import asyncio
+import multiprocessing
+import os
+import pickle
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any, Callable, Optional
+import structlog
+
+from sindri.tools.base import Tool, ToolResult
+
+log = structlog.get_logger()
+
+# Leave a core for the event loop and the model server
+DEFAULT_CPU_WORKERS = max(1, min(4, (os.cpu_count() or 2) - 1))
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_workers = DEFAULT_CPU_WORKERS
+_limits: dict[str, asyncio.Semaphore] = {}
+_limits_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def configure_cpu_pool(max_workers: int):
+    """Set the worker count; takes effect the next time the pool starts."""
+    global _pool_workers
+    _pool_workers = max(1, max_workers)
+
+
+def get_cpu_pool() -> ProcessPoolExecutor:
+    """The shared process pool, started on first use."""
+    global _pool
+    if _pool is None:
+        # spawn: workers don't inherit the parent's threads or open sockets
+        _pool = ProcessPoolExecutor(
+            max_workers=_pool_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        log.info("cpu_pool_started", workers=_pool_workers)
+    return _pool
+
+
+def shutdown_cpu_pool(wait: bool = True):
+    """Stop the worker processes, dropping calls that haven't started."""
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=wait, cancel_futures=True)
+        _pool = None
+
+
+def _limit(name: str, max_concurrency: int) -> asyncio.Semaphore:
+    """Per-name concurrency limit for the running event loop."""
+    global _limits_loop
+    loop = asyncio.get_running_loop()
+    if loop is not _limits_loop:
+        # Semaphores from a finished loop can't be awaited here
+        _limits.clear()
+        _limits_loop = loop
+    limit = _limits.get(name)
+    if limit is None:
+        limit = _limits[name] = asyncio.Semaphore(max_concurrency)
+    return limit
+
+
+def _submit(func: Callable, args: tuple) -> Future:
+    global _pool
+    try:
+        return get_cpu_pool().submit(func, *args)
+    except BrokenProcessPool:
+        # A worker died (e.g. killed for memory); start a fresh pool
+        log.warning("cpu_pool_restarted")
+        _pool = None
+        return get_cpu_pool().submit(func, *args)
+
+
+async def run_cpu_bound(
+    func: Callable,
+    *args: Any,
+    name: Optional[str] = None,
+    max_concurrency: Optional[int] = None,
+) -> Any:
+    """Run ``func(*args)`` in the shared process pool.
+
+    Args:
+        func: Module-level function (it's pickled by reference)
+        *args: Picklable arguments
+        name: Key for the concurrency limit (defaults to the function name)
+        max_concurrency: Most calls with this name running at once
+            (None = only the pool size limits them)
+
+    Returns:
+        What ``func`` returned; exceptions it raised are re-raised here.
+    """
+    loop = asyncio.get_running_loop()
+    limit = None
+    if max_concurrency:
+        limit = _limit(name or func.__qualname__, max_concurrency)
+        await limit.acquire()
+
+    try:
+        future = _submit(func, args)
+    except BaseException:
+        if limit:
+            limit.release()
+        raise
+
+    if limit:
+
+        def release(_):
+            # Runs in the pool's thread once the worker is done
+            try:
+                loop.call_soon_threadsafe(limit.release)
+            except RuntimeError:
+                pass  # Loop already closed
+
+        future.add_done_callback(release)
+
+    try:
+        return await asyncio.wrap_future(future)
+    except asyncio.CancelledError:
+        # wrap_future cancels the pool future; that fails if it's running
+        log.info(
+            "cpu_job_cancelled",
+            name=name or func.__qualname__,
+            started=not future.cancelled(),
+        )
+        raise
+
+
+def _execute_tool(tool: Tool, arguments: dict, cwd: Optional[str] = None) -> ToolResult:
+    """Worker side: run a tool's execute() on a private event loop."""
+    if cwd is not None:
+        # Tools without a work_dir resolve paths against the caller's cwd
+        os.chdir(cwd)
+    return asyncio.run(tool.execute(**arguments))
+
+
+async def run_tool(tool: Tool, arguments: dict) -> ToolResult:
+    """Run a CPU-bound tool's execute() in the process pool.
+
+    Tools or arguments that can't be pickled run in a thread instead,
+    which still keeps the event loop free. Both paths share the tool's
+    ``max_concurrency`` limit.
+    """
+    try:
+        pickle.dumps((tool, arguments))
+    except Exception as e:
+        log.debug("cpu_tool_not_picklable", tool=tool.name, error=str(e))
+        return await _run_tool_in_thread(tool, arguments)
+
+    return await run_cpu_bound(
+        _execute_tool,
+        tool,
+        arguments,
+        str(Path.cwd()),
+        name=tool.name,
+        max_concurrency=tool.max_concurrency,
+    )
+
+
+async def _run_tool_in_thread(tool: Tool, arguments: dict) -> ToolResult:
+    """Thread fallback for run_tool, under the same concurrency limit.
+
+    A thread can't be interrupted, so the slot is held until it finishes
+    even if the caller is cancelled first.
+    """
+    limit = None
+    if tool.max_concurrency:
+        limit = _limit(tool.name, tool.max_concurrency)
+        await limit.acquire()
+
+    job = asyncio.ensure_future(asyncio.to_thread(_execute_tool, tool, arguments))
+
+    def finished(done: asyncio.Future):
+        if limit:
+            limit.release()
+        if not done.cancelled():
+            done.exception()  # Retrieved here in case the caller is gone
+
+    job.add_done_callback(finished)
+    return await asyncio.shield(job)
@@ -0,0 +1,198 @@
+"""Output budgets and paging for oversized tool results."""
+
+import asyncio
+import tempfile
+import threading
+import uuid
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+import structlog
+
+from sindri.tools.base import SideEffect, Tool, ToolResult
+
+log = structlog.get_logger()
+
+
+@dataclass
+class OutputBudget:
+    """Limits on how much tool output goes into the conversation.
+
+    Outputs longer than ``max_chars`` keep their first ``head_chars`` and
+    last ``tail_chars``; the full text is stored and paged in
+    ``page_chars`` chunks.
+    """
+
+    max_chars: int = 12000
+    head_chars: int = 6000
+    tail_chars: int = 3000
+    page_chars: int = 8000
+
+    @classmethod
+    def from_max_chars(cls, max_chars: int) -> "OutputBudget":
+        """Budget with head, tail and page sizes scaled to ``max_chars``."""
+        return cls(
+            max_chars=max_chars,
+            head_chars=max_chars // 2,
+            tail_chars=max_chars // 4,
+            page_chars=max_chars * 2 // 3,
+        )
+
+
+class ToolOutputStore:
+    """Full tool outputs kept out of band (on disk) for later paging.
+
+    Each store owns the outputs it wrote: without an explicit root they go
+    to a private temporary directory removed with the store, and pruning
+    only ever deletes this store's own files.
+    """
+
+    def __init__(self, root: Optional[Path] = None, max_entries: int = 200):
+        """Initialize the store.
+
+        Args:
+            root: Directory for stored outputs. Defaults to a temporary
+                directory private to this store (one per orchestration)
+            max_entries: Oldest outputs are deleted past this many
+        """
+        self._tmp: Optional[tempfile.TemporaryDirectory] = None
+        if root is None:
+            self._tmp = tempfile.TemporaryDirectory(prefix="sindri-tool-outputs-")
+            root = Path(self._tmp.name)
+        self.root = root
+        self.max_entries = max_entries
+        self._handles: deque[str] = deque()
+        self._lock = threading.Lock()
+
+    def _path(self, handle: str) -> Path:
+        return self.root / f"{handle}.txt"
+
+    def put(self, text: str) -> str:
+        """Store an output and return its handle (blocking file I/O)."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        handle = uuid.uuid4().hex[:12]
+        self._path(handle).write_text(text, encoding="utf-8")
+        with self._lock:
+            self._handles.append(handle)
+            expired = [
+                self._handles.popleft()
+                for _ in range(len(self._handles) - self.max_entries)
+            ]
+        for old in expired:
+            self._path(old).unlink(missing_ok=True)
+        return handle
+
+    def get(self, handle: str) -> Optional[str]:
+        """Load a stored output (None if unknown or pruned)."""
+        if not handle.isalnum():
+            return None
+        try:
+            return self._path(handle).read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+
+    def close(self):
+        """Delete the private directory, if this store created one."""
+        if self._tmp is not None:
+            self._tmp.cleanup()
+            self._tmp = None
+
+
+def page_count(text: str, page_chars: int) -> int:
+    """Number of pages a text splits into."""
+    return max(1, -(-len(text) // page_chars))
+
+
+def truncate_output(
+    result: ToolResult, budget: OutputBudget, store: ToolOutputStore, tool_name: str
+) -> ToolResult:
+    """Shorten an oversized result to head + tail and store the full output.
+
+    Results within the budget are returned unchanged.
+    """
+    output = result.output
+    if len(output) <= budget.max_chars:
+        return result
+
+    handle = store.put(output)
+    pages = page_count(output, budget.page_chars)
+    omitted = len(output) - budget.head_chars - budget.tail_chars
+    hint = f'tool_output_page(handle="{handle}", page=N) with N from 1 to {pages}'
+    if tool_name == "read_file":
+        hint += ", or read_file with offset/limit"
+    note = (
+        f"\n\n... [{omitted} characters omitted of {len(output)}. "
+        f"Full output stored as {handle}: use {hint}] ...\n\n"
+    )
+    log.info(
+        "tool_output_truncated",
+        tool=tool_name,
+        size=len(output),
+        handle=handle,
+        pages=pages,
+    )
+    result.output = output[: budget.head_chars] + note + output[-budget.tail_chars :]
+    result.metadata = {
+        **result.metadata,
+        "truncated": True,
+        "output_handle": handle,
+        "output_size": len(output),
+        "output_pages": pages,
+    }
+    return result
+
+
+class ToolOutputPageTool(Tool):
+    """Page through a tool output that was truncated."""
+
+    name = "tool_output_page"
+    side_effect = SideEffect.READ
+    description = (
+        "Read one page of a tool output that was too long and got truncated. "
+        "The truncation note gives the handle and number of pages."
+    )
+    parameters = {
+        "type": "object",
+        "properties": {
+            "handle": {
+                "type": "string",
+                "description": "Handle from the truncation note",
+            },
+            "page": {
+                "type": "integer",
+                "description": "Page number, starting at 1",
+                "default": 1,
+            },
+        },
+        "required": ["handle"],
+    }
+
+    def __init__(self, store: ToolOutputStore, page_chars: int = 8000):
+        super().__init__()
+        self.store = store
+        self.page_chars = page_chars
+
+    async def execute(self, handle: str, page: int = 1) -> ToolResult:
+        """Return one page of a stored output."""
+        text = await asyncio.to_thread(self.store.get, handle)
+        if text is None:
+            return ToolResult(
+                success=False, output="", error=f"Unknown output handle: {handle}"
+            )
+
+        pages = page_count(text, self.page_chars)
+        page = int(page)
+        if not 1 <= page <= pages:
+            return ToolResult(
+                success=False,
+                output="",
+                error=f"Page {page} out of range (output has {pages} pages)",
+            )
+
+        start = (page - 1) * self.page_chars
+        return ToolResult(
+            success=True,
+            output=text[start : start + self.page_chars],
+            metadata={"handle": handle, "page": page, "pages": pages},
+        )
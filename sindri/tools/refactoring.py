@@ -29,6 +29,8 @@ class RenameSymbolTool(Tool):
     """
 
     name = "rename_symbol"
+    cpu_bound = True
+    max_concurrency = 1
     description = """Rename a symbol (function, class, variable, method) across multiple files.
 Uses intelligent matching to avoid renaming partial matches or strings.
 
@@ -296,6 +298,8 @@ class ExtractFunctionTool(Tool):
     """
 
     name = "extract_function"
+    cpu_bound = True
+    max_concurrency = 1
     description = """Extract a code block into a new function. The original code is replaced with a call to the new function.
 
 Examples:
@@ -593,6 +597,8 @@ class InlineVariableTool(Tool):
     """
 
     name = "inline_variable"
+    cpu_bound = True
+    max_concurrency = 1
     description = """Inline a variable by replacing all its usages with its assigned value.
 
 Examples:
@@ -1402,6 +1408,8 @@ class BatchRenameTool(Tool):
     """
 
     name = "batch_rename"
+    cpu_bound = True
+    max_concurrency = 1
     description = """Rename multiple files matching a pattern. Transforms filenames according to
 an output pattern with placeholders.
 
@@ -1848,6 +1856,8 @@ class SplitFileTool(Tool):
     """
 
     name = "split_file"
+    cpu_bound = True
+    max_concurrency = 1
     description = """Split a large file into multiple smaller files based on a splitting strategy.
 
 Splitting strategies:
@@ -2582,6 +2592,8 @@ class MergeFilesTool(Tool):
     """
 
     name = "merge_files"
+    cpu_bound = True
+    max_concurrency = 1
     description = """Merge multiple files into a single file.
 
 Combines multiple source files into one destination file, intelligently handling:
@@ -2,12 +2,14 @@
 
 import asyncio
 import json
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, replace
 from pathlib import Path
 from typing import Optional
 import structlog
 
-from sindri.tools.base import Tool, ToolResult
+from sindri.tools.base import SideEffect, Tool, ToolResult
+from sindri.tools.offload import run_tool
 from sindri.tools.filesystem import (
     ReadFileTool,
     WriteFileTool,
@@ -15,6 +17,7 @@ from sindri.tools.filesystem import (
     ListDirectoryTool,
     ReadTreeTool,
 )
+from sindri.tools.paging import OutputBudget, ToolOutputStore, truncate_output
 from sindri.tools.shell import ShellTool
 from sindri.tools.planning import ProposePlanTool
 from sindri.tools.search import SearchCodeTool, FindSymbolTool
@@ -94,6 +97,33 @@ from sindri.core.errors import (
 
 log = structlog.get_logger()
 
+# Note prepended to outputs served from the tool result cache
+CACHED_RESULT_NOTE = (
+    "[cached: same call as earlier in this task; nothing it reads has changed]"
+)
+
+# Arguments naming files or directories whose mtimes key the result cache
+_PATH_ARGUMENTS = ("path", "database")
+
+# Bumped whenever a tool that may modify a workspace runs there, so cached
+# reads from every registry sharing that work_dir become stale
+_workspace_generations: dict[str, int] = {}
+
+
+def _workspace_key(work_dir: Optional[Path]) -> str:
+    return str(work_dir.resolve()) if work_dir else str(Path.cwd())
+
+
+def workspace_generation(workspace: str) -> int:
+    """Current generation of a workspace (see ToolRegistry.read_generations)."""
+    return _workspace_generations.get(workspace, 0)
+
+
+def invalidate_workspace(work_dir: Optional[Path]) -> None:
+    """Mark cached tool results for a workspace as stale."""
+    key = _workspace_key(work_dir)
+    _workspace_generations[key] = _workspace_generations.get(key, 0) + 1
+
 
 @dataclass
 class ToolRetryConfig:
@@ -112,16 +142,44 @@ class ToolRegistry:
         self,
         work_dir: Optional[Path] = None,
         retry_config: Optional[ToolRetryConfig] = None,
+        cache_results: bool = False,
+        max_cached_results: int = 256,
+        output_budget: Optional[OutputBudget] = None,
+        output_store: Optional[ToolOutputStore] = None,
     ):
         """Initialize registry with optional working directory and retry config.
 
         Args:
             work_dir: Working directory for file operations. None = current directory.
             retry_config: Retry configuration for transient failures.
+            cache_results: Serve repeated calls to cacheable tools from a
+                result cache (meant for per-task registries)
+            max_cached_results: Oldest results are dropped past this many
+            output_budget: Truncate longer outputs to head + tail, storing
+                the full text for paging. None = no limit.
+            output_store: Where full outputs go (defaults to a private
+                temporary store when a budget is set)
         """
         self._tools: dict[str, Tool] = {}
         self.work_dir = work_dir
         self.retry_config = retry_config or ToolRetryConfig()
+        self.cache_results = cache_results
+        self.max_cached_results = max_cached_results
+        # key -> (workspace generation, result)
+        self._result_cache: OrderedDict[tuple, tuple[int, ToolResult]] = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
+        # Files named by calls, and tools that had effects without naming
+        # any (lets delegation results be reused while those files hold)
+        self.touched_paths: set[str] = set()
+        self.untracked_effects: list[str] = []
+        # Workspace -> its generation when a read first covered a directory
+        # (or no path at all); file stamps miss edits inside directories
+        self.read_generations: dict[str, int] = {}
+        self.output_budget = output_budget
+        self.output_store = output_store or (
+            ToolOutputStore() if output_budget else None
+        )
 
     def register(self, tool: Tool):
         """Register a tool."""
@@ -136,6 +194,15 @@ class ToolRegistry:
         """Get a tool by name."""
         return self._tools.get(name)
 
+    def side_effect(self, name: str) -> Optional[SideEffect]:
+        """The declared side-effect class of a tool (None if unknown)."""
+        tool = self._tools.get(name)
+        return tool.side_effect if tool else None
+
+    def is_read_only(self, name: str) -> bool:
+        """Whether a tool is declared side-effect-free."""
+        return self.side_effect(name) == SideEffect.READ
+
     def get_schemas(self) -> list[dict]:
         """Get all tool schemas for Ollama."""
         return [tool.get_schema() for tool in self._tools.values()]
@@ -174,16 +241,138 @@ class ToolRegistry:
                     error_category=ErrorCategory.FATAL,
                     suggestion="Check JSON syntax in arguments",
                 )
+        if not isinstance(arguments, dict):
+            log.error("tool_args_parse_error", name=name, error="not an object")
+            return ToolResult(
+                success=False,
+                output="",
+                error=(
+                    "Failed to parse tool arguments: expected a JSON object, "
+                    f"got {type(arguments).__name__}"
+                ),
+                error_category=ErrorCategory.FATAL,
+                suggestion="Check JSON syntax in arguments",
+            )
 
         log.info("tool_execute", name=name, args=arguments)
+        self._note_usage(tool, arguments)
+
+        # Serve repeated idempotent calls while nothing they read has changed
+        cache_key = None
+        if self.cache_results and tool.cacheable:
+            keyed = self._cache_key(tool, arguments)
+            if keyed is not None:
+                cache_key, generation = keyed
+                cached = self._cached_result(tool, cache_key)
+                if cached is not None:
+                    return cached
+
+        try:
+            result = await self._execute_with_retry(tool, name, arguments)
+        finally:
+            if not tool.read_only:
+                # Even a failed or cancelled call may have changed files
+                invalidate_workspace(getattr(tool, "work_dir", None))
+        if self.output_budget and result.success and name != "tool_output_page":
+            # Storing the full output is file I/O; keep it off the event loop
+            result = await asyncio.to_thread(
+                truncate_output, result, self.output_budget, self.output_store, name
+            )
+
+        if tool.read_only and cache_key is not None and result.success:
+            self._store_result(cache_key, generation, result)
+        return result
+
+    def _note_usage(self, tool: Tool, arguments: dict) -> None:
+        """Record the files a call names (see touched_paths)."""
+        named = False
+        directory = False
+        for name in _PATH_ARGUMENTS:
+            value = arguments.get(name)
+            if isinstance(value, str):
+                try:
+                    path = tool._resolve_path(value)
+                    self.touched_paths.add(str(path))
+                    named = True
+                    directory = directory or path.is_dir()
+                except (OSError, ValueError):
+                    pass
+        if not tool.read_only:
+            if not named:
+                self.untracked_effects.append(tool.name)
+        elif directory or not named:
+            workspace = _workspace_key(self.work_dir)
+            self.read_generations.setdefault(workspace, workspace_generation(workspace))
+
+    def _cache_key(self, tool: Tool, arguments: dict) -> Optional[tuple[tuple, int]]:
+        """Key a call by its normalized arguments and the mtimes of its paths.
+
+        The workspace generation is read here, before the call runs, so a
+        write that lands while it runs leaves its result stale.
+
+        Returns:
+            (key, workspace generation), or None if the arguments can't be
+            normalized
+        """
+        try:
+            normalized = dict(arguments)
+            stamps = []
+            for name in _PATH_ARGUMENTS:
+                value = normalized.get(name)
+                if not isinstance(value, str):
+                    continue
+                path = tool._resolve_path(value)
+                normalized[name] = str(path)
+                try:
+                    stat = path.stat()
+                    stamps.append((stat.st_mtime_ns, stat.st_size))
+                except OSError:
+                    stamps.append(None)
+            encoded = json.dumps(normalized, sort_keys=True)
+        except (TypeError, ValueError, RuntimeError):
+            return None
+        workspace = _workspace_key(tool.work_dir)
+        key = (tool.name, workspace, encoded, tuple(stamps))
+        return key, _workspace_generations.get(workspace, 0)
+
+    def _cached_result(self, tool: Tool, key: tuple) -> Optional[ToolResult]:
+        """Return a still-valid cached result for a key, marked as cached."""
+        entry = self._result_cache.get(key)
+        generation = _workspace_generations.get(key[1], 0)
+        if entry is None or entry[0] != generation:
+            self.cache_misses += 1
+            return None
+
+        self._result_cache.move_to_end(key)
+        self.cache_hits += 1
+        log.info("tool_cache_hit", name=tool.name)
+        result = entry[1]
+        return replace(
+            result,
+            output=f"{CACHED_RESULT_NOTE}\n{result.output}",
+            metadata={**result.metadata, "cached": True},
+        )
+
+    def _store_result(self, key: tuple, generation: int, result: ToolResult) -> None:
+        self._result_cache[key] = (generation, result)
+        self._result_cache.move_to_end(key)
+        while len(self._result_cache) > self.max_cached_results:
+            self._result_cache.popitem(last=False)
 
+    async def _execute_with_retry(
+        self, tool: Tool, name: str, arguments: dict
+    ) -> ToolResult:
+        """Execute a tool, retrying transient errors."""
         # Execute with retry for transient errors
         last_result: Optional[ToolResult] = None
         last_exception: Optional[Exception] = None
 
         for attempt in range(self.retry_config.max_attempts):
             try:
-                result = await tool.execute(**arguments)
+                if tool.cpu_bound:
+                    result = await run_tool(tool, arguments)
+                else:
+                    result = await tool.execute(**arguments)
 
                 if result.success:
                     # Success - return with retry count
@@ -6,7 +6,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Optional
 import structlog
 
-from sindri.tools.base import Tool, ToolResult
+from sindri.tools.base import SideEffect, Tool, ToolResult
 
 if TYPE_CHECKING:
     from sindri.memory.semantic import SemanticMemory
@@ -26,6 +26,8 @@ class SearchCodeTool(Tool):
     """
 
     name = "search_code"
+    side_effect = SideEffect.READ
+    cacheable = True
     description = """Search for code in the codebase. Supports literal text search (default) or semantic search for conceptual queries.
 
 Examples:
@@ -458,6 +460,10 @@ class FindSymbolTool(Tool):
     """
 
     name = "find_symbol"
+    side_effect = SideEffect.READ
+    cacheable = True
+    cpu_bound = True
+    max_concurrency = 2
     description = """Find where a symbol (function, class, or variable) is defined.
 
 Examples:
@@ -3,7 +3,7 @@
 import asyncio
 import structlog
 
-from sindri.tools.base import Tool, ToolResult
+from sindri.tools.base import SideEffect, Tool, ToolResult
 
 log = structlog.get_logger()
 
@@ -12,6 +12,7 @@ class ShellTool(Tool):
     """Execute shell commands."""
 
     name = "shell"
+    side_effect = SideEffect.EXTERNAL
     description = "Execute a shell command and return the output"
     parameters = {
         "type": "object",
@@ -6,7 +6,7 @@ import sqlite3
 from typing import Optional
 import structlog
 
-from sindri.tools.base import Tool, ToolResult
+from sindri.tools.base import SideEffect, Tool, ToolResult
 
 log = structlog.get_logger()
 
@@ -65,6 +65,7 @@ class ExecuteQueryTool(Tool):
     """
 
     name = "execute_query"
+    side_effect = SideEffect.EXTERNAL
     description = """Execute SQL queries against a SQLite database.
 
 Examples:
@@ -293,6 +294,8 @@ class DescribeSchemaTool(Tool):
     """
 
     name = "describe_schema"
+    side_effect = SideEffect.READ
+    cacheable = True
     description = """Get schema information from a SQLite database.
 
 Examples:
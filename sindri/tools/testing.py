@@ -7,7 +7,7 @@ from typing import Optional
 
 import structlog
 
-from sindri.tools.base import Tool, ToolResult
+from sindri.tools.base import SideEffect, Tool, ToolResult
 
 log = structlog.get_logger()
 
@@ -16,6 +16,7 @@ class RunTestsTool(Tool):
     """Run tests using auto-detected or specified testing framework."""
 
     name = "run_tests"
+    side_effect = SideEffect.EXTERNAL
     description = """Run tests using the appropriate testing framework.
 
 Auto-detects: pytest, unittest, npm test, jest, cargo test, go test.
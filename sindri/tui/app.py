@@ -8,6 +8,7 @@ from typing import Optional
 
 from sindri.tui.widgets.header import SindriHeader
 from sindri.tui.widgets.history import TaskHistoryPanel, SessionSelected
+from sindri.tui.widgets.task_tree import estimate_suffix
 from sindri.tui.screens.help import HelpScreen
 from sindri.core.events import EventBus, EventType, Event
 from sindri.core.tasks import Task, TaskStatus
@@ -177,6 +178,11 @@ class SindriApp(App):
         # Set up event handlers
         self._setup_event_handlers()
 
+        # Keep the endpoint pool's health current while the app runs
+        pool = getattr(self.orchestrator, "endpoint_pool", None)
+        if pool is not None:
+            self.run_worker(self._start_health_checks(pool))
+
         # Start VRAM monitor
         if self.orchestrator and hasattr(self.orchestrator, "model_manager"):
             self.set_interval(2.0, self._update_vram_stats)
@@ -189,6 +195,17 @@ class SindriApp(App):
         # Phase 5.5: Load session history
         self.run_worker(self._load_history())
 
+    async def _start_health_checks(self, pool):
+        """Check the endpoint pool now, then periodically."""
+        await pool.check_health()
+        pool.start_health_checks()
+
+    async def on_unmount(self):
+        """Stop background endpoint health checks."""
+        pool = getattr(self.orchestrator, "endpoint_pool", None)
+        if pool is not None:
+            await pool.stop_health_checks()
+
     async def _load_history(self):
         """Load session history into the history panel."""
         try:
@@ -220,13 +237,18 @@ class SindriApp(App):
                 desc = data.get("description", "Unknown")[:50]
                 status = data.get("status", TaskStatus.PENDING)
                 icon = STATUS_ICONS.get(status, "·")
-                label = f"[{icon}] {desc}"
+                label = f"[{icon}] {desc}" + estimate_suffix(
+                    data.get("estimated_seconds"), data.get("critical_path_seconds")
+                )
 
                 task_id = data.get("task_id")
                 parent_id = data.get("parent_id")
 
                 if parent_id and parent_id in self._task_nodes:
                     node = self._task_nodes[parent_id].add(label)
+                elif parent_id and self._root_task_id in self._task_nodes:
+                    # Subtasks of the orchestrator's root go under ours
+                    node = self._task_nodes[self._root_task_id].add(label)
                 else:
                     node = tree.root.add(label)
 
@@ -18,6 +18,30 @@ STATUS_ICONS = {
 }
 
 
+def format_estimate(seconds: Optional[float]) -> str:
+    """Short label for an estimated duration, e.g. "~45s" or "~3m"."""
+    if not seconds:
+        return ""
+    if seconds < 60:
+        return f"~{seconds:.0f}s"
+    if seconds < 3600:
+        return f"~{seconds / 60:.0f}m"
+    return f"~{seconds / 3600:.1f}h"
+
+
+def estimate_suffix(
+    estimated_seconds: Optional[float], critical_path_seconds: Optional[float]
+) -> str:
+    """Dim label suffix with a task's estimate and critical path, if any."""
+    estimate = format_estimate(estimated_seconds)
+    if not estimate:
+        return ""
+    path = format_estimate(critical_path_seconds)
+    if path and path != estimate:
+        return f" [dim]({estimate}, path {path})[/dim]"
+    return f" [dim]({estimate})[/dim]"
+
+
 class TaskTree(Tree):
     """Display task hierarchy with status icons."""
 
@@ -32,9 +56,14 @@ class TaskTree(Tree):
         task_id: Optional[str] = None,
         parent_id: Optional[str] = None,
         status: TaskStatus = TaskStatus.PENDING,
+        estimated_seconds: Optional[float] = None,
+        critical_path_seconds: Optional[float] = None,
     ) -> str:
         """Add a task to the tree.
 
+        Estimates, when given, are shown after the description: the task's
+        own expected duration and the critical path it heads.
+
         Returns: task_id
         """
         import uuid
@@ -43,7 +72,9 @@ class TaskTree(Tree):
 
         # Truncate long descriptions
         desc = description[:50] + "..." if len(description) > 50 else description
-        label = f"[{STATUS_ICONS[status]}] {desc}"
+        label = f"[{STATUS_ICONS[status]}] {desc}" + estimate_suffix(
+            estimated_seconds, critical_path_seconds
+        )
 
         if parent_id and parent_id in self._task_nodes:
             parent_node = self._task_nodes[parent_id]
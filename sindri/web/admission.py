@@ -0,0 +1,394 @@
+"""Admission control for web-submitted orchestrations.
+
+Each orchestration loads models and competes for the same Ollama server,
+so only ``max_running`` run at once. The rest wait in a queue persisted
+to the database, which survives a server restart. Tenants (API keys or
+teams) share the running slots by weight through stride scheduling:
+every start advances the tenant's pass by ``1 / weight``, and the tenant
+with the lowest pass starts next. Within a tenant, lower priority
+numbers go first, then submission order.
+"""
+
+import asyncio
+import heapq
+import json
+import math
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Optional
+import structlog
+
+if TYPE_CHECKING:
+    from sindri.persistence.database import Database
+
+log = structlog.get_logger()
+
+DEFAULT_MAX_RUNNING = 2
+DEFAULT_MAX_QUEUED = 50
+DEFAULT_RUN_SECONDS = 120.0  # Assumed orchestration time until some finish
+ANONYMOUS = "anonymous"
+# Tenant weights are clamped to this range
+MIN_WEIGHT = 0.01
+MAX_WEIGHT = 100.0
+
+# Job states in the admission_queue table
+QUEUED = "queued"
+RUNNING = "running"
+
+
+class QueueFullError(Exception):
+    """Raised when a submission finds the admission queue full."""
+
+    def __init__(self, max_queued: int, retry_after: float):
+        super().__init__(f"Task queue is full ({max_queued} waiting)")
+        self.retry_after = retry_after
+
+
+def parse_weight(value: Any) -> float:
+    """A tenant weight from untrusted metadata (e.g. an API key's).
+
+    Values that aren't finite numbers fall back to 1.0; the rest are
+    clamped to ``MIN_WEIGHT``..``MAX_WEIGHT``. Both are logged.
+    """
+    try:
+        weight = float(value)
+    except (TypeError, ValueError):
+        weight = math.nan
+    if not math.isfinite(weight):
+        log.warning("invalid_queue_weight", value=repr(value), fallback=1.0)
+        return 1.0
+
+    clamped = min(max(weight, MIN_WEIGHT), MAX_WEIGHT)
+    if clamped != weight:
+        log.warning("queue_weight_clamped", value=weight, clamped=clamped)
+    return clamped
+
+
+@dataclass
+class AdmissionJob:
+    """A submitted orchestration, waiting or running."""
+
+    task_id: str
+    payload: dict[str, Any]
+    tenant: str = ANONYMOUS
+    weight: float = 1.0
+    priority: int = 1
+    enqueued_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+
+
+@dataclass
+class AdmissionTicket:
+    """Where a job stands: running, or queued with position and ETA."""
+
+    task_id: str
+    status: str
+    position: Optional[int] = None  # 1 = next to start
+    eta_seconds: Optional[float] = None  # Until it is expected to start
+
+
+class AdmissionController:
+    """Bounded concurrency plus a weighted fair queue for orchestrations."""
+
+    def __init__(
+        self,
+        runner: Callable[[str, dict], Awaitable[None]],
+        database: Optional["Database"] = None,
+        max_running: int = DEFAULT_MAX_RUNNING,
+        max_queued: int = DEFAULT_MAX_QUEUED,
+    ):
+        """Initialize the controller.
+
+        Args:
+            runner: Runs an admitted job, called as ``runner(task_id, payload)``
+            database: Database for the queue (creates default if not provided)
+            max_running: Orchestrations allowed to run at once
+            max_queued: Jobs allowed to wait; further submissions are rejected
+        """
+        from sindri.persistence.database import Database
+
+        self.runner = runner
+        self.db = database or Database()
+        self.max_running = max_running
+        self.max_queued = max_queued
+        self.avg_run_seconds = DEFAULT_RUN_SECONDS
+
+        self._queued: dict[str, AdmissionJob] = {}
+        self._running: dict[str, AdmissionJob] = {}
+        self._tasks: dict[str, asyncio.Task] = {}
+        self._pass: dict[str, float] = {}  # Tenant -> stride pass
+        self._virtual = 0.0  # Pass of the most recently started tenant
+        self._closed = False
+
+    async def _ensure_tables(self) -> None:
+        """Ensure the admission_queue table exists."""
+        if self.db.is_schema_ready("admission_queue"):
+            return
+        async with self.db.get_connection() as conn:
+            await conn.execute("""
+                CREATE TABLE IF NOT EXISTS admission_queue (
+                    task_id TEXT PRIMARY KEY,
+                    tenant TEXT NOT NULL,
+                    weight REAL DEFAULT 1.0,
+                    priority INTEGER DEFAULT 1,
+                    payload_json TEXT NOT NULL,
+                    state TEXT NOT NULL,
+                    enqueued_at REAL NOT NULL
+                )
+            """)
+            await conn.commit()
+        self.db.mark_schema_ready("admission_queue")
+
+    async def submit(
+        self,
+        task_id: str,
+        payload: dict[str, Any],
+        tenant: str = ANONYMOUS,
+        weight: float = 1.0,
+        priority: int = 1,
+    ) -> AdmissionTicket:
+        """Run a job now if a slot is free, otherwise queue it.
+
+        Args:
+            task_id: Job id
+            payload: Passed to the runner (must be JSON-serializable)
+            tenant: Fair-sharing group (API key or team)
+            weight: Tenant's share relative to others (default 1.0)
+            priority: Order among the tenant's own jobs (lower first)
+
+        Returns:
+            The job's ticket
+
+        Raises:
+            QueueFullError: If ``max_queued`` jobs are already waiting
+        """
+        if len(self._queued) >= self.max_queued:
+            raise QueueFullError(self.max_queued, self._start_times(1)[0])
+
+        job = AdmissionJob(
+            task_id=task_id,
+            payload=payload,
+            tenant=tenant,
+            weight=max(weight, MIN_WEIGHT),
+            priority=priority,
+        )
+        # Counted against the limit before persisting, so concurrent
+        # submissions can't overshoot it
+        self._enqueue(job)
+        try:
+            await self._ensure_tables()
+            async with self.db.get_connection() as conn:
+                await conn.execute(
+                    """
+                    INSERT OR REPLACE INTO admission_queue
+                    (task_id, tenant, weight, priority, payload_json, state,
+                     enqueued_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (
+                        job.task_id,
+                        job.tenant,
+                        job.weight,
+                        job.priority,
+                        json.dumps(job.payload),
+                        QUEUED,
+                        job.enqueued_at,
+                    ),
+                )
+                await conn.commit()
+        except Exception:
+            self._queued.pop(task_id, None)
+            raise
+
+        self.dispatch()
+        ticket = self.ticket(task_id)
+        log.info(
+            "task_admission",
+            task_id=task_id,
+            tenant=tenant,
+            status=ticket.status,
+            position=ticket.position,
+        )
+        return ticket
+
+    async def recover(self) -> list[AdmissionJob]:
+        """Reload jobs still queued when the server last stopped.
+
+        Jobs that were running then can't be resumed and are dropped.
+        Call dispatch() afterwards to start the recovered jobs.
+
+        Returns:
+            Recovered jobs in submission order
+        """
+        await self._ensure_tables()
+        async with self.db.get_connection() as conn:
+            cursor = await conn.execute(
+                "DELETE FROM admission_queue WHERE state = ?", (RUNNING,)
+            )
+            interrupted = cursor.rowcount
+            await conn.commit()
+        async with self.db.get_connection(read_only=True) as conn:
+            async with conn.execute(
+                """
+                SELECT task_id, tenant, weight, priority, payload_json, enqueued_at
+                FROM admission_queue ORDER BY enqueued_at
+                """
+            ) as cursor:
+                rows = await cursor.fetchall()
+
+        jobs = [
+            AdmissionJob(
+                task_id=row[0],
+                tenant=row[1],
+                weight=row[2],
+                priority=row[3],
+                payload=json.loads(row[4]),
+                enqueued_at=row[5],
+            )
+            for row in rows
+            if row[0] not in self._queued and row[0] not in self._running
+        ]
+        for job in jobs:
+            self._enqueue(job)
+        if jobs or interrupted:
+            log.info("admission_queue_recovered", queued=len(jobs), dropped=interrupted)
+        return jobs
+
+    def _enqueue(self, job: AdmissionJob):
+        # A tenant returning from idle starts level with the others rather
+        # than spending credit saved while it had nothing queued
+        busy = any(j.tenant == job.tenant for j in self._queued.values())
+        if not busy:
+            previous = self._pass.get(job.tenant, 0.0)
+            self._pass[job.tenant] = max(previous, self._virtual)
+        self._queued[job.task_id] = job
+
+    def _order(self) -> list[AdmissionJob]:
+        """Queued jobs in the order they will start."""
+        per_tenant: dict[str, list[AdmissionJob]] = {}
+        for job in self._queued.values():
+            per_tenant.setdefault(job.tenant, []).append(job)
+        for jobs in per_tenant.values():
+            jobs.sort(key=lambda j: (j.priority, j.enqueued_at), reverse=True)
+
+        passes = {t: self._pass.get(t, 0.0) for t in per_tenant}
+        order = []
+        while per_tenant:
+            tenant = min(
+                per_tenant, key=lambda t: (passes[t], per_tenant[t][-1].enqueued_at)
+            )
+            job = per_tenant[tenant].pop()
+            order.append(job)
+            passes[tenant] += 1.0 / job.weight
+            if not per_tenant[tenant]:
+                del per_tenant[tenant]
+        return order
+
+    def dispatch(self):
+        """Start queued jobs while slots are free."""
+        while (
+            not self._closed and self._queued and len(self._running) < self.max_running
+        ):
+            job = self._order()[0]
+            del self._queued[job.task_id]
+            self._virtual = self._pass.get(job.tenant, 0.0)
+            self._pass[job.tenant] = self._virtual + 1.0 / job.weight
+            job.started_at = time.time()
+            self._running[job.task_id] = job
+            self._tasks[job.task_id] = asyncio.create_task(self._run(job))
+
+    async def _run(self, job: AdmissionJob):
+        try:
+            await self._set_state(job.task_id, RUNNING)
+            await self.runner(job.task_id, job.payload)
+        except Exception as e:
+            log.error("admitted_task_failed", task_id=job.task_id, error=str(e))
+        finally:
+            elapsed = time.time() - (job.started_at or time.time())
+            # Moving average, so ETAs follow the current workload
+            self.avg_run_seconds = 0.7 * self.avg_run_seconds + 0.3 * elapsed
+            self._running.pop(job.task_id, None)
+            self._tasks.pop(job.task_id, None)
+            try:
+                await self._set_state(job.task_id, None)
+            except Exception as e:
+                log.warning(
+                    "admission_cleanup_failed", task_id=job.task_id, error=str(e)
+                )
+            self.dispatch()
+
+    async def close(self):
+        """Stop starting jobs and cancel the running ones.
+
+        Queued jobs stay in the table for :meth:`recover`.
+        """
+        self._closed = True
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _set_state(self, task_id: str, state: Optional[str]):
+        """Mark a persisted job running, or remove it (state None)."""
+        async with self.db.get_connection() as conn:
+            if state is None:
+                await conn.execute(
+                    "DELETE FROM admission_queue WHERE task_id = ?", (task_id,)
+                )
+            else:
+                await conn.execute(
+                    "UPDATE admission_queue SET state = ? WHERE task_id = ?",
+                    (state, task_id),
+                )
+            await conn.commit()
+
+    def _start_times(self, count: int) -> list[float]:
+        """Expected seconds until each of the next ``count`` queued jobs starts.
+
+        Running jobs are assumed to take the average run time; each slot
+        then takes the next job in order.
+        """
+        now = time.time()
+        slots = [
+            max(0.0, self.avg_run_seconds - (now - (job.started_at or now)))
+            for job in self._running.values()
+        ]
+        slots += [0.0] * max(0, self.max_running - len(slots))
+        heapq.heapify(slots)
+        starts = []
+        for _ in range(count):
+            start = heapq.heappop(slots)
+            starts.append(start)
+            heapq.heappush(slots, start + self.avg_run_seconds)
+        return starts
+
+    def ticket(self, task_id: str) -> Optional[AdmissionTicket]:
+        """Current ticket for a job, or None if it is neither queued nor running."""
+        if task_id in self._running:
+            return AdmissionTicket(task_id=task_id, status=RUNNING)
+        if task_id not in self._queued:
+            return None
+        order = [job.task_id for job in self._order()]
+        position = order.index(task_id) + 1
+        return AdmissionTicket(
+            task_id=task_id,
+            status=QUEUED,
+            position=position,
+            eta_seconds=round(self._start_times(position)[-1], 1),
+        )
+
+    def get_stats(self) -> dict[str, Any]:
+        """Running and queued counts, per tenant as well."""
+        tenants: dict[str, dict[str, int]] = {}
+        for state, jobs in ((RUNNING, self._running), (QUEUED, self._queued)):
+            for job in jobs.values():
+                counts = tenants.setdefault(job.tenant, {RUNNING: 0, QUEUED: 0})
+                counts[state] += 1
+        return {
+            "running": len(self._running),
+            "queued": len(self._queued),
+            "max_running": self.max_running,
+            "max_queued": self.max_queued,
+            "avg_run_seconds": round(self.avg_run_seconds, 1),
+            "tenants": tenants,
+        }
@@ -28,7 +28,6 @@ from fastapi import (
     HTTPException,
     Query,
     Header,
-    BackgroundTasks,
 )
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
@@ -40,6 +39,15 @@ from sindri.agents.registry import get_agent, list_agents
 from sindri.persistence.state import SessionState
 from sindri.core.events import EventBus, EventType
 from sindri.llm.manager import ModelManager
+from sindri.llm.pool import EndpointPool
+from sindri.web.admission import (
+    ANONYMOUS,
+    DEFAULT_MAX_QUEUED,
+    DEFAULT_MAX_RUNNING,
+    AdmissionController,
+    QueueFullError,
+    parse_weight,
+)
 
 log = structlog.get_logger()
 
@@ -85,6 +93,9 @@ class TaskCreateRequest(BaseModel):
     max_iterations: int = Field(default=30, ge=1, le=100)
     work_dir: Optional[str] = Field(default=None, description="Working directory")
     enable_memory: bool = Field(default=True, description="Enable memory system")
+    priority: int = Field(
+        default=1, ge=0, le=10, description="Order among your queued tasks (0 first)"
+    )
 
 
 class TaskResponse(BaseModel):
@@ -93,6 +104,8 @@ class TaskResponse(BaseModel):
     task_id: str
     status: str
     message: str
+    queue_position: Optional[int] = None
+    eta_seconds: Optional[float] = None
 
 
 class TaskStatusResponse(BaseModel):
@@ -103,6 +116,8 @@ class TaskStatusResponse(BaseModel):
     result: Optional[str] = None
     error: Optional[str] = None
     subtasks: int = 0
+    queue_position: Optional[int] = None  # While queued; 1 = next to start
+    eta_seconds: Optional[float] = None  # Expected wait before it starts
 
 
 class MetricsResponse(BaseModel):
@@ -116,6 +131,10 @@ class MetricsResponse(BaseModel):
     vram_used_gb: float
     vram_total_gb: float
     loaded_models: list[str]
+    # Tokens/sec, prompt-eval share and load share overall, by model and agent
+    throughput: Optional[dict] = None
+    # Write-behind queue depth and flush latency per database file
+    write_queues: Optional[dict] = None
 
 
 class HealthResponse(BaseModel):
@@ -535,15 +554,30 @@ class APIKeyGlobalStatsResponse(BaseModel):
 class SindriAPI:
     """Sindri API application state."""
 
-    def __init__(self, vram_gb: float = 16.0, work_dir: Optional[Path] = None):
+    def __init__(
+        self,
+        vram_gb: float = 16.0,
+        work_dir: Optional[Path] = None,
+        max_running: int = DEFAULT_MAX_RUNNING,
+        max_queued: int = DEFAULT_MAX_QUEUED,
+    ):
         self.vram_gb = vram_gb
         self.work_dir = work_dir
         self.state = SessionState()
         self.event_bus = EventBus()
         self.model_manager: Optional[ModelManager] = None
+        self.endpoint_pool: Optional[EndpointPool] = None
         self.active_tasks: dict[str, dict] = {}
         self.websocket_connections: list[WebSocket] = []
 
+        # Orchestrations share one Ollama server; run a few, queue the rest
+        self.admission = AdmissionController(
+            self._run_task,
+            self.state.db,
+            max_running=max_running,
+            max_queued=max_queued,
+        )
+
         # Collaboration components
         self.share_store: Optional["ShareStore"] = None
         self.comment_store: Optional["CommentStore"] = None
@@ -555,7 +589,17 @@ class SindriAPI:
     async def initialize(self):
         """Initialize API components."""
         await self.state.db.initialize()
-        self.model_manager = ModelManager(total_vram_gb=self.vram_gb)
+
+        # Route across [[ollama_endpoints]] when the config lists several
+        from sindri.config import SindriConfig
+
+        self.endpoint_pool = EndpointPool.from_config(SindriConfig.load())
+        if self.endpoint_pool is not None:
+            await self.endpoint_pool.check_health()
+            self.endpoint_pool.start_health_checks()
+        self.model_manager = ModelManager(
+            total_vram_gb=self.vram_gb, pool=self.endpoint_pool
+        )
 
         # Initialize collaboration components
         from sindri.collaboration.sharing import ShareStore
@@ -586,6 +630,11 @@ class SindriAPI:
         if cleaned > 0:
             log.info("startup_cleanup", stale_sessions_marked_failed=cleaned)
 
+        # Resume the task queue left by the previous run
+        for job in await self.admission.recover():
+            self._track_task(job.task_id, job.payload, "queued")
+        self.admission.dispatch()
+
         # Subscribe to events for WebSocket broadcast
         for event_type in EventType:
             self.event_bus.subscribe(event_type, self._broadcast_event_sync)
@@ -594,6 +643,63 @@ class SindriAPI:
             "sindri_api_initialized", vram_gb=self.vram_gb, collaboration_enabled=True
         )
 
+    def _track_task(self, task_id: str, payload: dict, status: str):
+        """Record a submitted task for the status endpoints."""
+        self.active_tasks[task_id] = {
+            "status": status,
+            "description": payload["description"],
+            "agent": payload.get("agent", "brokkr"),
+            "submitted_at": time.time(),
+            "started_at": None,
+            "result": None,
+            "error": None,
+        }
+
+    async def _run_task(self, task_id: str, payload: dict):
+        """Run an orchestration admitted by the admission controller."""
+        from sindri.core.orchestrator import Orchestrator
+        from sindri.core.loop import LoopConfig
+
+        if task_id not in self.active_tasks:
+            self._track_task(task_id, payload, "running")
+        task = self.active_tasks[task_id]
+        task["status"] = "running"
+        task["started_at"] = time.time()
+
+        try:
+            work_dir = payload.get("work_dir")
+            orchestrator = Orchestrator(
+                config=LoopConfig(max_iterations=payload.get("max_iterations", 30)),
+                total_vram_gb=self.vram_gb,
+                enable_memory=payload.get("enable_memory", True),
+                work_dir=Path(work_dir) if work_dir else self.work_dir,
+                event_bus=self.event_bus,
+                endpoint_pool=self.endpoint_pool,
+            )
+            result = await orchestrator.run(payload["description"])
+            task["status"] = "completed" if result.get("success") else "failed"
+            task["result"] = result.get("result")
+            task["error"] = result.get("error")
+            task["subtasks"] = result.get("subtasks", 0)
+        except Exception as e:
+            task["status"] = "failed"
+            task["error"] = str(e)
+            log.error("task_execution_failed", task_id=task_id, error=str(e))
+
+    def _task_status(self, task_id: str) -> "TaskStatusResponse":
+        """Status of a tracked task, with queue position while it waits."""
+        task = self.active_tasks[task_id]
+        ticket = self.admission.ticket(task_id) if task["status"] == "queued" else None
+        return TaskStatusResponse(
+            task_id=task_id,
+            status=task["status"],
+            result=task.get("result"),
+            error=task.get("error"),
+            subtasks=task.get("subtasks", 0),
+            queue_position=ticket.position if ticket else None,
+            eta_seconds=ticket.eta_seconds if ticket else None,
+        )
+
     def _broadcast_event_sync(self, data: Any):
         """Synchronous wrapper for event broadcast (called from EventBus)."""
         # Queue for async broadcast
@@ -663,21 +769,49 @@ class SindriAPI:
             except Exception:
                 pass
         self.websocket_connections.clear()
+
+        # Queued tasks stay persisted and resume on the next start
+        await self.admission.close()
+
+        if self.endpoint_pool is not None:
+            await self.endpoint_pool.stop_health_checks()
+
+        # Commit batched metrics/audit/activity records
+        from sindri.persistence.write_behind import flush_all
+
+        await flush_all()
+
+        # Stop CPU-bound tool workers without waiting on abandoned calls
+        from sindri.tools.offload import shutdown_cpu_pool
+
+        shutdown_cpu_pool(wait=False)
         log.info("sindri_api_shutdown")
 
 
-def create_app(vram_gb: float = 16.0, work_dir: Optional[Path] = None) -> FastAPI:
+def create_app(
+    vram_gb: float = 16.0,
+    work_dir: Optional[Path] = None,
+    max_running: int = DEFAULT_MAX_RUNNING,
+    max_queued: int = DEFAULT_MAX_QUEUED,
+) -> FastAPI:
     """Create and configure the FastAPI application.
 
     Args:
         vram_gb: Total VRAM available in GB
         work_dir: Working directory for file operations
+        max_running: Orchestrations allowed to run at once
+        max_queued: Tasks allowed to wait before submissions get 429
 
     Returns:
         Configured FastAPI application
     """
 
-    api = SindriAPI(vram_gb=vram_gb, work_dir=work_dir)
+    api = SindriAPI(
+        vram_gb=vram_gb,
+        work_dir=work_dir,
+        max_running=max_running,
+        max_queued=max_queued,
+    )
 
     @asynccontextmanager
     async def lifespan(app: FastAPI):
@@ -723,7 +857,7 @@ def create_app(vram_gb: float = 16.0, work_dir: Optional[Path] = None) -> FastAP
         # Check database
         db_ok = False
         try:
-            async with api.state.db.get_connection() as conn:
+            async with api.state.db.get_connection(read_only=True) as conn:
                 await conn.execute("SELECT 1")
             db_ok = True
         except Exception:
@@ -997,14 +1131,22 @@ def create_app(vram_gb: float = 16.0, work_dir: Optional[Path] = None) -> FastAP
 
     # ===== Task Endpoints =====
 
-    @app.post("/api/tasks", response_model=TaskResponse, tags=["Tasks"])
+    @app.post(
+        "/api/tasks",
+        response_model=TaskResponse,
+        tags=["Tasks"],
+        responses={429: {"description": "Task queue is full"}},
+    )
     async def create_task(
-        request: TaskCreateRequest, background_tasks: BackgroundTasks
+        request: TaskCreateRequest,
+        api_key: Optional[str] = Header(default=None, alias="X-API-Key"),
     ):
-        """Create and start a new task."""
-        from sindri.core.orchestrator import Orchestrator
-        from sindri.core.loop import LoopConfig
+        """Create a task: start it if a slot is free, otherwise queue it.
 
+        Queued tasks are shared fairly between API keys (or their teams),
+        weighted by the key's ``queue_weight`` metadata. Returns 429 when
+        the queue is full.
+        """
         # Validate agent
         try:
             get_agent(request.agent)
@@ -1013,92 +1155,89 @@ def create_app(vram_gb: float = 16.0, work_dir: Optional[Path] = None) -> FastAP
                 status_code=400, detail=f"Unknown agent: {request.agent}"
             )
 
-        # Create orchestrator
-        config = LoopConfig(max_iterations=request.max_iterations)
-        work_path = (
-            Path(request.work_dir).resolve() if request.work_dir else api.work_dir
-        )
+        # Fair-share tenant: the key's team, else the key itself
+        tenant, weight = ANONYMOUS, 1.0
+        if api_key and api.api_key_store:
+            from sindri.collaboration.api_keys import APIKeyScope
 
-        orchestrator = Orchestrator(
-            config=config,
-            total_vram_gb=api.vram_gb,
-            enable_memory=request.enable_memory,
-            work_dir=work_path,
-            event_bus=api.event_bus,
-        )
+            key = await api.api_key_store.verify_key(
+                api_key, required_scope=APIKeyScope.WRITE_TASKS
+            )
+            if not key:
+                raise HTTPException(
+                    status_code=401, detail="Invalid or expired API key"
+                )
+            tenant = f"team:{key.team_id}" if key.team_id else f"key:{key.id}"
+            weight = parse_weight(key.metadata.get("queue_weight", 1.0))
 
-        # Generate task ID
         import uuid
 
         task_id = str(uuid.uuid4())
-
-        # Track task
-        api.active_tasks[task_id] = {
-            "status": "running",
+        payload = {
             "description": request.description,
             "agent": request.agent,
-            "started_at": time.time(),
-            "result": None,
-            "error": None,
+            "max_iterations": request.max_iterations,
+            "work_dir": str(Path(request.work_dir).resolve())
+            if request.work_dir
+            else None,
+            "enable_memory": request.enable_memory,
         }
 
-        # Run task in background
-        async def run_task():
-            try:
-                result = await orchestrator.run(request.description)
-                api.active_tasks[task_id]["status"] = (
-                    "completed" if result.get("success") else "failed"
-                )
-                api.active_tasks[task_id]["result"] = result.get("result")
-                api.active_tasks[task_id]["error"] = result.get("error")
-                api.active_tasks[task_id]["subtasks"] = result.get("subtasks", 0)
-            except Exception as e:
-                api.active_tasks[task_id]["status"] = "failed"
-                api.active_tasks[task_id]["error"] = str(e)
-                log.error("task_execution_failed", task_id=task_id, error=str(e))
-
-        background_tasks.add_task(run_task)
+        api._track_task(task_id, payload, "queued")
+        try:
+            ticket = await api.admission.submit(
+                task_id,
+                payload,
+                tenant=tenant,
+                weight=weight,
+                priority=request.priority,
+            )
+        except QueueFullError as e:
+            del api.active_tasks[task_id]
+            raise HTTPException(
+                status_code=429,
+                detail=str(e),
+                headers={"Retry-After": str(max(1, round(e.retry_after)))},
+            )
 
+        if ticket.status == "running":
+            message = f"Task started with agent '{request.agent}'"
+        else:
+            message = (
+                f"Task queued at position {ticket.position} "
+                f"(about {ticket.eta_seconds:.0f}s until it starts)"
+            )
         return TaskResponse(
             task_id=task_id,
-            status="running",
-            message=f"Task started with agent '{request.agent}'",
+            status=ticket.status,
+            message=message,
+            queue_position=ticket.position,
+            eta_seconds=ticket.eta_seconds,
         )
 
     @app.get("/api/tasks/{task_id}", response_model=TaskStatusResponse, tags=["Tasks"])
     async def get_task_status(task_id: str):
-        """Get task execution status."""
+        """Get task execution status (queue position and ETA while queued)."""
         if task_id not in api.active_tasks:
             raise HTTPException(status_code=404, detail=f"Task '{task_id}' not found")
 
-        task = api.active_tasks[task_id]
-        return TaskStatusResponse(
-            task_id=task_id,
-            status=task["status"],
-            result=task.get("result"),
-            error=task.get("error"),
-            subtasks=task.get("subtasks", 0),
-        )
+        return api._task_status(task_id)
 
     @app.get("/api/tasks", response_model=list[TaskStatusResponse], tags=["Tasks"])
     async def list_tasks(
         status: Optional[str] = Query(default=None, description="Filter by status")
     ):
         """List all tracked tasks."""
-        tasks = []
-        for task_id, task in api.active_tasks.items():
-            if status and task["status"] != status:
-                continue
-            tasks.append(
-                TaskStatusResponse(
-                    task_id=task_id,
-                    status=task["status"],
-                    result=task.get("result"),
-                    error=task.get("error"),
-                    subtasks=task.get("subtasks", 0),
-                )
-            )
-        return tasks
+        return [
+            api._task_status(task_id)
+            for task_id, task in api.active_tasks.items()
+            if not status or task["status"] == status
+        ]
+
+    @app.get("/api/queue", tags=["Tasks"])
+    async def get_queue_stats():
+        """Running and queued task counts, overall and per tenant."""
+        return api.admission.get_stats()
 
     # ===== Metrics Endpoints =====
 
@@ -1124,6 +1263,13 @@ def create_app(vram_gb: float = 16.0, work_dir: Optional[Path] = None) -> FastAP
                 else []
             )
 
+        # Token throughput from recent session metrics
+        from sindri.persistence.metrics import MetricsStore
+
+        throughput = await MetricsStore(api.state.db).get_throughput_stats()
+
+        from sindri.persistence.write_behind import write_behind_stats
+
         return MetricsResponse(
             total_sessions=len(sessions),
             completed_sessions=completed,
@@ -1133,6 +1279,8 @@ def create_app(vram_gb: float = 16.0, work_dir: Optional[Path] = None) -> FastAP
             vram_used_gb=vram_used,
             vram_total_gb=api.vram_gb,
             loaded_models=loaded_models,
+            throughput=throughput,
+            write_queues=write_behind_stats(),
         )
 
     @app.get("/api/metrics/sessions/{session_id}", tags=["Metrics"])
@@ -1157,7 +1305,7 @@ def create_app(vram_gb: float = 16.0, work_dir: Optional[Path] = None) -> FastAP
                 )
             full_id = matching[0]["id"]
 
-        metrics = await store.get_metrics(full_id)
+        metrics = await store.load_metrics(full_id)
         if not metrics:
             raise HTTPException(
                 status_code=404, detail=f"Metrics not found for session '{session_id}'"
@@ -2671,6 +2819,8 @@ def run_server(
     port: int = 8000,
     vram_gb: float = 16.0,
     work_dir: Optional[Path] = None,
+    max_running: int = DEFAULT_MAX_RUNNING,
+    max_queued: int = DEFAULT_MAX_QUEUED,
 ):
     """Run the Sindri API server.
 
@@ -2679,8 +2829,15 @@ def run_server(
         port: Port to listen on
         vram_gb: Total VRAM available
         work_dir: Working directory for file operations
+        max_running: Orchestrations allowed to run at once
+        max_queued: Tasks allowed to wait before submissions get 429
     """
     import uvicorn
 
-    app = create_app(vram_gb=vram_gb, work_dir=work_dir)
+    app = create_app(
+        vram_gb=vram_gb,
+        work_dir=work_dir,
+        max_running=max_running,
+        max_queued=max_queued,
+    )
     uvicorn.run(app, host=host, port=port, log_level="info")
@@ -0,0 +1,316 @@
+"""Tests for web task admission control."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from sindri.web.admission import (
+    MAX_WEIGHT,
+    MIN_WEIGHT,
+    AdmissionController,
+    QueueFullError,
+    parse_weight,
+)
+from sindri.web.server import create_app
+
+
+class GatedRunner:
+    """Runner whose jobs finish only when released."""
+
+    def __init__(self):
+        self.started: list[str] = []
+        self.gates: dict[str, asyncio.Event] = {}
+
+    async def __call__(self, task_id: str, payload: dict):
+        self.started.append(task_id)
+        gate = self.gates.setdefault(task_id, asyncio.Event())
+        await gate.wait()
+
+    def release(self, task_id: str):
+        self.gates.setdefault(task_id, asyncio.Event()).set()
+
+
+async def _wait_for(condition, timeout: float = 5.0):
+    """Poll until condition() holds; the queue table is updated off-loop."""
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        assert asyncio.get_running_loop().time() < deadline, "timed out"
+        await asyncio.sleep(0.01)
+
+
+async def _drain(controller: AdmissionController, runner: GatedRunner) -> list[str]:
+    """Release jobs one at a time as they start; returns the start order."""
+    released = 0
+    while controller._queued or controller._running:
+        await _wait_for(lambda: len(runner.started) > released)
+        task_id = runner.started[released]
+        runner.release(task_id)
+        released += 1
+        await _wait_for(lambda: task_id not in controller._running)
+    return runner.started
+
+
+@pytest.fixture
+async def controllers(db):
+    """Builds controllers on the test database; closes them afterwards."""
+    created = []
+
+    def make(runner, **kwargs):
+        controller = AdmissionController(runner, db, **kwargs)
+        created.append(controller)
+        return controller
+
+    yield make
+    for controller in created:
+        await controller.close()
+
+
+# =============================================================================
+# Controller tests
+# =============================================================================
+
+
+class TestAdmissionController:
+    """Concurrency bound, queue order and persistence."""
+
+    @pytest.mark.asyncio
+    async def test_runs_up_to_max_then_queues(self, controllers):
+        runner = GatedRunner()
+        controller = controllers(runner, max_running=2)
+
+        tickets = [await controller.submit(f"t{i}", {}) for i in range(4)]
+        await _wait_for(lambda: len(runner.started) == 2)
+
+        assert [t.status for t in tickets] == ["running", "running", "queued", "queued"]
+        assert runner.started == ["t0", "t1"]
+        assert controller.ticket("t3").position == 2
+
+        runner.release("t0")
+        await _wait_for(lambda: len(runner.started) == 3)
+        assert runner.started == ["t0", "t1", "t2"]
+        assert controller.ticket("t3").position == 1
+
+    @pytest.mark.asyncio
+    async def test_full_queue_rejected(self, controllers):
+        controller = controllers(GatedRunner(), max_running=1, max_queued=1)
+        await controller.submit("a", {})
+        await controller.submit("b", {})
+
+        with pytest.raises(QueueFullError) as exc:
+            await controller.submit("c", {})
+
+        assert exc.value.retry_after > 0
+        assert controller.ticket("c") is None
+
+    @pytest.mark.asyncio
+    async def test_tenants_alternate(self, controllers):
+        runner = GatedRunner()
+        controller = controllers(runner, max_running=1)
+        await controller.submit("blocker", {})
+        for i in range(3):
+            await controller.submit(f"a{i}", {}, tenant="a")
+        for i in range(3):
+            await controller.submit(f"b{i}", {}, tenant="b")
+
+        order = await _drain(controller, runner)
+
+        assert order == ["blocker", "a0", "b0", "a1", "b1", "a2", "b2"]
+
+    @pytest.mark.asyncio
+    async def test_weight_sets_share(self, controllers):
+        runner = GatedRunner()
+        controller = controllers(runner, max_running=1)
+        await controller.submit("blocker", {})
+        for i in range(4):
+            await controller.submit(f"heavy{i}", {}, tenant="heavy", weight=3.0)
+        for i in range(4):
+            await controller.submit(f"light{i}", {}, tenant="light")
+
+        order = await _drain(controller, runner)
+
+        first_four = order[1:5]
+        assert sum(t.startswith("heavy") for t in first_four) == 3
+
+    @pytest.mark.asyncio
+    async def test_priority_orders_within_tenant(self, controllers):
+        runner = GatedRunner()
+        controller = controllers(runner, max_running=1)
+        await controller.submit("blocker", {}, tenant="a")
+        await controller.submit("later", {}, tenant="a", priority=5)
+        await controller.submit("urgent", {}, tenant="a", priority=0)
+
+        assert controller.ticket("urgent").position == 1
+        order = await _drain(controller, runner)
+        assert order == ["blocker", "urgent", "later"]
+
+    @pytest.mark.asyncio
+    async def test_eta_grows_with_position(self, controllers):
+        controller = controllers(GatedRunner(), max_running=1)
+        controller.avg_run_seconds = 60.0
+        for i in range(3):
+            await controller.submit(f"t{i}", {})
+
+        first, second = controller.ticket("t1"), controller.ticket("t2")
+
+        assert 0 < first.eta_seconds <= 60.0
+        assert second.eta_seconds == pytest.approx(first.eta_seconds + 60.0, abs=1)
+
+    @pytest.mark.asyncio
+    async def test_recover_reloads_queued_jobs(self, controllers):
+        first = controllers(GatedRunner(), max_running=1)
+        await first.submit("running", {"description": "x"})
+        await first.submit("waiting", {"description": "y"}, tenant="a", priority=3)
+        await _wait_for(lambda: first.get_stats()["running"] == 1)
+        await asyncio.sleep(0.1)  # Let the running state reach the table
+
+        runner = GatedRunner()
+        second = controllers(runner, max_running=1)
+        jobs = await second.recover()
+        second.dispatch()
+        await _wait_for(lambda: runner.started)
+
+        assert [(j.task_id, j.tenant, j.priority) for j in jobs] == [
+            ("waiting", "a", 3)
+        ]
+        assert jobs[0].payload == {"description": "y"}
+        assert runner.started == ["waiting"]
+        # The interrupted job is gone for good
+        assert await controllers(runner).recover() == []
+
+    @pytest.mark.asyncio
+    async def test_failing_runner_frees_slot(self, controllers):
+        async def boom(task_id, payload):
+            raise RuntimeError("boom")
+
+        controller = controllers(boom, max_running=1)
+        await controller.submit("a", {})
+        await controller.submit("b", {})
+
+        await _wait_for(lambda: controller.get_stats()["running"] == 0)
+        assert controller.get_stats()["queued"] == 0
+
+
+# =============================================================================
+# Web endpoint tests
+# =============================================================================
+
+
+@pytest.fixture
+def app(controllers):
+    app = create_app(vram_gb=16.0)
+    api = app.state.api
+    api.admission = controllers(api._run_task, max_running=1, max_queued=1)
+    return app
+
+
+class TestTaskAdmissionEndpoints:
+    """POST /api/tasks queues, reports position and returns 429."""
+
+    @pytest.mark.asyncio
+    async def test_queue_position_and_429(self, app):
+        gate = asyncio.Event()
+
+        async def slow_run(description):
+            await gate.wait()
+            return {"success": True, "result": "done"}
+
+        with patch("sindri.core.orchestrator.Orchestrator") as orchestrator:
+            orchestrator.return_value = MagicMock(run=slow_run)
+            async with AsyncClient(
+                transport=ASGITransport(app=app), base_url="http://test"
+            ) as client:
+                first = await client.post("/api/tasks", json={"description": "a"})
+                second = await client.post("/api/tasks", json={"description": "b"})
+                third = await client.post("/api/tasks", json={"description": "c"})
+
+                assert first.json()["status"] == "running"
+                assert second.json()["status"] == "queued"
+                assert second.json()["queue_position"] == 1
+                assert third.status_code == 429
+                assert "Retry-After" in third.headers
+
+                task_id = second.json()["task_id"]
+                status = (await client.get(f"/api/tasks/{task_id}")).json()
+                assert status["queue_position"] == 1
+                assert status["eta_seconds"] is not None
+
+                gate.set()
+                await _wait_for(
+                    lambda: (
+                        app.state.api.active_tasks[task_id]["status"] != "queued"
+                        and not app.state.api.admission._running
+                    )
+                )
+                status = (await client.get(f"/api/tasks/{task_id}")).json()
+                assert status["status"] == "completed"
+                assert status["queue_position"] is None
+
+    @pytest.mark.asyncio
+    async def test_api_key_sets_tenant(self, app):
+        api = app.state.api
+        key = SimpleNamespace(id="k1", team_id="t1", metadata={"queue_weight": 2})
+        api.api_key_store = MagicMock(verify_key=AsyncMock(return_value=key))
+        submit = AsyncMock(return_value=MagicMock(status="running", position=None))
+        api.admission.submit = submit
+
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.post(
+                "/api/tasks",
+                json={"description": "a", "priority": 0},
+                headers={"X-API-Key": "sk_test"},
+            )
+
+        assert response.status_code == 200
+        kwargs = submit.call_args.kwargs
+        assert (kwargs["tenant"], kwargs["weight"], kwargs["priority"]) == (
+            "team:t1",
+            2.0,
+            0,
+        )
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("raw", ["heavy", None, "nan", [2]])
+    async def test_bad_queue_weight_falls_back(self, app, raw):
+        api = app.state.api
+        key = SimpleNamespace(id="k1", team_id=None, metadata={"queue_weight": raw})
+        api.api_key_store = MagicMock(verify_key=AsyncMock(return_value=key))
+        submit = AsyncMock(return_value=MagicMock(status="running", position=None))
+        api.admission.submit = submit
+
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.post(
+                "/api/tasks",
+                json={"description": "a"},
+                headers={"X-API-Key": "sk_test"},
+            )
+
+        assert response.status_code == 200
+        assert submit.call_args.kwargs["weight"] == 1.0
+
+    @pytest.mark.parametrize(
+        "raw, expected",
+        [("2.5", 2.5), (-3, MIN_WEIGHT), (0, MIN_WEIGHT), (1e9, MAX_WEIGHT)],
+    )
+    def test_parse_weight_clamps(self, raw, expected):
+        assert parse_weight(raw) == expected
+
+    @pytest.mark.asyncio
+    async def test_invalid_api_key_rejected(self, app):
+        api = app.state.api
+        api.api_key_store = MagicMock(verify_key=AsyncMock(return_value=None))
+
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.post(
+                "/api/tasks", json={"description": "a"}, headers={"X-API-Key": "bad"}
+            )
+
+        assert response.status_code == 401
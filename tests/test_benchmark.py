@@ -0,0 +1,160 @@
+"""Tests for the fake Ollama server and orchestration benchmark."""
+
+import pytest
+
+from sindri.benchmark.fake_ollama import FakeModel, FakeOllamaServer, ScriptedReply
+from sindri.benchmark.runner import (
+    BenchmarkScenario,
+    default_scenarios,
+    run_scenario,
+)
+from sindri.benchmark.timeline import union_length
+from sindri.llm.client import OllamaClient
+
+
+def _system(task: str) -> dict:
+    return {
+        "role": "system",
+        "content": f"You are an agent.\n\nYour current task: {task}",
+    }
+
+
+@pytest.fixture
+def server():
+    """Fake server with a two-step script."""
+    scripts = {
+        "Read the app": [
+            ScriptedReply(
+                "Reading.", [{"name": "read_file", "arguments": {"path": "a.py"}}]
+            ),
+            ScriptedReply("Done <sindri:complete/>"),
+        ]
+    }
+    with FakeOllamaServer(
+        scripts,
+        models=[FakeModel("big:14b", 10.0), FakeModel("small:7b", 5.0)],
+        vram_gb=12.0,
+    ) as fake:
+        yield fake
+
+
+# =============================================================================
+# Fake server tests
+# =============================================================================
+
+
+class TestFakeOllamaServer:
+    """Tests for scripted replies and simulated VRAM."""
+
+    def test_reply_follows_conversation(self, server):
+        """The number of assistant turns selects the reply."""
+        first = server.reply_for([_system("Read the app")])
+        second = server.reply_for(
+            [_system("Read the app"), {"role": "assistant", "content": "x"}]
+        )
+        assert first.tool_calls[0]["name"] == "read_file"
+        assert "complete" in second.content
+
+    def test_unscripted_task_gets_default(self, server):
+        """Unknown tasks get the default reply and are counted."""
+        reply = server.reply_for([_system("Something else")])
+        assert reply is server.default_reply
+        assert server.stats.unscripted == 1
+
+    def test_inline_tools_rendered_as_json(self):
+        """Inline tool calls are written into the text."""
+        message = ScriptedReply(
+            "Reading.",
+            [{"name": "read_file", "arguments": {"path": "a"}}],
+            inline_tools=True,
+        ).message()
+        assert "tool_calls" not in message
+        assert '"name": "read_file"' in message["content"]
+
+    def test_vram_eviction(self, server):
+        """Loading past the VRAM limit evicts the least recently used model."""
+        server.load("big:14b")
+        server.load("small:7b")
+
+        assert set(server.resident) == {"small:7b"}
+        assert server.stats.evictions == 1
+        assert server.stats.loads == 2
+
+    @pytest.mark.asyncio
+    async def test_chat_returns_native_tool_calls(self, server):
+        """Non-streaming chat returns tool calls and Ollama stats."""
+        client = OllamaClient(host=server.host)
+        response = await client.chat("small:7b", [_system("Read the app")])
+
+        assert response.message.tool_calls[0].function.name == "read_file"
+        assert response.stats.eval_tokens == 1
+        assert [m["name"] for m in server.ps()] == ["small:7b"]
+
+    @pytest.mark.asyncio
+    async def test_stream_tokens(self, server):
+        """Streaming chat delivers the reply token by token."""
+        client = OllamaClient(host=server.host)
+        tokens = []
+        result = await client.chat_stream(
+            "small:7b",
+            [_system("Read the app"), {"role": "assistant", "content": "Reading."}],
+            on_token=tokens.append,
+        )
+
+        assert result.content == "Done <sindri:complete/>"
+        assert len(tokens) == 2
+        assert server.stats.streamed_requests == 1
+
+
+# =============================================================================
+# Benchmark runner tests
+# =============================================================================
+
+
+class TestBenchmarkRunner:
+    """Tests for end-to-end scenario runs."""
+
+    def test_union_merges_overlaps(self):
+        """Overlapping intervals are only counted once."""
+        assert union_length([(0.0, 2.0), (1.0, 3.0), (5.0, 6.0)]) == 4.0
+        assert union_length([]) == 0.0
+
+    def test_default_scenarios(self):
+        """Default scenarios cover single, delegation and parallel runs."""
+        names = [s.name for s in default_scenarios()]
+        assert names == ["single_agent", "delegation_tree", "parallel_batch"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("streaming", [True, False])
+    async def test_delegation_tree(self, streaming):
+        """A delegation tree completes and reports component timings."""
+        scenario = next(s for s in default_scenarios() if s.name == "delegation_tree")
+
+        result = await run_scenario(
+            scenario, streaming=streaming, token_latency=0.0, load_seconds=0.0
+        )
+
+        assert result.success, result.error
+        assert result.server["unscripted"] == 0
+        assert result.components["delegation"].calls >= 3
+        assert result.components["tools"].calls >= 3
+        assert result.events > 0
+        assert result.overhead <= result.wall_time
+        assert result.to_dict()["scenario"] == "delegation_tree"
+
+    @pytest.mark.asyncio
+    async def test_parallel_extra_tasks(self):
+        """Extra tasks run alongside the root task."""
+        scenario = BenchmarkScenario(
+            name="pair",
+            request="Check the project layout",
+            scripts={
+                "Check the project layout": [ScriptedReply("Fine. <sindri:complete/>")]
+            },
+            extra_tasks=[("ratatoskr", "Show the README")],
+        )
+
+        result = await run_scenario(scenario, token_latency=0.0, load_seconds=0.0)
+
+        assert result.components["tasks"].calls == 2
+        assert result.server["requests"] >= 2
@@ -0,0 +1,265 @@
+"""Tests for aborting in-flight generation on cancellation."""
+
+import asyncio
+import time
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from sindri.agents.registry import AGENTS
+from sindri.benchmark.fake_ollama import FakeOllamaServer, ScriptedReply
+from sindri.core.delegation import DelegationManager, DelegationRequest
+from sindri.core.events import EventBus, EventType
+from sindri.core.hierarchical import GenerationCancelled, HierarchicalAgentLoop
+from sindri.core.loop import LoopConfig
+from sindri.core.orchestrator import Orchestrator
+from sindri.core.scheduler import TaskScheduler
+from sindri.core.tasks import Task, TaskStatus
+from sindri.llm.client import OllamaClient, StreamingResponse
+from sindri.persistence.database import Database
+
+
+def _loop(client=None, delegation=None, event_bus=None) -> HierarchicalAgentLoop:
+    return HierarchicalAgentLoop(
+        client=client or MagicMock(),
+        tools=MagicMock(),
+        state=MagicMock(),
+        scheduler=MagicMock(),
+        delegation=delegation or MagicMock(),
+        config=LoopConfig(),
+        event_bus=event_bus or EventBus(),
+        enable_metrics=False,
+    )
+
+
+def _agent(timeout: float = 30.0):
+    agent = MagicMock()
+    agent.name = "huginn"
+    agent.llm_timeout = timeout
+    return agent
+
+
+class _SlowCall:
+    """A call that takes a long time and records whether it was aborted."""
+
+    def __init__(self, seconds: float = 10.0):
+        self.seconds = seconds
+        self.aborted = False
+
+    async def __call__(self):
+        try:
+            await asyncio.sleep(self.seconds)
+            return "finished"
+        except asyncio.CancelledError:
+            self.aborted = True
+            raise
+
+
+# =============================================================================
+# Cancellable LLM calls
+# =============================================================================
+
+
+class TestCancellableCalls:
+    """Tests for HierarchicalAgentLoop._call_llm_cancellable."""
+
+    @pytest.mark.asyncio
+    async def test_returns_result(self):
+        """Calls that finish normally return their result."""
+        loop = _loop()
+        task = Task(id="t1", description="d")
+
+        result = await loop._call_llm_cancellable(task, _agent(), _SlowCall(0.01)())
+
+        assert result == "finished"
+        assert loop._inflight_calls == {}
+
+    @pytest.mark.asyncio
+    async def test_cancel_flag_set_before_call(self):
+        """A task already flagged as cancelled aborts without waiting."""
+        loop = _loop()
+        task = Task(id="t1", description="d", cancel_requested=True)
+        call = _SlowCall()
+
+        start = time.monotonic()
+        with pytest.raises(GenerationCancelled):
+            await loop._call_llm_cancellable(task, _agent(), call())
+
+        assert time.monotonic() - start < 1.0
+        assert loop._inflight_calls == {}
+
+    @pytest.mark.asyncio
+    async def test_cancel_generation_aborts_immediately(self):
+        """cancel_generation() stops the in-flight call."""
+        loop = _loop()
+        task = Task(id="t1", description="d")
+        call = _SlowCall()
+
+        async def abort_soon():
+            await asyncio.sleep(0.02)
+            assert loop.cancel_generation("t1") is True
+
+        asyncio.ensure_future(abort_soon())
+        with pytest.raises(GenerationCancelled):
+            await loop._call_llm_cancellable(task, _agent(), call())
+
+        assert call.aborted
+        assert loop.cancel_generation("t1") is False
+
+    @pytest.mark.asyncio
+    async def test_deadline(self):
+        """Calls past the agent's deadline time out and are aborted."""
+        loop = _loop()
+        task = Task(id="t1", description="d")
+        call = _SlowCall()
+
+        with pytest.raises(asyncio.TimeoutError):
+            await loop._call_llm_cancellable(task, _agent(timeout=0.05), call())
+
+        assert call.aborted
+
+    @pytest.mark.asyncio
+    async def test_stream_abort_emits_end_and_drops_prefetch(self):
+        """An aborted stream ends its display stream and cancels early tools."""
+        events = []
+        bus = EventBus()
+        bus.subscribe(EventType.STREAMING_END, events.append)
+
+        async def endless_stream(model, messages, tools, on_token, **kwargs):
+            while True:
+                on_token("tok ")
+                await asyncio.sleep(0.01)
+            return StreamingResponse()  # pragma: no cover
+
+        client = MagicMock()
+        client.chat_stream = endless_stream
+        loop = _loop(client=client, event_bus=bus)
+        task = Task(id="t1", description="d")
+
+        async def cancel_soon():
+            await asyncio.sleep(0.05)
+            task.cancel_requested = True
+            loop.cancel_generation(task.id)
+
+        asyncio.ensure_future(cancel_soon())
+        with pytest.raises(GenerationCancelled):
+            await loop._call_llm_cancellable(
+                task,
+                _agent(),
+                loop._call_llm_streaming("m", [], [], task, _agent()),
+            )
+
+        assert events and events[-1]["cancelled"] is True
+
+    def test_agents_have_deadlines(self):
+        """Every agent has a positive LLM deadline."""
+        assert all(a.llm_timeout > 0 for a in AGENTS.values())
+        assert AGENTS["odin"].llm_timeout > AGENTS["huginn"].llm_timeout
+
+
+# =============================================================================
+# Delegation tree propagation
+# =============================================================================
+
+
+class TestCancellationPropagation:
+    """Tests for cancelling down (and back up) the delegation tree."""
+
+    def _delegation(self):
+        scheduler = TaskScheduler(MagicMock())
+        return scheduler, DelegationManager(scheduler)
+
+    @pytest.mark.asyncio
+    async def test_child_of_cancelled_parent_starts_cancelled(self):
+        """Children delegated by a cancelled parent are cancelled too."""
+        scheduler, delegation = self._delegation()
+        parent = Task(description="p", assigned_agent="brokkr")
+        scheduler.add_task(parent)
+        parent.cancel_requested = True
+
+        child = await delegation.delegate(
+            parent, DelegationRequest("huginn", "c", {}, [], [])
+        )
+
+        assert child.cancel_requested is True
+
+    @pytest.mark.asyncio
+    async def test_cancelled_task_does_not_load_model(self):
+        """A task cancelled while queued never loads its model."""
+        scheduler, delegation = self._delegation()
+        scheduler.model_manager.ensure_loaded = AsyncMock(return_value=True)
+        parent = Task(description="p", assigned_agent="brokkr")
+        scheduler.add_task(parent)
+        child = await delegation.delegate(
+            parent, DelegationRequest("huginn", "c", {}, [], [])
+        )
+        parent.cancel_requested = child.cancel_requested = True
+
+        loop = _loop(delegation=delegation)
+        loop.scheduler = scheduler
+        result = await loop.run_task(child)
+
+        assert result.success is False
+        assert child.status == TaskStatus.CANCELLED
+        assert parent.status == TaskStatus.CANCELLED
+        scheduler.model_manager.ensure_loaded.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_child_cancel_fails_uncancelled_parent(self):
+        """A parent left waiting on a cancelled child fails instead of hanging."""
+        scheduler, delegation = self._delegation()
+        parent = Task(description="p", assigned_agent="brokkr")
+        scheduler.add_task(parent)
+        child = await delegation.delegate(
+            parent, DelegationRequest("huginn", "c", {}, [], [])
+        )
+
+        await delegation.child_cancelled(child)
+
+        assert parent.status == TaskStatus.FAILED
+        assert "cancelled" in parent.error
+
+
+# =============================================================================
+# End to end
+# =============================================================================
+
+
+class TestCancelRun:
+    """Cancelling a run against a slow fake Ollama server."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("streaming", [True, False])
+    async def test_cancel_frees_generation(self, temp_dir, streaming):
+        """Cancelling the root returns long before the generation would end."""
+        long_reply = ScriptedReply("word " * 200)  # ~10s at 50ms per token
+        with FakeOllamaServer(
+            {"Write an essay": [long_reply]}, token_latency=0.05
+        ) as server:
+            orchestrator = Orchestrator(
+                client=OllamaClient(host=server.host),
+                config=LoopConfig(streaming=streaming),
+                enable_memory=False,
+                work_dir=temp_dir,
+                database=Database(temp_dir / "cancel.db"),
+            )
+
+            async def cancel_soon():
+                await asyncio.sleep(0.5)
+                for task_id in list(orchestrator.scheduler.tasks):
+                    orchestrator.cancel_task(task_id)
+
+            start = time.monotonic()
+            asyncio.ensure_future(cancel_soon())
+            result = await orchestrator.run("Write an essay")
+            elapsed = time.monotonic() - start
+
+            if streaming:
+                # The server notices the closed stream on its next token
+                for _ in range(50):
+                    if server.stats.aborted:
+                        break
+                    await asyncio.sleep(0.05)
+                assert server.stats.aborted == 1
+
+        assert result["success"] is False
+        assert elapsed < 3.0
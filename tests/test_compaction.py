@@ -0,0 +1,144 @@
+"""Tests for rolling in-session conversation compaction."""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from sindri.core.loop import LoopConfig
+from sindri.memory.compaction import (
+    SUMMARY_PREFIX,
+    CompactionConfig,
+    ConversationCompactor,
+)
+from sindri.memory.system import MuninnMemory
+from sindri.persistence.state import Turn
+
+
+def _turns(count: int) -> list[Turn]:
+    return [
+        Turn(role="assistant" if i % 2 else "tool", content=f"turn {i}")
+        for i in range(count)
+    ]
+
+
+def _compactor(**config) -> tuple[ConversationCompactor, AsyncMock]:
+    summarizer = MagicMock()
+    summarizer.summarize_span = AsyncMock(
+        side_effect=lambda task, conv: f"summary of {conv[0]['content']}"
+    )
+    compactor = ConversationCompactor(
+        summarizer,
+        CompactionConfig(
+            **{"threshold_turns": 10, "keep_recent": 4, "span_turns": 4, **config}
+        ),
+    )
+    return compactor, summarizer.summarize_span
+
+
+# =============================================================================
+# Compactor tests
+# =============================================================================
+
+
+class TestConversationCompactor:
+    """Tests for background span summaries."""
+
+    def test_short_conversations_untouched(self):
+        """Nothing happens below the threshold."""
+        compactor, summarize = _compactor()
+        turns = _turns(10)
+
+        assert compactor.schedule("task", turns) == 0
+        assert compactor.compact(turns) == turns
+
+    @pytest.mark.asyncio
+    async def test_spans_replaced_once_summarized(self):
+        """Old spans are sent verbatim until their summaries are ready."""
+        compactor, summarize = _compactor()
+        turns = _turns(13)  # Spans 0-4 and 4-8; last 5 turns stay
+
+        assert compactor.schedule("task", turns) == 2
+        assert compactor.compact(turns) == turns  # Not ready yet
+
+        await compactor.wait()
+        compacted = compactor.compact(turns)
+
+        assert len(compacted) == 1 + 5
+        assert compacted[0].content.startswith(SUMMARY_PREFIX)
+        assert "(turns 1-8)" in compacted[0].content
+        assert "summary of turn 0" in compacted[0].content
+        assert "summary of turn 4" in compacted[0].content
+        assert compacted[1:] == turns[8:]
+        assert len(turns) == 13  # Originals untouched
+
+    @pytest.mark.asyncio
+    async def test_summaries_computed_once(self):
+        """Growing conversations reuse earlier span summaries."""
+        compactor, summarize = _compactor()
+        turns = _turns(13)
+        compactor.schedule("task", turns)
+        await compactor.wait()
+
+        turns += _turns(4)
+        assert compactor.schedule("task", turns) == 1
+        compactor.schedule("task", turns)  # Already pending
+        await compactor.wait()
+
+        assert summarize.await_count == 3
+        assert len(compactor.compact(turns)) == 1 + 5
+
+    @pytest.mark.asyncio
+    async def test_failed_summary_keeps_turns(self):
+        """Spans whose summary failed stay verbatim and aren't retried."""
+        compactor, summarize = _compactor()
+        summarize.side_effect = RuntimeError("model unavailable")
+        turns = _turns(13)
+
+        compactor.schedule("task", turns)
+        await compactor.wait()
+
+        assert compactor.compact(turns) == turns
+        assert compactor.schedule("task", turns) == 0
+
+    @pytest.mark.asyncio
+    async def test_unsummarized_span_between_summaries(self):
+        """A span without a summary splits the summary turns."""
+        compactor, summarize = _compactor()
+        summarize.side_effect = lambda task, conv: (
+            "" if conv[0]["content"] == "turn 4" else f"summary of {conv[0]['content']}"
+        )
+        turns = _turns(17)
+
+        compactor.schedule("task", turns)
+        await compactor.wait()
+        compacted = compactor.compact(turns)
+
+        assert "(turns 1-4)" in compacted[0].content
+        assert compacted[1:5] == turns[4:8]
+        assert "(turns 9-12)" in compacted[5].content
+
+    def test_loop_default(self):
+        """Agent loops compact by default."""
+        assert LoopConfig().compaction_threshold > 0
+
+
+# =============================================================================
+# Working memory tests
+# =============================================================================
+
+
+class TestFitConversation:
+    """Tests for keeping summaries when fitting working memory."""
+
+    def test_summaries_survive_trimming(self):
+        """Summary turns are kept even when older turns are dropped."""
+        memory = MuninnMemory.__new__(MuninnMemory)
+        memory._count_tokens = lambda text: len(text.split())
+        conv = [
+            {"role": "user", "content": f"{SUMMARY_PREFIX} (turns 1-8)] decided x"},
+            {"role": "assistant", "content": "old " * 20},
+            {"role": "tool", "content": "recent result"},
+        ]
+
+        fitted = memory._fit_conversation(conv, max_tokens=12)
+
+        assert fitted == [conv[0], conv[2]]
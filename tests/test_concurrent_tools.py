@@ -0,0 +1,227 @@
+"""Tests for concurrent execution of read-only tool calls."""
+
+import asyncio
+import time
+import pytest
+from unittest.mock import MagicMock
+
+from sindri.benchmark.fake_ollama import FakeOllamaServer, ScriptedReply
+from sindri.core.events import EventBus
+from sindri.core.hierarchical import HierarchicalAgentLoop
+from sindri.core.loop import LoopConfig
+from sindri.core.orchestrator import Orchestrator
+from sindri.core.tasks import Task
+from sindri.llm.client import OllamaClient
+from sindri.persistence.database import Database
+from sindri.tools.base import SideEffect, Tool, ToolResult
+from sindri.tools.registry import ToolRegistry
+
+
+class _SlowTool(Tool):
+    """Tool that sleeps and records when it ran."""
+
+    parameters = {"type": "object", "properties": {"path": {"type": "string"}}}
+    description = "test tool"
+
+    def __init__(self, name: str, side_effect: SideEffect, runs: list, delay=0.1):
+        super().__init__()
+        self.name = name
+        self.side_effect = side_effect
+        self._runs = runs
+        self._delay = delay
+
+    async def execute(self, path: str = "") -> ToolResult:
+        start = time.monotonic()
+        await asyncio.sleep(self._delay)
+        self._runs.append((self.name, path, start, time.monotonic()))
+        return ToolResult(success=True, output=f"{self.name}:{path}")
+
+
+def _registry(runs: list, delay: float = 0.1) -> ToolRegistry:
+    registry = ToolRegistry()
+    registry.register(_SlowTool("read_file", SideEffect.READ, runs, delay))
+    registry.register(_SlowTool("write_file", SideEffect.WRITE, runs, delay))
+    return registry
+
+
+def _call(name: str, path: str):
+    call = MagicMock()
+    call.function.name = name
+    call.function.arguments = {"path": path}
+    return call
+
+
+def _loop(registry: ToolRegistry, config: LoopConfig = None) -> HierarchicalAgentLoop:
+    return HierarchicalAgentLoop(
+        client=MagicMock(),
+        tools=registry,
+        state=MagicMock(),
+        scheduler=MagicMock(),
+        delegation=MagicMock(),
+        config=config or LoopConfig(),
+        event_bus=EventBus(),
+        enable_metrics=False,
+    )
+
+
+# =============================================================================
+# Side-effect declarations
+# =============================================================================
+
+
+class TestSideEffects:
+    """Tests for Tool.side_effect and its read_only view."""
+
+    def test_default_is_write(self):
+        """Tools that declare nothing are treated as writing."""
+        tool = _SlowTool("x", SideEffect.WRITE, [])
+        del tool.side_effect  # Fall back to the class default
+        assert tool.side_effect == SideEffect.WRITE
+        assert tool.read_only is False
+
+    def test_read_only_follows_side_effect(self):
+        """read_only is derived from the side-effect class."""
+        tool = _SlowTool("x", SideEffect.READ, [])
+        assert tool.read_only is True
+        tool.read_only = False
+        assert tool.side_effect == SideEffect.WRITE
+
+    def test_builtin_declarations(self):
+        """Built-in tools declare reads, writes and external effects."""
+        registry = ToolRegistry.default()
+        assert registry.side_effect("read_file") == SideEffect.READ
+        assert registry.side_effect("search_code") == SideEffect.READ
+        assert registry.side_effect("write_file") == SideEffect.WRITE
+        assert registry.side_effect("shell") == SideEffect.EXTERNAL
+        assert registry.side_effect("http_get") == SideEffect.EXTERNAL
+        assert registry.side_effect("missing") is None
+
+
+# =============================================================================
+# Batching
+# =============================================================================
+
+
+class TestReadOnlyRuns:
+    """Tests for HierarchicalAgentLoop._start_read_only_run."""
+
+    @pytest.mark.asyncio
+    async def test_run_stops_at_write(self):
+        """Only the reads before the first write are started."""
+        runs = []
+        registry = _registry(runs)
+        loop = _loop(registry)
+        calls = [
+            _call("read_file", "a"),
+            _call("read_file", "b"),
+            _call("write_file", "c"),
+            _call("read_file", "c"),
+        ]
+        started = {}
+
+        assert loop._start_read_only_run(registry, calls, 0, started) == 2
+        assert set(started) == {0, 1}
+        await asyncio.gather(*started.values())
+
+    @pytest.mark.asyncio
+    async def test_reads_overlap(self):
+        """Started reads run at the same time."""
+        runs = []
+        registry = _registry(runs, delay=0.2)
+        loop = _loop(registry)
+        calls = [_call("read_file", str(i)) for i in range(4)]
+        started = {}
+
+        start = time.monotonic()
+        loop._start_read_only_run(registry, calls, 0, started)
+        results = [await started[i] for i in range(4)]
+
+        assert time.monotonic() - start < 0.6
+        assert [r[0].output for r in results] == [f"read_file:{i}" for i in range(4)]
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self):
+        """No more than max_parallel_tools reads run at once."""
+        runs = []
+        registry = _registry(runs, delay=0.05)
+        loop = _loop(registry, LoopConfig(max_parallel_tools=2))
+        calls = [_call("read_file", str(i)) for i in range(6)]
+        started = {}
+
+        loop._start_read_only_run(registry, calls, 0, started)
+        await asyncio.gather(*started.values())
+
+        points = sorted(
+            [(s, 1) for _, _, s, _ in runs] + [(e, -1) for _, _, _, e in runs],
+            key=lambda p: (p[0], p[1]),
+        )
+        running = peak = 0
+        for _, delta in points:
+            running += delta
+            peak = max(peak, running)
+        assert peak == 2
+
+
+# =============================================================================
+# Agent loop
+# =============================================================================
+
+
+class TestConcurrentToolsInLoop:
+    """Running a mixed batch of calls through a real agent iteration."""
+
+    @pytest.mark.asyncio
+    async def test_reads_parallel_writes_ordered(self, temp_dir):
+        """Reads overlap, the write waits for them, and results keep call order."""
+        calls = [
+            {"name": "read_file", "arguments": {"path": "a"}},
+            {"name": "read_file", "arguments": {"path": "b"}},
+            {"name": "read_file", "arguments": {"path": "c"}},
+            {"name": "write_file", "arguments": {"path": "d"}},
+            {"name": "read_file", "arguments": {"path": "d"}},
+        ]
+        scripts = {
+            "Inspect the files": [
+                ScriptedReply("Looking.", calls),
+                ScriptedReply("Done. <sindri:complete/>"),
+            ]
+        }
+        runs = []
+        with FakeOllamaServer(scripts) as server:
+            orchestrator = Orchestrator(
+                client=OllamaClient(host=server.host),
+                config=LoopConfig(streaming=False),
+                enable_memory=False,
+                work_dir=temp_dir,
+                database=Database(temp_dir / "tools.db"),
+            )
+            orchestrator.loop.tools = _registry(runs, delay=0.2)
+            task = Task(description="Inspect the files", assigned_agent="huginn")
+            orchestrator.scheduler.add_task(task)
+
+            start = time.monotonic()
+            await orchestrator.loop.run_task(task)
+            elapsed = time.monotonic() - start
+
+            session = await orchestrator.state.load_session(task.session_id)
+
+        by_path = {(name, path): (s, e) for name, path, s, e in runs}
+        reads_end = max(by_path[("read_file", p)][1] for p in "abc")
+        write_start, write_end = by_path[("write_file", "d")]
+        assert write_start >= reads_end
+        assert by_path[("read_file", "d")][0] >= write_end
+        # Three overlapping reads + write + read, rather than five in a row
+        assert elapsed < 0.95
+
+        tool_turn = next(t for t in session.turns if t.role == "tool")
+        order = [
+            tool_turn.content.index(f"'{name}:{path}'")
+            for name, path in [
+                ("read_file", "a"),
+                ("read_file", "b"),
+                ("read_file", "c"),
+                ("write_file", "d"),
+                ("read_file", "d"),
+            ]
+        ]
+        assert order == sorted(order)
@@ -0,0 +1,211 @@
+"""Tests for pooled SQLite connections and one-time schema setup."""
+
+import asyncio
+import threading
+import pytest
+from unittest.mock import patch
+
+from sindri.persistence import pool as pool_module
+from sindri.persistence.database import Database
+from sindri.persistence.pool import get_pool
+from sindri.persistence.state import SessionState
+
+
+# =============================================================================
+# Pool tests
+# =============================================================================
+
+
+class TestConnectionPool:
+    """Tests for the shared writer and reader connections."""
+
+    @pytest.mark.asyncio
+    async def test_connections_are_reused(self, temp_dir):
+        """Every Database on a file shares the same writer connection."""
+        first, second = Database(temp_dir / "a.db"), Database(temp_dir / "a.db")
+
+        async with first.get_connection() as conn_a:
+            pass
+        async with second.get_connection() as conn_b:
+            pass
+
+        assert conn_a is conn_b
+
+    @pytest.mark.asyncio
+    async def test_wal_and_pragmas(self, temp_dir):
+        """Pooled connections use WAL and a busy timeout."""
+        db = Database(temp_dir / "a.db")
+        async with db.get_connection() as conn:
+            async with conn.execute("PRAGMA journal_mode") as cursor:
+                assert (await cursor.fetchone())[0] == "wal"
+            async with conn.execute("PRAGMA busy_timeout") as cursor:
+                assert (await cursor.fetchone())[0] == 5000
+
+    @pytest.mark.asyncio
+    async def test_readers_are_read_only(self, temp_dir):
+        """Read-only connections refuse writes."""
+        db = Database(temp_dir / "a.db")
+        await db.initialize()
+
+        async with db.get_connection(read_only=True) as conn:
+            with pytest.raises(Exception):
+                await conn.execute("DELETE FROM sessions")
+
+    @pytest.mark.asyncio
+    async def test_readers_run_alongside_writer(self, temp_dir):
+        """A reader sees committed data while the writer is held."""
+        db = Database(temp_dir / "a.db")
+        state = SessionState(db)
+        await db.initialize()
+        session = await state.create_session("task", "m")
+
+        async with db.get_connection() as writer:
+            await writer.execute("UPDATE sessions SET status = 'busy'")
+            # Not committed: readers still see the last committed state
+            loaded = await asyncio.wait_for(state.load_session(session.id), 2)
+            await writer.commit()
+
+        assert loaded.status == "active"
+
+    @pytest.mark.asyncio
+    async def test_writer_is_reentrant(self, temp_dir):
+        """A task holding the writer can ask for it again."""
+        db = Database(temp_dir / "a.db")
+
+        async with db.get_connection() as outer:
+            async with db.get_connection() as inner:
+                assert inner is outer
+
+    @pytest.mark.asyncio
+    async def test_writer_shared_with_gathered_tasks(self, temp_dir):
+        """Tasks gathered by the holder share the writer instead of deadlocking."""
+        db = Database(temp_dir / "a.db")
+        db.write_behind("sessions", "SELECT 1", ())
+
+        async def use():
+            async with db.get_connection() as conn:
+                return conn
+
+        async with db.get_connection() as outer:
+            inner = await asyncio.wait_for(asyncio.gather(use(), use()), 2)
+
+        assert inner == [outer, outer]
+
+    @pytest.mark.asyncio
+    async def test_task_outliving_hold_waits(self, temp_dir):
+        """A task started under a hold queues for the writer once it ends."""
+        db = Database(temp_dir / "a.db")
+        released = asyncio.Event()
+        order = []
+
+        async def later():
+            await released.wait()
+            async with db.get_connection():
+                order.append("later")
+
+        async with db.get_connection():
+            task = asyncio.create_task(later())
+        async with db.get_connection():
+            released.set()
+            await asyncio.sleep(0.05)
+            order.append("holder")
+        await asyncio.wait_for(task, 2)
+
+        assert order == ["holder", "later"]
+
+    @pytest.mark.asyncio
+    async def test_stop_ends_connection_threads(self, temp_dir):
+        """Stopping a pool (as done at exit) lets its worker threads finish."""
+        before = set(threading.enumerate())
+        db = Database(temp_dir / "a.db")
+        async with db.get_connection():
+            pass
+        async with db.get_connection(read_only=True):
+            pass
+        workers = [
+            t
+            for t in set(threading.enumerate()) - before
+            if "_connection_worker_thread" in t.name
+        ]
+        assert len(workers) == 2
+
+        get_pool(db.db_path).stop()
+
+        for thread in workers:
+            await asyncio.to_thread(thread.join, 2)
+        assert not any(t.is_alive() for t in workers)
+
+    @pytest.mark.asyncio
+    async def test_writer_serializes_tasks(self, temp_dir):
+        """Other tasks wait for the writer."""
+        db = Database(temp_dir / "a.db")
+        order = []
+
+        async def hold(name):
+            async with db.get_connection():
+                order.append(f"{name} in")
+                await asyncio.sleep(0.05)
+                order.append(f"{name} out")
+
+        await asyncio.gather(hold("a"), hold("b"))
+
+        assert order == ["a in", "a out", "b in", "b out"]
+
+    @pytest.mark.asyncio
+    async def test_uncommitted_work_rolled_back(self, temp_dir):
+        """Releasing a connection discards an open transaction."""
+        db = Database(temp_dir / "a.db")
+        state = SessionState(db)
+        await db.initialize()
+        session = await state.create_session("task", "m")
+
+        async with db.get_connection() as conn:
+            await conn.execute("UPDATE sessions SET status = 'lost'")
+
+        assert (await state.load_session(session.id)).status == "active"
+
+    @pytest.mark.asyncio
+    async def test_replaced_file_gets_new_pool(self, temp_dir):
+        """Deleting the file drops the pool and its schema memo."""
+        db = Database(temp_dir / "a.db")
+        await db.initialize()
+        old_pool = get_pool(db.db_path)
+
+        db.db_path.unlink()
+        await db.initialize()
+
+        assert get_pool(db.db_path) is not old_pool
+        assert db.db_path.exists()
+
+
+# =============================================================================
+# Schema memoization tests
+# =============================================================================
+
+
+class TestSchemaMemo:
+    """Tests for running schema setup once per file."""
+
+    @pytest.mark.asyncio
+    async def test_initialize_runs_once(self, temp_dir):
+        """Later initialize() calls skip the DDL."""
+        db = Database(temp_dir / "a.db")
+        await db.initialize()
+
+        with patch.object(pool_module.ConnectionPool, "writer") as writer:
+            await Database(temp_dir / "a.db").initialize()
+
+        writer.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_store_tables_once(self, temp_dir):
+        """Collaboration stores create their tables once."""
+        from sindri.collaboration.users import UserStore
+
+        store = UserStore(Database(temp_dir / "a.db"))
+        await store.create_user("ann", "ann@example.com", "Ann")
+
+        assert store.db.is_schema_ready("users")
+        with patch.object(store.db, "initialize") as initialize:
+            await store.get_user_by_username("ann")
+        initialize.assert_not_called()
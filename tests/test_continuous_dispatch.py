@@ -0,0 +1,160 @@
+"""Tests for event-driven continuous task dispatch."""
+
+import asyncio
+import time
+import pytest
+from unittest.mock import patch
+
+from sindri.core.loop import LoopResult
+from sindri.core.orchestrator import Orchestrator
+from sindri.core.scheduler import TaskScheduler
+from sindri.core.tasks import Task, TaskStatus
+from sindri.llm.manager import ModelManager
+
+
+class _TimedLoop:
+    """Stands in for HierarchicalAgentLoop; each task sleeps a set time."""
+
+    def __init__(self, scheduler: TaskScheduler, on_root=None):
+        self.scheduler = scheduler
+        self.on_root = on_root
+        self.durations: dict[str, float] = {}
+        self.started: dict[str, float] = {}
+        self.t0 = time.monotonic()
+
+    async def run_task(self, task: Task) -> LoopResult:
+        self.started[task.id] = time.monotonic() - self.t0
+        task.status = TaskStatus.RUNNING
+        if task.parent_id is None and task.assigned_agent == "brokkr":
+            if self.on_root:
+                self.on_root(task)
+            if task.status == TaskStatus.WAITING:
+                return LoopResult(success=False, iterations=1, reason="waiting")
+        await asyncio.sleep(self.durations.get(task.id, 0.0))
+        task.status = TaskStatus.COMPLETE
+        return LoopResult(success=True, iterations=1)
+
+    def cancel_generation(self, task_id: str):
+        pass
+
+
+def _orchestrator() -> Orchestrator:
+    with patch("sindri.core.orchestrator.OllamaClient"):
+        return Orchestrator(enable_memory=False)
+
+
+# =============================================================================
+# Scheduler tests
+# =============================================================================
+
+
+class TestSchedulerWakeups:
+    """Tests for scheduler listeners and running-task awareness."""
+
+    @pytest.fixture
+    def scheduler(self):
+        return TaskScheduler(ModelManager(total_vram_gb=16.0, reserve_gb=2.0))
+
+    def test_listeners_called_on_add_and_requeue(self, scheduler):
+        """Adding or re-queueing a task wakes listeners."""
+        calls = []
+        scheduler.add_listener(lambda: calls.append(1))
+        task = Task(id="t1", description="t", assigned_agent="huginn")
+
+        scheduler.add_task(task)
+        task.status = TaskStatus.WAITING
+        scheduler.requeue(task)
+
+        assert len(calls) == 2
+        assert task.status == TaskStatus.PENDING
+        assert scheduler.get_ready_batch() == [task]
+
+    def test_running_tasks_use_budget(self, scheduler):
+        """VRAM held by running tasks isn't handed out again."""
+        running = Task(id="r", description="r", model_name="big", vram_required=10.0)
+        scheduler.add_task(Task(id="other", description="o", assigned_agent="huginn"))
+
+        assert scheduler.get_ready_batch(max_vram=14.0, running=[running]) == []
+        assert len(scheduler.get_ready_batch(max_vram=16.0, running=[running])) == 1
+
+    def test_children_wait_for_running_parent(self, scheduler):
+        """A child isn't started while its parent's run is still ending."""
+        parent = Task(id="p", description="p", assigned_agent="huginn")
+        child = Task(id="c", description="c", assigned_agent="huginn", parent_id="p")
+        scheduler.add_task(child)
+
+        assert scheduler.get_ready_batch(running=[parent]) == []
+        assert scheduler.get_ready_batch() == [child]
+
+
+# =============================================================================
+# Orchestrator tests
+# =============================================================================
+
+
+class TestContinuousDispatch:
+    """Tests for Orchestrator._run_parallel."""
+
+    @pytest.mark.asyncio
+    async def test_no_barrier_behind_slow_task(self):
+        """A follow-up task starts when its dependency ends, not the batch."""
+        orchestrator = _orchestrator()
+        scheduler = orchestrator.scheduler
+
+        def add_work(root):
+            for task in (
+                Task(id="slow", description="s", assigned_agent="huginn"),
+                Task(id="fast", description="f", assigned_agent="huginn"),
+                Task(
+                    id="next",
+                    description="n",
+                    assigned_agent="huginn",
+                    depends_on=["fast"],
+                ),
+            ):
+                scheduler.add_task(task)
+
+        loop = _TimedLoop(scheduler, on_root=add_work)
+        loop.durations = {"slow": 0.5, "fast": 0.05}
+        orchestrator.loop = loop
+
+        result = await orchestrator.run("root")
+
+        assert result["success"] is True
+        assert loop.started["next"] < 0.3
+        assert loop.started["slow"] < 0.1
+
+    @pytest.mark.asyncio
+    async def test_waiting_woken_by_cancel(self):
+        """With only waiting tasks, cancelling wakes the dispatcher."""
+        orchestrator = _orchestrator()
+
+        def wait_forever(root):
+            root.status = TaskStatus.WAITING
+
+        orchestrator.loop = _TimedLoop(orchestrator.scheduler, on_root=wait_forever)
+
+        async def cancel_soon():
+            await asyncio.sleep(0.05)
+            for task_id in list(orchestrator.scheduler.tasks):
+                orchestrator.cancel_task(task_id)
+
+        asyncio.ensure_future(cancel_soon())
+        result = await asyncio.wait_for(orchestrator.run("root"), 2)
+
+        assert result["error"] == "Task cancelled by user"
+
+    @pytest.mark.asyncio
+    async def test_exception_fails_task(self):
+        """A task whose run raises is failed without stopping others."""
+        orchestrator = _orchestrator()
+
+        async def boom(task):
+            raise RuntimeError("boom")
+
+        orchestrator.loop.run_task = boom
+
+        result = await orchestrator.run("root")
+
+        assert result["success"] is False
+        assert result["error"] == "boom"
@@ -0,0 +1,191 @@
+"""Tests for running CPU-bound tools in the shared process pool."""
+
+import asyncio
+import os
+import time
+import pytest
+
+from sindri.tools.base import Tool, ToolResult
+from sindri.tools.offload import run_cpu_bound, run_tool, shutdown_cpu_pool
+from sindri.tools.registry import ToolRegistry
+from sindri.tools.search import FindSymbolTool
+
+
+@pytest.fixture(autouse=True, scope="module")
+def cpu_pool():
+    """Share one pool across the module; workers are slow to spawn."""
+    yield
+    shutdown_cpu_pool()
+
+
+class PidTool(Tool):
+    """Reports the process it ran in."""
+
+    name = "pid"
+    description = "pid"
+    parameters = {"type": "object", "properties": {}}
+    cpu_bound = True
+
+    async def execute(self, **kwargs) -> ToolResult:
+        return ToolResult(success=True, output=str(os.getpid()))
+
+
+class UnpicklableTool(PidTool):
+    """Holds a lambda, so it can't be sent to a worker process."""
+
+    name = "unpicklable"
+
+    def __init__(self):
+        super().__init__()
+        self.callback = lambda: None
+
+
+# =============================================================================
+# Pool tests
+# =============================================================================
+
+
+class TestRunCpuBound:
+    """Tests for run_cpu_bound."""
+
+    @pytest.mark.asyncio
+    async def test_returns_result(self):
+        """The function's return value comes back from the worker."""
+        assert await run_cpu_bound(pow, 2, 10) == 1024
+
+    @pytest.mark.asyncio
+    async def test_reraises_exceptions(self):
+        """Exceptions raised in the worker are raised to the caller."""
+        with pytest.raises(ValueError):
+            await run_cpu_bound(int, "not a number")
+
+    @pytest.mark.asyncio
+    async def test_event_loop_stays_responsive(self):
+        """Other coroutines keep running while a worker is busy."""
+        await run_cpu_bound(pow, 1, 1)  # Start the workers first
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        ticker = asyncio.ensure_future(tick())
+        await run_cpu_bound(time.sleep, 0.3)
+        ticker.cancel()
+
+        assert ticks >= 10
+
+    @pytest.mark.asyncio
+    async def test_concurrency_limit(self):
+        """Calls over a name's limit wait for a free slot."""
+        await run_cpu_bound(pow, 1, 1)
+        started = time.monotonic()
+
+        await asyncio.gather(
+            *(
+                run_cpu_bound(time.sleep, 0.2, name="nap", max_concurrency=1)
+                for _ in range(2)
+            )
+        )
+
+        assert time.monotonic() - started >= 0.4
+
+    @pytest.mark.asyncio
+    async def test_cancel_running_call(self):
+        """Cancelling returns at once; the slot frees when the worker ends."""
+        await run_cpu_bound(pow, 1, 1)
+        running = asyncio.ensure_future(
+            run_cpu_bound(time.sleep, 0.4, name="slow", max_concurrency=1)
+        )
+        await asyncio.sleep(0.1)
+
+        started = time.monotonic()
+        running.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await running
+        assert time.monotonic() - started < 0.1
+
+        # The abandoned call still holds the only slot until it finishes
+        await run_cpu_bound(pow, 1, 1, name="slow", max_concurrency=1)
+        assert time.monotonic() - started >= 0.2
+
+    @pytest.mark.asyncio
+    async def test_cancel_waiting_call(self):
+        """A call still waiting for a slot never runs."""
+        first = asyncio.ensure_future(
+            run_cpu_bound(time.sleep, 0.2, name="queue", max_concurrency=1)
+        )
+        second = asyncio.ensure_future(
+            run_cpu_bound(pow, 2, 2, name="queue", max_concurrency=1)
+        )
+        await asyncio.sleep(0.05)
+
+        second.cancel()
+        await first
+
+        assert second.cancelled()
+
+
+# =============================================================================
+# Registry tests
+# =============================================================================
+
+
+class TestCpuBoundTools:
+    """Tests for tools declared cpu_bound."""
+
+    @pytest.mark.asyncio
+    async def test_runs_in_worker_process(self):
+        """A cpu_bound tool's execute() runs outside this process."""
+        registry = ToolRegistry()
+        registry.register(PidTool())
+
+        result = await registry.execute("pid", {})
+
+        assert result.success
+        assert int(result.output) != os.getpid()
+
+    @pytest.mark.asyncio
+    async def test_unpicklable_tool_runs_in_thread(self):
+        """Tools that can't be pickled still run off the event loop."""
+        registry = ToolRegistry()
+        registry.register(UnpicklableTool())
+
+        result = await registry.execute("unpicklable", {})
+
+        assert result.success
+        assert int(result.output) == os.getpid()
+
+    @pytest.mark.asyncio
+    async def test_thread_fallback_respects_limit(self):
+        """Unpicklable tools queue for the tool's concurrency slots too."""
+
+        class SlowTool(UnpicklableTool):
+            name = "slow_unpicklable"
+            max_concurrency = 1
+
+            async def execute(self, **kwargs) -> ToolResult:
+                time.sleep(0.2)
+                return ToolResult(success=True, output="done")
+
+        tool = SlowTool()
+        started = time.monotonic()
+
+        await asyncio.gather(*(run_tool(tool, {}) for _ in range(2)))
+
+        assert time.monotonic() - started >= 0.4
+
+    @pytest.mark.asyncio
+    async def test_worker_uses_callers_directory(self, temp_dir, monkeypatch):
+        """Relative paths resolve against the caller's working directory."""
+        (temp_dir / "app.py").write_text("def handler():\n    pass\n")
+        monkeypatch.chdir(temp_dir)
+        registry = ToolRegistry()
+        registry.register(FindSymbolTool())
+
+        result = await registry.execute("find_symbol", {"name": "handler"})
+
+        assert result.success
+        assert "app.py" in result.output
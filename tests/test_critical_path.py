@@ -0,0 +1,195 @@
+"""Tests for critical-path task ranking from historical durations."""
+
+import pytest
+
+from sindri.core.estimates import DEFAULT_TASK_SECONDS, DurationEstimator
+from sindri.core.scheduler import TaskScheduler
+from sindri.core.tasks import Task, TaskStatus
+from sindri.llm.manager import ModelManager
+from sindri.persistence.database import Database
+from sindri.persistence.metrics import MetricsStore, SessionMetrics, TaskMetrics
+from sindri.tui.widgets.task_tree import estimate_suffix, format_estimate
+
+
+def _metrics(agent: str, model: str, seconds: float, status="completed"):
+    return TaskMetrics(
+        task_id=f"{agent}-{seconds}",
+        task_description="t",
+        agent_name=agent,
+        model_name=model,
+        start_time=100.0,
+        end_time=100.0 + seconds,
+        status=status,
+    )
+
+
+class _FixedEstimator(DurationEstimator):
+    """Estimates taken from the task description, e.g. "30"."""
+
+    def estimate(self, task: Task) -> float:
+        return float(task.description)
+
+
+@pytest.fixture
+def scheduler():
+    return TaskScheduler(
+        ModelManager(total_vram_gb=16.0, reserve_gb=2.0),
+        estimator=_FixedEstimator(),
+    )
+
+
+# =============================================================================
+# Estimator tests
+# =============================================================================
+
+
+class TestDurationEstimator:
+    """Tests for duration lookup and fallbacks."""
+
+    def test_median_by_agent_and_model(self):
+        """The (agent, model) median wins over broader history."""
+        estimator = DurationEstimator.from_history(
+            [
+                _metrics("huginn", "a", 10),
+                _metrics("huginn", "a", 30),
+                _metrics("huginn", "a", 20),
+                _metrics("huginn", "b", 100),
+            ]
+        )
+        task = Task(assigned_agent="huginn", model_name="a")
+
+        assert estimator.estimate(task) == 20
+
+    def test_fallbacks(self):
+        """Unknown models fall back to the agent, then all tasks, then default."""
+        estimator = DurationEstimator.from_history(
+            [_metrics("huginn", "a", 10), _metrics("mimir", "b", 50)]
+        )
+
+        assert estimator.estimate(Task(assigned_agent="huginn", model_name="x")) == 10
+        assert estimator.estimate(Task(assigned_agent="ratatoskr")) == 30
+        assert DurationEstimator().estimate(Task()) == DEFAULT_TASK_SECONDS
+
+    @pytest.mark.asyncio
+    async def test_loaded_from_metrics_store(self, temp_dir):
+        """Finished tasks in saved sessions feed the estimates."""
+        store = MetricsStore(Database(temp_dir / "m.db"))
+        metrics = SessionMetrics(
+            session_id="s1", task_description="t", model_name="a", start_time=0.0
+        )
+        metrics.tasks = [
+            _metrics("huginn", "a", 40),
+            _metrics("huginn", "a", 999, status="incomplete"),
+        ]
+        await store.save_metrics(metrics)
+
+        estimator = await DurationEstimator.load(store)
+
+        assert estimator.by_agent_model == {("huginn", "a"): 40}
+
+
+# =============================================================================
+# Ranking tests
+# =============================================================================
+
+
+class TestCriticalPathRanking:
+    """Tests for upward ranks and the ready order."""
+
+    def test_rank_is_longest_chain(self, scheduler):
+        """A task's rank includes the longest chain waiting on it."""
+        scheduler.add_task(Task(id="a", description="10", assigned_agent="huginn"))
+        scheduler.add_task(
+            Task(id="b", description="20", assigned_agent="huginn", depends_on=["a"])
+        )
+        scheduler.add_task(
+            Task(id="c", description="5", assigned_agent="huginn", depends_on=["a"])
+        )
+
+        assert scheduler.tasks["b"].critical_path == 20
+        assert scheduler.tasks["a"].critical_path == 30
+
+    def test_parent_counts_as_successor(self, scheduler):
+        """Subtasks rank above their waiting parent."""
+        parent = Task(id="p", description="15", assigned_agent="brokkr")
+        scheduler.add_task(parent)
+        parent.add_subtask("c")
+        scheduler.add_task(
+            Task(id="c", description="10", assigned_agent="huginn", parent_id="p")
+        )
+
+        assert scheduler.tasks["c"].critical_path == 25
+
+    def test_long_chain_starts_before_short_leaves(self, scheduler):
+        """Ready order follows rank, not insertion or depth priority."""
+        for i in range(3):
+            scheduler.add_task(
+                Task(id=f"leaf{i}", description="30", assigned_agent="huginn")
+            )
+        scheduler.add_task(
+            Task(id="head", description="10", assigned_agent="huginn", priority=5)
+        )
+        scheduler.add_task(
+            Task(
+                id="tail",
+                description="60",
+                assigned_agent="huginn",
+                depends_on=["head"],
+            )
+        )
+
+        assert scheduler.get_next_task().id == "head"
+
+    def test_queued_task_reordered_when_dependent_added(self, scheduler):
+        """A ready task moves up once a long task is added behind it."""
+        scheduler.add_task(Task(id="x", description="30", assigned_agent="huginn"))
+        scheduler.add_task(Task(id="y", description="20", assigned_agent="huginn"))
+        scheduler.add_task(
+            Task(id="z", description="50", assigned_agent="huginn", depends_on=["y"])
+        )
+
+        order = [scheduler.get_next_task().id for _ in range(2)]
+
+        assert order == ["y", "x"]
+
+    def test_cycle_does_not_hang(self, scheduler):
+        """Tasks on a dependency cycle keep a finite rank."""
+        scheduler.add_task(
+            Task(id="a", description="1", assigned_agent="huginn", depends_on=["b"])
+        )
+        scheduler.add_task(
+            Task(id="b", description="1", assigned_agent="huginn", depends_on=["a"])
+        )
+
+        assert scheduler.tasks["a"].status == TaskStatus.PENDING
+
+    def test_without_estimator_priority_decides(self):
+        """With no estimator every rank is zero and priority orders tasks."""
+        scheduler = TaskScheduler(ModelManager(total_vram_gb=16.0))
+        scheduler.add_task(Task(id="low", assigned_agent="huginn", priority=3))
+        scheduler.add_task(Task(id="high", assigned_agent="huginn", priority=1))
+
+        assert scheduler.tasks["low"].critical_path == 0.0
+        assert scheduler.get_next_task().id == "high"
+
+
+# =============================================================================
+# Display tests
+# =============================================================================
+
+
+class TestEstimateLabels:
+    """Tests for estimate labels in the task tree."""
+
+    def test_format_estimate(self):
+        """Durations are shown in the largest sensible unit."""
+        assert format_estimate(None) == ""
+        assert format_estimate(42) == "~42s"
+        assert format_estimate(180) == "~3m"
+        assert format_estimate(5400) == "~1.5h"
+
+    def test_suffix_shows_path_when_longer(self):
+        """The critical path is shown only when it adds information."""
+        assert estimate_suffix(30, 30) == " [dim](~30s)[/dim]"
+        assert estimate_suffix(30, 300) == " [dim](~30s, path ~5m)[/dim]"
+        assert estimate_suffix(None, None) == ""
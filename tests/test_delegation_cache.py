@@ -0,0 +1,253 @@
+"""Tests for the delegation result cache."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from sindri.core.delegation import DelegationManager, DelegationRequest
+from sindri.core.scheduler import TaskScheduler
+from sindri.core.tasks import Task, TaskStatus
+from sindri.llm.manager import ModelManager
+from sindri.tools.delegation import DelegateTool
+from sindri.tools.registry import ToolRegistry
+
+
+@pytest.fixture
+def scheduler():
+    return TaskScheduler(ModelManager(total_vram_gb=16.0, reserve_gb=2.0))
+
+
+@pytest.fixture
+def manager(scheduler):
+    return DelegationManager(scheduler)
+
+
+@pytest.fixture
+def parent(scheduler):
+    task = Task(id="parent", description="Parent task", assigned_agent="brokkr")
+    scheduler.add_task(task)
+    task.status = TaskStatus.RUNNING
+    return task
+
+
+def _request(description="Write the parser", **kwargs) -> DelegationRequest:
+    kwargs.setdefault("context", {"language": "python"})
+    return DelegationRequest(
+        target_agent="huginn",
+        task_description=description,
+        constraints=kwargs.pop("constraints", []),
+        success_criteria=kwargs.pop("success_criteria", []),
+        **kwargs,
+    )
+
+
+def _usage(*paths, untracked=()):
+    """Stands in for a task's ToolRegistry after its run."""
+    return SimpleNamespace(
+        touched_paths={str(p) for p in paths},
+        untracked_effects=list(untracked),
+        read_generations={},
+    )
+
+
+async def _finish(manager: DelegationManager, child: Task, usage=None):
+    """Complete a child as the agent loop would."""
+    child.status = TaskStatus.RUNNING
+    manager.record_tool_usage(child, usage or _usage())
+    child.status = TaskStatus.COMPLETE
+    child.result = {"output": f"done by {child.id}"}
+    await manager.child_completed(child)
+
+
+# =============================================================================
+# Cache hits and misses
+# =============================================================================
+
+
+class TestDelegationCache:
+    """Repeated delegations reuse results while their files are unchanged."""
+
+    @pytest.mark.asyncio
+    async def test_repeat_delegation_reuses_result(self, manager, parent, temp_dir):
+        source = temp_dir / "parser.py"
+        source.write_text("def parse(): ...\n")
+        first = await manager.delegate(parent, _request())
+        await _finish(manager, first, _usage(source))
+        parent.status = TaskStatus.RUNNING
+
+        again = await manager.delegate(parent, _request("  write THE parser "))
+
+        assert again.status == TaskStatus.COMPLETE
+        assert again.result == {"output": f"done by {first.id}"}
+        assert again.context["cached_from"] == first.id
+        assert again.id in parent.subtask_ids
+        # Nothing to wait for
+        assert parent.status == TaskStatus.RUNNING
+        assert manager.get_cache_stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_different_context_misses(self, manager, parent):
+        first = await manager.delegate(parent, _request())
+        await _finish(manager, first)
+
+        other = await manager.delegate(parent, _request(context={"language": "go"}))
+
+        assert other.status == TaskStatus.PENDING
+        assert manager.get_cache_stats()["hits"] == 0
+
+    @pytest.mark.asyncio
+    async def test_changed_file_invalidates(self, manager, parent, temp_dir):
+        source = temp_dir / "parser.py"
+        source.write_text("v1\n")
+        first = await manager.delegate(parent, _request())
+        await _finish(manager, first, _usage(source))
+
+        source.write_text("version two\n")
+        again = await manager.delegate(parent, _request())
+
+        assert again.status == TaskStatus.PENDING
+        assert manager.get_cache_stats()["entries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_fresh_request_reruns_and_refreshes(self, manager, parent):
+        first = await manager.delegate(parent, _request())
+        await _finish(manager, first)
+
+        rerun = await manager.delegate(parent, _request(use_cache=False))
+        assert rerun.status == TaskStatus.PENDING
+        await _finish(manager, rerun)
+
+        again = await manager.delegate(parent, _request())
+        assert again.context["cached_from"] == rerun.id
+
+    @pytest.mark.asyncio
+    async def test_unstamped_side_effects_not_cached(self, manager, parent):
+        first = await manager.delegate(parent, _request())
+        await _finish(manager, first, _usage(untracked=["shell"]))
+
+        again = await manager.delegate(parent, _request())
+
+        assert again.status == TaskStatus.PENDING
+
+    @pytest.mark.asyncio
+    async def test_failed_child_not_cached(self, manager, parent):
+        first = await manager.delegate(parent, _request())
+        first.status = TaskStatus.FAILED
+        await manager.child_failed(first)
+
+        assert manager.get_cache_stats()["entries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_grandchild_files_guard_child_result(
+        self, manager, scheduler, parent, temp_dir
+    ):
+        source = temp_dir / "lib.py"
+        source.write_text("v1\n")
+        planner = await manager.delegate(
+            parent,
+            DelegationRequest("odin", "Plan the parser", {}, [], []),
+        )
+        planner.status = TaskStatus.RUNNING
+        worker = await manager.delegate(planner, _request())
+        await _finish(manager, worker, _usage(source))
+        await _finish(manager, planner, _usage(untracked=["delegate"]))
+        parent.status = TaskStatus.RUNNING
+
+        source.write_text("changed\n")
+        again = await manager.delegate(
+            parent, DelegationRequest("odin", "Plan the parser", {}, [], [])
+        )
+
+        assert again.status == TaskStatus.PENDING
+
+    @pytest.mark.asyncio
+    async def test_disabled(self, scheduler, parent):
+        manager = DelegationManager(scheduler, cache_results=False)
+        first = await manager.delegate(parent, _request())
+        await _finish(manager, first)
+
+        again = await manager.delegate(parent, _request())
+
+        assert again.status == TaskStatus.PENDING
+        assert manager.get_cache_stats()["misses"] == 0
+
+
+# =============================================================================
+# Tool integration
+# =============================================================================
+
+
+class TestDelegateToolCache:
+    """The delegate tool answers cache hits without pausing the parent."""
+
+    @pytest.mark.asyncio
+    async def test_hit_returns_result_inline(self, manager, parent):
+        first = await manager.delegate(parent, _request())
+        await _finish(manager, first)
+        tool = DelegateTool(manager, parent)
+
+        result = await tool.execute(
+            agent="huginn", task="Write the parser", context={"language": "python"}
+        )
+
+        assert result.success
+        assert result.metadata["cached"] is True
+        assert f"done by {first.id}" in result.output
+
+    @pytest.mark.asyncio
+    async def test_registry_records_touched_paths(self, temp_dir):
+        (temp_dir / "a.txt").write_text("hello")
+        registry = ToolRegistry.default(work_dir=temp_dir)
+
+        await registry.execute("read_file", {"path": "a.txt"})
+        await registry.execute("shell", {"command": "true"})
+
+        assert registry.touched_paths == {str((temp_dir / "a.txt").resolve())}
+        assert registry.untracked_effects == ["shell"]
+
+    @pytest.mark.asyncio
+    async def test_search_child_invalidated_by_edit_under_searched_dir(
+        self, manager, parent, temp_dir
+    ):
+        src = temp_dir / "src"
+        src.mkdir()
+        (src / "a.py").write_text("def parse(): ...\n")
+        searcher = ToolRegistry.default(work_dir=temp_dir)
+        first = await manager.delegate(parent, _request())
+        await searcher.execute("search_code", {"query": "parse", "path": "src"})
+        await _finish(manager, first, searcher)
+        parent.status = TaskStatus.RUNNING
+
+        # A sibling rewrites a file inside the searched directory
+        sibling = ToolRegistry.default(work_dir=temp_dir)
+        await sibling.execute(
+            "write_file", {"path": "src/a.py", "content": "def parse(x): ...\n"}
+        )
+        again = await manager.delegate(parent, _request())
+
+        assert again.status == TaskStatus.PENDING
+        assert manager.get_cache_stats()["entries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_search_child_reused_without_edits(self, manager, parent, temp_dir):
+        (temp_dir / "a.py").write_text("def parse(): ...\n")
+        searcher = ToolRegistry.default(work_dir=temp_dir)
+        first = await manager.delegate(parent, _request())
+        await searcher.execute("search_code", {"query": "parse"})
+        await _finish(manager, first, searcher)
+        parent.status = TaskStatus.RUNNING
+
+        again = await manager.delegate(parent, _request())
+
+        assert again.status == TaskStatus.COMPLETE
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("arguments", ["null", "[1]", "3"])
+    async def test_non_object_arguments_rejected(self, temp_dir, arguments):
+        registry = ToolRegistry.default(work_dir=temp_dir)
+
+        result = await registry.execute("read_file", arguments)
+
+        assert not result.success
+        assert "expected a JSON object" in result.error
+        assert registry.touched_paths == set()
@@ -0,0 +1,471 @@
+"""Tests for distributed execution: the lease queue, workers and coordinator."""
+
+import asyncio
+import multiprocessing
+import os
+import sqlite3
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from sindri.core.delegation import DelegationManager, DelegationRequest
+from sindri.core.events import Event, EventBus, EventType
+from sindri.core.loop import LoopResult
+from sindri.core.orchestrator import Orchestrator
+from sindri.core.scheduler import TaskScheduler
+from sindri.core.tasks import Task, TaskStatus
+from sindri.distributed import SQLiteTaskQueue, Worker
+from sindri.distributed.queue import DONE, LEASED
+from sindri.llm.manager import ModelManager
+from sindri.persistence.database import Database
+
+
+class _FakeLoop:
+    """Stands in for HierarchicalAgentLoop on a worker.
+
+    A Brokkr task delegates ``fan_out`` Huginn children on its first run
+    and completes when resumed; other tasks sleep ``delay`` seconds and
+    complete with the worker's pid as output.
+    """
+
+    def __init__(self, fan_out: int = 0, delay: float = 0.0):
+        self.event_bus = EventBus()
+        self.scheduler = TaskScheduler(ModelManager(total_vram_gb=16.0))
+        self.delegation = DelegationManager(self.scheduler)
+        self.fan_out = fan_out
+        self.delay = delay
+        self.cancelled: list[str] = []
+
+    def cancel_generation(self, task_id: str):
+        self.cancelled.append(task_id)
+
+    async def run_task(self, task: Task) -> LoopResult:
+        task.status = TaskStatus.RUNNING
+        self.event_bus.emit(
+            Event(
+                type=EventType.AGENT_OUTPUT,
+                data={"task_id": task.id, "text": f"working on {task.id}"},
+            )
+        )
+        if task.assigned_agent == "brokkr" and not task.subtask_ids and self.fan_out:
+            for i in range(self.fan_out):
+                request = DelegationRequest("huginn", f"part {i}", {}, [], [])
+                await self.delegation.delegate(task, request)
+            return LoopResult(success=None, iterations=1, reason="delegated")
+
+        await asyncio.sleep(self.delay)
+        task.result = {"output": str(os.getpid())}
+        task.status = TaskStatus.COMPLETE
+        return LoopResult(success=True, iterations=1, reason="completed")
+
+
+def _worker_main(db_path: str, ready, delay: float):
+    """Entry point of a worker process in the multi-process test."""
+
+    async def main():
+        queue = SQLiteTaskQueue(Database(Path(db_path)))
+        loop = _FakeLoop(fan_out=4, delay=delay)
+        worker = Worker(queue, loop, lease_seconds=5, poll_interval=0.05)
+        ready.set()
+        await worker.run(idle_timeout=60)
+
+    asyncio.run(main())
+
+
+@pytest.fixture
+def database(temp_dir):
+    return Database(temp_dir / "queue.db")
+
+
+@pytest.fixture
+def queue(database):
+    return SQLiteTaskQueue(database)
+
+
+def _coordinator(database: Database, queue: SQLiteTaskQueue) -> Orchestrator:
+    orchestrator = Orchestrator(
+        client=MagicMock(), enable_memory=False, database=database, task_queue=queue
+    )
+    orchestrator.remote.poll_interval = 0.02
+    orchestrator.remote.requeue_interval = 0.02
+    return orchestrator
+
+
+# =============================================================================
+# Queue tests
+# =============================================================================
+
+
+class TestSQLiteTaskQueue:
+    """Leasing, heartbeats, expiry and events."""
+
+    @pytest.mark.asyncio
+    async def test_publish_and_lease_round_trip(self, queue):
+        task = Task(description="build it", assigned_agent="huginn", priority=2)
+        task.context = {"files": ["a.py"]}
+        await queue.publish(task)
+
+        lease = await queue.lease("w1")
+
+        assert lease is not None
+        assert lease.attempt == 1
+        assert lease.task.to_dict() == task.to_dict()
+        entry = await queue.get_entry(task.id)
+        assert entry.state == LEASED
+        assert entry.worker_id == "w1"
+        assert await queue.lease("w2") is None
+
+    @pytest.mark.asyncio
+    async def test_concurrent_workers_never_share_a_task(self, queue):
+        for i in range(5):
+            await queue.publish(Task(description=f"t{i}"))
+
+        leases = await asyncio.gather(*(queue.lease(f"w{i}") for i in range(10)))
+
+        task_ids = [lease.task.id for lease in leases if lease is not None]
+        assert len(task_ids) == 5
+        assert len(set(task_ids)) == 5
+
+    @pytest.mark.asyncio
+    async def test_longest_critical_path_leased_first(self, queue):
+        short = Task(description="short", critical_path=10.0)
+        long = Task(description="long", critical_path=90.0)
+        await queue.publish(short)
+        await queue.publish(long)
+
+        assert (await queue.lease("w1")).task.id == long.id
+        assert (await queue.lease("w1")).task.id == short.id
+
+    @pytest.mark.asyncio
+    async def test_model_filter(self, queue):
+        task = Task(description="t", model_name="qwen2.5-coder:14b")
+        await queue.publish(task)
+
+        assert await queue.lease("w1", models={"llama3.1:8b"}) is None
+        lease = await queue.lease("w1", models={"qwen2.5-coder:14b"})
+        assert lease.task.id == task.id
+
+    @pytest.mark.asyncio
+    async def test_expired_lease_is_requeued_for_another_worker(self, queue):
+        task = Task(description="t")
+        await queue.publish(task)
+        first = await queue.lease("w1", lease_seconds=0.01)
+        await asyncio.sleep(0.05)
+
+        second = await queue.lease("w2")
+
+        assert second.task.id == task.id
+        assert second.attempt == 2
+        # The first worker has lost it and can neither renew nor report
+        assert await queue.heartbeat(first) is False
+        assert await queue.complete(first, first.task, [], {}) is False
+        assert await queue.complete(second, second.task, [], {}) is True
+        assert (await queue.get_entry(task.id)).worker_id == "w2"
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_attempts(self, database):
+        queue = SQLiteTaskQueue(database, max_attempts=1)
+        task = Task(description="t")
+        await queue.publish(task)
+        await queue.lease("w1", lease_seconds=0.01)
+        await asyncio.sleep(0.05)
+
+        assert await queue.requeue_expired() == 1
+
+        entry = await queue.get_entry(task.id)
+        assert entry.state == DONE
+        assert entry.outcome is None
+        assert "expired" in entry.error
+
+    @pytest.mark.asyncio
+    async def test_heartbeat_extends_lease_and_reports_cancel(self, queue):
+        task = Task(description="t")
+        await queue.publish(task)
+        lease = await queue.lease("w1", lease_seconds=0.2)
+        before = lease.expires_at
+
+        await queue.request_cancel(task.id)
+        assert await queue.heartbeat(lease, lease_seconds=30) is True
+
+        assert lease.expires_at > before + 10
+        assert lease.cancel_requested is True
+
+    @pytest.mark.asyncio
+    async def test_events_are_returned_in_order(self, queue):
+        task = Task(description="t")
+        await queue.publish(task)
+        for i in range(3):
+            await queue.post_event(task.id, "w1", "AGENT_OUTPUT", {"n": i})
+
+        events = await queue.get_events(task.id)
+        assert [e.data["n"] for e in events] == [0, 1, 2]
+        later = await queue.get_events(task.id, after_id=events[0].id)
+        assert [e.data["n"] for e in later] == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_forget_removes_task_and_events(self, queue):
+        task = Task(description="t")
+        await queue.publish(task)
+        await queue.post_event(task.id, "w1", "AGENT_OUTPUT", {})
+
+        await queue.forget(task.id)
+
+        assert await queue.get_entry(task.id) is None
+        assert await queue.get_events(task.id) == []
+
+
+# =============================================================================
+# Worker tests
+# =============================================================================
+
+
+class TestWorker:
+    """A worker leasing, running and reporting tasks."""
+
+    @pytest.mark.asyncio
+    async def test_runs_task_and_reports_result_and_events(self, queue):
+        task = Task(description="t", assigned_agent="huginn")
+        await queue.publish(task)
+        worker = Worker(queue, _FakeLoop(), worker_id="w1")
+
+        assert await worker.run_once() is True
+        assert await worker.run_once() is False
+
+        entry = await queue.get_entry(task.id)
+        assert entry.state == DONE
+        assert entry.outcome["task"]["status"] == "complete"
+        assert entry.outcome["result"]["success"] is True
+        events = await queue.get_events(task.id)
+        assert [e.event_type for e in events] == ["AGENT_OUTPUT"]
+        assert events[0].worker_id == "w1"
+
+    @pytest.mark.asyncio
+    async def test_reports_delegated_subtasks(self, queue):
+        task = Task(description="plan", assigned_agent="brokkr")
+        await queue.publish(task)
+        worker = Worker(queue, _FakeLoop(fan_out=2))
+
+        await worker.run_once()
+
+        outcome = (await queue.get_entry(task.id)).outcome
+        assert outcome["task"]["status"] == "waiting"
+        assert len(outcome["new_tasks"]) == 2
+        assert {t["parent_id"] for t in outcome["new_tasks"]} == {task.id}
+        assert {t["id"] for t in outcome["new_tasks"]} == set(
+            outcome["task"]["subtask_ids"]
+        )
+
+    @pytest.mark.asyncio
+    async def test_scheduler_is_cleared_between_tasks(self, queue):
+        loop = _FakeLoop(fan_out=2)
+        worker = Worker(queue, loop)
+        first = Task(description="plan", assigned_agent="brokkr")
+        second = Task(description="t", assigned_agent="huginn")
+        await queue.publish(first)
+        await worker.run_once()
+        await queue.publish(second)
+
+        await worker.run_once()
+
+        assert list(loop.scheduler.tasks) == [second.id]
+        assert (await queue.get_entry(second.id)).outcome["new_tasks"] == []
+
+    @pytest.mark.asyncio
+    async def test_abandons_task_when_lease_is_lost(self, queue):
+        task = Task(description="t", assigned_agent="huginn")
+        await queue.publish(task)
+        worker = Worker(queue, _FakeLoop(delay=5.0), lease_seconds=0.15)
+
+        run = asyncio.ensure_future(worker.run_once())
+        await asyncio.sleep(0.02)
+        await queue.forget(task.id)
+
+        assert await asyncio.wait_for(run, timeout=2.0) is True
+        assert await queue.get_entry(task.id) is None
+
+    @pytest.mark.asyncio
+    async def test_cancel_request_reaches_the_loop(self, queue):
+        task = Task(description="t", assigned_agent="huginn")
+        await queue.publish(task)
+        loop = _FakeLoop(delay=0.3)
+        worker = Worker(queue, loop, lease_seconds=0.15)
+
+        run = asyncio.ensure_future(worker.run_once())
+        await asyncio.sleep(0.02)
+        await queue.request_cancel(task.id)
+        await run
+
+        assert loop.cancelled == [task.id]
+
+
+# =============================================================================
+# Coordinator tests
+# =============================================================================
+
+
+class TestRemoteRunner:
+    """The orchestrator dispatching through the queue."""
+
+    @pytest.mark.asyncio
+    async def test_orchestrator_runs_delegating_task_on_worker(self, database, queue):
+        orchestrator = _coordinator(database, queue)
+        outputs = []
+        orchestrator.event_bus.subscribe(EventType.AGENT_OUTPUT, outputs.append)
+        worker = Worker(queue, _FakeLoop(fan_out=3), poll_interval=0.01)
+        worker_run = asyncio.ensure_future(worker.run())
+
+        try:
+            result = await asyncio.wait_for(orchestrator.run("build it"), timeout=10)
+        finally:
+            worker.stop()
+            await asyncio.wait_for(worker_run, timeout=5)
+
+        assert result["success"] is True
+        assert result["subtasks"] == 3
+        # Root (twice: delegate, then resume) and each child
+        assert worker.tasks_run == 5
+        assert len(outputs) == 5
+        children = [t for t in orchestrator.scheduler.tasks.values() if t.parent_id]
+        assert all(t.status == TaskStatus.COMPLETE for t in children)
+        assert await queue.get_stats() == {}
+
+    @pytest.mark.asyncio
+    async def test_task_fails_when_no_worker_finishes_it(self, database):
+        queue = SQLiteTaskQueue(database, max_attempts=1)
+        orchestrator = _coordinator(database, queue)
+        task = Task(description="t", assigned_agent="huginn")
+        orchestrator.scheduler.add_task(task)
+
+        run = asyncio.ensure_future(orchestrator.remote.run_task(task))
+        await asyncio.sleep(0.05)
+        await queue.lease("w1", lease_seconds=0.01)
+        result = await asyncio.wait_for(run, timeout=5)
+
+        assert result.success is False
+        assert task.status == TaskStatus.FAILED
+        assert "expired" in task.error
+
+    @pytest.mark.asyncio
+    async def test_waiting_tasks_share_one_poller(self, database, queue):
+        orchestrator = _coordinator(database, queue)
+        runner = orchestrator.remote
+        runner.requeue_interval = 60.0
+        queue.requeue_expired = AsyncMock(wraps=queue.requeue_expired)
+        queue.get_entries = AsyncMock(wraps=queue.get_entries)
+        tasks = [Task(description=f"t{i}", assigned_agent="huginn") for i in range(3)]
+        runs = [asyncio.ensure_future(runner.run_task(t)) for t in tasks]
+        await asyncio.sleep(0.2)
+
+        # One timer for lease expiry; each poll covers every waiting task
+        assert queue.requeue_expired.await_count == 1
+        assert {len(call.args[0]) for call in queue.get_entries.await_args_list} == {3}
+
+        worker = Worker(queue, _FakeLoop())
+        for _ in tasks:
+            await worker.run_once()
+        results = await asyncio.wait_for(asyncio.gather(*runs), timeout=5)
+
+        assert all(r.success for r in results)
+        assert all(t.status == TaskStatus.COMPLETE for t in tasks)
+        await asyncio.wait_for(runner._poller, timeout=1)
+        assert runner._waiting == {}
+
+    @pytest.mark.asyncio
+    async def test_transient_poll_errors_are_retried(self, database, queue):
+        orchestrator = _coordinator(database, queue)
+        real = queue.get_entries
+        errors = [sqlite3.OperationalError("database is locked")] * 2
+
+        async def flaky_get_entries(task_ids):
+            if errors:
+                raise errors.pop()
+            return await real(task_ids)
+
+        queue.get_entries = flaky_get_entries
+        task = Task(description="t", assigned_agent="huginn")
+        orchestrator.scheduler.add_task(task)
+        run = asyncio.ensure_future(orchestrator.remote.run_task(task))
+
+        await Worker(queue, _FakeLoop()).run_once()
+        result = await asyncio.wait_for(run, timeout=5)
+
+        assert result.success is True
+        assert errors == []
+
+    @pytest.mark.asyncio
+    async def test_persistent_poll_errors_cancel_and_fail(self, database, queue):
+        orchestrator = _coordinator(database, queue)
+        orchestrator.remote.max_poll_failures = 3
+        queue.get_entries = AsyncMock(
+            side_effect=sqlite3.OperationalError("database is locked")
+        )
+        parent = Task(id="p", description="p", assigned_agent="brokkr")
+        task = Task(description="t", parent_id="p", assigned_agent="huginn")
+        orchestrator.scheduler.add_task(parent)
+        orchestrator.scheduler.add_task(task)
+        parent.add_subtask(task.id)
+        parent.status = TaskStatus.WAITING
+
+        result = await asyncio.wait_for(orchestrator.remote.run_task(task), timeout=5)
+
+        assert result.success is False
+        assert task.status == TaskStatus.FAILED
+        assert "database is locked" in task.error
+        assert queue.get_entries.await_count == 3
+        # The worker that leases it is told to stop; the parent hears of it
+        lease = await queue.lease("w1")
+        assert lease.cancel_requested is True
+        assert parent.status == TaskStatus.FAILED
+
+    @pytest.mark.asyncio
+    async def test_local_cancel_is_sent_to_queue(self, database, queue):
+        orchestrator = _coordinator(database, queue)
+        task = Task(description="t", assigned_agent="huginn")
+        run = asyncio.ensure_future(orchestrator.remote.run_task(task))
+        await asyncio.sleep(0.05)
+
+        task.cancel_requested = True
+        await asyncio.sleep(0.1)
+        lease = await queue.lease("w1")
+        await queue.complete(lease, lease.task, [], {"success": False})
+        await asyncio.wait_for(run, timeout=5)
+
+        assert lease.cancel_requested is True
+
+
+class TestMultipleWorkerProcesses:
+    """Two worker processes sharing one queue with a coordinator."""
+
+    @pytest.mark.asyncio
+    async def test_subtasks_spread_across_worker_processes(self, temp_dir):
+        db_path = temp_dir / "shared.db"
+        database = Database(db_path)
+        queue = SQLiteTaskQueue(database)
+        await queue.get_stats()  # Create the schema before workers start
+
+        ctx = multiprocessing.get_context("spawn")
+        workers = []
+        try:
+            for _ in range(2):
+                ready = ctx.Event()
+                process = ctx.Process(
+                    target=_worker_main, args=(str(db_path), ready, 0.5), daemon=True
+                )
+                process.start()
+                workers.append((process, ready))
+            for process, ready in workers:
+                assert await asyncio.to_thread(ready.wait, 60)
+
+            orchestrator = _coordinator(database, queue)
+            result = await asyncio.wait_for(orchestrator.run("build it"), timeout=60)
+        finally:
+            for process, _ in workers:
+                process.terminate()
+                process.join(timeout=10)
+
+        assert result["success"] is True
+        assert result["subtasks"] == 4
+        children = [t for t in orchestrator.scheduler.tasks.values() if t.parent_id]
+        pids = {t.result["output"] for t in children}
+        assert pids == {str(process.pid) for process, _ in workers}
@@ -0,0 +1,498 @@
+"""Tests for multi-endpoint Ollama load balancing."""
+
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from sindri.config import SindriConfig
+from sindri.llm.client import OllamaClient
+from sindri.llm.manager import ModelManager
+from sindri.llm.pool import EndpointPool, NoHealthyEndpointError, OllamaEndpoint
+
+
+# =============================================================================
+# Fake Ollama server
+# =============================================================================
+
+
+class _FakeOllamaHandler(BaseHTTPRequestHandler):
+    """Minimal Ollama API: /api/chat, /api/ps, /api/tags."""
+
+    def log_message(self, *args):
+        pass
+
+    def _send_json(self, payload: dict):
+        body = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        server = self.server
+        if self.path == "/api/ps":
+            self._send_json(
+                {"models": [{"model": m, "name": m} for m in server.loaded_models]}
+            )
+        elif self.path == "/api/tags":
+            self._send_json({"models": []})
+        else:
+            self.send_error(404)
+
+    def do_POST(self):
+        server = self.server
+        length = int(self.headers.get("Content-Length", 0))
+        request = json.loads(self.rfile.read(length) or b"{}")
+        server.requests.append(request)
+
+        if self.path != "/api/chat":
+            self.send_error(404)
+            return
+
+        server.loaded_models.add(request["model"])
+        message = {"role": "assistant", "content": f"from {server.name}"}
+
+        if request.get("stream"):
+            self.send_response(200)
+            self.send_header("Content-Type", "application/x-ndjson")
+            self.end_headers()
+            for token in ["from ", server.name]:
+                chunk = {
+                    "model": request["model"],
+                    "message": {"role": "assistant", "content": token},
+                    "done": False,
+                }
+                self.wfile.write((json.dumps(chunk) + "\n").encode())
+            final = {
+                "model": request["model"],
+                "message": {"role": "assistant", "content": ""},
+                "done": True,
+            }
+            self.wfile.write((json.dumps(final) + "\n").encode())
+        else:
+            self._send_json(
+                {"model": request["model"], "message": message, "done": True}
+            )
+
+
+class FakeOllamaServer:
+    """A fake Ollama server running on a background thread."""
+
+    def __init__(self, name: str):
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), _FakeOllamaHandler)
+        self.httpd.name = name
+        self.httpd.requests = []
+        self.httpd.loaded_models = set()
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def host(self) -> str:
+        return f"http://127.0.0.1:{self.httpd.server_address[1]}"
+
+    @property
+    def requests(self) -> list:
+        return self.httpd.requests
+
+    @property
+    def loaded_models(self) -> set:
+        return self.httpd.loaded_models
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def fake_servers():
+    """Two fake Ollama servers."""
+    servers = [FakeOllamaServer("gpu0").start(), FakeOllamaServer("gpu1").start()]
+    yield servers
+    for server in servers:
+        server.stop()
+
+
+def _dead_host() -> str:
+    """A host URL with nothing listening on it."""
+    server = FakeOllamaServer("dead")
+    host = server.host
+    server.httpd.server_close()
+    return host
+
+
+# =============================================================================
+# Routing tests
+# =============================================================================
+
+
+class TestEndpointRouting:
+    """Tests for endpoint selection."""
+
+    def test_requires_endpoints(self):
+        """An empty pool is rejected."""
+        with pytest.raises(ValueError):
+            EndpointPool([])
+
+    def test_model_affinity_preferred(self):
+        """Endpoints with the model loaded win over idle ones."""
+        a = OllamaEndpoint(host="http://a")
+        b = OllamaEndpoint(host="http://b", loaded_models={"qwen:14b"})
+        a.outstanding = 0
+        b.outstanding = 3
+        pool = EndpointPool([a, b])
+
+        assert pool.select("qwen:14b").host == "http://b"
+
+    def test_least_outstanding_without_affinity(self):
+        """Without affinity, the least busy endpoint is chosen."""
+        a = OllamaEndpoint(host="http://a", outstanding=2)
+        b = OllamaEndpoint(host="http://b", outstanding=1)
+        pool = EndpointPool([a, b])
+
+        assert pool.select("new:7b").host == "http://b"
+
+    def test_unhealthy_skipped_until_cooldown(self):
+        """Unhealthy endpoints are skipped until their cooldown passes."""
+        a = OllamaEndpoint(host="http://a")
+        b = OllamaEndpoint(host="http://b")
+        pool = EndpointPool([a, b], cooldown_seconds=3600)
+
+        pool.mark_failure(a, ConnectionError("down"))
+        assert a.healthy is False
+        assert [e.host for e in pool.candidates()] == ["http://b"]
+
+        pool.mark_failure(b, ConnectionError("down"))
+        with pytest.raises(NoHealthyEndpointError):
+            pool.select()
+
+    def test_recovery_after_cooldown(self):
+        """Endpoints become candidates again once the cooldown expires."""
+        a = OllamaEndpoint(host="http://a")
+        pool = EndpointPool([a], cooldown_seconds=0)
+        pool.mark_failure(a, ConnectionError("down"))
+
+        assert pool.select().host == "http://a"
+        pool.mark_success(a)
+        assert a.healthy is True
+
+    def test_placement_gives_affinity(self):
+        """ModelManager placements route requests to the same endpoint."""
+        a = OllamaEndpoint(host="http://a")
+        b = OllamaEndpoint(host="http://b")
+        pool = EndpointPool([a, b])
+        pool.note_loaded("http://b", "coder:14b")
+
+        assert pool.select("coder:14b").host == "http://b"
+        pool.note_unloaded("http://b", "coder:14b")
+        assert "coder:14b" not in pool.placements
+
+    def test_from_config(self, temp_dir):
+        """Pools are built from ollama_endpoints."""
+        config = SindriConfig(
+            data_dir=temp_dir,
+            ollama_endpoints=[
+                {"host": "http://a", "total_vram_gb": 24.0},
+                {"host": "http://b"},
+            ],
+        )
+        pool = EndpointPool.from_config(config)
+        assert set(pool.endpoints) == {"http://a", "http://b"}
+        assert pool.endpoints["http://a"].available_vram_gb == 22.0
+
+        assert EndpointPool.from_config(SindriConfig(data_dir=temp_dir)) is None
+
+    def test_least_busy_copy_selected(self):
+        """With a model on several endpoints, the least busy one is used."""
+        a = OllamaEndpoint(host="http://a")
+        b = OllamaEndpoint(host="http://b", total_vram_gb=24.0)
+        pool = EndpointPool([a, b])
+        pool.note_loaded("http://a", "coder:14b")
+        pool.note_loaded("http://b", "coder:14b")
+        b.outstanding = 1
+
+        assert pool.select("coder:14b").host == "http://a"
+        pool.note_unloaded("http://a", "coder:14b")
+        assert pool.placements["coder:14b"] == {"http://b"}
+
+    @pytest.mark.asyncio
+    async def test_periodic_health_checks(self):
+        """Background checks run until stopped."""
+        pool = EndpointPool([OllamaEndpoint(host="http://a")])
+        pool.health_check_interval = 0.01
+        checks = []
+
+        async def check_health():
+            checks.append(1)
+            return {}
+
+        pool.check_health = check_health
+        pool.start_health_checks()
+        await asyncio.sleep(0.1)
+        await pool.stop_health_checks()
+        seen = len(checks)
+        await asyncio.sleep(0.05)
+
+        assert seen >= 2
+        assert len(checks) == seen
+
+
+# =============================================================================
+# Client integration with fake servers
+# =============================================================================
+
+
+class TestPoolWithFakeServers:
+    """End-to-end routing against local fake Ollama servers."""
+
+    @pytest.mark.asyncio
+    async def test_health_check_reads_loaded_models(self, fake_servers):
+        """Health checks refresh loaded models from /api/ps."""
+        fake_servers[1].loaded_models.add("coder:14b")
+        pool = EndpointPool.from_hosts([s.host for s in fake_servers])
+
+        health = await pool.check_health()
+
+        assert all(health.values())
+        assert pool.endpoints[fake_servers[1].host].loaded_models == {"coder:14b"}
+        assert pool.select("coder:14b").host == fake_servers[1].host
+
+    @pytest.mark.asyncio
+    async def test_cli_pool_from_config(self, fake_servers, temp_dir):
+        """Without --endpoint the CLI uses [[ollama_endpoints]]."""
+        from sindri.cli import _start_endpoint_pool
+
+        fake_servers[0].loaded_models.add("coder:14b")
+        config = SindriConfig(
+            data_dir=temp_dir,
+            ollama_endpoints=[{"host": s.host} for s in fake_servers],
+        )
+
+        pool = await _start_endpoint_pool((), 16.0, config)
+        try:
+            assert set(pool.endpoints) == {s.host for s in fake_servers}
+            assert pool.select("coder:14b").host == fake_servers[0].host
+            assert pool._health_task is not None
+        finally:
+            await pool.stop_health_checks()
+
+        assert await _start_endpoint_pool((), 16.0, SindriConfig()) is None
+
+    @pytest.mark.asyncio
+    async def test_chat_routes_by_affinity(self, fake_servers):
+        """Requests go to the endpoint that has the model loaded."""
+        fake_servers[1].loaded_models.add("coder:14b")
+        pool = EndpointPool.from_hosts([s.host for s in fake_servers])
+        await pool.check_health()
+        client = OllamaClient(pool=pool)
+
+        response = await client.chat("coder:14b", [{"role": "user", "content": "hi"}])
+
+        assert response.message.content == "from gpu1"
+        assert len(fake_servers[0].requests) == 0
+
+    @pytest.mark.asyncio
+    async def test_failover_on_connection_error(self, fake_servers):
+        """A dead endpoint is marked unhealthy and the call fails over."""
+        dead = _dead_host()
+        pool = EndpointPool(
+            [
+                OllamaEndpoint(host=dead, total_vram_gb=48.0),  # Preferred on ties
+                OllamaEndpoint(host=fake_servers[0].host),
+            ]
+        )
+        client = OllamaClient(pool=pool)
+
+        response = await client.chat("m:7b", [{"role": "user", "content": "hi"}])
+
+        assert response.message.content == "from gpu0"
+        assert pool.endpoints[dead].healthy is False
+        assert pool.endpoints[dead].outstanding == 0
+
+    @pytest.mark.asyncio
+    async def test_streaming_failover(self, fake_servers):
+        """Streaming requests fail over before any token is delivered."""
+        dead = _dead_host()
+        pool = EndpointPool(
+            [
+                OllamaEndpoint(host=dead, total_vram_gb=48.0),
+                OllamaEndpoint(host=fake_servers[1].host),
+            ]
+        )
+        client = OllamaClient(pool=pool)
+        tokens = []
+
+        result = await client.chat_stream(
+            "m:7b", [{"role": "user", "content": "hi"}], on_token=tokens.append
+        )
+
+        assert result.content == "from gpu1"
+        assert "".join(tokens) == "from gpu1"
+
+    @pytest.mark.asyncio
+    async def test_all_endpoints_down(self):
+        """When every endpoint fails the error surfaces."""
+        pool = EndpointPool.from_hosts([_dead_host(), _dead_host()])
+        client = OllamaClient(pool=pool)
+
+        with pytest.raises(NoHealthyEndpointError):
+            await client.chat("m:7b", [{"role": "user", "content": "hi"}])
+
+    @pytest.mark.asyncio
+    async def test_parallel_requests_spread(self, fake_servers):
+        """Concurrent requests for a new model spread across endpoints."""
+        import asyncio
+
+        pool = EndpointPool.from_hosts([s.host for s in fake_servers])
+        client = OllamaClient(pool=pool)
+
+        await asyncio.gather(
+            *[
+                client.chat(f"model{i}:7b", [{"role": "user", "content": "hi"}])
+                for i in range(4)
+            ]
+        )
+
+        assert len(fake_servers[0].requests) > 0
+        assert len(fake_servers[1].requests) > 0
+
+
+# =============================================================================
+# Per-endpoint VRAM budgets
+# =============================================================================
+
+
+class TestModelManagerWithPool:
+    """Tests for per-endpoint VRAM management."""
+
+    def _pool(self) -> EndpointPool:
+        return EndpointPool(
+            [
+                OllamaEndpoint(
+                    host="http://a", total_vram_gb=12.0, reserve_vram_gb=2.0
+                ),
+                OllamaEndpoint(
+                    host="http://b", total_vram_gb=16.0, reserve_vram_gb=2.0
+                ),
+            ]
+        )
+
+    def test_budget_is_sum_of_endpoints(self):
+        """Aggregate VRAM equals the sum of endpoint budgets."""
+        manager = ModelManager(pool=self._pool())
+        assert manager.total_vram == 28.0
+        assert manager.available == 24.0
+
+    @pytest.mark.asyncio
+    async def test_models_spread_across_endpoints(self):
+        """Models that don't fit together go to different endpoints."""
+        pool = self._pool()
+        manager = ModelManager(pool=pool)
+
+        assert await manager.ensure_loaded("big:14b", 10.0)
+        assert await manager.ensure_loaded("mid:7b", 9.0)
+
+        placed = {m.name: m.endpoint for m in manager.loaded.values()}
+        assert placed["big:14b"] != placed["mid:7b"]
+        assert manager.metrics.evictions == 0
+        assert pool.placements["big:14b"] == {placed["big:14b"]}
+
+    @pytest.mark.asyncio
+    async def test_eviction_is_per_endpoint(self):
+        """Eviction only frees VRAM on the chosen endpoint."""
+        pool = self._pool()
+        manager = ModelManager(pool=pool)
+
+        await manager.ensure_loaded("a:14b", 13.0)  # Only fits on b
+        await manager.ensure_loaded("b:7b", 9.0)  # Goes to a
+        await manager.ensure_loaded("c:7b", 9.0)  # Needs an eviction somewhere
+
+        assert manager.metrics.evictions == 1
+        stats = manager.get_vram_stats()["endpoints"]
+        for host_stats in stats.values():
+            assert host_stats["free"] >= 0
+
+    @pytest.mark.asyncio
+    async def test_model_too_big_for_any_endpoint(self):
+        """Models larger than every endpoint cannot load."""
+        manager = ModelManager(pool=self._pool())
+        assert manager.can_load("huge:70b", 40.0) is False
+        assert await manager.ensure_loaded("huge:70b", 40.0) is False
+
+    @pytest.mark.asyncio
+    async def test_idle_copy_is_shared(self):
+        """Tasks for a model share its copy while the endpoint is idle."""
+        manager = ModelManager(pool=self._pool())
+
+        assert await manager.ensure_loaded("m:7b", 4.0)
+        assert await manager.ensure_loaded("m:7b", 4.0)
+
+        assert len(manager.copies["m:7b"]) == 1
+        assert manager.metrics.hits == 1
+
+    @pytest.mark.asyncio
+    async def test_saturated_copy_gets_another(self):
+        """A busy copy is joined by one on an endpoint with spare VRAM."""
+        pool = self._pool()
+        manager = ModelManager(pool=pool)
+        await manager.ensure_loaded("m:7b", 4.0)
+        (first,) = manager.copies["m:7b"]
+        pool.endpoints[first].outstanding = 1
+
+        assert await manager.ensure_loaded("m:7b", 4.0)
+
+        hosts = set(manager.copies["m:7b"])
+        assert hosts == {"http://a", "http://b"}
+        assert pool.placements["m:7b"] == hosts
+        assert list(manager.loaded) == ["m:7b"]
+        # Requests now go to the idle copy
+        assert pool.select("m:7b").host != first
+
+    @pytest.mark.asyncio
+    async def test_evicting_one_copy_keeps_the_model_loaded(self):
+        """``loaded`` keeps the model while any copy of it is resident."""
+        pool = self._pool()
+        manager = ModelManager(pool=pool)
+        await manager.ensure_loaded("m:7b", 4.0)
+        (first,) = manager.copies["m:7b"]
+        pool.endpoints[first].outstanding = 1
+        await manager.ensure_loaded("m:7b", 4.0)
+
+        await manager._unload("m:7b", first)
+
+        assert manager.loaded["m:7b"].endpoint != first
+        assert list(manager.copies["m:7b"]) == [manager.loaded["m:7b"].endpoint]
+        await manager._unload("m:7b", manager.loaded["m:7b"].endpoint)
+        assert "m:7b" not in manager.loaded
+        assert "m:7b" not in manager.copies
+
+    @pytest.mark.asyncio
+    async def test_saturated_copy_shared_without_spare_room(self):
+        """No copy is loaded if that would mean evicting another model."""
+        pool = self._pool()
+        manager = ModelManager(pool=pool)
+        await manager.ensure_loaded("big:14b", 12.0)  # Only fits on b
+        await manager.ensure_loaded("mid:7b", 9.0)  # Goes to a
+        pool.endpoints["http://a"].outstanding = 1
+
+        # b could only take a copy by evicting big:14b
+        assert await manager.ensure_loaded("mid:7b", 9.0)
+
+        assert len(manager.copies["mid:7b"]) == 1
+        assert manager.metrics.evictions == 0
+
+    @pytest.mark.asyncio
+    async def test_unhealthy_endpoint_not_used(self):
+        """Models are not placed on unhealthy endpoints."""
+        pool = self._pool()
+        pool.mark_failure(pool.endpoints["http://b"], ConnectionError("down"))
+        manager = ModelManager(pool=pool)
+
+        await manager.ensure_loaded("m:7b", 4.0)
+        assert list(manager.copies["m:7b"]) == ["http://a"]
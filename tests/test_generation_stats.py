@@ -0,0 +1,223 @@
+"""Tests for Ollama token counts and timings in metrics."""
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from sindri.llm.client import GenerationStats, OllamaClient
+from sindri.persistence.database import Database
+from sindri.persistence.metrics import (
+    IterationMetrics,
+    MetricsCollector,
+    MetricsStore,
+    SessionMetrics,
+    ThroughputStats,
+)
+
+
+def _final_chunk(**overrides) -> dict:
+    chunk = {
+        "model": "coder:7b",
+        "message": {"role": "assistant", "content": "done"},
+        "done": True,
+        "prompt_eval_count": 200,
+        "eval_count": 50,
+        "load_duration": 1_000_000_000,
+        "prompt_eval_duration": 500_000_000,
+        "eval_duration": 2_500_000_000,
+        "total_duration": 4_000_000_000,
+    }
+    chunk.update(overrides)
+    return chunk
+
+
+def _iteration(model="coder:7b", agent="huginn", **kwargs) -> IterationMetrics:
+    return IterationMetrics(
+        iteration_number=1,
+        start_time=0.0,
+        end_time=5.0,
+        agent_name=agent,
+        model_name=model,
+        **kwargs,
+    )
+
+
+# =============================================================================
+# Client extraction tests
+# =============================================================================
+
+
+class TestGenerationStats:
+    """Tests for reading stats from Ollama responses."""
+
+    def test_from_response_converts_nanoseconds(self):
+        """Durations are converted to seconds."""
+        stats = GenerationStats.from_response(_final_chunk())
+
+        assert stats.prompt_tokens == 200
+        assert stats.eval_tokens == 50
+        assert stats.load_duration == 1.0
+        assert stats.prompt_eval_duration == 0.5
+        assert stats.eval_duration == 2.5
+        assert stats.total_duration == 4.0
+        assert stats.tokens_per_second == 20.0
+
+    def test_missing_counts_give_none(self):
+        """Responses without counts (e.g. mid-stream chunks) have no stats."""
+        assert GenerationStats.from_response({"done": False}) is None
+
+    @pytest.mark.asyncio
+    async def test_chat_attaches_stats(self):
+        """Non-streaming responses carry stats."""
+        client = OllamaClient()
+        with patch.object(
+            client._async_client, "chat", AsyncMock(return_value=_final_chunk())
+        ):
+            response = await client.chat("coder:7b", [{"role": "user", "content": "x"}])
+
+        assert response.stats.eval_tokens == 50
+
+    @pytest.mark.asyncio
+    async def test_stream_stats_from_final_chunk(self):
+        """Streaming responses take stats from the done chunk."""
+        client = OllamaClient()
+
+        async def mock_stream(*args, **kwargs):
+            yield {"message": {"content": "do"}, "done": False}
+            yield _final_chunk(message={"content": "ne"})
+
+        with patch.object(
+            client._async_client, "chat", side_effect=lambda **kw: mock_stream()
+        ):
+            result = await client.chat_stream(
+                "coder:7b", [{"role": "user", "content": "x"}]
+            )
+
+        assert result.stats.prompt_tokens == 200
+        assert result.to_response().stats is result.stats
+
+
+# =============================================================================
+# Collector and aggregation tests
+# =============================================================================
+
+
+class TestThroughputMetrics:
+    """Tests for per-iteration, per-model and per-agent throughput."""
+
+    def test_shares(self):
+        """Prompt-eval and load shares are fractions of generation time."""
+        stats = ThroughputStats.from_iterations(
+            [
+                _iteration(
+                    prompt_tokens=200,
+                    tokens_generated=50,
+                    load_duration=1.0,
+                    prompt_eval_duration=0.5,
+                    eval_duration=2.5,
+                )
+            ]
+        )
+
+        assert stats.tokens_per_second == 20.0
+        assert stats.prompt_tokens_per_second == 400.0
+        assert stats.prompt_eval_share == 0.125
+        assert stats.load_share == 0.25
+
+    def test_empty_stats_are_zero(self):
+        """No recorded time gives zero rates rather than errors."""
+        stats = ThroughputStats.from_iterations([_iteration()])
+        assert stats.tokens_per_second == 0.0
+        assert stats.load_share == 0.0
+
+    def test_collector_records_generation(self):
+        """Recorded stats land on the iteration and the task load time."""
+        collector = MetricsCollector("s1", "task", "coder:7b")
+        collector.start_task("t1", "task", "huginn", "coder:7b")
+        collector.start_iteration(1, "huginn", "coder:7b")
+        collector.record_generation(
+            prompt_tokens=100, eval_tokens=40, load_duration=2.0, eval_duration=2.0
+        )
+        collector.record_generation(prompt_tokens=20, eval_tokens=10, eval_duration=0.5)
+        collector.end_iteration()
+        collector.end_task()
+
+        task = collector.get_metrics().tasks[0]
+        iteration = task.iterations[0]
+        assert iteration.tokens_generated == 50
+        assert iteration.prompt_tokens == 120
+        assert iteration.tokens_per_second == 20.0
+        assert task.model_load_time == 2.0
+
+    def test_end_iteration_override(self):
+        """An explicit token count still overrides recorded stats."""
+        collector = MetricsCollector("s1", "task", "m")
+        collector.start_task("t1", "task", "a", "m")
+        collector.start_iteration(1, "a", "m")
+        collector.record_generation(eval_tokens=10)
+        collector.end_iteration(tokens_generated=7)
+        collector.end_task()
+
+        assert collector.get_metrics().tasks[0].iterations[0].tokens_generated == 7
+
+    def test_breakdown_by_model_and_agent(self):
+        """Throughput is grouped by model and agent."""
+        collector = MetricsCollector("s1", "task", "big:14b")
+        collector.start_task("t1", "task", "brokkr", "big:14b")
+        collector.start_iteration(1, "brokkr", "big:14b")
+        collector.record_generation(eval_tokens=30, eval_duration=3.0)
+        collector.end_iteration()
+        collector.end_task()
+        collector.start_task("t2", "sub", "huginn", "coder:7b")
+        collector.start_iteration(1, "huginn", "coder:7b")
+        collector.record_generation(eval_tokens=60, eval_duration=2.0)
+        collector.end_iteration()
+        collector.end_task()
+
+        breakdown = collector.get_metrics().get_throughput_breakdown()
+
+        assert breakdown["by_model"]["big:14b"]["tokens_per_second"] == 10.0
+        assert breakdown["by_model"]["coder:7b"]["tokens_per_second"] == 30.0
+        assert set(breakdown["by_agent"]) == {"brokkr", "huginn"}
+        assert breakdown["overall"]["tokens_generated"] == 90
+
+    def test_round_trip(self):
+        """Generation stats survive serialization."""
+        collector = MetricsCollector("s1", "task", "m")
+        collector.start_task("t1", "task", "a", "m")
+        collector.start_iteration(1, "a", "m")
+        collector.record_generation(
+            prompt_tokens=5,
+            eval_tokens=6,
+            load_duration=0.1,
+            prompt_eval_duration=0.2,
+            eval_duration=0.3,
+        )
+        collector.end_iteration()
+        collector.end_task()
+
+        restored = SessionMetrics.from_dict(collector.get_metrics().to_dict())
+        iteration = restored.tasks[0].iterations[0]
+        assert iteration.prompt_tokens == 5
+        assert iteration.load_duration == 0.1
+        assert iteration.prompt_eval_duration == 0.2
+        assert iteration.eval_duration == 0.3
+        assert restored.get_summary()["throughput"]["tokens_generated"] == 6
+
+    @pytest.mark.asyncio
+    async def test_store_throughput_stats(self, temp_dir):
+        """The store aggregates throughput over saved sessions."""
+        store = MetricsStore(Database(temp_dir / "metrics.db"))
+        for session_id in ("s1", "s2"):
+            collector = MetricsCollector(session_id, "task", "m")
+            collector.start_task("t", "task", "a", "m")
+            collector.start_iteration(1, "a", "m")
+            collector.record_generation(eval_tokens=10, eval_duration=1.0)
+            collector.end_iteration()
+            collector.end_task()
+            collector.end_session()
+            await store.save_metrics(collector.get_metrics())
+
+        stats = await store.get_throughput_stats()
+
+        assert stats["overall"]["tokens_generated"] == 20
+        assert stats["by_model"]["m"]["tokens_per_second"] == 10.0
@@ -79,3 +79,108 @@ async def test_session_completion():
 
         assert loaded.status == "completed"
         assert loaded.completed_at is not None
+
+
+async def _turn_rows(db: Database, session_id: str) -> list[tuple]:
+    async with db.get_connection() as conn:
+        async with conn.execute(
+            "SELECT id, seq, content FROM turns WHERE session_id = ? ORDER BY seq",
+            (session_id,),
+        ) as cursor:
+            return await cursor.fetchall()
+
+
+@pytest.mark.asyncio
+async def test_session_save_appends_new_turns(temp_dir):
+    """Repeated saves only insert turns added since the last save."""
+    db = Database(temp_dir / "test.db")
+    state = SessionState(db)
+    session = await state.create_session("Test task", "test-model")
+
+    session.add_turn("user", "one")
+    await state.save_session(session)
+    first_rows = await _turn_rows(db, session.id)
+
+    session.add_turn("assistant", "two")
+    session.add_turn("tool", "three")
+    await state.save_session(session)
+    await state.save_session(session)
+    rows = await _turn_rows(db, session.id)
+
+    assert rows[0] == first_rows[0]  # Not deleted and re-inserted
+    assert [(seq, content) for _, seq, content in rows] == [
+        (0, "one"),
+        (1, "two"),
+        (2, "three"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_loaded_session_continues_appending(temp_dir):
+    """A loaded session appends after the turns it was loaded with."""
+    db = Database(temp_dir / "test.db")
+    state = SessionState(db)
+    session = await state.create_session("Test task", "test-model")
+    session.add_turn("user", "one")
+    await state.save_session(session)
+
+    loaded = await state.load_session(session.id)
+    loaded.add_turn("assistant", "two")
+    await state.save_session(loaded)
+
+    reloaded = await state.load_session(session.id)
+    assert [t.content for t in reloaded.turns] == ["one", "two"]
+
+
+@pytest.mark.asyncio
+async def test_removed_turns_are_deleted(temp_dir):
+    """Turns dropped from the session are dropped from the database."""
+    db = Database(temp_dir / "test.db")
+    state = SessionState(db)
+    session = await state.create_session("Test task", "test-model")
+    for content in ("one", "two", "three"):
+        session.add_turn("user", content)
+    await state.save_session(session)
+
+    session.turns = session.turns[:1]
+    session.add_turn("user", "four")
+    await state.save_session(session)
+
+    loaded = await state.load_session(session.id)
+    assert [t.content for t in loaded.turns] == ["one", "four"]
+
+
+@pytest.mark.asyncio
+async def test_turn_seq_migration(temp_dir):
+    """Databases from before turns.seq get it backfilled in order."""
+    import aiosqlite
+
+    db_path = temp_dir / "old.db"
+    async with aiosqlite.connect(db_path) as conn:
+        await conn.execute(
+            """
+            CREATE TABLE turns (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                session_id TEXT NOT NULL,
+                role TEXT NOT NULL,
+                content TEXT NOT NULL,
+                tool_calls TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """
+        )
+        await conn.executemany(
+            "INSERT INTO turns (session_id, role, content) VALUES (?, ?, ?)",
+            [("a", "user", "a0"), ("b", "user", "b0"), ("a", "user", "a1")],
+        )
+        await conn.execute("PRAGMA user_version = 4")
+        await conn.commit()
+
+    db = Database(db_path, auto_backup=False)
+    await db.initialize()
+
+    assert [(seq, c) for _, seq, c in await _turn_rows(db, "a")] == [
+        (0, "a0"),
+        (1, "a1"),
+    ]
+    assert [(seq, c) for _, seq, c in await _turn_rows(db, "b")] == [(0, "b0")]
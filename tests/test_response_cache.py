@@ -0,0 +1,350 @@
+"""Tests for the content-addressed LLM response cache."""
+
+import time
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from sindri.config import SindriConfig
+from sindri.finetuning.evaluator import ModelEvaluator
+from sindri.llm.cache import ResponseCache
+from sindri.llm.client import OllamaClient
+from sindri.memory.summarizer import ConversationSummarizer
+from sindri.persistence.database import Database
+from sindri.persistence.metrics import MetricsCollector, SessionMetrics
+
+
+@pytest.fixture
+def cache(temp_dir):
+    """Response cache backed by a temporary database."""
+    return ResponseCache(database=Database(temp_dir / "cache.db"))
+
+
+def _chat_response(content: str = "cached answer", tool_calls=None) -> dict:
+    return {
+        "message": {
+            "role": "assistant",
+            "content": content,
+            "tool_calls": tool_calls,
+        },
+        "model": "test:7b",
+        "done": True,
+    }
+
+
+# =============================================================================
+# Key and policy tests
+# =============================================================================
+
+
+class TestCacheKey:
+    """Tests for cache key construction and cache policy."""
+
+    def test_key_is_stable(self):
+        """Identical requests produce the same key."""
+        messages = [{"role": "user", "content": "hi"}]
+        key1 = ResponseCache.make_key("sha256:abc", messages, None, {"temperature": 0})
+        key2 = ResponseCache.make_key("sha256:abc", messages, [], {"temperature": 0})
+        assert key1 == key2
+
+    def test_key_depends_on_all_inputs(self):
+        """Changing digest, messages, tools or options changes the key."""
+        messages = [{"role": "user", "content": "hi"}]
+        base = ResponseCache.make_key("d1", messages, None, {"temperature": 0})
+
+        assert base != ResponseCache.make_key("d2", messages, None, {"temperature": 0})
+        assert base != ResponseCache.make_key(
+            "d1", [{"role": "user", "content": "hello"}], None, {"temperature": 0}
+        )
+        assert base != ResponseCache.make_key(
+            "d1", messages, [{"function": {"name": "x"}}], {"temperature": 0}
+        )
+        assert base != ResponseCache.make_key("d1", messages, None, {"seed": 1})
+
+    def test_option_order_does_not_matter(self):
+        """Option dict ordering is normalized."""
+        messages = [{"role": "user", "content": "hi"}]
+        key1 = ResponseCache.make_key("d", messages, None, {"a": 1, "b": 2})
+        key2 = ResponseCache.make_key("d", messages, None, {"b": 2, "a": 1})
+        assert key1 == key2
+
+    def test_deterministic_requires_zero_temperature(self):
+        """Only explicit temperature 0 is deterministic."""
+        assert ResponseCache.is_deterministic({"temperature": 0})
+        assert not ResponseCache.is_deterministic({"temperature": 0.7})
+        assert not ResponseCache.is_deterministic({})
+        assert not ResponseCache.is_deterministic(None)
+
+    def test_should_use_counts_bypasses(self, cache):
+        """Non-deterministic calls bypass the cache unless forced."""
+        assert cache.should_use({"temperature": 0.8}) is False
+        assert cache.stats.bypassed == 1
+        assert cache.should_use({"temperature": 0.8}, force=True) is True
+        assert cache.should_use({"temperature": 0}) is True
+
+    def test_forced_cache_serves_sampled_calls(self, temp_dir):
+        """A cache built with force=True ignores the temperature."""
+        cache = ResponseCache(database=Database(temp_dir / "f.db"), force=True)
+        assert cache.should_use({"temperature": 0.8}) is True
+
+
+# =============================================================================
+# Configuration tests
+# =============================================================================
+
+
+class TestResponseCacheConfig:
+    """Tests for building the cache from [response_cache]."""
+
+    def test_disabled_by_default(self):
+        """No cache unless the config or a flag enables it."""
+        assert ResponseCache.from_config(SindriConfig()) is None
+
+    def test_settings_applied(self, db):
+        """TTL, size bound and force come from the config."""
+        config = SindriConfig(
+            response_cache={
+                "enabled": True,
+                "ttl_hours": 2,
+                "max_entries": 10,
+                "force": True,
+            }
+        )
+
+        cache = ResponseCache.from_config(config, database=db)
+
+        assert cache.db is db
+        assert cache.ttl_seconds == 7200
+        assert cache.max_entries == 10
+        assert cache.force is True
+
+    def test_flags_override_config(self):
+        """Command-line flags enable and force a cache the config leaves off."""
+        config = SindriConfig(response_cache={"max_entries": 5})
+
+        assert ResponseCache.from_config(config, enable=True).force is False
+        forced = ResponseCache.from_config(config, force=True)
+        assert forced.force is True
+        assert forced.max_entries == 5
+
+    def test_evaluator_client_uses_cache(self, cache):
+        """The benchmark evaluator's own client gets the cache."""
+        assert ModelEvaluator(response_cache=cache).client.response_cache is cache
+
+
+# =============================================================================
+# Storage tests
+# =============================================================================
+
+
+class TestResponseCacheStorage:
+    """Tests for SQLite persistence, TTL and eviction."""
+
+    @pytest.mark.asyncio
+    async def test_put_and_get(self, cache):
+        """Stored responses are returned on lookup."""
+        await cache.put("k1", "test:7b", "hello", duration=2.5)
+        cached = await cache.get("k1")
+
+        assert cached is not None
+        assert cached.content == "hello"
+        assert cached.duration == 2.5
+        assert cache.stats.hits == 1
+        assert cache.stats.time_saved == 2.5
+
+    @pytest.mark.asyncio
+    async def test_miss(self, cache):
+        """Unknown keys are misses."""
+        assert await cache.get("missing") is None
+        assert cache.stats.misses == 1
+
+    @pytest.mark.asyncio
+    async def test_ttl_expiry(self, temp_dir):
+        """Expired entries are treated as misses and removed."""
+        cache = ResponseCache(database=Database(temp_dir / "ttl.db"), ttl_seconds=60)
+        await cache.put("k1", "m", "old")
+
+        with patch("sindri.llm.cache.time.time", return_value=time.time() + 120):
+            assert await cache.get("k1") is None
+
+        assert await cache.count() == 0
+
+    @pytest.mark.asyncio
+    async def test_size_bounded_eviction(self, temp_dir):
+        """Least recently used entries are evicted past max_entries."""
+        cache = ResponseCache(database=Database(temp_dir / "lru.db"), max_entries=2)
+        await cache.put("a", "m", "A")
+        await cache.put("b", "m", "B")
+        await cache.get("a")  # Touch "a" so "b" is least recently used
+        await cache.put("c", "m", "C")
+
+        assert await cache.count() == 2
+        assert await cache.get("b") is None
+        assert (await cache.get("a")).content == "A"
+        assert cache.stats.evictions >= 1
+
+    @pytest.mark.asyncio
+    async def test_tool_calls_round_trip(self, cache):
+        """Native tool calls survive serialization."""
+        calls = [{"function": {"name": "read_file", "arguments": {"path": "x"}}}]
+        await cache.put("k", "m", "", tool_calls=calls)
+        cached = await cache.get("k")
+        assert cached.tool_calls == calls
+
+    @pytest.mark.asyncio
+    async def test_clear(self, cache):
+        """Clear removes all entries."""
+        await cache.put("a", "m", "A")
+        await cache.put("b", "m", "B")
+        assert await cache.clear() == 2
+        assert await cache.count() == 0
+
+
+# =============================================================================
+# Client integration tests
+# =============================================================================
+
+
+class TestClientCaching:
+    """Tests for OllamaClient integration."""
+
+    @pytest.mark.asyncio
+    async def test_deterministic_chat_is_cached(self, cache):
+        """Second identical temperature-0 call is served from the cache."""
+        client = OllamaClient(response_cache=cache)
+        messages = [{"role": "user", "content": "summarize"}]
+
+        with patch.object(
+            client._async_client, "chat", AsyncMock(return_value=_chat_response())
+        ) as mock_chat, patch.object(
+            client._async_client, "list", AsyncMock(side_effect=Exception("offline"))
+        ):
+            first = await client.chat("test:7b", messages, options={"temperature": 0})
+            second = await client.chat("test:7b", messages, options={"temperature": 0})
+
+        assert mock_chat.await_count == 1
+        assert first.cached is False
+        assert second.cached is True
+        assert second.message.content == "cached answer"
+
+    @pytest.mark.asyncio
+    async def test_sampled_chat_bypasses_cache(self, cache):
+        """Calls without temperature 0 always hit the model."""
+        client = OllamaClient(response_cache=cache)
+        messages = [{"role": "user", "content": "write code"}]
+
+        with patch.object(
+            client._async_client, "chat", AsyncMock(return_value=_chat_response())
+        ) as mock_chat:
+            await client.chat("test:7b", messages)
+            await client.chat("test:7b", messages)
+
+        assert mock_chat.await_count == 2
+        assert cache.stats.bypassed == 2
+
+    @pytest.mark.asyncio
+    async def test_forced_cache_restores_tool_calls(self, cache):
+        """Forced caching works for agent calls and restores tool call objects."""
+        client = OllamaClient(response_cache=cache)
+        messages = [{"role": "user", "content": "plan"}]
+        tool_calls = [{"function": {"name": "read_file", "arguments": {"path": "a"}}}]
+
+        with patch.object(
+            client._async_client,
+            "chat",
+            AsyncMock(return_value=_chat_response("", tool_calls)),
+        ), patch.object(
+            client._async_client, "list", AsyncMock(side_effect=Exception("offline"))
+        ):
+            await client.chat("test:7b", messages, force_cache=True)
+            replay = await client.chat("test:7b", messages, force_cache=True)
+
+        assert replay.cached is True
+        assert replay.message.tool_calls[0].function.name == "read_file"
+        assert replay.message.tool_calls[0].function.arguments == {"path": "a"}
+
+    @pytest.mark.asyncio
+    async def test_stream_replays_cached_content(self, cache):
+        """A cached streaming call replays content through on_token."""
+        client = OllamaClient(response_cache=cache)
+        messages = [{"role": "user", "content": "hi"}]
+
+        async def mock_stream(*args, **kwargs):
+            yield {"message": {"content": "Hel"}, "done": False}
+            yield {"message": {"content": "lo"}, "done": True, "model": "test:7b"}
+
+        with patch.object(
+            client._async_client, "chat", side_effect=lambda **kw: mock_stream()
+        ), patch.object(
+            client._async_client, "list", AsyncMock(side_effect=Exception("offline"))
+        ):
+            await client.chat_stream(
+                "test:7b", messages, options={"temperature": 0}
+            )
+            tokens = []
+            replay = await client.chat_stream(
+                "test:7b",
+                messages,
+                on_token=tokens.append,
+                options={"temperature": 0},
+            )
+
+        assert replay.cached is True
+        assert replay.content == "Hello"
+        assert tokens == ["Hello"]
+
+    @pytest.mark.asyncio
+    async def test_summarizer_uses_cache(self, cache):
+        """ConversationSummarizer calls are deterministic and cacheable."""
+        client = OllamaClient(response_cache=cache)
+        summarizer = ConversationSummarizer(client, model="test:3b")
+        conversation = [{"role": "user", "content": "do the thing"}]
+
+        with patch.object(
+            client._async_client,
+            "chat",
+            AsyncMock(return_value=_chat_response("Did the thing.")),
+        ) as mock_chat, patch.object(
+            client._async_client, "list", AsyncMock(side_effect=Exception("offline"))
+        ):
+            first = await summarizer.summarize("task", conversation)
+            second = await summarizer.summarize("task", conversation)
+
+        assert first == second == "Did the thing."
+        assert mock_chat.await_count == 1
+
+
+# =============================================================================
+# Metrics tests
+# =============================================================================
+
+
+class TestCacheMetrics:
+    """Tests for recording cache hits in session metrics."""
+
+    def test_record_cache_hit(self):
+        """Hits and time saved accumulate on the session."""
+        collector = MetricsCollector("s1", "task", "model")
+        collector.record_cache_hit(1.5)
+        collector.record_cache_hit(0.5)
+
+        metrics = collector.get_metrics()
+        assert metrics.cache_hits == 2
+        assert metrics.cache_time_saved == 2.0
+        assert metrics.get_summary()["response_cache"] == {
+            "hits": 2,
+            "time_saved": 2.0,
+        }
+
+    def test_round_trip(self):
+        """Cache stats survive serialization."""
+        metrics = SessionMetrics(
+            session_id="s1",
+            task_description="t",
+            model_name="m",
+            start_time=0.0,
+            cache_hits=3,
+            cache_time_saved=4.2,
+        )
+        restored = SessionMetrics.from_dict(metrics.to_dict())
+        assert restored.cache_hits == 3
+        assert restored.cache_time_saved == 4.2
@@ -89,3 +89,99 @@ def test_has_work(scheduler):
     task.status = TaskStatus.COMPLETE
 
     assert not scheduler.has_work()
+
+
+def test_ready_heap_holds_only_ready_tasks(scheduler):
+    """Blocked tasks enter the heap when their last dependency completes."""
+    first = Task(id="a", description="A", assigned_agent="brokkr")
+    second = Task(id="b", description="B", assigned_agent="brokkr")
+    joined = Task(
+        id="c", description="C", assigned_agent="brokkr", depends_on=["a", "b"]
+    )
+    for task in (first, second, joined):
+        scheduler.add_task(task)
+
+    assert sorted(task_id for _, task_id in scheduler.pending) == ["a", "b"]
+
+    first.status = TaskStatus.COMPLETE
+    assert "c" not in [task_id for _, task_id in scheduler.pending]
+
+    second.status = TaskStatus.COMPLETE
+    assert "c" in [task_id for _, task_id in scheduler.pending]
+
+
+def test_blocked_tasks_not_rechecked(scheduler, monkeypatch):
+    """Dispatch doesn't look at tasks still waiting on dependencies."""
+    root = Task(id="root", description="Root", assigned_agent="brokkr")
+    scheduler.add_task(root)
+    for i in range(200):
+        scheduler.add_task(
+            Task(description=f"Sub {i}", assigned_agent="brokkr", depends_on=["root"])
+        )
+
+    checked = []
+    original = scheduler._dependencies_satisfied
+    monkeypatch.setattr(
+        scheduler,
+        "_dependencies_satisfied",
+        lambda task: checked.append(task.id) or original(task),
+    )
+
+    assert scheduler.get_next_task() is root
+    assert checked == ["root"]
+
+
+def test_status_counters_follow_transitions(scheduler):
+    """Counts track status changes made directly on tasks."""
+    task = Task(description="Task", assigned_agent="brokkr")
+    scheduler.add_task(task)
+
+    task.status = TaskStatus.RUNNING
+    assert scheduler.get_pending_count() == 0
+    assert scheduler.get_running_count() == 1
+
+    task.status = TaskStatus.WAITING
+    assert scheduler.has_work()
+
+    task.status = TaskStatus.COMPLETE
+    assert not scheduler.has_work()
+    assert scheduler.get_status_counts() == {TaskStatus.COMPLETE: 1}
+
+
+def test_dependency_added_after_task(scheduler):
+    """Dependencies added after add_task are still honoured."""
+    first = Task(id="a", description="A", assigned_agent="brokkr")
+    later = Task(id="b", description="B", assigned_agent="brokkr")
+    scheduler.add_task(later)
+    scheduler.add_task(first)
+    later.add_dependency("a")
+
+    assert scheduler.get_next_task() is first
+    assert scheduler.get_next_task() is None
+
+    first.status = TaskStatus.COMPLETE
+    assert scheduler.get_next_task() is later
+
+
+def test_requeued_parent_is_ready(scheduler):
+    """A waiting parent is dispatchable again once re-queued."""
+    parent = Task(description="Parent", assigned_agent="brokkr")
+    scheduler.add_task(parent)
+    assert scheduler.get_next_task() is parent
+
+    parent.status = TaskStatus.WAITING
+    scheduler.requeue(parent)
+
+    assert scheduler.get_next_task() is parent
+
+
+def test_skipped_tasks_do_not_wake_listeners(scheduler):
+    """Putting back tasks that didn't fit a batch isn't new work."""
+    parent = Task(id="p", description="Parent", assigned_agent="brokkr")
+    child = Task(description="Child", assigned_agent="brokkr", parent_id="p")
+    scheduler.add_task(child)
+    calls = []
+    scheduler.add_listener(lambda: calls.append(1))
+
+    assert scheduler.get_ready_batch(running=[parent]) == []
+    assert calls == []
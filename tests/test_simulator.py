@@ -0,0 +1,203 @@
+"""Tests for the virtual-clock scheduling simulator."""
+
+import asyncio
+import json
+import time
+
+import pytest
+
+from sindri.benchmark.simulator import (
+    SimTask,
+    SimulationConfig,
+    VirtualClockLoop,
+    Workload,
+    run_simulation,
+    synthetic_workload,
+)
+from sindri.persistence.metrics import TaskMetrics
+
+
+def _config(**kwargs) -> SimulationConfig:
+    """16 GB with 2 GB reserved; every model loads in 10s."""
+    models = ("big:14b", "other:14b", "small:7b", "tiny:3b", "llama3.1:8b")
+    kwargs.setdefault("load_seconds", {m: 10.0 for m in models})
+    return SimulationConfig(**kwargs)
+
+
+def _task(task_id: str, duration: float, model="small:7b", vram=5.0, **kwargs):
+    return SimTask(id=task_id, duration=duration, model=model, vram_gb=vram, **kwargs)
+
+
+# =============================================================================
+# Virtual clock tests
+# =============================================================================
+
+
+class TestVirtualClockLoop:
+    """Timers complete instantly, in virtual-time order."""
+
+    def test_sleep_advances_virtual_time_only(self):
+        loop = VirtualClockLoop()
+        start = time.perf_counter()
+        try:
+            loop.run_until_complete(asyncio.sleep(3600))
+            assert loop.time() == pytest.approx(3600)
+        finally:
+            loop.close()
+        assert time.perf_counter() - start < 5
+
+    def test_concurrent_sleeps_overlap(self):
+        order = []
+
+        async def nap(name, seconds):
+            await asyncio.sleep(seconds)
+            order.append((name, asyncio.get_running_loop().time()))
+
+        async def main():
+            await asyncio.gather(nap("long", 20), nap("short", 10), nap("mid", 15))
+
+        loop = VirtualClockLoop()
+        try:
+            loop.run_until_complete(main())
+        finally:
+            loop.close()
+
+        assert [name for name, _ in order] == ["short", "mid", "long"]
+        assert order[-1][1] == pytest.approx(20)
+
+
+# =============================================================================
+# Simulation tests
+# =============================================================================
+
+
+class TestRunSimulation:
+    """Makespan, swaps and queueing delay on small known DAGs."""
+
+    def test_chain_runs_back_to_back(self):
+        workload = Workload(
+            "chain",
+            [
+                _task("a", 30),
+                _task("b", 20, depends_on=["a"]),
+                _task("c", 10, depends_on=["b"]),
+            ],
+        )
+
+        result = run_simulation(workload, _config())
+
+        assert result.success
+        assert result.makespan == pytest.approx(10 + 30 + 20 + 10)
+        assert result.model_loads == 1
+        assert result.model_swaps == 0
+        assert result.tasks["b"].ready == pytest.approx(40)
+        assert result.max_queueing_delay == pytest.approx(0)
+        assert result.tasks["a"].load_wait == pytest.approx(10)
+
+    def test_independent_tasks_share_vram(self):
+        workload = Workload(
+            "pair", [_task("a", 30), _task("b", 50, model="tiny:3b", vram=3.0)]
+        )
+
+        result = run_simulation(workload, _config())
+
+        assert result.makespan == pytest.approx(10 + 50)
+        assert result.model_swaps == 0
+        assert result.tasks["a"].started == result.tasks["b"].started
+
+    def test_models_that_do_not_fit_together_swap(self):
+        workload = Workload(
+            "swap",
+            [
+                _task("a", 30, model="big:14b", vram=10.0),
+                _task("b", 30, model="other:14b", vram=10.0),
+            ],
+        )
+
+        result = run_simulation(workload, _config())
+
+        assert result.model_loads == 2
+        assert result.model_swaps == 1
+        assert result.makespan == pytest.approx(2 * (10 + 30))
+        # One of them waited for the other to finish
+        assert result.max_queueing_delay == pytest.approx(40)
+        assert result.gpu_idle_fraction == pytest.approx(20 / 80)
+
+    def test_tasks_sharing_a_model_wait_for_one_load(self):
+        workload = Workload("shared", [_task("a", 30), _task("b", 30)])
+
+        result = run_simulation(workload, _config())
+
+        assert result.model_loads == 1
+        assert result.tasks["b"].running == pytest.approx(10)
+        assert result.load_seconds == pytest.approx(10)
+
+    def test_agent_defaults_apply_without_overrides(self):
+        workload = Workload("agent", [SimTask(id="a", agent="mimir", duration=5)])
+
+        result = run_simulation(workload, _config())
+
+        assert result.tasks["a"].model == "llama3.1:8b"
+
+    def test_parallel_beats_sequential(self):
+        workload = synthetic_workload(25, seed=4)
+
+        parallel = run_simulation(workload, _config(parallel=True))
+        sequential = run_simulation(workload, _config(parallel=False))
+
+        assert parallel.success and sequential.success
+        assert len(parallel.tasks) == 25
+        assert parallel.makespan < sequential.makespan
+
+    def test_same_seed_same_result(self):
+        workload = synthetic_workload(15, seed=2)
+
+        first = run_simulation(workload, _config(seed=7))
+        second = run_simulation(workload, _config(seed=7))
+
+        assert first.to_dict() == second.to_dict()
+
+    def test_dependencies_respected(self):
+        workload = synthetic_workload(20, seed=1)
+        result = run_simulation(workload, _config())
+
+        for task in workload.tasks:
+            for dep in task.depends_on:
+                assert result.tasks[task.id].started >= result.tasks[dep].finished
+
+
+# =============================================================================
+# Workload tests
+# =============================================================================
+
+
+class TestWorkload:
+    """Workload validation and loading."""
+
+    def test_unknown_dependency_rejected(self):
+        workload = Workload("bad", [_task("a", 1, depends_on=["missing"])])
+        with pytest.raises(ValueError, match="missing"):
+            run_simulation(workload)
+
+    def test_duplicate_ids_rejected(self):
+        with pytest.raises(ValueError, match="duplicate"):
+            Workload("dup", [_task("a", 1), _task("a", 2)]).validate()
+
+    def test_json_round_trip(self, temp_dir):
+        workload = synthetic_workload(5, seed=3)
+        path = temp_dir / "workload.json"
+        path.write_text(json.dumps(workload.to_dict()))
+
+        assert Workload.from_json(path) == workload
+
+    def test_from_history(self):
+        history = [
+            TaskMetrics("x", "t", "huginn", "qwen2.5-coder:7b", 0.0, 42.0, "completed"),
+            TaskMetrics("y", "t", "mimir", "llama3.1:8b", 0.0, 0.0, "completed"),
+        ]
+
+        workload = Workload.from_history(history)
+
+        assert len(workload.tasks) == 1
+        assert workload.tasks[0].agent == "huginn"
+        assert workload.tasks[0].duration == pytest.approx(42.0)
@@ -4,17 +4,27 @@ Tests cover:
 - StreamingResponse dataclass
 - OllamaClient.chat_stream() method
 - StreamingBuffer tool call detection
+- Incremental streaming parser
 - Event system streaming events
+- Token frame coalescing
 - HierarchicalAgentLoop streaming mode
+- Read-only tool calls started mid-stream
 """
 
+import asyncio
+import json
+
 import pytest
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 from sindri.llm.client import OllamaClient, StreamingResponse, Response
 from sindri.llm.streaming import StreamingBuffer, DetectedToolCall
-from sindri.core.events import EventBus, EventType, Event
+from sindri.core.events import EventBus, EventType, Event, TokenFrameCoalescer
 from sindri.core.loop import LoopConfig
+from sindri.core.hierarchical import HierarchicalAgentLoop
+from sindri.core.tasks import Task
+from sindri.tools.base import Tool, ToolResult
+from sindri.tools.registry import ToolRegistry
 
 
 # =============================================================================
@@ -230,6 +240,131 @@ class TestStreamingBuffer:
         assert buffer.in_tool_block is False
 
 
+# =============================================================================
+# Incremental Parser Tests
+# =============================================================================
+
+
+class TestIncrementalStreamingParser:
+    """Tests for the single-pass streaming state machine."""
+
+    def _feed(self, buffer, text, chunk=1):
+        shown = []
+        for i in range(0, len(text), chunk):
+            displayable, _ = buffer.add_token(text[i : i + chunk])
+            shown.append(displayable)
+        shown.append(buffer.flush())
+        return "".join(shown)
+
+    def test_braces_inside_strings(self):
+        """Braces and quotes inside JSON strings don't end the call early."""
+        buffer = StreamingBuffer()
+        json_str = (
+            '{"name": "write_file", "arguments": '
+            '{"path": "a.py", "content": "def f():\\n    return {\\"x\\": \\"}\\"}"}}'
+        )
+        self._feed(buffer, json_str)
+
+        calls = buffer.get_tool_calls()
+        assert len(calls) == 1
+        assert calls[0].arguments["content"] == 'def f():\n    return {"x": "}"}'
+        assert buffer.in_tool_block is False
+
+    def test_call_available_as_soon_as_it_closes(self):
+        """Each call is parsed when its closing brace arrives."""
+        buffer = StreamingBuffer()
+        buffer.add_token('{"name": "read_file", "arguments": {"path": "a"}')
+        assert buffer.get_tool_calls() == []
+
+        buffer.add_token("}")
+        assert [c.name for c in buffer.get_tool_calls()] == ["read_file"]
+
+    def test_fenced_call_hidden_from_display(self):
+        """Wrapped calls (fence and closer) never reach the display."""
+        buffer = StreamingBuffer()
+        text = (
+            "Reading now:\n```json\n"
+            '{"name": "read_file", "arguments": {"path": "a"}}\n```\nDone.'
+        )
+        shown = self._feed(buffer, text)
+
+        assert "```" not in shown
+        assert "read_file" not in shown
+        assert shown == "Reading now:\n\nDone."
+        assert buffer.get_display_content() == "Reading now:\n[Tool Call]\nDone."
+
+    def test_xml_wrapped_call(self):
+        """<tool_call> wrappers are recognized."""
+        buffer = StreamingBuffer()
+        shown = self._feed(
+            buffer,
+            '<tool_call>{"name": "shell", "arguments": {"command": "ls"}}</tool_call> ok',
+        )
+
+        assert [c.name for c in buffer.get_tool_calls()] == ["shell"]
+        assert shown == " ok"
+
+    def test_non_tool_json_is_displayed(self):
+        """JSON objects that aren't tool calls stay in the display text."""
+        buffer = StreamingBuffer()
+        text = 'Config: {"name": "sindri", "version": 2} and {"a": 1}'
+        shown = self._feed(buffer, text)
+
+        assert shown == text
+        assert buffer.get_tool_calls() == []
+
+    def test_lookalike_text_is_released(self):
+        """Held-back characters are released when they aren't a wrapper."""
+        buffer = StreamingBuffer()
+        text = "if a < b and `x` then ```python\nprint(1)\n```"
+        assert self._feed(buffer, text) == text
+
+    def test_flush_releases_trailing_held_text(self):
+        """A trailing possible opener is released by flush()."""
+        buffer = StreamingBuffer()
+        displayable, _ = buffer.add_token("x <")
+        assert displayable == "x "
+        assert buffer.flush() == "<"
+
+    def test_token_boundaries_do_not_matter(self):
+        """The same text parses identically however it is chunked."""
+        text = (
+            'Start {"tool": "edit_file", "input": {"path": "f"}} mid '
+            '```json\n{"function": {"name": "shell", "arguments": {}}}\n``` end'
+        )
+        results = set()
+        for chunk in (1, 2, 3, 7, len(text)):
+            buffer = StreamingBuffer()
+            shown = self._feed(buffer, text, chunk)
+            calls = tuple(c.name for c in buffer.get_tool_calls())
+            results.add((shown, calls))
+
+        assert results == {("Start  mid  end", ("edit_file", "shell"))}
+
+    def test_unfinished_call_stays_pending(self):
+        """A call cut off by the end of the stream is not reported."""
+        buffer = StreamingBuffer()
+        self._feed(buffer, '{"name": "read_file", "arguments": {"path"')
+
+        assert buffer.in_tool_block is True
+        assert buffer.get_tool_calls() == []
+
+    def test_long_generation_is_linear(self):
+        """Large outputs with many calls parse quickly."""
+        import time
+
+        call = '{"name": "read_file", "arguments": {"path": "f.py"}}'
+        text = ("Some prose with a < and { brace. " * 20 + call) * 200
+        buffer = StreamingBuffer()
+
+        start = time.perf_counter()
+        self._feed(buffer, text, chunk=4)
+        elapsed = time.perf_counter() - start
+
+        assert len(buffer.get_tool_calls()) == 200
+        assert elapsed < 5.0
+
+
 # =============================================================================
 # Event System Tests
 # =============================================================================
@@ -302,6 +437,115 @@ class TestStreamingEvents:
         assert event.task_id == "task-456"
 
 
+# =============================================================================
+# Token Frame Coalescing Tests
+# =============================================================================
+
+
+class TestTokenFrameCoalescer:
+    """Tests for batching streamed tokens into frames."""
+
+    def _collect(self, bus):
+        frames = []
+        bus.subscribe(EventType.STREAMING_TOKEN, frames.append)
+        return frames
+
+    def test_tokens_buffered_until_finish(self):
+        """Tokens inside the interval are emitted as one frame."""
+        bus = EventBus()
+        frames = self._collect(bus)
+        coalescer = TokenFrameCoalescer(bus, interval_ms=10_000, max_bytes=1024)
+
+        for token in ["Hel", "lo", " wor", "ld"]:
+            coalescer.add("task-1", "huginn", token)
+        assert frames == []
+
+        assert coalescer.finish("task-1") == 1
+        assert len(frames) == 1
+        assert frames[0]["token"] == "Hello world"
+        assert frames[0]["token_count"] == 4
+        assert frames[0]["seq"] == 0
+        assert frames[0]["agent"] == "huginn"
+
+    def test_flush_on_byte_limit(self):
+        """A frame is emitted as soon as max_bytes is reached."""
+        bus = EventBus()
+        frames = self._collect(bus)
+        coalescer = TokenFrameCoalescer(bus, interval_ms=10_000, max_bytes=8)
+
+        for char in "abcdefghijkl":
+            coalescer.add("t", "a", char)
+        coalescer.finish("t")
+
+        assert [f["token"] for f in frames] == ["abcdefgh", "ijkl"]
+        assert [f["seq"] for f in frames] == [0, 1]
+
+    def test_flush_on_interval(self):
+        """Tokens older than the interval flush on the next token."""
+        bus = EventBus()
+        frames = self._collect(bus)
+        coalescer = TokenFrameCoalescer(bus, interval_ms=0, max_bytes=1024)
+
+        coalescer.add("t", "a", "x")
+        coalescer.add("t", "a", "y")
+
+        assert [f["token"] for f in frames] == ["x", "y"]
+
+    def test_per_task_sequences(self):
+        """Parallel tasks keep separate buffers and sequence numbers."""
+        bus = EventBus()
+        frames = self._collect(bus)
+        coalescer = TokenFrameCoalescer(bus, interval_ms=10_000, max_bytes=2)
+
+        coalescer.add("a", "huginn", "a1")
+        coalescer.add("b", "mimir", "b1")
+        coalescer.add("a", "huginn", "a2")
+
+        by_task = {}
+        for frame in frames:
+            by_task.setdefault(frame["task_id"], []).append(frame["seq"])
+        assert by_task == {"a": [0, 1], "b": [0]}
+
+    def test_coalescing_reduces_events(self):
+        """Many tokens produce few events."""
+        bus = EventBus()
+        frames = self._collect(bus)
+        coalescer = TokenFrameCoalescer(bus, interval_ms=10_000, max_bytes=256)
+
+        for i in range(1000):
+            coalescer.add("t", "a", "tok ")
+        coalescer.finish("t")
+
+        assert "".join(f["token"] for f in frames) == "tok " * 1000
+        assert len(frames) < 20
+        assert coalescer.get_stats()["tokens"] == 1000
+
+    @pytest.mark.asyncio
+    async def test_timer_flushes_stalled_stream(self):
+        """Buffered tokens flush after the interval even with no new tokens."""
+        import asyncio
+
+        bus = EventBus()
+        frames = self._collect(bus)
+        coalescer = TokenFrameCoalescer(bus, interval_ms=20, max_bytes=1024)
+
+        coalescer.add("t", "a", "partial")
+        assert frames == []
+        await asyncio.sleep(0.1)
+
+        assert [f["token"] for f in frames] == ["partial"]
+
+    def test_empty_tokens_ignored(self):
+        """Empty tokens neither buffer nor emit."""
+        bus = EventBus()
+        frames = self._collect(bus)
+        coalescer = TokenFrameCoalescer(bus)
+
+        coalescer.add("t", "a", "")
+        assert coalescer.finish("t") == 0
+        assert frames == []
+
+
 # =============================================================================
 # OllamaClient Streaming Tests
 # =============================================================================
@@ -461,6 +705,130 @@ class TestStreamingIntegration:
         assert all(e[0] == "token" for e in events[1:6])
 
 
+# =============================================================================
+# Eager Tool Execution Tests
+# =============================================================================
+
+
+class _RecordingTool(Tool):
+    """Tool that records when it ran."""
+
+    parameters = {"type": "object", "properties": {}}
+    description = "test tool"
+
+    def __init__(self, name: str, read_only: bool, log: list):
+        super().__init__()
+        self.name = name
+        self.read_only = read_only
+        self._log = log
+
+    async def execute(self, **kwargs) -> ToolResult:
+        self._log.append(("tool", self.name, kwargs.get("path")))
+        return ToolResult(success=True, output=f"{self.name}:{kwargs.get('path')}")
+
+
+class TestEagerToolExecution:
+    """Tests for starting read-only tool calls mid-stream."""
+
+    def _setup(self, text: str, config: LoopConfig = None):
+        events = []
+        registry = ToolRegistry()
+        registry.register(_RecordingTool("read_file", True, events))
+        registry.register(_RecordingTool("write_file", False, events))
+
+        async def fake_stream(model, messages, tools, on_token, **kwargs):
+            for i in range(0, len(text), 5):
+                on_token(text[i : i + 5])
+                await asyncio.sleep(0)
+            events.append(("stream_end", None, None))
+            return StreamingResponse(content=text, model=model, done=True)
+
+        client = MagicMock()
+        client.chat_stream = fake_stream
+        loop = HierarchicalAgentLoop(
+            client=client,
+            tools=registry,
+            state=MagicMock(),
+            scheduler=MagicMock(),
+            delegation=MagicMock(),
+            config=config or LoopConfig(),
+            event_bus=EventBus(),
+            enable_metrics=False,
+        )
+        task = Task(id="t1", description="d", assigned_agent="huginn")
+        return loop, registry, task, events
+
+    async def _call(self, loop, registry, task):
+        agent = MagicMock()
+        agent.name = "huginn"
+        return await loop._call_llm_streaming(
+            "m", [], [], task, agent, tool_registry=registry
+        )
+
+    @staticmethod
+    def _call_json(name: str, path: str) -> str:
+        return json.dumps({"name": name, "arguments": {"path": path}})
+
+    @pytest.mark.asyncio
+    async def test_read_only_call_starts_before_stream_ends(self):
+        """A read-only call runs while the model is still generating."""
+        text = self._call_json("read_file", "a.py") + " and now a long explanation" * 5
+        loop, registry, task, events = self._setup(text)
+
+        _, _, calls, prefetched = await self._call(loop, registry, task)
+
+        assert [c.name for c in calls] == ["read_file"]
+        assert set(prefetched) == {0}
+        assert events.index(("tool", "read_file", "a.py")) < events.index(
+            ("stream_end", None, None)
+        )
+        result, start, end = await prefetched[0]
+        assert result.output == "read_file:a.py"
+        assert start <= end
+
+    @pytest.mark.asyncio
+    async def test_calls_after_write_are_not_started(self):
+        """Once a call with side effects appears, later calls wait."""
+        text = " ".join(
+            [
+                self._call_json("read_file", "a"),
+                self._call_json("write_file", "b"),
+                self._call_json("read_file", "b"),
+            ]
+        )
+        loop, registry, task, events = self._setup(text)
+
+        _, _, calls, prefetched = await self._call(loop, registry, task)
+
+        assert [c.name for c in calls] == ["read_file", "write_file", "read_file"]
+        assert set(prefetched) == {0}
+        await prefetched[0]
+        assert ("tool", "write_file", "b") not in events
+        assert ("tool", "read_file", "b") not in events
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_config(self):
+        """eager_tools=False leaves all calls for after the stream."""
+        text = self._call_json("read_file", "a")
+        loop, registry, task, events = self._setup(
+            text, LoopConfig(eager_tools=False)
+        )
+
+        _, _, calls, prefetched = await self._call(loop, registry, task)
+
+        assert len(calls) == 1
+        assert prefetched == {}
+        assert events == [("stream_end", None, None)]
+
+    def test_read_only_declarations(self):
+        """Built-in side-effect-free tools are declared read-only."""
+        registry = ToolRegistry.default()
+        for name in ["read_file", "list_directory", "search_code", "git_status"]:
+            assert registry.is_read_only(name), name
+        for name in ["write_file", "edit_file", "shell", "delegate"]:
+            assert not registry.is_read_only(name), name
+
+
 # =============================================================================
 # Edge Case Tests
 # =============================================================================
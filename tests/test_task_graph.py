@@ -0,0 +1,212 @@
+"""Tests for durable task graphs and resuming orchestrations."""
+
+from unittest.mock import patch
+
+import pytest
+
+from sindri.core.loop import LoopResult
+from sindri.core.orchestrator import Orchestrator, prepare_resume
+from sindri.core.scheduler import TaskScheduler
+from sindri.core.tasks import Task, TaskStatus
+from sindri.llm.manager import ModelManager
+from sindri.persistence.task_graph import TaskGraphStore
+
+
+def _tree() -> list[Task]:
+    """Root waiting on two children; one done, one cut off mid-run."""
+    root = Task(
+        id="root",
+        description="build it",
+        status=TaskStatus.WAITING,
+        subtask_ids=["done", "cut"],
+        session_id="root-session",
+    )
+    done = Task(
+        id="done",
+        parent_id="root",
+        description="first half",
+        assigned_agent="huginn",
+        status=TaskStatus.COMPLETE,
+        result={"output": "half built"},
+    )
+    cut = Task(
+        id="cut",
+        parent_id="root",
+        description="second half",
+        assigned_agent="huginn",
+        status=TaskStatus.RUNNING,
+        depends_on=["done"],
+    )
+    return [root, done, cut]
+
+
+async def _save(store: TaskGraphStore, tasks: list[Task]):
+    for task in tasks:
+        store.track(task)
+    await store.flush()
+
+
+class _RecordingLoop:
+    """Stands in for HierarchicalAgentLoop; completes every task it runs."""
+
+    def __init__(self, orchestrator: Orchestrator):
+        self.orchestrator = orchestrator
+        self.ran: list[str] = []
+
+    async def run_task(self, task: Task) -> LoopResult:
+        self.ran.append(task.id)
+        task.status = TaskStatus.RUNNING
+        task.status = TaskStatus.COMPLETE
+        task.result = {"output": f"{task.id} done"}
+        await self.orchestrator.delegation.child_completed(task)
+        return LoopResult(success=True, iterations=1)
+
+    def cancel_generation(self, task_id: str):
+        pass
+
+
+# =============================================================================
+# Store tests
+# =============================================================================
+
+
+class TestTaskGraphStore:
+    """Saving task trees and loading them back."""
+
+    @pytest.mark.asyncio
+    async def test_round_trip(self, db):
+        store = TaskGraphStore(db)
+        await _save(store, _tree())
+
+        tasks = await TaskGraphStore(db).load("root")
+
+        assert [t.id for t in tasks][0] == "root"
+        assert {t.id for t in tasks} == {"root", "done", "cut"}
+        by_id = {t.id: t for t in tasks}
+        assert by_id["done"].result == {"output": "half built"}
+        assert by_id["cut"].depends_on == ["done"]
+        assert by_id["root"].session_id == "root-session"
+
+    @pytest.mark.asyncio
+    async def test_load_by_any_task_in_tree(self, db):
+        store = TaskGraphStore(db)
+        await _save(store, _tree())
+
+        assert await store.find_root("cut") == "root"
+        assert len(await store.load("cut")) == 3
+
+    @pytest.mark.asyncio
+    async def test_unknown_task(self, db):
+        store = TaskGraphStore(db)
+
+        assert await store.find_root("missing") is None
+        assert await store.load("missing") == []
+
+    @pytest.mark.asyncio
+    async def test_scheduler_changes_are_saved(self, db):
+        store = TaskGraphStore(db)
+        scheduler = TaskScheduler(ModelManager(total_vram_gb=16.0))
+        scheduler.add_observer(store.track)
+        task = Task(id="t1", description="t", assigned_agent="huginn")
+        scheduler.add_task(task)
+
+        # Result set right after the status change is in the same snapshot
+        task.status = TaskStatus.COMPLETE
+        task.result = {"output": "ok"}
+        await store.flush()
+
+        (saved,) = await TaskGraphStore(db).load("t1")
+        assert saved.status == TaskStatus.COMPLETE
+        assert saved.result == {"output": "ok"}
+
+
+# =============================================================================
+# Resume tests
+# =============================================================================
+
+
+class TestPrepareResume:
+    """Resetting a saved tree so unfinished work runs again."""
+
+    def test_running_tasks_return_to_pending(self):
+        tasks = _tree()
+        prepare_resume(tasks)
+
+        assert tasks[2].status == TaskStatus.PENDING
+        assert tasks[1].status == TaskStatus.COMPLETE
+        # Still waiting on the re-run child
+        assert tasks[0].status == TaskStatus.WAITING
+
+    def test_parent_of_completed_children_resumes(self):
+        tasks = _tree()
+        tasks[2].status = TaskStatus.COMPLETE
+        prepare_resume(tasks)
+
+        assert tasks[0].status == TaskStatus.PENDING
+
+    def test_parent_of_failed_child_fails(self):
+        tasks = _tree()
+        tasks[2].status = TaskStatus.FAILED
+        tasks[2].error = "boom"
+        prepare_resume(tasks)
+
+        assert tasks[0].status == TaskStatus.FAILED
+        assert "boom" in tasks[0].error
+
+    def test_parent_of_cancelled_child_fails(self):
+        tasks = _tree()
+        tasks[2].status = TaskStatus.CANCELLED
+        prepare_resume(tasks)
+
+        assert tasks[0].status == TaskStatus.FAILED
+        assert tasks[2].id in tasks[0].error
+
+    def test_cancelled_parent_of_cancelled_child_is_cancelled(self):
+        tasks = _tree()
+        tasks[0].cancel_requested = True
+        tasks[2].status = TaskStatus.CANCELLED
+        prepare_resume(tasks)
+
+        assert tasks[0].status == TaskStatus.CANCELLED
+        assert tasks[0].error == "Task cancelled by user"
+
+
+class TestOrchestratorResume:
+    """Only unfinished work is dispatched again."""
+
+    @pytest.mark.asyncio
+    async def test_resume_skips_completed_tasks(self, db):
+        await _save(TaskGraphStore(db), _tree())
+        with patch("sindri.core.orchestrator.OllamaClient"):
+            orchestrator = Orchestrator(enable_memory=False, database=db)
+        orchestrator.delegation.state = None
+        orchestrator.loop = _RecordingLoop(orchestrator)
+
+        result = await orchestrator.resume("cut")
+
+        assert result["success"]
+        assert result["task_id"] == "root"
+        assert orchestrator.loop.ran == ["cut", "root"]
+        # The finished tree is saved too
+        statuses = {t.id: t.status for t in await TaskGraphStore(db).load("root")}
+        assert set(statuses.values()) == {TaskStatus.COMPLETE}
+
+    @pytest.mark.asyncio
+    async def test_resume_unknown_task(self, db):
+        with patch("sindri.core.orchestrator.OllamaClient"):
+            orchestrator = Orchestrator(enable_memory=False, database=db)
+
+        assert await orchestrator.resume("missing") is None
+
+    @pytest.mark.asyncio
+    async def test_run_saves_tree(self, db):
+        with patch("sindri.core.orchestrator.OllamaClient"):
+            orchestrator = Orchestrator(enable_memory=False, database=db)
+        orchestrator.delegation.state = None
+        orchestrator.loop = _RecordingLoop(orchestrator)
+
+        result = await orchestrator.run("do it")
+
+        (saved,) = await TaskGraphStore(db).load(result["task_id"])
+        assert saved.status == TaskStatus.COMPLETE
+        assert saved.result == {"output": f"{saved.id} done"}
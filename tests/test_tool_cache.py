@@ -0,0 +1,210 @@
+"""Tests for the per-task tool result cache."""
+
+import asyncio
+import os
+import pytest
+
+from sindri.tools.base import SideEffect, Tool, ToolResult
+from sindri.tools.filesystem import ReadFileTool, WriteFileTool
+from sindri.tools.registry import CACHED_RESULT_NOTE, ToolRegistry
+
+
+class _CountingRead(Tool):
+    """Cacheable read that counts its executions."""
+
+    name = "count_read"
+    description = "test tool"
+    parameters = {"type": "object", "properties": {"path": {"type": "string"}}}
+    side_effect = SideEffect.READ
+    cacheable = True
+
+    def __init__(self, work_dir=None):
+        super().__init__(work_dir)
+        self.calls = 0
+
+    async def execute(self, path: str = ".", **kwargs) -> ToolResult:
+        self.calls += 1
+        return ToolResult(success=self.calls < 100, output=f"run {self.calls}")
+
+
+@pytest.fixture
+def registry(temp_dir):
+    """Per-task registry with caching on."""
+    registry = ToolRegistry(work_dir=temp_dir, cache_results=True)
+    registry.register(ReadFileTool(work_dir=temp_dir))
+    registry.register(WriteFileTool(work_dir=temp_dir))
+    registry.register(_CountingRead(work_dir=temp_dir))
+    return registry
+
+
+# =============================================================================
+# Cache behaviour
+# =============================================================================
+
+
+class TestToolResultCache:
+    """Tests for ToolRegistry result caching."""
+
+    @pytest.mark.asyncio
+    async def test_repeat_call_is_served_from_cache(self, registry, temp_dir):
+        """A repeated read returns the cached output with a note."""
+        (temp_dir / "a.py").write_text("x = 1\n")
+
+        first = await registry.execute("read_file", {"path": "a.py"})
+        second = await registry.execute("read_file", {"path": "a.py"})
+
+        assert first.output == "x = 1\n"
+        assert second.output == f"{CACHED_RESULT_NOTE}\nx = 1\n"
+        assert second.metadata["cached"] is True
+        assert registry.cache_hits == 1
+
+    @pytest.mark.asyncio
+    async def test_arguments_are_normalized(self, registry, temp_dir):
+        """Equivalent paths and JSON-string arguments share an entry."""
+        tool = registry.get_tool("count_read")
+
+        await registry.execute("count_read", {"path": "sub/../a"})
+        await registry.execute("count_read", '{"path": "a"}')
+
+        assert tool.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_mtime_change_misses(self, registry, temp_dir):
+        """A file changed outside the tools is read again."""
+        path = temp_dir / "a.py"
+        path.write_text("x = 1\n")
+        await registry.execute("read_file", {"path": "a.py"})
+
+        path.write_text("x = 22\n")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        result = await registry.execute("read_file", {"path": "a.py"})
+
+        assert result.output == "x = 22\n"
+        assert registry.cache_hits == 0
+
+    @pytest.mark.asyncio
+    async def test_write_invalidates(self, registry, temp_dir):
+        """Any workspace write drops cached reads."""
+        tool = registry.get_tool("count_read")
+        await registry.execute("count_read", {"path": "a"})
+
+        await registry.execute("write_file", {"path": "b.txt", "content": "b"})
+        await registry.execute("count_read", {"path": "a"})
+
+        assert tool.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_write_in_other_registry_invalidates(self, registry, temp_dir):
+        """Writes by another task in the same work_dir invalidate too."""
+        tool = registry.get_tool("count_read")
+        await registry.execute("count_read", {"path": "a"})
+
+        other = ToolRegistry(work_dir=temp_dir, cache_results=True)
+        other.register(WriteFileTool(work_dir=temp_dir))
+        await other.execute("write_file", {"path": "b.txt", "content": "b"})
+        await registry.execute("count_read", {"path": "a"})
+
+        assert tool.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_write_during_read_leaves_result_stale(self, registry, temp_dir):
+        """A write landing while a read runs isn't hidden by the cache."""
+        tool = registry.get_tool("count_read")
+        other = ToolRegistry(work_dir=temp_dir)
+        other.register(WriteFileTool(work_dir=temp_dir))
+        execute = tool.execute
+
+        async def read_racing_a_write(**kwargs):
+            result = await execute(**kwargs)
+            await other.execute("write_file", {"path": "b.txt", "content": "b"})
+            return result
+
+        tool.execute = read_racing_a_write
+        await registry.execute("count_read", {"path": "."})
+        tool.execute = execute
+        await registry.execute("count_read", {"path": "."})
+
+        assert tool.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_write_invalidates(self, registry, temp_dir):
+        """A write cancelled mid-call may have changed files; reads rerun."""
+        tool = registry.get_tool("count_read")
+        writer = registry.get_tool("write_file")
+        await registry.execute("count_read", {"path": "a"})
+
+        async def cancelled_write(**kwargs):
+            (temp_dir / "b.txt").write_text("b")
+            raise asyncio.CancelledError
+
+        writer.execute = cancelled_write
+        with pytest.raises(asyncio.CancelledError):
+            await registry.execute("write_file", {"path": "b.txt", "content": "b"})
+        await registry.execute("count_read", {"path": "a"})
+
+        assert tool.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_unresolvable_path_not_cached(self, registry):
+        """Arguments the key can't be built from run uncached."""
+        tool = registry.get_tool("count_read")
+
+        for _ in range(2):
+            result = await registry.execute("count_read", {"path": "a\x00b"})
+
+        assert result.success
+        assert tool.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_failures_not_cached(self, registry):
+        """Failed calls run again."""
+        registry.register(_CountingRead())
+        tool = registry.get_tool("count_read")
+        tool.calls = 99
+
+        await registry.execute("count_read", {"path": "a"})
+        await registry.execute("count_read", {"path": "a"})
+
+        assert tool.calls == 101
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(self, temp_dir):
+        """Registries don't cache unless asked to."""
+        registry = ToolRegistry(work_dir=temp_dir)
+        tool = _CountingRead(work_dir=temp_dir)
+        registry.register(tool)
+
+        await registry.execute("count_read", {"path": "a"})
+        await registry.execute("count_read", {"path": "a"})
+
+        assert tool.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_size_is_bounded(self, temp_dir):
+        """The oldest entries are dropped past the limit."""
+        registry = ToolRegistry(
+            work_dir=temp_dir, cache_results=True, max_cached_results=2
+        )
+        tool = _CountingRead(work_dir=temp_dir)
+        registry.register(tool)
+
+        for path in ("a", "b", "c", "a"):
+            await registry.execute("count_read", {"path": path})
+
+        assert tool.calls == 4
+
+    def test_builtin_cacheable_tools(self):
+        """The idempotent built-in reads are cacheable."""
+        registry = ToolRegistry.default()
+        cacheable = {name for name, tool in registry._tools.items() if tool.cacheable}
+        assert cacheable == {
+            "read_file",
+            "list_directory",
+            "read_tree",
+            "search_code",
+            "find_symbol",
+            "git_status",
+            "describe_schema",
+        }
+        assert all(registry.is_read_only(name) for name in cacheable)
@@ -0,0 +1,194 @@
+"""Tests for tool output budgets and paging."""
+
+import pytest
+
+from sindri.core.loop import LoopConfig
+from sindri.tools.base import Tool, ToolResult
+from sindri.tools.filesystem import ReadFileTool
+from sindri.tools.paging import (
+    OutputBudget,
+    ToolOutputPageTool,
+    ToolOutputStore,
+    truncate_output,
+)
+from sindri.tools.registry import ToolRegistry
+
+
+class _LoudTool(Tool):
+    """Tool that prints a lot."""
+
+    name = "loud"
+    description = "test tool"
+    parameters = {"type": "object", "properties": {}}
+
+    def __init__(self, output: str):
+        super().__init__()
+        self.output = output
+
+    async def execute(self, **kwargs) -> ToolResult:
+        return ToolResult(success=True, output=self.output)
+
+
+@pytest.fixture
+def store(temp_dir):
+    """Output store in a temp directory."""
+    return ToolOutputStore(temp_dir / "outputs")
+
+
+BUDGET = OutputBudget(max_chars=100, head_chars=40, tail_chars=20, page_chars=50)
+
+
+# =============================================================================
+# Truncation
+# =============================================================================
+
+
+class TestTruncation:
+    """Tests for cutting oversized outputs to head + tail."""
+
+    def test_small_output_unchanged(self, store):
+        """Outputs within budget pass through."""
+        result = truncate_output(ToolResult(True, "short"), BUDGET, store, "loud")
+        assert result.output == "short"
+        assert "truncated" not in result.metadata
+
+    def test_head_tail_and_handle(self, store):
+        """Long outputs keep head and tail and point at the stored copy."""
+        text = "".join(f"{i:03d}," for i in range(100))  # 400 chars
+        result = truncate_output(ToolResult(True, text), BUDGET, store, "loud")
+
+        handle = result.metadata["output_handle"]
+        assert result.output.startswith(text[:40])
+        assert result.output.endswith(text[-20:])
+        assert f'tool_output_page(handle="{handle}"' in result.output
+        assert "340 characters omitted" in result.output
+        assert result.metadata["output_pages"] == 8
+        assert store.get(handle) == text
+
+    def test_read_file_hint(self, store):
+        """Truncated file reads also suggest offset/limit."""
+        result = truncate_output(
+            ToolResult(True, "x" * 500), BUDGET, store, "read_file"
+        )
+        assert "read_file with offset/limit" in result.output
+
+    def test_store_prunes_oldest(self, temp_dir):
+        """The store keeps at most max_entries outputs."""
+        store = ToolOutputStore(temp_dir / "outputs", max_entries=2)
+        handles = [store.put(str(i)) for i in range(3)]
+        assert len(list((temp_dir / "outputs").glob("*.txt"))) == 2
+        assert store.get(handles[-1]) == "2"
+
+    def test_prune_leaves_other_stores_alone(self, temp_dir):
+        """Pruning only deletes the store's own outputs, even in a shared root."""
+        other = ToolOutputStore(temp_dir / "outputs")
+        foreign = other.put("theirs")
+        store = ToolOutputStore(temp_dir / "outputs", max_entries=1)
+        for i in range(3):
+            store.put(str(i))
+        assert other.get(foreign) == "theirs"
+
+    def test_prune_tolerates_missing_files(self, temp_dir):
+        """Outputs deleted behind the store's back don't break pruning."""
+        store = ToolOutputStore(temp_dir / "outputs", max_entries=1)
+        first = store.put("a")
+        (temp_dir / "outputs" / f"{first}.txt").unlink()
+        handle = store.put("b")
+        assert store.get(first) is None
+        assert store.get(handle) == "b"
+
+    def test_default_root_is_private(self):
+        """Stores without a root each get their own directory, removed on close."""
+        a, b = ToolOutputStore(), ToolOutputStore()
+        assert a.root != b.root
+        handle = a.put("text")
+        assert b.get(handle) is None
+        a.close()
+        assert not a.root.exists()
+        b.close()
+
+    def test_budget_from_max_chars(self):
+        """Pages fit within the budget they page through."""
+        budget = OutputBudget.from_max_chars(12000)
+        assert budget.head_chars + budget.tail_chars < budget.max_chars
+        assert budget.page_chars < budget.max_chars
+
+
+# =============================================================================
+# Paging
+# =============================================================================
+
+
+class TestPaging:
+    """Tests for tool_output_page and read_file ranges."""
+
+    @pytest.mark.asyncio
+    async def test_pages_cover_output(self, store):
+        """Reading every page reproduces the full output."""
+        text = "abcdefghij" * 23
+        handle = store.put(text)
+        tool = ToolOutputPageTool(store, page_chars=50)
+
+        pages = [(await tool.execute(handle, page=n)).output for n in range(1, 6)]
+
+        assert "".join(pages) == text
+        assert (await tool.execute(handle, page=6)).success is False
+
+    @pytest.mark.asyncio
+    async def test_unknown_handle(self, store):
+        """Unknown or malformed handles fail cleanly."""
+        tool = ToolOutputPageTool(store)
+        assert (await tool.execute("nope")).success is False
+        assert (await tool.execute("../../etc/passwd")).success is False
+
+    @pytest.mark.asyncio
+    async def test_read_file_offset_limit(self, temp_dir):
+        """read_file returns a range of lines."""
+        (temp_dir / "f.txt").write_text("".join(f"line {i}\n" for i in range(1, 11)))
+        tool = ReadFileTool(work_dir=temp_dir)
+
+        result = await tool.execute("f.txt", offset=3, limit=2)
+
+        assert result.output == "line 3\nline 4\n"
+        assert result.metadata["total_lines"] == 10
+        assert result.metadata["last_line"] == 4
+        assert (await tool.execute("f.txt", offset=9)).output == "line 9\nline 10\n"
+
+
+# =============================================================================
+# Registry integration
+# =============================================================================
+
+
+class TestRegistryBudget:
+    """Tests for the budget applied in ToolRegistry.execute."""
+
+    @pytest.mark.asyncio
+    async def test_registry_truncates_and_pages(self, store):
+        """Oversized results are truncated and the pages come back whole."""
+        text = "0123456789" * 30
+        registry = ToolRegistry(output_budget=BUDGET, output_store=store)
+        registry.register(_LoudTool(text))
+        registry.register(ToolOutputPageTool(store, page_chars=BUDGET.page_chars))
+
+        result = await registry.execute("loud", {})
+        handle = result.metadata["output_handle"]
+        pages = [
+            (await registry.execute("tool_output_page", {"handle": handle, "page": n}))
+            for n in range(1, result.metadata["output_pages"] + 1)
+        ]
+
+        assert len(result.output) < len(text)
+        assert "".join(p.output for p in pages) == text
+        assert not any(p.metadata.get("truncated") for p in pages)
+
+    @pytest.mark.asyncio
+    async def test_no_budget_by_default(self):
+        """Registries without a budget return outputs whole."""
+        registry = ToolRegistry()
+        registry.register(_LoudTool("x" * 50000))
+        assert len((await registry.execute("loud", {})).output) == 50000
+
+    def test_loop_default_budget(self):
+        """Agent loops budget tool outputs by default."""
+        assert LoopConfig().tool_output_budget > 0
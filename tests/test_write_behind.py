@@ -0,0 +1,171 @@
+"""Tests for write-behind batching of log records."""
+
+import asyncio
+import sqlite3
+import pytest
+
+from sindri.collaboration.audit import AuditAction, AuditCategory, AuditStore
+from sindri.persistence.database import Database
+from sindri.persistence.metrics import MetricsStore, SessionMetrics
+from sindri.persistence.write_behind import (
+    WriteBehindQueue,
+    get_write_queue,
+    write_behind_stats,
+)
+
+
+INSERT = "INSERT INTO items (name) VALUES (?)"
+
+
+@pytest.fixture
+async def db(temp_dir):
+    """Database with a small test table."""
+    database = Database(temp_dir / "wb.db")
+    async with database.get_connection() as conn:
+        await conn.execute("CREATE TABLE items (name TEXT NOT NULL)")
+        await conn.commit()
+    return database
+
+
+def _count(database: Database, table: str = "items") -> int:
+    conn = sqlite3.connect(database.db_path)
+    try:
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+    finally:
+        conn.close()
+
+
+# =============================================================================
+# Queue tests
+# =============================================================================
+
+
+class TestWriteBehindQueue:
+    """Tests for batching and flushing."""
+
+    @pytest.mark.asyncio
+    async def test_enqueue_does_not_write(self, db):
+        """Records wait for the next batch."""
+        db.write_behind("items", INSERT, ("a",))
+
+        assert _count(db) == 0
+        assert db.pending_writes("items") == 1
+
+    @pytest.mark.asyncio
+    async def test_flushes_after_interval(self, db):
+        """The timer writes queued records in one batch."""
+        queue = get_write_queue(db.db_path)
+        queue.flush_interval_ms = 10
+        batches = queue.batches
+        for name in "abc":
+            db.write_behind("items", INSERT, (name,))
+
+        await asyncio.sleep(0.1)
+
+        assert _count(db) == 3
+        assert queue.batches == batches + 1
+        assert queue.depth == 0
+
+    @pytest.mark.asyncio
+    async def test_flushes_when_batch_full(self, temp_dir):
+        """A full batch is written without waiting for the timer."""
+        queue = WriteBehindQueue(
+            temp_dir / "full.db", flush_interval_ms=60000, max_batch=2
+        )
+        database = Database(temp_dir / "full.db")
+        async with database.get_connection() as conn:
+            await conn.execute("CREATE TABLE items (name TEXT NOT NULL)")
+            await conn.commit()
+
+        queue.enqueue("items", INSERT, ("a",))
+        queue.enqueue("items", INSERT, ("b",))
+        await asyncio.sleep(0.05)
+
+        assert _count(database) == 2
+
+    @pytest.mark.asyncio
+    async def test_writer_drains_queue_first(self, db):
+        """Writes through get_connection() land after queued ones."""
+        db.write_behind("items", INSERT, ("queued",))
+
+        async with db.get_connection() as conn:
+            await conn.execute("UPDATE items SET name = 'updated'")
+            await conn.commit()
+
+        async with db.get_connection(read_only=True) as conn:
+            async with conn.execute("SELECT name FROM items") as cursor:
+                assert [row[0] for row in await cursor.fetchall()] == ["updated"]
+
+    @pytest.mark.asyncio
+    async def test_bad_record_dropped_alone(self, db):
+        """A failing statement doesn't lose the rest of its batch."""
+        db.write_behind("items", INSERT, ("a",))
+        db.write_behind("items", INSERT, (None,))  # NOT NULL
+        db.write_behind("items", INSERT, ("c",))
+
+        await db.flush_writes()
+
+        assert _count(db) == 2
+        assert get_write_queue(db.db_path).failed >= 1
+
+    @pytest.mark.asyncio
+    async def test_sync_flush_at_exit(self, db):
+        """Records still queued without a loop are written synchronously."""
+        db.write_behind("items", INSERT, ("a",))
+
+        get_write_queue(db.db_path).flush_sync()
+
+        assert _count(db) == 1
+
+    @pytest.mark.asyncio
+    async def test_stats(self, db):
+        """Depth and flush latency are reported per database."""
+        db.write_behind("items", INSERT, ("a",))
+        stats = write_behind_stats()[str(db.db_path.resolve())]
+        assert stats["depth"] == 1
+
+        await db.flush_writes()
+        stats = write_behind_stats()[str(db.db_path.resolve())]
+
+        assert stats["depth"] == 0
+        assert stats["batches"] >= 1
+        assert stats["last_flush_ms"] > 0
+
+
+# =============================================================================
+# Store tests
+# =============================================================================
+
+
+class TestBatchedStores:
+    """Tests for stores writing through the queue."""
+
+    @pytest.mark.asyncio
+    async def test_metrics_visible_to_readers(self, temp_dir):
+        """Saved metrics are read back before the batch would flush."""
+        database = Database(temp_dir / "m.db")
+        store = MetricsStore(database)
+        metrics = SessionMetrics(
+            session_id="s1", task_description="t", model_name="m", start_time=0.0
+        )
+
+        await store.save_metrics(metrics)
+
+        assert database.pending_writes("session_metrics") == 1
+        assert (await store.load_metrics("s1")).session_id == "s1"
+
+    @pytest.mark.asyncio
+    async def test_audit_entries_batched(self, temp_dir):
+        """Audit entries are committed together."""
+        store = AuditStore(Database(temp_dir / "a.db"))
+        queue = get_write_queue(store.db.db_path)
+        batches = queue.batches
+
+        for _ in range(5):
+            await store.log(AuditCategory.AUTHENTICATION, AuditAction.LOGIN_SUCCESS)
+        assert queue.depth == 5
+
+        await store.get_statistics()
+
+        assert queue.batches == batches + 1
+        assert _count(store.db, "audit_logs") == 5